@@ -1,39 +1,98 @@
 __version__ = "0.3.0"
 
-# RFC imports
-# Modern helper functions (recommended API)
-from .helpers import (
-    detect_rfc_type,
-    # CURP helpers
-    generate_curp,
-    # RFC helpers
-    generate_rfc_persona_fisica,
-    generate_rfc_persona_moral,
-    get_curp_info,
-    is_valid_curp,
-    is_valid_rfc,
-    validate_curp,
-    validate_rfc,
-)
+from typing import TYPE_CHECKING
 
-# CURP imports
-from .validators.curp import (
-    CURPException,
-    CURPGenerator,
-    CURPLengthError,
-    CURPStructureError,
-    CURPValidator,
-)
-from .validators.rfc import (
-    RFCGenerator,
-    RFCGeneratorFisicas,
-    RFCGeneratorMorales,
-    RFCValidator,
+from .utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # RFC imports
+    # Modern helper functions (recommended API)
+    from .helpers import (
+        detect_rfc_type,
+        # CURP helpers
+        generate_curp,
+        # RFC helpers
+        generate_rfc_persona_fisica,
+        generate_rfc_persona_moral,
+        get_curp_info,
+        is_valid_curp,
+        is_valid_rfc,
+        validate_curp,
+        validate_rfc,
+        validate_rfc_batch,
+        validate_rfc_many,
+    )
+
+    # Catalog warm-up
+    from .registry import preload
+    from .utils.views import read_only, set_read_only
+
+    # CURP imports
+    from .validators.curp import (
+        CURPException,
+        CURPGenerator,
+        CURPLengthError,
+        CURPStructureError,
+        CURPValidator,
+    )
+    from .validators.rfc import (
+        RFCBatchValidator,
+        RFCGenerator,
+        RFCGeneratorFisicas,
+        RFCGeneratorMorales,
+        RFCValidator,
+    )
+
+# Validators pull in unidecode (and NumPy for batches); import them on first use
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        **dict.fromkeys(
+            (
+                "detect_rfc_type",
+                "generate_curp",
+                "generate_rfc_persona_fisica",
+                "generate_rfc_persona_moral",
+                "get_curp_info",
+                "is_valid_curp",
+                "is_valid_rfc",
+                "validate_curp",
+                "validate_rfc",
+                "validate_rfc_batch",
+                "validate_rfc_many",
+            ),
+            ".helpers",
+        ),
+        **dict.fromkeys(
+            (
+                "CURPException",
+                "CURPGenerator",
+                "CURPLengthError",
+                "CURPStructureError",
+                "CURPValidator",
+            ),
+            ".validators.curp",
+        ),
+        **dict.fromkeys(
+            (
+                "RFCBatchValidator",
+                "RFCGenerator",
+                "RFCGeneratorFisicas",
+                "RFCGeneratorMorales",
+                "RFCValidator",
+            ),
+            ".validators.rfc",
+        ),
+        "preload": ".registry",
+        "read_only": ".utils.views",
+        "set_read_only": ".utils.views",
+    },
 )
 
 __all__ = [
     # RFC Classes (legacy/advanced usage)
     "RFCValidator",
+    "RFCBatchValidator",
     "RFCGenerator",
     "RFCGeneratorFisicas",
     "RFCGeneratorMorales",
@@ -47,10 +106,16 @@ __all__ = [
     "generate_rfc_persona_fisica",
     "generate_rfc_persona_moral",
     "validate_rfc",
+    "validate_rfc_batch",
+    "validate_rfc_many",
     "detect_rfc_type",
     "is_valid_rfc",
     "generate_curp",
     "validate_curp",
     "get_curp_info",
     "is_valid_curp",
+    # Catalog warm-up and read-only views
+    "preload",
+    "read_only",
+    "set_read_only",
 ]
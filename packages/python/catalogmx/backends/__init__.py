@@ -0,0 +1,18 @@
+"""
+Alternative storage backends for catalogmx
+==========================================
+
+Opt-in backends that serve the large catalogs from a prebuilt database
+instead of parsing each catalog's own JSON or SQLite file.
+"""
+
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .sqlite import UnifiedBackend
+
+__getattr__, __dir__ = lazy_exports(__name__, {"UnifiedBackend": ".sqlite"})
+
+__all__ = ["UnifiedBackend"]
@@ -0,0 +1,382 @@
+"""
+Unified SQLite backend for catalogmx
+====================================
+
+Serves the large catalogs from the single ``mexico.sqlite3`` file produced by
+``packages/shared-data/build_unified_sqlite.py`` through indexed queries.
+
+Nothing is parsed at startup: every process opens the same file read-only and
+memory-mapped (see ``catalogmx.utils.sqlite``), so pre-forked workers share the
+OS page cache instead of each holding its own copy of the catalogs.
+
+The backend is opt-in. Each catalog is exposed as an attribute with the same
+method names as its in-memory counterpart:
+
+- ``codigos_postales``: ``CodigosPostales`` (tables ``codigos_postales`` and
+  ``codigos_postales_fts``)
+- ``localidades``: ``LocalidadesCatalog`` (tables ``localidades`` and
+  ``localidades_fts``)
+- ``municipios``: ``MunicipiosCompletoCatalog`` (tables ``municipios_completo``
+  and ``municipios_completo_fts``)
+- ``clave_prod_serv``: ``ClaveProdServCatalog`` (tables ``clave_prod_serv`` and
+  ``clave_prod_serv_fts``)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from catalogmx.catalogs.sat.cfdi_4.clave_prod_serv import ClaveProdServCatalog
+from catalogmx.registry import data_path
+from catalogmx.utils.geo import KM_PER_DEGREE, _lon_span_deg, haversine_km
+from catalogmx.utils.sqlite import SQLiteConnectionPool, fts_prefix_query
+from catalogmx.utils.text import normalize_text
+
+DEFAULT_PATH = data_path("mexico.sqlite3")
+
+
+class _TableQueries:
+    """Base class for the per-catalog query objects of a UnifiedBackend."""
+
+    table = ""
+
+    def __init__(self, backend: UnifiedBackend) -> None:
+        self._backend = backend
+        # Distinct values of a column keyed by their normalized form, per column
+        self._names: dict[str, dict[str, list[str]]] = {}
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict]:
+        rows = self._backend.connection().execute(sql, params)
+        return [dict(row) for row in rows]
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> sqlite3.Row | None:
+        row: sqlite3.Row | None = self._backend.connection().execute(sql, params).fetchone()
+        return row
+
+    def _count(self, sql: str, params: tuple = ()) -> int:
+        count: int = self._backend.connection().execute(sql, params).fetchone()[0]
+        return count
+
+    def _exists(self, column: str, value: str) -> bool:
+        sql = f"SELECT 1 FROM {self.table} WHERE {column} = ? LIMIT 1"
+        return self._fetchone(sql, (value,)) is not None
+
+    def _where_normalized(self, column: str, text: str) -> list[dict]:
+        """
+        Rows whose column equals text, ignoring accents and case.
+
+        The distinct values of the column are read once (an index scan), so the
+        lookup itself is an indexed ``IN`` query.
+        """
+        names = self._names.get(column)
+        if names is None:
+            names = {}
+            rows = self._backend.connection().execute(
+                f"SELECT DISTINCT {column} FROM {self.table} WHERE {column} IS NOT NULL"
+            )
+            for (value,) in rows:
+                names.setdefault(normalize_text(value), []).append(value)
+            self._names[column] = names
+        values = names.get(normalize_text(text))
+        if not values:
+            return []
+        placeholders = ", ".join("?" for _ in values)
+        return self._query(
+            f"SELECT * FROM {self.table} WHERE {column} IN ({placeholders}) ORDER BY rowid",
+            tuple(values),
+        )
+
+    def _search_words(self, column: str, text: str) -> list[dict]:
+        """
+        Rows with words in column starting with every word of text, ignoring accents and case.
+
+        Uses the ``<table>_fts`` index of build_unified_sqlite.py (tokenizer
+        ``unicode61 remove_diacritics 2``) restricted to the column.
+        """
+        query = fts_prefix_query(text)
+        if not query:
+            return []
+        fts = f"{self.table}_fts"
+        return self._query(
+            f"SELECT t.* FROM {fts} JOIN {self.table} t ON t.rowid = {fts}.rowid "
+            f"WHERE {fts} MATCH ? ORDER BY t.rowid",
+            (f"{column} : ({query})",),
+        )
+
+    def get_all(self) -> list[dict]:
+        """Returns every row of the catalog, in catalog order."""
+        return self._query(f"SELECT * FROM {self.table} ORDER BY rowid")
+
+    def get_total_count(self) -> int:
+        """Returns the number of rows in the catalog."""
+        return self._count(f"SELECT COUNT(*) FROM {self.table}")
+
+
+class CodigosPostalesQueries(_TableQueries):
+    """SEPOMEX postal codes served from the unified database."""
+
+    table = "codigos_postales"
+
+    def get_by_cp(self, cp: str) -> list[dict]:
+        """Returns every settlement of a postal code."""
+        return self._query("SELECT * FROM codigos_postales WHERE cp = ? ORDER BY rowid", (cp,))
+
+    def is_valid(self, cp: str) -> bool:
+        """Checks whether a postal code exists."""
+        return self._exists("cp", cp)
+
+    def get_by_estado(self, estado: str) -> list[dict]:
+        """Returns the settlements of a state (accent-insensitive)."""
+        return self._where_normalized("estado", estado)
+
+    def get_by_municipio(self, municipio: str) -> list[dict]:
+        """Returns the settlements of a municipality (accent-insensitive)."""
+        return self._where_normalized("municipio", municipio)
+
+    def get_cps_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Returns the postal codes starting with a prefix, in ascending order.
+
+        Args:
+            prefix: Prefix of 1 to 5 digits (e.g. "0670")
+            limit: Maximum number of postal codes (None for all)
+        """
+        if not prefix.isdigit() or len(prefix) > 5:
+            return []
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = self._backend.connection().execute(
+            "SELECT DISTINCT cp FROM codigos_postales WHERE cp >= ? AND cp < ? "
+            "ORDER BY cp LIMIT ?",
+            (prefix, upper, -1 if limit is None else limit),
+        )
+        return [row[0] for row in rows]
+
+    def get_by_prefix(self, prefix: str, limit: int | None = None) -> list[dict]:
+        """Returns the settlements of the postal codes starting with a prefix."""
+        cps = self.get_cps_by_prefix(prefix, limit)
+        if not cps:
+            return []
+        placeholders = ", ".join("?" for _ in cps)
+        return self._query(
+            f"SELECT * FROM codigos_postales WHERE cp IN ({placeholders}) ORDER BY cp, rowid",
+            tuple(cps),
+        )
+
+    def search_by_colonia(self, colonia: str) -> list[dict]:
+        """Searches settlements by the beginning of their words (accent-insensitive)."""
+        return self._search_words("asentamiento", colonia)
+
+    def get_municipio(self, cp: str) -> str | None:
+        """Returns the municipality of a postal code."""
+        row = self._fetchone("SELECT municipio FROM codigos_postales WHERE cp = ? LIMIT 1", (cp,))
+        return row[0] if row else None
+
+    def get_estado(self, cp: str) -> str | None:
+        """Returns the state of a postal code."""
+        row = self._fetchone("SELECT estado FROM codigos_postales WHERE cp = ? LIMIT 1", (cp,))
+        return row[0] if row else None
+
+
+class LocalidadesQueries(_TableQueries):
+    """INEGI localities served from the unified database."""
+
+    table = "localidades"
+
+    def get_localidad(self, cvegeo: str) -> dict | None:
+        """Returns a locality by its geostatistical key (CVEGEO)."""
+        rows = self._query("SELECT * FROM localidades WHERE cvegeo = ? LIMIT 1", (cvegeo,))
+        return rows[0] if rows else None
+
+    def is_valid(self, cvegeo: str) -> bool:
+        """Checks whether a CVEGEO exists."""
+        return self._exists("cvegeo", cvegeo)
+
+    def get_by_municipio(self, cve_municipio: str) -> list[dict]:
+        """Returns the localities of a municipality code (e.g. "001")."""
+        return self._query(
+            "SELECT * FROM localidades WHERE cve_municipio = ? ORDER BY rowid", (cve_municipio,)
+        )
+
+    def get_by_entidad(self, cve_entidad: str) -> list[dict]:
+        """Returns the localities of a state code (e.g. "01")."""
+        return self._query(
+            "SELECT * FROM localidades WHERE cve_entidad = ? ORDER BY rowid",
+            (cve_entidad.zfill(2),),
+        )
+
+    def get_urbanas(self) -> list[dict]:
+        """Returns urban localities only."""
+        return self._query("SELECT * FROM localidades WHERE ambito = 'U' ORDER BY rowid")
+
+    def get_rurales(self) -> list[dict]:
+        """Returns rural localities only."""
+        return self._query("SELECT * FROM localidades WHERE ambito = 'R' ORDER BY rowid")
+
+    def search_by_name(self, nombre: str) -> list[dict]:
+        """Searches localities by the beginning of their words (accent-insensitive)."""
+        return self._search_words("nom_localidad", nombre)
+
+    def get_by_coordinates(self, lat: float, lon: float, radio_km: float = 10) -> list[dict]:
+        """
+        Returns the localities within a radius, closest first.
+
+        Candidates come from a bounding-box query on latitude and longitude;
+        haversine is only computed for those.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            radio_km: Search radius in kilometers (default: 10)
+
+        Returns:
+            Localities with an added "distancia_km", ordered by distance
+        """
+        lat_span = radio_km / KM_PER_DEGREE
+        lon_span = _lon_span_deg(lat, radio_km)
+        rows = self._query(
+            "SELECT * FROM localidades "
+            "WHERE latitud BETWEEN ? AND ? AND longitud BETWEEN ? AND ? ORDER BY rowid",
+            (lat - lat_span, lat + lat_span, lon - lon_span, lon + lon_span),
+        )
+        resultados = []
+        for row in rows:
+            distancia = haversine_km(lat, lon, row["latitud"], row["longitud"])
+            if distancia <= radio_km:
+                row["distancia_km"] = round(distancia, 2)
+                resultados.append(row)
+        resultados.sort(key=lambda x: x["distancia_km"])
+        return resultados
+
+    def get_by_population_range(self, min_pob: int, max_pob: int | None = None) -> list[dict]:
+        """Returns the localities whose population is within a range."""
+        if max_pob is None:
+            return self._query(
+                "SELECT * FROM localidades WHERE poblacion_total >= ? ORDER BY rowid", (min_pob,)
+            )
+        return self._query(
+            "SELECT * FROM localidades WHERE poblacion_total BETWEEN ? AND ? ORDER BY rowid",
+            (min_pob, max_pob),
+        )
+
+
+class MunicipiosQueries(_TableQueries):
+    """INEGI municipalities (complete catalog) served from the unified database."""
+
+    table = "municipios_completo"
+
+    def get_municipio(self, cve_completa: str) -> dict | None:
+        """Returns a municipality by its 5-digit code (e.g. "14039")."""
+        rows = self._query(
+            "SELECT * FROM municipios_completo WHERE cve_completa = ? LIMIT 1", (cve_completa,)
+        )
+        return rows[0] if rows else None
+
+    def is_valid(self, cve_completa: str) -> bool:
+        """Checks whether a municipality code exists."""
+        return self._exists("cve_completa", cve_completa)
+
+    def get_by_entidad(self, cve_entidad: str) -> list[dict]:
+        """Returns the municipalities of a state code (e.g. "14")."""
+        return self._query(
+            "SELECT * FROM municipios_completo WHERE cve_entidad = ? ORDER BY rowid",
+            (cve_entidad,),
+        )
+
+    def search_by_name(self, name: str) -> list[dict]:
+        """Searches municipalities by the beginning of their words (accent-insensitive)."""
+        return self._search_words("nom_municipio", name)
+
+    def get_by_state_name(self, state_name: str) -> list[dict]:
+        """Returns the municipalities of a state, by state name (accent-insensitive)."""
+        return self._where_normalized("nom_entidad", state_name)
+
+    def get_count_by_entidad(self, cve_entidad: str) -> int:
+        """Returns the number of municipalities of a state."""
+        sql = "SELECT COUNT(*) FROM municipios_completo WHERE cve_entidad = ?"
+        return self._count(sql, (cve_entidad,))
+
+    def get_estadisticas(self) -> dict[str, int]:
+        """Returns the number of municipalities and states and the total population."""
+        cursor = self._backend.connection().execute(
+            "SELECT COUNT(*), COUNT(DISTINCT cve_entidad), COALESCE(SUM(poblacion_total), 0) "
+            "FROM municipios_completo"
+        )
+        total, estados, poblacion = cursor.fetchone()
+        return {
+            "total_municipios": total,
+            "total_estados": estados,
+            "poblacion_total": poblacion,
+        }
+
+
+class UnifiedBackend:
+    """
+    Read-only query backend over the unified ``mexico.sqlite3`` database.
+
+    Args:
+        path: Database file (default: ``packages/shared-data/mexico.sqlite3``)
+
+    Example:
+        >>> backend = UnifiedBackend()
+        >>> backend.codigos_postales.get_by_cp("06700")
+        >>> backend.localidades.get_by_coordinates(21.88, -102.29, radio_km=5)
+        >>> backend.municipios.get_municipio("14039")
+        >>> backend.clave_prod_serv.search("computadora", ranked=True)
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else DEFAULT_PATH
+        self.pool = SQLiteConnectionPool(lambda: self.path)
+        self.codigos_postales = CodigosPostalesQueries(self)
+        self.localidades = LocalidadesQueries(self)
+        self.municipios = MunicipiosQueries(self)
+        self.clave_prod_serv = self._bind_clave_prod_serv()
+
+    def _bind_clave_prod_serv(self) -> type[ClaveProdServCatalog]:
+        """
+        ClaveProdServCatalog subclass reading from this backend's database.
+
+        The catalog is already SQLite-backed, so it is reused as is with its
+        pool and path pointed at the unified file and its caches reset.
+        """
+        return type(
+            "ClaveProdServCatalog",
+            (ClaveProdServCatalog,),
+            {
+                "__module__": __name__,
+                "_db_path": self.path,
+                "_pool": self.pool,
+                "_jerarquia": None,
+                "_memory_index": None,
+                "_memory_rows": None,
+                "_valid_index": None,
+            },
+        )
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's read-only connection.
+
+        Raises:
+            FileNotFoundError: If the database file does not exist
+        """
+        return self.pool.get_connection()
+
+    def tables(self) -> set[str]:
+        """Returns the names of the tables available in the database."""
+        rows = self.connection().execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        return {row[0] for row in rows}
+
+    def close(self) -> None:
+        """Closes every connection opened by this backend."""
+        self.pool.close_all()
+
+
+__all__ = [
+    "CodigosPostalesQueries",
+    "DEFAULT_PATH",
+    "LocalidadesQueries",
+    "MunicipiosQueries",
+    "UnifiedBackend",
+]
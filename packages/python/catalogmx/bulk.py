@@ -0,0 +1,475 @@
+"""
+Streaming bulk validation of tabular files.
+
+Reads CSV, JSONL or Parquet files in fixed-size chunks, validates the requested
+columns (RFC, CURP, CLABE, NSS, código postal) column-by-column and writes an
+annotated copy of every row with one ``<column>_valid`` flag per checked column.
+
+Memory stays bounded by ``chunk_size * (workers + 2)`` rows regardless of the file
+size. With ``workers > 1`` chunks are sharded across a process pool; only the
+columns being validated are sent to the workers, the rows stay in the parent.
+
+Example:
+    >>> from catalogmx.bulk import validate_file
+    >>> stats = validate_file(
+    ...     "facturas.csv", "facturas_validadas.csv",
+    ...     columns={"rfc_emisor": "rfc", "rfc_receptor": "rfc"},
+    ... )
+    >>> stats.rows, stats.invalid
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO, cast
+
+from .helpers import validate_curp, validate_rfc_batch
+from .validators.clabe import validate_clabe
+from .validators.nss import validate_nss
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _as_text(value: Any) -> str:
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _validate_rfc_column(values: list) -> list[bool]:
+    return validate_rfc_batch([_as_text(v) for v in values])
+
+
+def _validate_curp_column(values: list) -> list[bool]:
+    return [validate_curp(_as_text(v)) for v in values]
+
+
+def _validate_clabe_column(values: list) -> list[bool]:
+    return [validate_clabe(_as_text(v)) for v in values]
+
+
+def _validate_nss_column(values: list) -> list[bool]:
+    return [validate_nss(_as_text(v)) for v in values]
+
+
+def _validate_cp_column(values: list) -> list[bool]:
+    from .catalogs.sepomex import CodigosPostales
+
+    # Numeric columns (JSON/Parquet) lose the leading zero of CDMX codes
+    return [
+        CodigosPostales.is_valid(str(v).zfill(5) if isinstance(v, int) else _as_text(v).strip())
+        for v in values
+    ]
+
+
+COLUMN_VALIDATORS: dict[str, Callable[[list], list[bool]]] = {
+    "rfc": _validate_rfc_column,
+    "curp": _validate_curp_column,
+    "clabe": _validate_clabe_column,
+    "nss": _validate_nss_column,
+    "cp": _validate_cp_column,
+}
+
+
+def validate_columns(columns: dict[str, list], kinds: dict[str, str]) -> dict[str, list[bool]]:
+    """
+    Validates whole columns at once.
+
+    Args:
+        columns: Column name -> list of values
+        kinds: Column name -> validator kind ("rfc", "curp", "clabe", "nss", "cp")
+
+    Returns:
+        Column name -> list of validity flags
+    """
+    return {name: COLUMN_VALIDATORS[kinds[name]](values) for name, values in columns.items()}
+
+
+@dataclass
+class ValidationStats:
+    """Throughput and result counters for a validate_file run."""
+
+    rows: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    invalid: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"rows: {self.rows:,}  chunks: {self.chunks:,}  "
+            f"elapsed: {self.elapsed:.2f}s  throughput: {self.rows_per_second:,.0f} rows/s"
+        ]
+        for name, count in self.invalid.items():
+            lines.append(f"  {name}: {count:,} invalid")
+        return "\n".join(lines)
+
+
+def detect_format(path: str | Path) -> str:
+    """Infers the file format from its extension (``.csv``, ``.jsonl``/``.ndjson``, ``.parquet``)."""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    return "csv"
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet support requires pyarrow: pip install pyarrow") from exc
+    return pq
+
+
+# ----------------------------------------------------------------------------
+# Readers: yield (columns to validate, format-specific chunk payload)
+# ----------------------------------------------------------------------------
+
+
+def _read_csv(
+    path: str | Path, names: list[str], chunk_size: int
+) -> Iterator[tuple[dict[str, list], Any]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [name for name in names if name not in header]
+        if missing:
+            raise KeyError(f"Columns not found in {path}: {', '.join(missing)}")
+        indexes = {name: header.index(name) for name in names}
+        while True:
+            rows = [row for _, row in zip(range(chunk_size), reader, strict=False)]
+            if not rows:
+                return
+            columns = {
+                name: [row[i] if i < len(row) else "" for row in rows]
+                for name, i in indexes.items()
+            }
+            yield columns, (header, rows)
+
+
+def _read_jsonl(
+    path: str | Path, names: list[str], chunk_size: int
+) -> Iterator[tuple[dict[str, list], Any]]:
+    with open(path, encoding="utf-8") as f:
+        lines = (line for line in f if line.strip())
+        while True:
+            records = [json.loads(line) for _, line in zip(range(chunk_size), lines, strict=False)]
+            if not records:
+                return
+            columns = {name: [record.get(name) for record in records] for name in names}
+            yield columns, records
+
+
+def _jsonl_fields(path: str | Path) -> list[str]:
+    """Union of the keys of every record, in order of first appearance."""
+    fields: dict[str, None] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                fields.update(dict.fromkeys(json.loads(line)))
+    return list(fields)
+
+
+def _read_parquet(
+    path: str | Path, names: list[str], chunk_size: int
+) -> Iterator[tuple[dict[str, list], Any]]:
+    pq = _require_pyarrow()
+    parquet = pq.ParquetFile(str(path))
+    missing = [name for name in names if name not in parquet.schema_arrow.names]
+    if missing:
+        raise KeyError(f"Columns not found in {path}: {', '.join(missing)}")
+    for batch in parquet.iter_batches(batch_size=chunk_size):
+        columns = {name: batch.column(name).to_pylist() for name in names}
+        yield columns, batch
+
+
+# ----------------------------------------------------------------------------
+# Writers: receive the chunk payload plus the validity flags. ``fields`` is
+# the output column list for JSONL input (the union of the keys of all records)
+# ----------------------------------------------------------------------------
+
+
+def _check_flag_names(fields: Iterable[str], flag_names: list[str]) -> None:
+    """Refuses to overwrite input columns that already use a ``<column>_valid`` name."""
+    taken = [name for name in flag_names if name in fields]
+    if taken:
+        raise ValueError(f"Input already has column(s): {', '.join(taken)}")
+
+
+def _fit(row: list, width: int) -> list:
+    """Pads a ragged CSV row with empty strings, or trims it, to ``width`` cells."""
+    if len(row) == width:
+        return row
+    return row[:width] + [""] * (width - len(row))
+
+
+class _CSVWriter:
+    def __init__(
+        self, stream: TextIO, flag_names: list[str], fields: list[str] | None = None
+    ) -> None:
+        self._writer = csv.writer(stream)
+        self._flag_names = flag_names
+        self._fields = fields
+        self._header: list[str] | None = None
+
+    def write(self, payload: Any, flags: dict[str, list[bool]], keep: list[int] | None) -> None:
+        if isinstance(payload, tuple):
+            header, rows = payload
+            rows = [_fit(row, len(header)) for row in rows]
+        elif isinstance(payload, list):
+            header = self._fields if self._fields is not None else list(payload[0])
+            rows = [[record.get(k) for k in header] for record in payload]
+        else:
+            header = payload.schema.names
+            rows = [list(record.values()) for record in payload.to_pylist()]
+        if self._header is None:
+            _check_flag_names(header, self._flag_names)
+            self._header = list(header)
+            self._writer.writerow(self._header + self._flag_names)
+        columns = list(flags.values())
+        positions = range(len(rows)) if keep is None else keep
+        self._writer.writerows(
+            list(rows[i]) + ["true" if col[i] else "false" for col in columns] for i in positions
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class _JSONLWriter:
+    def __init__(
+        self, stream: TextIO, flag_names: list[str], fields: list[str] | None = None
+    ) -> None:
+        self._stream = stream
+        self._flag_names = flag_names
+
+    def write(self, payload: Any, flags: dict[str, list[bool]], keep: list[int] | None) -> None:
+        if isinstance(payload, tuple):
+            header, rows = payload
+            records = [dict(zip(header, row, strict=False)) for row in rows]
+        elif isinstance(payload, list):
+            records = payload
+        else:
+            records = payload.to_pylist()
+        pairs = list(zip(self._flag_names, flags.values(), strict=True))
+        positions = range(len(records)) if keep is None else keep
+        dumps = json.dumps
+        for i in positions:
+            record = records[i]
+            for flag_name, column in pairs:
+                if flag_name in record:
+                    raise ValueError(f"Input already has column(s): {flag_name}")
+                record[flag_name] = column[i]
+            self._stream.write(dumps(record, ensure_ascii=False, default=str))
+            self._stream.write("\n")
+
+    def close(self) -> None:
+        pass
+
+
+class _ParquetWriter:
+    def __init__(self, path: str | Path, flag_names: list[str], fields: list[str] | None = None):
+        self._pq = _require_pyarrow()
+        self._path = str(path)
+        self._flag_names = flag_names
+        self._fields = fields
+        self._writer: Any = None
+
+    def write(self, payload: Any, flags: dict[str, list[bool]], keep: list[int] | None) -> None:
+        import pyarrow as pa
+
+        data: dict[str, list]
+        if isinstance(payload, tuple):
+            header, rows = payload
+            rows = [_fit(row, len(header)) for row in rows]
+            data = {name: [row[i] for row in rows] for i, name in enumerate(header)}
+        elif isinstance(payload, list):
+            fields = self._fields if self._fields is not None else list(payload[0])
+            data = {k: [record.get(k) for record in payload] for k in fields}
+        else:
+            data = payload.to_pydict()
+        if self._writer is None:
+            _check_flag_names(data, self._flag_names)
+        for flag_name, column in zip(self._flag_names, flags.values(), strict=True):
+            data[flag_name] = column
+        table = pa.table(data)
+        if keep is not None:
+            table = table.take(pa.array(keep, type=pa.int64()))
+        if self._writer is None:
+            # A column with no values in the first chunk would be typed null and
+            # reject later values; store it as text instead
+            schema = pa.schema(
+                pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                for f in table.schema
+            )
+            self._writer = self._pq.ParquetWriter(self._path, schema)
+        if table.schema != self._writer.schema:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+# ----------------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------------
+
+
+def _bounded_map(
+    executor: Executor | None,
+    items: Iterator[tuple[dict[str, list], Any]],
+    kinds: dict[str, str],
+    max_pending: int,
+) -> Iterator[tuple[dict[str, list[bool]], Any]]:
+    """Like Executor.map but keeps at most ``max_pending`` chunks in flight, in order."""
+    if executor is None:
+        for columns, payload in items:
+            yield validate_columns(columns, kinds), payload
+        return
+    pending: deque[tuple[Future, Any]] = deque()
+    for columns, payload in items:
+        pending.append((executor.submit(validate_columns, columns, kinds), payload))
+        if len(pending) >= max_pending:
+            future, ready = pending.popleft()
+            yield future.result(), ready
+    while pending:
+        future, ready = pending.popleft()
+        yield future.result(), ready
+
+
+def validate_file(
+    input_path: str | Path,
+    output: str | Path | TextIO | None,
+    columns: dict[str, str],
+    *,
+    input_format: str | None = None,
+    output_format: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    only_invalid: bool = False,
+    progress: Callable[[ValidationStats], None] | None = None,
+) -> ValidationStats:
+    """
+    Streams a file, validates the given columns and writes an annotated copy.
+
+    Args:
+        input_path: CSV, JSONL or Parquet file
+        output: Output path, a text stream, or None/"-" for stdout
+        columns: Column name -> validator kind ("rfc", "curp", "clabe", "nss", "cp")
+        input_format: Force the input format (default: from the extension)
+        output_format: Force the output format (default: from the output extension,
+            or the input format; Parquet to stdout is written as CSV)
+        chunk_size: Rows per chunk
+        workers: Number of worker processes (1 validates in-process)
+        only_invalid: Write only rows with at least one invalid column
+        progress: Optional callback invoked with the running stats after each chunk
+
+    Returns:
+        ValidationStats with row counts, invalid counts per column and throughput
+
+    Raises:
+        ValueError: Unknown validator kind or format, or the input already has
+            a ``<column>_valid`` column
+        KeyError: A column is missing from the input
+    """
+    unknown = sorted(set(columns.values()) - set(COLUMN_VALIDATORS))
+    if unknown:
+        raise ValueError(f"Unknown validator(s): {', '.join(unknown)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    input_format = input_format or detect_format(input_path)
+    to_stdout = output is None or output == "-"
+    out_path = output if isinstance(output, (str, Path)) and not to_stdout else None
+    if output_format is None:
+        if out_path is None:
+            output_format = "csv" if input_format == "parquet" else input_format
+        else:
+            output_format = detect_format(out_path)
+    for fmt in (input_format, output_format):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+    if output_format == "parquet" and out_path is None:
+        raise ValueError("Parquet output requires a file path")
+
+    readers = {"csv": _read_csv, "jsonl": _read_jsonl, "parquet": _read_parquet}
+    names = list(columns)
+    flag_names = [f"{name}_valid" for name in names]
+    chunks = readers[input_format](input_path, names, chunk_size)
+
+    fields = None
+    if input_format == "jsonl" and output_format != "jsonl":
+        # Tabular output needs every column up front, including keys that first
+        # appear in later records; this pass keeps only the key set in memory
+        fields = _jsonl_fields(input_path)
+
+    close_stream = False
+    if output_format == "parquet" and out_path is not None:
+        writer: Any = _ParquetWriter(out_path, flag_names, fields)
+    else:
+        stream: TextIO
+        if out_path is not None:
+            stream = open(out_path, "w", encoding="utf-8", newline="")
+            close_stream = True
+        elif to_stdout:
+            stream = sys.stdout
+        else:
+            stream = cast(TextIO, output)
+        writer = (_CSVWriter if output_format == "csv" else _JSONLWriter)(
+            stream, flag_names, fields
+        )
+
+    stats = ValidationStats(invalid=dict.fromkeys(names, 0))
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    start = time.perf_counter()
+    try:
+        for flags, payload in _bounded_map(executor, chunks, columns, max_pending=workers + 1):
+            flag_columns = list(flags.values())
+            n = len(flag_columns[0]) if flag_columns else 0
+            for name, column in flags.items():
+                stats.invalid[name] += column.count(False)
+            keep = None
+            if only_invalid:
+                keep = [i for i in range(n) if not all(col[i] for col in flag_columns)]
+            writer.write(payload, flags, keep)
+            stats.rows += n
+            stats.chunks += 1
+            stats.elapsed = time.perf_counter() - start
+            if progress is not None:
+                progress(stats)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        writer.close()
+        if close_stream:
+            stream.close()
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+__all__ = [
+    "COLUMN_VALIDATORS",
+    "DEFAULT_CHUNK_SIZE",
+    "ValidationStats",
+    "detect_format",
+    "validate_columns",
+    "validate_file",
+]
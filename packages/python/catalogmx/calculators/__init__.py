@@ -0,0 +1,36 @@
+"""
+Tax and payroll calculators for catalogmx
+=========================================
+
+Calculators built on the SAT tax catalogs in ``shared-data/sat/impuestos``
+and the UMA and minimum-wage catalogs.
+"""
+
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .isr import DIAS_POR_MES, PERIODICIDADES, ISRCalculator, calcular_isr_many
+    from .nomina import TOPE_SBC_UMAS, NominaCalculator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DIAS_POR_MES": ".isr",
+        "PERIODICIDADES": ".isr",
+        "ISRCalculator": ".isr",
+        "calcular_isr_many": ".isr",
+        "TOPE_SBC_UMAS": ".nomina",
+        "NominaCalculator": ".nomina",
+    },
+)
+
+__all__ = [
+    "DIAS_POR_MES",
+    "ISRCalculator",
+    "NominaCalculator",
+    "PERIODICIDADES",
+    "TOPE_SBC_UMAS",
+    "calcular_isr_many",
+]
@@ -0,0 +1,365 @@
+"""
+ISR withholding calculator
+==========================
+
+Income tax (ISR) withholding on wages with the Art. 96 LISR tariffs in
+``shared-data/sat/impuestos/isr_tablas.json``.
+
+The JSON ships monthly tariffs. Other pay periods use the monthly tariff
+scaled the way SAT derives its own tables (Anexo 8 RMF): the daily tariff is
+the monthly one divided by 30.4 and multiplied by the days of the period;
+the bimonthly and annual tariffs are the monthly one times 2 and 12.
+
+Each (year, period) tariff is built once into sorted ``array('d')`` columns
+(lower limits, fixed fee minus the lower limit times the rate, and marginal
+rate), so a withholding is a ``bisect`` plus one multiply-add, and a whole
+payroll can go through ``numpy.searchsorted``.
+"""
+
+import json
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from catalogmx.registry import data_path
+from catalogmx.utils.lazy import is_ndarray, optional_numpy
+
+#: Days per month used by SAT to derive daily tariffs from monthly ones
+DIAS_POR_MES = 30.4
+
+#: Factor applied to the monthly tariff for each pay period
+PERIODICIDADES = {
+    "mensual": 1.0,
+    "quincenal": 15 / DIAS_POR_MES,
+    "catorcenal": 14 / DIAS_POR_MES,
+    "decenal": 10 / DIAS_POR_MES,
+    "semanal": 7 / DIAS_POR_MES,
+    "diario": 1 / DIAS_POR_MES,
+    "bimestral": 2.0,
+    "anual": 12.0,
+}
+
+#: Days of the pay periods whose tariff SAT builds from the daily one (Anexo 8 RMF)
+_DIAS = {"quincenal": 15, "catorcenal": 14, "decenal": 10, "semanal": 7, "diario": 1}
+
+
+def _escala(periodicidad: str) -> Callable[[float], float]:
+    """Scale of the monthly amounts to a pay period, rounded to cents as SAT publishes them."""
+    if periodicidad == "mensual":
+        return lambda value: value
+    dias = _DIAS.get(periodicidad)
+    if dias is None:
+        factor = PERIODICIDADES[periodicidad]
+        return lambda value: round(value * factor, 2)
+    # Anexo 8 divides by 30.4, rounds the daily amount and multiplies it by the days
+    return lambda value: round(round(value / DIAS_POR_MES, 2) * dias, 2)
+
+
+def _limites(
+    tramos: list[dict], scale: Callable[[float], float]
+) -> tuple[list[float], list[float | None]]:
+    """Scaled bracket limits; each lower limit is the previous upper one plus a cent."""
+    superiores = [
+        None if t["limite_superior"] is None else scale(t["limite_superior"]) for t in tramos
+    ]
+    limites = [t["limite_inferior"] for t in tramos[:1]]
+    limites += [round(ls + 0.01, 2) for ls in superiores[:-1] if ls is not None]
+    return limites, superiores
+
+
+class _Tarifa:
+    """Progressive tariff as sorted columns: ISR = base[i] + ingreso * tasa[i]."""
+
+    __slots__ = (
+        "limites",
+        "superiores",
+        "cuotas",
+        "tasas",
+        "bases",
+        "subsidio_limites",
+        "subsidios",
+    )
+
+    def __init__(self, tramos: list[dict], subsidio: list[dict] | None, periodicidad: str) -> None:
+        scale = _escala(periodicidad)
+        tramos = sorted(tramos, key=lambda t: t["limite_inferior"])
+        limites, self.superiores = _limites(tramos, scale)
+        self.limites = array("d", limites)
+        self.cuotas = array("d", [scale(t["cuota_fija"]) for t in tramos])
+        self.tasas = array("d", [t["tasa_excedente"] / 100 for t in tramos])
+        self.bases = array(
+            "d",
+            [c - li * t for c, li, t in zip(self.cuotas, self.limites, self.tasas, strict=True)],
+        )
+        subsidio = sorted(subsidio or [], key=lambda t: t["limite_inferior"])
+        self.subsidio_limites = array("d", _limites(subsidio, scale)[0])
+        self.subsidios = array("d", [scale(t["subsidio"]) for t in subsidio])
+
+    def tramo(self, ingreso: float) -> int:
+        """Position of the bracket of an income, -1 below the first one."""
+        return bisect_right(self.limites, ingreso) - 1
+
+    def subsidio(self, ingreso: float) -> float:
+        i = bisect_right(self.subsidio_limites, ingreso) - 1
+        return self.subsidios[i] if i >= 0 else 0.0
+
+
+class ISRCalculator:
+    """
+    ISR withholding on wages (Art. 96 LISR) for every year in the tariff catalog.
+
+    Example:
+        >>> round(ISRCalculator.calcular_isr(15000, 2025), 2)
+        1552.78
+        >>> ISRCalculator.calcular_isr_many([8000, 15000, 40000], 2025, "quincenal")
+    """
+
+    _tablas: dict[int, dict] | None = None
+    _anios: list[int] = []
+    _subsidios: dict[str, list[dict]] = {}
+    _tarifas: dict[tuple[int | None, str], _Tarifa] = {}
+
+    @classmethod
+    def _get_tablas(cls) -> dict[int, dict]:
+        if cls._tablas is None:
+            with open(data_path("sat/impuestos/isr_tablas.json"), encoding="utf-8") as f:
+                data = json.load(f)
+            cls._subsidios = data.get("subsidio_empleo", {})
+            tablas = {t["año"]: t for t in data["tablas"] if t.get("periodicidad") == "mensual"}
+            cls._anios = sorted(tablas)
+            cls._tablas = tablas
+        return cls._tablas
+
+    @classmethod
+    def _get_tarifa(cls, anio: int | None, periodicidad: str) -> _Tarifa:
+        tarifa = cls._tarifas.get((anio, periodicidad))
+        if tarifa is None:
+            if periodicidad not in PERIODICIDADES:
+                raise ValueError(
+                    f"Unknown periodicidad {periodicidad!r}; "
+                    f"expected one of {tuple(PERIODICIDADES)}"
+                )
+            vigente = cls.get_anio_vigente(anio)
+            tarifa = cls._tarifas.get((vigente, periodicidad))
+            if tarifa is None:
+                tabla = cls._get_tablas()[vigente]
+                tabla_subsidio = cls._subsidios.get(str(vigente))
+                tarifa = _Tarifa(tabla["tramos"], tabla_subsidio, periodicidad)
+                cls._tarifas[(vigente, periodicidad)] = tarifa
+            cls._tarifas[(anio, periodicidad)] = tarifa
+        return tarifa
+
+    @classmethod
+    def get_anios_disponibles(cls) -> list[int]:
+        """Years with a tariff, newest first."""
+        cls._get_tablas()
+        return cls._anios[::-1]
+
+    @classmethod
+    def get_anio_vigente(cls, anio: int | None = None) -> int:
+        """
+        Year of the tariff in force in a year.
+
+        A tariff stays in force until SAT publishes a new one, so a year
+        without a tariff of its own uses the latest one published before it.
+
+        Args:
+            anio: Calendar year (default: the latest tariff in the catalog)
+
+        Raises:
+            ValueError: If the year is before the first tariff
+        """
+        cls._get_tablas()
+        if anio is None:
+            return cls._anios[-1]
+        i = bisect_right(cls._anios, anio)
+        if i == 0:
+            raise ValueError(f"No ISR tariff for year {anio}")
+        return cls._anios[i - 1]
+
+    @classmethod
+    def get_tabla(cls, anio: int, periodicidad: str = "mensual") -> list[dict]:
+        """
+        Brackets of a year's tariff for a pay period.
+
+        Args:
+            anio: Fiscal year
+            periodicidad: Pay period (see ``PERIODICIDADES``)
+
+        Returns:
+            list[dict]: Brackets with limite_inferior, limite_superior, cuota_fija
+            and tasa_excedente (percent)
+
+        Raises:
+            ValueError: If there is no tariff for the year or the period is unknown
+        """
+        tarifa = cls._get_tarifa(anio, periodicidad)
+        return [
+            {
+                "limite_inferior": li,
+                "limite_superior": ls,
+                "cuota_fija": c,
+                "tasa_excedente": round(t * 100, 4),
+            }
+            for li, ls, c, t in zip(
+                tarifa.limites, tarifa.superiores, tarifa.cuotas, tarifa.tasas, strict=True
+            )
+        ]
+
+    @classmethod
+    def calcular(
+        cls,
+        ingreso: float,
+        anio: int | None = None,
+        periodicidad: str = "mensual",
+        aplicar_subsidio: bool = False,
+    ) -> dict[str, float]:
+        """
+        Detailed ISR withholding for a taxable income.
+
+        Args:
+            ingreso: Taxable income of the period
+            anio: Fiscal year (default: latest tariff; see ``get_anio_vigente``)
+            periodicidad: Pay period (see ``PERIODICIDADES``)
+            aplicar_subsidio: Subtract the employment subsidy (subsidio al empleo)
+
+        Returns:
+            dict: ingreso_gravable, limite_inferior, excedente, cuota_fija,
+            impuesto_marginal, isr_causado, tasa_efectiva (percent),
+            subsidio_empleo and isr_a_retener
+
+        Raises:
+            ValueError: If there is no tariff for the year or the period is unknown
+        """
+        tarifa = cls._get_tarifa(anio, periodicidad)
+        i = tarifa.tramo(ingreso)
+        if i < 0:
+            limite, cuota, tasa = 0.0, 0.0, 0.0
+        else:
+            limite, cuota, tasa = tarifa.limites[i], tarifa.cuotas[i], tarifa.tasas[i]
+        excedente = max(0.0, ingreso - limite)
+        impuesto_marginal = excedente * tasa
+        isr_causado = cuota + impuesto_marginal
+        subsidio = tarifa.subsidio(ingreso) if aplicar_subsidio else 0.0
+        isr_a_retener = max(0.0, isr_causado - subsidio)
+        return {
+            "ingreso_gravable": ingreso,
+            "limite_inferior": limite,
+            "excedente": excedente,
+            "cuota_fija": cuota,
+            "impuesto_marginal": impuesto_marginal,
+            "isr_causado": isr_causado,
+            "tasa_efectiva": isr_a_retener / ingreso * 100 if ingreso > 0 else 0.0,
+            "subsidio_empleo": subsidio,
+            "isr_a_retener": isr_a_retener,
+        }
+
+    @classmethod
+    def calcular_isr(
+        cls,
+        ingreso: float,
+        anio: int | None = None,
+        periodicidad: str = "mensual",
+        aplicar_subsidio: bool = False,
+    ) -> float:
+        """ISR to withhold for a taxable income (``calcular(...)["isr_a_retener"]``)."""
+        tarifa = cls._get_tarifa(anio, periodicidad)
+        i = tarifa.tramo(ingreso)
+        isr = tarifa.bases[i] + ingreso * tarifa.tasas[i] if i >= 0 else 0.0
+        if aplicar_subsidio:
+            isr -= tarifa.subsidio(ingreso)
+        return max(0.0, isr)
+
+    @classmethod
+    def calcular_isr_many(
+        cls,
+        ingresos: Iterable[float],
+        anio: int | None = None,
+        periodicidad: str = "mensual",
+        aplicar_subsidio: bool = False,
+    ) -> Any:
+        """
+        ISR to withhold for many incomes of the same year and pay period.
+
+        The tariff is resolved once for the whole batch. NumPy arrays are
+        processed with ``numpy.searchsorted``; other iterables with bisect.
+
+        Args:
+            ingresos: Taxable incomes (list, iterable or NumPy array)
+            anio: Fiscal year (default: latest tariff; see ``get_anio_vigente``)
+            periodicidad: Pay period (see ``PERIODICIDADES``)
+            aplicar_subsidio: Subtract the employment subsidy
+
+        Returns:
+            ISR per income: a NumPy float64 array for NumPy input, a list otherwise
+
+        Raises:
+            ValueError: If there is no tariff for the year or the period is unknown
+        """
+        tarifa = cls._get_tarifa(anio, periodicidad)
+
+        if is_ndarray(ingresos):
+            np = optional_numpy()
+            montos = ingresos.astype(np.float64, copy=False)
+            idx = np.searchsorted(np.frombuffer(tarifa.limites), montos, side="right") - 1
+            dentro = idx >= 0
+            idx = np.maximum(idx, 0)
+            isr_np = np.where(
+                dentro,
+                np.frombuffer(tarifa.bases)[idx] + montos * np.frombuffer(tarifa.tasas)[idx],
+                0.0,
+            )
+            if aplicar_subsidio and len(tarifa.subsidios):
+                j = np.searchsorted(np.frombuffer(tarifa.subsidio_limites), montos, side="right")
+                subsidios = np.concatenate(([0.0], np.frombuffer(tarifa.subsidios)))
+                isr_np -= subsidios[j]
+            return np.maximum(isr_np, 0.0)
+
+        limites, bases, tasas = tarifa.limites, tarifa.bases, tarifa.tasas
+        result = []
+        for ingreso in ingresos:
+            i = bisect_right(limites, ingreso) - 1
+            isr = bases[i] + ingreso * tasas[i] if i >= 0 else 0.0
+            if aplicar_subsidio:
+                isr -= tarifa.subsidio(ingreso)
+            result.append(isr if isr > 0.0 else 0.0)
+        return result
+
+    @classmethod
+    def calcular_salario_neto(
+        cls,
+        salario_bruto: float,
+        anio: int | None = None,
+        periodicidad: str = "mensual",
+        aplicar_subsidio: bool = True,
+    ) -> float:
+        """Gross salary minus the ISR withheld on it."""
+        return salario_bruto - cls.calcular_isr(salario_bruto, anio, periodicidad, aplicar_subsidio)
+
+    @classmethod
+    def calcular_tasa_marginal(
+        cls, ingreso: float, anio: int | None = None, periodicidad: str = "mensual"
+    ) -> float:
+        """Marginal rate (percent) of the bracket of an income."""
+        tarifa = cls._get_tarifa(anio, periodicidad)
+        i = tarifa.tramo(ingreso)
+        return round(tarifa.tasas[i] * 100, 4) if i >= 0 else 0.0
+
+
+def calcular_isr_many(
+    ingresos: Iterable[float],
+    anio: int | None = None,
+    periodicidad: str = "mensual",
+    aplicar_subsidio: bool = False,
+) -> Any:
+    """
+    ISR to withhold for a whole payroll run (see ``ISRCalculator.calcular_isr_many``).
+
+    Example:
+        >>> calcular_isr_many([8000, 15000, 40000], 2025)
+    """
+    return ISRCalculator.calcular_isr_many(ingresos, anio, periodicidad, aplicar_subsidio)
+
+
+__all__ = ["DIAS_POR_MES", "ISRCalculator", "PERIODICIDADES", "calcular_isr_many"]
@@ -0,0 +1,301 @@
+"""
+Payroll (nómina) calculator
+===========================
+
+Computes a whole payroll run at once from columns of employee data: ISR
+withholding, minimum-wage compliance, the IMSS contribution base (salario
+base de cotización, SBC) with its 25 UMA cap, and the work-risk premium.
+
+Every parameter that depends on the payment date (UMA, minimum wages, ISR
+tariff of the year) is resolved once per distinct date, and ISR runs once
+per (year, pay period) group through ``ISRCalculator.calcular_isr_many``.
+NumPy arrays are processed with array arithmetic; other sequences in a
+single Python pass.
+
+Parameter sources:
+
+- Pay periods and days: ``PeriodicidadPagoCatalog`` (c_PeriodicidadPago).
+- Work-risk premium: ``RiesgoPuestoCatalog`` (prima media of the class).
+- UMA: ``UMACatalog``, in force from its ``vigencia_inicio`` (February 1st
+  since 2017); earlier dates use the minimum-wage equivalent.
+- Minimum wages: ``SalariosMinimos`` (nominal daily wages, general zone and
+  northern border zone).
+"""
+
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, cast
+
+from catalogmx.calculators.isr import PERIODICIDADES, ISRCalculator
+from catalogmx.catalogs.mexico import SalariosMinimos, UMACatalog
+from catalogmx.catalogs.sat.nomina import PeriodicidadPagoCatalog, RiesgoPuestoCatalog
+from catalogmx.utils.lazy import is_ndarray, optional_numpy
+from catalogmx.utils.timeseries import TimeSeries, to_ordinals
+
+#: SBC cap in UMAs (Art. 28 LSS)
+TOPE_SBC_UMAS = 25
+
+
+def _columna(value: Any, n: int, name: str) -> Sequence[Any]:
+    """A column of n values; strings, bools, numbers and None are repeated."""
+    if value is None or isinstance(value, (str, bool, int, float, date)):
+        return [value] * n
+    if len(value) != n:
+        raise ValueError(f"{name} must have the same length as salarios")
+    return cast(Sequence[Any], value)
+
+
+class _Parametros:
+    """Catalog data used by every payroll run, loaded once."""
+
+    __slots__ = ("periodicidades", "primas", "uma", "salario_general", "salario_frontera")
+
+    def __init__(self) -> None:
+        periodicidades = {}
+        for item in PeriodicidadPagoCatalog.get_all():
+            nombre = item["descripcion"].lower()
+            if item.get("days") and nombre in PERIODICIDADES:
+                periodicidades[item["code"]] = periodicidades[nombre] = (item["days"], nombre)
+        self.periodicidades: dict[str, tuple[int, str]] = periodicidades
+        self.primas: dict[str, float] = {
+            item["code"]: item["prima_media"] for item in RiesgoPuestoCatalog.get_all()
+        }
+
+        salarios = SalariosMinimos.get_data()
+        uma = [
+            {"fecha": r["vigencia_inicio"], "valor": r["valor_diario"]}
+            for r in UMACatalog.get_data()
+        ]
+        inicio_uma = min((r["fecha"] for r in uma), default="9999-12-31")
+        # Before the first UMA, the reference unit was the minimum wage
+        uma += [
+            {"fecha": r["vigencia_inicio"], "valor": r.get("uma_equivalente_diario")}
+            for r in salarios
+            if r["vigencia_inicio"] < inicio_uma
+        ]
+        self.uma = TimeSeries(uma, value_field="valor")
+        self.salario_general = TimeSeries(
+            [
+                {
+                    "fecha": r["vigencia_inicio"],
+                    "valor": r.get("resto_pais") or r.get("zona_general") or r.get("zona_b"),
+                }
+                for r in salarios
+            ],
+            value_field="valor",
+        )
+        self.salario_frontera = TimeSeries(
+            [
+                {
+                    "fecha": r["vigencia_inicio"],
+                    "valor": (
+                        r.get("zona_frontera_norte") or r.get("zona_general") or r.get("zona_a")
+                    ),
+                }
+                for r in salarios
+            ],
+            value_field="valor",
+        )
+
+
+class NominaCalculator:
+    """
+    Vectorized payroll computation over columns of employees.
+
+    Example:
+        >>> lote = NominaCalculator.calcular_lote(
+        ...     salarios=[9000, 25000, 180000],
+        ...     periodicidades="04",                # quincenal, for every employee
+        ...     fechas_pago="2025-03-15",
+        ...     riesgos=["1", "1", "2"],
+        ... )
+        >>> lote["isr"], lote["sbc"], lote["cumple_salario_minimo"]
+    """
+
+    _parametros: _Parametros | None = None
+
+    @classmethod
+    def _get_parametros(cls) -> _Parametros:
+        if cls._parametros is None:
+            cls._parametros = _Parametros()
+        return cls._parametros
+
+    @classmethod
+    def _periodicidad(cls, periodicidad: str) -> tuple[int, str]:
+        periodicidades = cls._get_parametros().periodicidades
+        resolved = periodicidades.get(str(periodicidad).lower())
+        if resolved is None:
+            raise ValueError(
+                f"Unsupported periodicidad {periodicidad!r}; expected one of "
+                f"{sorted(periodicidades)}"
+            )
+        return resolved
+
+    @classmethod
+    def calcular_lote(
+        cls,
+        salarios: Any,
+        periodicidades: str | Sequence[str],
+        fechas_pago: Any,
+        riesgos: str | Sequence[str] | None = None,
+        zona_frontera: bool | Sequence[bool] = False,
+        aplicar_subsidio: bool = True,
+        factor_integracion: float = 1.0,
+    ) -> dict[str, Any]:
+        """
+        Computes a payroll run for many employees at once.
+
+        Every argument except ``salarios`` is either a column (one value per
+        employee) or a single value shared by every employee.
+
+        Args:
+            salarios: Gross taxable salary of the pay period (list or NumPy array)
+            periodicidades: c_PeriodicidadPago code ("04") or name ("quincenal")
+            fechas_pago: Payment dates (YYYY-MM-DD, date or numpy.datetime64)
+            riesgos: c_RiesgoPuesto class ("1" to "5"); None skips the work-risk premium
+            zona_frontera: Employee works in the northern border zone
+            aplicar_subsidio: Subtract the employment subsidy from ISR
+            factor_integracion: Integration factor applied to the daily salary
+                to get the SBC (benefits such as aguinaldo and vacation premium)
+
+        Returns:
+            dict[str, Any]: Columns, as NumPy arrays for NumPy salaries and
+            lists otherwise:
+
+            - ``dias``: days of the pay period
+            - ``salario_diario``: salary / days
+            - ``salario_minimo``: daily minimum wage in force
+            - ``cumple_salario_minimo``: daily salary is at least the minimum wage
+            - ``uma``: daily UMA in force
+            - ``sbc``: daily SBC, at least the minimum wage and at most 25 UMA
+            - ``tope_sbc_aplicado``: the 25 UMA cap was applied
+            - ``isr``: ISR to withhold
+            - ``neto``: salary minus ISR
+            - ``cuota_riesgo_trabajo``: work-risk premium of the period (only
+              when ``riesgos`` is given)
+
+        Raises:
+            ValueError: If columns differ in length, a pay period or risk class is
+                unknown, or there is no UMA, minimum wage or ISR tariff for a date
+        """
+        parametros = cls._get_parametros()
+        n = len(salarios)
+        periodicidades = _columna(periodicidades, n, "periodicidades")
+        fechas_pago = _columna(fechas_pago, n, "fechas_pago")
+        zona_frontera = _columna(zona_frontera, n, "zona_frontera")
+
+        # Per-row parameters, each distinct value resolved once
+        periodos = {p: cls._periodicidad(p) for p in dict.fromkeys(periodicidades)}
+        dias = [periodos[p][0] for p in periodicidades]
+        days = to_ordinals(fechas_pago)
+        distinct = list(dict.fromkeys(days))
+        uma_por_dia = cls._valores(parametros.uma, distinct, "UMA")
+        general = cls._valores(parametros.salario_general, distinct, "minimum wage")
+        frontera = cls._valores(parametros.salario_frontera, distinct, "minimum wage")
+        anios = {
+            day: ISRCalculator.get_anio_vigente(date.fromordinal(day).year) for day in distinct
+        }
+        uma = [uma_por_dia[day] for day in days]
+        minimos = [
+            (frontera if en_frontera else general)[day]
+            for day, en_frontera in zip(days, zona_frontera, strict=True)
+        ]
+        primas = None
+        if riesgos is not None:
+            riesgos = _columna(riesgos, n, "riesgos")
+            primas = []
+            for riesgo in riesgos:
+                prima = parametros.primas.get(str(riesgo))
+                if prima is None:
+                    raise ValueError(f"Unknown riesgo de puesto {riesgo!r}")
+                primas.append(prima)
+
+        # ISR: one batch per (year, pay period)
+        grupos: dict[tuple[int, str], list[int]] = {}
+        for i, (day, periodicidad) in enumerate(zip(days, periodicidades, strict=True)):
+            grupos.setdefault((anios[day], periodos[periodicidad][1]), []).append(i)
+
+        if is_ndarray(salarios):
+            np = optional_numpy()
+            montos = salarios.astype(np.float64, copy=False)
+            isr_np = np.empty(n)
+            for (anio, nombre), rows in grupos.items():
+                isr_np[rows] = ISRCalculator.calcular_isr_many(
+                    montos[rows], anio, nombre, aplicar_subsidio
+                )
+            dias_np = np.asarray(dias, dtype=np.float64)
+            minimos_np = np.asarray(minimos, dtype=np.float64)
+            tope_np = np.asarray(uma, dtype=np.float64) * TOPE_SBC_UMAS
+            diario_np = montos / dias_np
+            integrado_np = np.maximum(diario_np * factor_integracion, minimos_np)
+            sbc_np = np.minimum(integrado_np, tope_np)
+            result: dict[str, Any] = {
+                "dias": np.asarray(dias),
+                "salario_diario": diario_np,
+                "salario_minimo": minimos_np,
+                "cumple_salario_minimo": diario_np >= minimos_np,
+                "uma": np.asarray(uma, dtype=np.float64),
+                "sbc": sbc_np,
+                "tope_sbc_aplicado": integrado_np > tope_np,
+                "isr": isr_np,
+                "neto": montos - isr_np,
+            }
+            if primas is not None:
+                result["cuota_riesgo_trabajo"] = (
+                    sbc_np * dias_np * np.asarray(primas, dtype=np.float64) / 100
+                )
+            return result
+
+        isr: list[float] = [0.0] * n
+        for (anio, nombre), rows in grupos.items():
+            valores = ISRCalculator.calcular_isr_many(
+                [salarios[i] for i in rows], anio, nombre, aplicar_subsidio
+            )
+            for i, valor in zip(rows, valores, strict=True):
+                isr[i] = valor
+
+        diarios: list[float] = []
+        cumple: list[bool] = []
+        sbcs: list[float] = []
+        topados: list[bool] = []
+        netos: list[float] = []
+        for salario, dia, minimo, valor_uma, retencion in zip(
+            salarios, dias, minimos, uma, isr, strict=True
+        ):
+            diario = salario / dia
+            integrado = max(diario * factor_integracion, minimo)
+            tope = valor_uma * TOPE_SBC_UMAS
+            diarios.append(diario)
+            cumple.append(diario >= minimo)
+            sbcs.append(min(integrado, tope))
+            topados.append(integrado > tope)
+            netos.append(salario - retencion)
+        result = {
+            "dias": dias,
+            "salario_diario": diarios,
+            "salario_minimo": minimos,
+            "cumple_salario_minimo": cumple,
+            "uma": uma,
+            "sbc": sbcs,
+            "tope_sbc_aplicado": topados,
+            "isr": isr,
+            "neto": netos,
+        }
+        if primas is not None:
+            result["cuota_riesgo_trabajo"] = [
+                sbc * dia * prima / 100 for sbc, dia, prima in zip(sbcs, dias, primas, strict=True)
+            ]
+        return result
+
+    @staticmethod
+    def _valores(series: TimeSeries, days: list[int], nombre: str) -> dict[int, float]:
+        """Value in force on each ordinal day, raising for days before the series."""
+        valores = {}
+        for day, i in zip(days, series.lookup_many(days), strict=True):
+            if i < 0:
+                raise ValueError(f"No {nombre} in force on {date.fromordinal(day).isoformat()}")
+            valores[day] = series.values[i]
+        return valores
+
+
+__all__ = ["NominaCalculator", "TOPE_SBC_UMAS"]
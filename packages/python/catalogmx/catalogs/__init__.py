@@ -2,4 +2,17 @@
 catalogmx.catalogs - Catálogos oficiales mexicanos
 """
 
+from catalogmx.utils.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "sat": ".sat",
+        "banxico": ".banxico",
+        "inegi": ".inegi",
+        "sepomex": ".sepomex",
+        "ift": ".ift",
+    },
+)
+
 __all__ = ["sat", "banxico", "inegi", "sepomex", "ift"]
@@ -12,21 +12,55 @@ Catálogos incluidos:
 - InstitucionesFinancieras: Tipos de instituciones del sistema financiero
 - MonedasDivisas: Monedas y divisas internacionales
 - CodigosPlazaCatalog: Códigos de plaza para CLABE
+- BanxicoSeriesCatalog: Base de las series por fecha (UDI, FIX, TIIE, CETES, INPC)
+- BanxicoRateCatalog: Base de las tasas con devengo diario (TIIE, CETES)
 """
 
-from .banks import BankCatalog
-from .cetes_28 import CETES28Catalog
-from .codigos_plaza import CodigosPlazaCatalog
-from .inflacion_anual import InflacionAnualCatalog
-from .instituciones_financieras import InstitucionesFinancieras
-from .monedas_divisas import MonedasDivisas
-from .salarios_minimos import SalariosMinimosCatalog
-from .tiie_28 import TIIE28Catalog
-from .tipo_cambio_usd import TipoCambioUSDCatalog
-from .udis import UDICatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .banks import BankCatalog
+    from .cetes_28 import CETES28Catalog, CETESRecord
+    from .codigos_plaza import CodigosPlazaCatalog
+    from .inflacion_anual import InflacionAnualCatalog, InflacionRecord
+    from .instituciones_financieras import InstitucionesFinancieras
+    from .monedas_divisas import MonedasDivisas
+    from .salarios_minimos import SalarioMinimoRecord, SalariosMinimosCatalog
+    from .series import BanxicoRateCatalog, BanxicoSeriesCatalog
+    from .tiie_28 import TIIE28Catalog, TIIERecord
+    from .tipo_cambio_usd import TipoCambioRecord, TipoCambioUSDCatalog
+    from .udis import UDICatalog, UDIRecord
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BankCatalog": ".banks",
+        "CETES28Catalog": ".cetes_28",
+        "CETESRecord": ".cetes_28",
+        "CodigosPlazaCatalog": ".codigos_plaza",
+        "InflacionAnualCatalog": ".inflacion_anual",
+        "InflacionRecord": ".inflacion_anual",
+        "InstitucionesFinancieras": ".instituciones_financieras",
+        "MonedasDivisas": ".monedas_divisas",
+        "SalariosMinimosCatalog": ".salarios_minimos",
+        "SalarioMinimoRecord": ".salarios_minimos",
+        "BanxicoRateCatalog": ".series",
+        "BanxicoSeriesCatalog": ".series",
+        "TIIE28Catalog": ".tiie_28",
+        "TIIERecord": ".tiie_28",
+        "TipoCambioUSDCatalog": ".tipo_cambio_usd",
+        "TipoCambioRecord": ".tipo_cambio_usd",
+        "UDICatalog": ".udis",
+        "UDIRecord": ".udis",
+    },
+)
 
 __all__ = [
     "BankCatalog",
+    "BanxicoRateCatalog",
+    "BanxicoSeriesCatalog",
     "CETES28Catalog",
     "CodigosPlazaCatalog",
     "InflacionAnualCatalog",
@@ -36,4 +70,11 @@ __all__ = [
     "TIIE28Catalog",
     "TipoCambioUSDCatalog",
     "UDICatalog",
+    # Record types
+    "CETESRecord",
+    "InflacionRecord",
+    "SalarioMinimoRecord",
+    "TIIERecord",
+    "TipoCambioRecord",
+    "UDIRecord",
 ]
@@ -6,11 +6,13 @@ participating in the SPEI (Sistema de Pagos Electrónicos Interbancarios).
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_dict, copy_list
 
 
+@register("banxico/banks.json")
 class BankCatalog:
     """
     Catalog of Mexican banks
@@ -25,15 +27,7 @@ class BankCatalog:
     def _load_data(cls) -> None:
         """Load bank data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/banxico/banks.py
-            # Target: catalogmx/packages/shared-data/banxico/banks.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "banks.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -54,7 +48,7 @@ class BankCatalog:
         :return: List of bank dictionaries
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_bank_by_code(cls, code: str) -> dict | None:
@@ -120,7 +114,7 @@ class BankCatalog:
 def get_banks_dict() -> dict[str, dict]:
     """Get dictionary of all banks indexed by code"""
     BankCatalog._load_data()
-    return BankCatalog._bank_by_code.copy()
+    return copy_dict(BankCatalog._bank_by_code)
 
 
 def get_spei_banks() -> list[dict]:
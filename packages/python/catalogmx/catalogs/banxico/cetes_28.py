@@ -5,11 +5,31 @@ This module provides access to CETES 28-day values from Banco de México.
 CETES (Certificados de la Tesorería) are short-term government securities.
 """
 
-import json
-from pathlib import Path
+from catalogmx.catalogs.banxico.series import BanxicoRateCatalog
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.snapshot import load_records
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
 
 
-class CETES28Catalog:
+class CETESRecord(Record):
+    """CETES 28-day rate of one auction"""
+
+    fecha: str
+    tasa: float
+    plazo_dias: int
+    instrumento: str
+    tipo: str
+    año: int
+    mes: int
+    fuente: str
+
+    __slots__ = ("fecha", "tasa", "plazo_dias", "instrumento", "tipo", "año", "mes", "fuente")
+    _intern = frozenset({"plazo_dias", "instrumento", "tipo", "año", "mes", "fuente"})
+
+
+@register("banxico/cetes_28.json")
+class CETES28Catalog(BanxicoRateCatalog):
     """
     Catalog of CETES 28-day values
 
@@ -17,7 +37,9 @@ class CETES28Catalog:
     and are considered the benchmark for risk-free interest rates in Mexico.
     """
 
-    _data: list[dict] | None = None
+    _data: list[CETESRecord] | None = None
+    _series = None
+    _accrual = None
     _by_fecha: dict[str, dict] | None = None
     _by_anio: dict[int, list[dict]] | None = None
 
@@ -25,16 +47,10 @@ class CETES28Catalog:
     def _load_data(cls) -> None:
         """Load CETES data from JSON file"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "cetes_28.json"
-            )
+            shared_data_path = data_path(cls)
 
-            with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+            # Uses the binary snapshot (.snap) when it is up to date with the JSON
+            cls._data = load_records(shared_data_path, CETESRecord)
 
         if cls._by_fecha is not None:
             return
@@ -67,7 +83,7 @@ class CETES28Catalog:
         :return: List of all CETES records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_fecha(cls, fecha: str) -> dict | None:
@@ -79,7 +95,7 @@ class CETES28Catalog:
         """
         cls._load_data()
         record = cls._by_fecha.get(fecha)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> list[dict]:
@@ -91,7 +107,7 @@ class CETES28Catalog:
         """
         cls._load_data()
         records = cls._by_anio.get(anio, [])
-        return [record.copy() for record in records]
+        return copy_dicts(records)
 
     @classmethod
     def get_actual(cls) -> dict | None:
@@ -106,7 +122,7 @@ class CETES28Catalog:
             return None
 
         record = max(cls._data, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_tasa_actual(cls) -> float | None:
@@ -120,35 +136,23 @@ class CETES28Catalog:
 
     @classmethod
     def calcular_rendimiento(
-        cls, inversion: float, fecha_inicio: str, fecha_fin: str
+        cls, inversion: float, fecha_inicio: str, fecha_fin: str, base: int = 360
     ) -> float | None:
         """
-        Calculate return on CETES investment
+        Calculate the value of a CETES investment at the end of a period
+
+        The investment grows every calendar day from fecha_inicio (included) to
+        fecha_fin (excluded) at the CETES rate in force that day, capitalized
+        daily.
 
         :param inversion: Investment amount
         :param fecha_inicio: Start date (YYYY-MM-DD)
         :param fecha_fin: End date (YYYY-MM-DD)
-        :return: Final amount or None if rates not found
+        :param base: Day-count basis, 360 (ACT/360) or 365 (ACT/365)
+        :return: Final amount or None if the period is not covered by the series
         """
-        # CETES are discounted securities, so the calculation is different
-        # This is a simplified version
-        record = cls.get_por_fecha(fecha_inicio)
-
-        if not record:
-            return None
-
-        rate = record.get("tasa", 0) / 100  # Convert to decimal
-
-        # CETES are typically 28-day securities
-        # Simplified calculation: final value = investment / (1 - rate * days/360)
-        days = 28  # Standard CETES term
-        discount_factor = 1 - (rate * days / 360)
-
-        if discount_factor <= 0:
-            return None
-
-        face_value = inversion / discount_factor
-        return face_value
+        factor = cls.factor_acumulado(fecha_inicio, fecha_fin, base)
+        return None if factor is None else inversion * factor
 
     @classmethod
     def get_promedio_anual(cls, anio: int) -> float | None:
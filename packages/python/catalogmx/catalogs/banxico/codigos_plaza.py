@@ -13,6 +13,10 @@ import json
 import os
 from typing import TypedDict
 
+from catalogmx.registry import register
+from catalogmx.utils.search import TokenIndex
+from catalogmx.utils.views import copy_list
+
 try:
     from unidecode import unidecode
 except ImportError:
@@ -30,6 +34,7 @@ class CodigoPlaza(TypedDict):
     cve_entidad: str  # Código INEGI del estado
 
 
+@register("banxico/codigos_plaza.json")
 class CodigosPlazaCatalog:
     """Catálogo de códigos de plaza para CLABE."""
 
@@ -38,6 +43,7 @@ class CodigosPlazaCatalog:
     _by_estado: dict[str, list[CodigoPlaza]] | None = None
     _by_plaza: dict[str, list[CodigoPlaza]] | None = None
     _by_plaza_normalized: dict[str, list[CodigoPlaza]] | None = None
+    _plaza_index: TokenIndex | None = None
 
     @classmethod
     def _normalize(cls, text: str) -> str:
@@ -87,6 +93,9 @@ class CodigosPlazaCatalog:
                 cls._by_plaza_normalized[plaza_normalized] = []
             cls._by_plaza_normalized[plaza_normalized].append(plaza)
 
+        # Inverted index for partial, accent-insensitive search
+        cls._plaza_index = TokenIndex(cls._data, key=lambda p: p["plaza"], normalize=cls._normalize)
+
     @classmethod
     def get_all(cls) -> list[CodigoPlaza]:
         """
@@ -96,7 +105,7 @@ class CodigosPlazaCatalog:
             Lista con todos los códigos de plaza
         """
         cls._load()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def buscar_por_codigo(cls, codigo: str) -> list[CodigoPlaza]:
@@ -260,8 +269,7 @@ class CodigosPlazaCatalog:
             3
         """
         cls._load()
-        query_normalized = cls._normalize(query)
-        return [p for p in cls._data if query_normalized in cls._normalize(p["plaza"])]
+        return cls._plaza_index.search(query)
 
     @classmethod
     def get_estadisticas(cls) -> dict:
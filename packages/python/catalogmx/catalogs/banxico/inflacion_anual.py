@@ -6,10 +6,35 @@ Inflation is measured using the National Consumer Price Index.
 """
 
 import json
-from pathlib import Path
+from datetime import date
+from math import prod
+from typing import Any
 
+from catalogmx.catalogs.banxico.series import BanxicoSeriesCatalog
+from catalogmx.registry import data_path, register
+from catalogmx.utils.lazy import is_ndarray
+from catalogmx.utils.records import Record
+from catalogmx.utils.timeseries import TimeSeries
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
 
-class InflacionAnualCatalog:
+
+class InflacionRecord(Record):
+    """Annual inflation (INPC) for one month"""
+
+    fecha: str
+    inflacion_anual: float
+    indice: str
+    tipo: str
+    año: int
+    mes: int
+    fuente: str
+
+    __slots__ = ("fecha", "inflacion_anual", "indice", "tipo", "año", "mes", "fuente")
+    _intern = frozenset({"indice", "tipo", "año", "mes", "fuente"})
+
+
+@register("banxico/inflacion_anual.json")
+class InflacionAnualCatalog(BanxicoSeriesCatalog):
     """
     Catalog of annual inflation data (INPC)
 
@@ -17,24 +42,21 @@ class InflacionAnualCatalog:
     of a basket of goods and services representative of household consumption.
     """
 
-    _data: list[dict] | None = None
+    _data: list[InflacionRecord] | None = None
+    _series = None
+    _value_field = "inflacion_anual"
     _by_fecha: dict[str, dict] | None = None
     _by_anio: dict[int, list[dict]] | None = None
+    _indice: TimeSeries | None = None
 
     @classmethod
     def _load_data(cls) -> None:
         """Load inflation data from JSON file"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "inflacion_anual.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+                cls._data = InflacionRecord.from_dicts(json.load(f))
 
         if cls._by_fecha is not None:
             return
@@ -67,7 +89,7 @@ class InflacionAnualCatalog:
         :return: List of all inflation records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_fecha(cls, fecha: str) -> dict | None:
@@ -79,7 +101,7 @@ class InflacionAnualCatalog:
         """
         cls._load_data()
         record = cls._by_fecha.get(fecha)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> list[dict]:
@@ -91,7 +113,7 @@ class InflacionAnualCatalog:
         """
         cls._load_data()
         records = cls._by_anio.get(anio, [])
-        return [record.copy() for record in records]
+        return copy_dicts(records)
 
     @classmethod
     def get_actual(cls) -> dict | None:
@@ -106,7 +128,7 @@ class InflacionAnualCatalog:
             return None
 
         record = max(cls._data, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_tasa_actual(cls) -> float | None:
@@ -118,6 +140,68 @@ class InflacionAnualCatalog:
         record = cls.get_actual()
         return record.get("inflacion_anual") if record else None
 
+    @classmethod
+    def _get_indice(cls) -> TimeSeries:
+        """
+        Cumulative price index (INPC-like, base 100) built from the annual rates
+
+        Each month's level is the level of the same month a year earlier times
+        (1 + annual inflation). The first twelve months have no earlier level,
+        so they are anchored on a constant monthly growth equal to the average
+        annual inflation of that first year.
+        """
+        if cls._indice is None:
+            series = cls._get_series()
+            months = []
+            for day in series.days:
+                fecha = date.fromordinal(day)
+                months.append(fecha.year * 12 + fecha.month - 1)
+            records = []
+            if months:
+                first = months[0]
+                rates = [1 + series.values[i] / 100 for i, m in enumerate(months) if m < first + 12]
+                anual = prod(rates) ** (1 / len(rates))
+                position = {month: i for i, month in enumerate(months)}
+                levels: list[float] = []
+                for i, month in enumerate(months):
+                    previous = position.get(month - 12)
+                    if previous is None:
+                        levels.append(100 * anual ** ((month - first) / 12))
+                    else:
+                        levels.append(levels[previous] * (1 + series.values[i] / 100))
+                    records.append({"fecha": series.records[i]["fecha"], "indice": levels[-1]})
+            cls._indice = TimeSeries(records, value_field="indice")
+        return cls._indice
+
+    @classmethod
+    def get_indice(cls, fecha: str | date) -> float | None:
+        """
+        Get the cumulative price index in force on a date
+
+        :param fecha: Date (YYYY-MM-DD); any day uses its month's level
+        :return: Index level (base 100 on the first month) or None before the series
+        """
+        return cls._get_indice().value(fecha)
+
+    @classmethod
+    def factor_actualizacion(cls, fecha_a: str | date, fecha_b: str | date) -> float | None:
+        """
+        Get the inflation update factor from one date to another
+
+        The factor is the ratio of the index levels, INPC(fecha_b) / INPC(fecha_a),
+        as in the "actualización" of amounts (CFF art. 17-A).
+
+        :param fecha_a: Original date (YYYY-MM-DD)
+        :param fecha_b: Target date (YYYY-MM-DD)
+        :return: Update factor or None if a date is before the series
+        """
+        indice = cls._get_indice()
+        a = indice.value(fecha_a)
+        b = indice.value(fecha_b)
+        if not a or b is None:
+            return None
+        return b / a
+
     @classmethod
     def ajustar_por_inflacion(
         cls, monto: float, fecha_original: str, fecha_actual: str
@@ -128,22 +212,49 @@ class InflacionAnualCatalog:
         :param monto: Original amount
         :param fecha_original: Original date (YYYY-MM-DD)
         :param fecha_actual: Current date (YYYY-MM-DD)
-        :return: Adjusted amount or None if rates not found
+        :return: Adjusted amount or None if a date is before the series
         """
-        record_original = cls.get_por_fecha(fecha_original)
-        record_actual = cls.get_por_fecha(fecha_actual)
+        factor = cls.factor_actualizacion(fecha_original, fecha_actual)
+        return None if factor is None else monto * factor
 
-        if not record_original or not record_actual:
-            return None
+    @classmethod
+    def factor_actualizacion_many(cls, fechas_a: Any, fechas_b: Any) -> list[float | None]:
+        """
+        Get many update factors at once (batch version of factor_actualizacion)
 
-        inflacion_original = record_original.get("inflacion_anual", 0) / 100
-        inflacion_actual = record_actual.get("inflacion_anual", 0) / 100
+        :param fechas_a: Original dates
+        :param fechas_b: Target dates, one per original date
+        :return: List of factors (None where a date is before the series)
+        """
+        return cls.ajustar_por_inflacion_many([1.0] * len(fechas_a), fechas_a, fechas_b)
 
-        # Simplified adjustment: multiply by ratio of inflation rates
-        # More sophisticated methods exist for inflation adjustment
-        adjustment_factor = (1 + inflacion_actual) / (1 + inflacion_original)
+    @classmethod
+    def ajustar_por_inflacion_many(
+        cls, montos: Any, fechas_originales: Any, fechas_actuales: Any
+    ) -> Any:
+        """
+        Adjust many amounts for inflation at once
+
+        Dates are resolved against the index in one sorted pass per column, so
+        mass updates do not pay a lookup and a copy per amount.
 
-        return monto * adjustment_factor
+        :param montos: Original amounts (list or NumPy array)
+        :param fechas_originales: Original dates, one per amount
+        :param fechas_actuales: Target dates, one per amount
+        :return: Adjusted amounts, same container type as montos (None in lists
+            and NaN in NumPy arrays where a date is before the series)
+        """
+        indice = cls._get_indice()
+        if len(montos) != len(fechas_originales):
+            raise ValueError("montos and fechas_originales must have the same length")
+        if is_ndarray(montos):
+            actualizados = indice.scale_many(montos, fechas_actuales)
+            return indice.scale_many(actualizados, fechas_originales, divide=True)
+        origen = indice.scale_many([1.0] * len(montos), fechas_originales)
+        destino = indice.scale_many(list(montos), fechas_actuales)
+        return [
+            None if a is None or b is None else b / a for a, b in zip(origen, destino, strict=True)
+        ]
 
     @classmethod
     def calcular_variacion(cls, fecha_inicio: str, fecha_fin: str) -> float | None:
@@ -7,10 +7,11 @@ CONSAR y otras entidades reguladoras.
 """
 
 import json
-from pathlib import Path
 from typing import TypedDict
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_list
 
 
 class TipoInstitucionFinanciera(TypedDict):
@@ -24,6 +25,7 @@ class TipoInstitucionFinanciera(TypedDict):
     ejemplos: list[str]
 
 
+@register("banxico/instituciones_financieras.json")
 class InstitucionesFinancieras:
     """
     Catálogo de tipos de instituciones del sistema financiero mexicano.
@@ -63,16 +65,9 @@ class InstitucionesFinancieras:
         if cls._data is not None:
             return
 
-        # Path: catalogmx/packages/python/catalogmx/catalogs/banxico/instituciones_financieras.py
-        # Target: catalogmx/packages/shared-data/banxico/instituciones_financieras.json
-        data_path = (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "shared-data"
-            / "banxico"
-            / "instituciones_financieras.json"
-        )
+        path = data_path(cls)
 
-        with open(data_path, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             json_data = json.load(f)
             cls._data = json_data["tipos_institucion"]
 
@@ -89,7 +84,7 @@ class InstitucionesFinancieras:
             >>> print(f"Total tipos: {len(instituciones)}")
         """
         cls._load_data()
-        return cls._data.copy()  # type: ignore
+        return copy_list(cls._data)  # type: ignore
 
     @classmethod
     def get_por_codigo(cls, codigo: str) -> TipoInstitucionFinanciera | None:
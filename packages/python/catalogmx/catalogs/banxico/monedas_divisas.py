@@ -7,9 +7,11 @@ basado en códigos ISO 4217.
 """
 
 import json
-from pathlib import Path
 from typing import TypedDict
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
+
 
 class MonedaDivisa(TypedDict, total=False):
     """Estructura de una moneda o divisa"""
@@ -27,6 +29,7 @@ class MonedaDivisa(TypedDict, total=False):
     notas: str  # Optional
 
 
+@register("banxico/monedas_divisas.json")
 class MonedasDivisas:
     """
     Catálogo de monedas y divisas internacionales.
@@ -66,16 +69,9 @@ class MonedasDivisas:
         if cls._data is not None:
             return
 
-        # Path: catalogmx/packages/python/catalogmx/catalogs/banxico/monedas_divisas.py
-        # Target: catalogmx/packages/shared-data/banxico/monedas_divisas.json
-        data_path = (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "shared-data"
-            / "banxico"
-            / "monedas_divisas.json"
-        )
+        path = data_path(cls)
 
-        with open(data_path, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             json_data = json.load(f)
             cls._data = json_data["monedas"]
 
@@ -92,7 +88,7 @@ class MonedasDivisas:
             >>> print(f"Total monedas: {len(monedas)}")
         """
         cls._load_data()
-        return cls._data.copy()  # type: ignore
+        return copy_list(cls._data)  # type: ignore
 
     @classmethod
     def get_por_codigo(cls, codigo_iso: str) -> MonedaDivisa | None:
@@ -6,9 +6,42 @@ Includes different zones: general and northern border area.
 """
 
 import json
-from pathlib import Path
-
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
+
+
+class SalarioMinimoRecord(Record):
+    """Minimum wage of one zone and period"""
+
+    fecha: str
+    salario_minimo: float
+    tipo: str
+    zona: str
+    periodo: str
+    serie: str
+    año: int
+    mes: int
+    fuente: str
+    base_year: int
+
+    __slots__ = (
+        "fecha",
+        "salario_minimo",
+        "tipo",
+        "zona",
+        "periodo",
+        "serie",
+        "año",
+        "mes",
+        "fuente",
+        "base_year",
+    )
+    _intern = frozenset({"tipo", "zona", "periodo", "serie", "año", "mes", "fuente", "base_year"})
+
+
+@register("banxico/salarios_minimos.json")
 class SalariosMinimosCatalog:
     """
     Catalog of minimum wage values
@@ -17,7 +50,7 @@ class SalariosMinimosCatalog:
     The northern border area has higher minimum wages.
     """
 
-    _data: list[dict] | None = None
+    _data: list[SalarioMinimoRecord] | None = None
     _by_fecha_zona: dict[str, dict] | None = None
     _by_anio_zona: dict[str, list[dict]] | None = None
 
@@ -25,16 +58,10 @@ class SalariosMinimosCatalog:
     def _load_data(cls) -> None:
         """Load minimum wage data from JSON file"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "salarios_minimos.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+                cls._data = SalarioMinimoRecord.from_dicts(json.load(f))
 
         if cls._by_fecha_zona is not None:
             return
@@ -69,7 +96,7 @@ class SalariosMinimosCatalog:
         :return: List of all minimum wage records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_fecha_zona(cls, fecha: str, zona: str = "general") -> dict | None:
@@ -83,7 +110,7 @@ class SalariosMinimosCatalog:
         cls._load_data()
         key = f"{fecha}_{zona}"
         record = cls._by_fecha_zona.get(key)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio_zona(cls, anio: int, zona: str = "general") -> list[dict]:
@@ -97,7 +124,7 @@ class SalariosMinimosCatalog:
         cls._load_data()
         key = f"{anio}_{zona}"
         records = cls._by_anio_zona.get(key, [])
-        return [record.copy() for record in records]
+        return copy_dicts(records)
 
     @classmethod
     def get_actual_zona(cls, zona: str = "general") -> dict | None:
@@ -118,7 +145,7 @@ class SalariosMinimosCatalog:
             return None
 
         record = max(zone_records, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_actual_general(cls) -> dict | None:
@@ -0,0 +1,185 @@
+"""
+Banxico time series base
+
+Shared base for the Banxico catalogs that publish one value per date
+(UDI, tipo de cambio FIX, TIIE 28, CETES 28, inflación anual).
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any
+
+from catalogmx.utils.accrual import AccrualTable
+from catalogmx.utils.timeseries import TimeSeries
+from catalogmx.utils.views import copy_dict
+
+
+class BanxicoSeriesCatalog(ABC):
+    """
+    Base class for Banxico daily/monthly series catalogs
+
+    Subclasses load their records in ``_load_data`` and name the field holding
+    the value in ``_value_field``. The sorted series is built lazily from
+    ``_series_records()`` and answers date lookups with a binary search; it is
+    rebuilt whenever ``_data`` is reset or reloaded.
+
+    Fill policies for dates without a published value (weekends, holidays):
+
+    - "exact": no value
+    - "previous": last value published before the date (default)
+    - "next": first value published after the date
+    - "nearest": closest published value (the earlier one on ties)
+    """
+
+    _data: list[dict] | None = None
+    _series: TimeSeries | None = None
+    #: The ``_data`` list the series was built from
+    _series_data: list | None = None
+    _value_field: str = "valor"
+
+    @classmethod
+    @abstractmethod
+    def _load_data(cls) -> None:
+        """Loads the records into ``_data`` (if not loaded yet)"""
+
+    @classmethod
+    def _series_records(cls) -> list[dict]:
+        """Records that make up the series (all loaded records by default)"""
+        cls._load_data()
+        return cls._data or []
+
+    @classmethod
+    def _preload(cls) -> None:
+        """Eager load (catalogmx.preload): records and the sorted series"""
+        cls._get_series()
+
+    @classmethod
+    def _get_series(cls) -> TimeSeries:
+        if cls._series is None or cls._series_data is not cls._data:
+            cls._series = TimeSeries(cls._series_records(), cls._value_field)
+            cls._series_data = cls._data
+        return cls._series
+
+    @classmethod
+    def as_of(cls, fecha: str | date, fill: str = "previous") -> float | None:
+        """
+        Get the value in force on a date
+
+        :param fecha: Date (YYYY-MM-DD string, date or datetime)
+        :param fill: Policy for dates without a value: "exact", "previous",
+            "next" or "nearest"
+        :return: Value or None if there is none under the given policy
+        """
+        return cls._get_series().value(fecha, fill)
+
+    @classmethod
+    def get_as_of(cls, fecha: str | date, fill: str = "previous") -> dict | None:
+        """
+        Get the record in force on a date
+
+        :param fecha: Date (YYYY-MM-DD string, date or datetime)
+        :param fill: Policy for dates without a value (see as_of)
+        :return: Copy of the record or None if there is none under the given policy
+        """
+        record = cls._get_series().record(fecha, fill)
+        return copy_dict(record)
+
+    @classmethod
+    def convert_many(
+        cls, amounts: Any, fechas: Any, *, divide: bool = False, fill: str = "previous"
+    ) -> Any:
+        """
+        Convert many amounts at once using the value in force on each date
+
+        All dates are resolved in one sorted pass over the series and no record
+        is copied, so this is the method to use for large batches.
+
+        :param amounts: Amounts as a list, array.array or NumPy array
+        :param fechas: Dates (YYYY-MM-DD strings, dates or a NumPy datetime64 array)
+        :param divide: Divide by the value instead of multiplying
+        :param fill: Policy for dates without a value (see as_of)
+        :return: Converted amounts in the same container type as amounts; missing
+            values are None in lists and NaN in arrays
+        """
+        return cls._get_series().scale_many(amounts, fechas, fill=fill, divide=divide)
+
+    @classmethod
+    def previous_business_day(cls, fecha: str | date) -> str | None:
+        """
+        Get the last date before the given one with a published value
+
+        :param fecha: Date (YYYY-MM-DD string, date or datetime)
+        :return: Date string (YYYY-MM-DD) or None if the series starts later
+        """
+        return cls._get_series().previous_date(fecha)
+
+
+class BanxicoRateCatalog(BanxicoSeriesCatalog):
+    """
+    Base class for Banxico interest rate series (TIIE, CETES)
+
+    Accrues interest day by day over the actual date range, using the rate in
+    force on each calendar day (the last one published on or before it).
+    Periods include the start date and exclude the end date, and can only be
+    accrued between the first and the last published rate.
+
+    The prefix-summed accrual table of each day-count basis (360 for ACT/360,
+    365 for ACT/365) is built on first use; every query after that is O(1).
+    """
+
+    _value_field = "tasa"
+    _accrual: dict[int, AccrualTable] | None = None
+    #: The series the accrual tables were built from
+    _accrual_series: TimeSeries | None = None
+
+    @classmethod
+    def _get_accrual(cls, base: int) -> AccrualTable:
+        series = cls._get_series()
+        if cls._accrual is None or cls._accrual_series is not series:
+            cls._accrual = {}
+            cls._accrual_series = series
+        table = cls._accrual.get(base)
+        if table is None:
+            table = cls._accrual[base] = AccrualTable(series, basis=base)
+        return table
+
+    @classmethod
+    def factor_acumulado(
+        cls, fecha_inicio: str | date, fecha_fin: str | date, base: int = 360
+    ) -> float | None:
+        """
+        Get the growth factor with daily capitalization between two dates
+
+        :param fecha_inicio: Start date (accrues)
+        :param fecha_fin: End date (does not accrue)
+        :param base: Day-count basis, 360 (ACT/360) or 365 (ACT/365)
+        :return: Growth factor or None if the period is not covered by the series
+        """
+        return cls._get_accrual(base).factor(fecha_inicio, fecha_fin)
+
+    @classmethod
+    def calcular_interes_many(
+        cls,
+        capitales: Any,
+        fechas_inicio: Any,
+        fechas_fin: Any,
+        base: int = 360,
+        compuesto: bool = False,
+    ) -> Any:
+        """
+        Calculate interest for many periods at once
+
+        :param capitales: Principal amounts (list or NumPy array)
+        :param fechas_inicio: Start dates, one per principal
+        :param fechas_fin: End dates, one per principal
+        :param base: Day-count basis, 360 (ACT/360) or 365 (ACT/365)
+        :param compuesto: Capitalize interest daily instead of simple accrual
+        :return: Interest amounts, same container type as capitales (None or
+            NaN for periods not covered by the series)
+        """
+        return cls._get_accrual(base).accrue_many(
+            capitales, fechas_inicio, fechas_fin, compound=compuesto
+        )
+
+
+__all__ = ["BanxicoRateCatalog", "BanxicoSeriesCatalog"]
@@ -5,11 +5,30 @@ This module provides access to TIIE 28-day values from Banco de México.
 TIIE (Tasa de Interés Interbancaria de Equilibrio) is the interbank equilibrium interest rate.
 """
 
-import json
-from pathlib import Path
+from catalogmx.catalogs.banxico.series import BanxicoRateCatalog
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.snapshot import load_records
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
 
 
-class TIIE28Catalog:
+class TIIERecord(Record):
+    """TIIE 28-day rate published on one date"""
+
+    fecha: str
+    tasa: float
+    plazo_dias: int
+    tipo: str
+    año: int
+    mes: int
+    fuente: str
+
+    __slots__ = ("fecha", "tasa", "plazo_dias", "tipo", "año", "mes", "fuente")
+    _intern = frozenset({"plazo_dias", "tipo", "año", "mes", "fuente"})
+
+
+@register("banxico/tiie_28.json")
+class TIIE28Catalog(BanxicoRateCatalog):
     """
     Catalog of TIIE 28-day values
 
@@ -17,7 +36,9 @@ class TIIE28Catalog:
     based on transactions between banks in the Mexican peso money market.
     """
 
-    _data: list[dict] | None = None
+    _data: list[TIIERecord] | None = None
+    _series = None
+    _accrual = None
     _by_fecha: dict[str, dict] | None = None
     _by_anio: dict[int, list[dict]] | None = None
 
@@ -25,16 +46,10 @@ class TIIE28Catalog:
     def _load_data(cls) -> None:
         """Load TIIE data from JSON file"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "tiie_28.json"
-            )
+            shared_data_path = data_path(cls)
 
-            with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+            # Uses the binary snapshot (.snap) when it is up to date with the JSON
+            cls._data = load_records(shared_data_path, TIIERecord)
 
         if cls._by_fecha is not None:
             return
@@ -67,7 +82,7 @@ class TIIE28Catalog:
         :return: List of all TIIE records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_fecha(cls, fecha: str) -> dict | None:
@@ -79,7 +94,7 @@ class TIIE28Catalog:
         """
         cls._load_data()
         record = cls._by_fecha.get(fecha)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> list[dict]:
@@ -91,7 +106,7 @@ class TIIE28Catalog:
         """
         cls._load_data()
         records = cls._by_anio.get(anio, [])
-        return [record.copy() for record in records]
+        return copy_dicts(records)
 
     @classmethod
     def get_actual(cls) -> dict | None:
@@ -106,7 +121,7 @@ class TIIE28Catalog:
             return None
 
         record = max(cls._data, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_tasa_actual(cls) -> float | None:
@@ -119,36 +134,34 @@ class TIIE28Catalog:
         return record.get("tasa") if record else None
 
     @classmethod
-    def calcular_interes(cls, capital: float, fecha_inicio: str, fecha_fin: str) -> float | None:
+    def calcular_interes(
+        cls,
+        capital: float,
+        fecha_inicio: str,
+        fecha_fin: str,
+        base: int = 360,
+        compuesto: bool = False,
+    ) -> float | None:
         """
         Calculate interest for a period using TIIE
 
+        Interest accrues every calendar day from fecha_inicio (included) to
+        fecha_fin (excluded) at the TIIE in force that day, i.e. the last rate
+        published on or before it.
+
         :param capital: Principal amount
         :param fecha_inicio: Start date (YYYY-MM-DD)
         :param fecha_fin: End date (YYYY-MM-DD)
-        :return: Interest amount or None if rates not found
+        :param base: Day-count basis, 360 (ACT/360) or 365 (ACT/365)
+        :param compuesto: Capitalize interest daily instead of simple accrual
+        :return: Interest amount or None if the period is not covered by the series
         """
-        # This is a simplified calculation - in practice, you might need
-        # more sophisticated interest calculation methods
-        record_inicio = cls.get_por_fecha(fecha_inicio)
-        record_fin = cls.get_por_fecha(fecha_fin)
-
-        if not record_inicio or not record_fin:
-            return None
-
-        # Use average rate for the period (simplified)
-        rate_inicio = record_inicio.get("tasa", 0)
-        rate_fin = record_fin.get("tasa", 0)
-        avg_rate = (rate_inicio + rate_fin) / 2
-
-        # Calculate days between dates (simplified)
-        # In practice, you should use proper date calculations
-        days = 30  # Simplified assumption
-
-        # Daily rate
-        daily_rate = avg_rate / 100 / 360  # Assuming 360-day year
-
-        return capital * daily_rate * days
+        table = cls._get_accrual(base)
+        if compuesto:
+            tasa = table.compound(fecha_inicio, fecha_fin)
+        else:
+            tasa = table.simple(fecha_inicio, fecha_fin)
+        return None if tasa is None else capital * tasa
 
     @classmethod
     def get_promedio_anual(cls, anio: int) -> float | None:
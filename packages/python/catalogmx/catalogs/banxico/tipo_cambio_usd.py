@@ -5,11 +5,42 @@ This module provides access to USD/MXN exchange rate FIX values from Banco de M
 The FIX rate is the official exchange rate determined daily by Banco de México.
 """
 
-import json
-from pathlib import Path
-
-
-class TipoCambioUSDCatalog:
+from typing import Any
+
+from catalogmx.catalogs.banxico.series import BanxicoSeriesCatalog
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.snapshot import load_records
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
+
+
+class TipoCambioRecord(Record):
+    """USD/MXN FIX exchange rate on one date"""
+
+    fecha: str
+    tipo_cambio: float
+    moneda_origen: str
+    moneda_destino: str
+    tipo: str
+    año: int
+    mes: int
+    fuente: str
+
+    __slots__ = (
+        "fecha",
+        "tipo_cambio",
+        "moneda_origen",
+        "moneda_destino",
+        "tipo",
+        "año",
+        "mes",
+        "fuente",
+    )
+    _intern = frozenset({"moneda_origen", "moneda_destino", "tipo", "año", "mes", "fuente"})
+
+
+@register("banxico/tipo_cambio_usd.json")
+class TipoCambioUSDCatalog(BanxicoSeriesCatalog):
     """
     Catalog of USD/MXN exchange rate FIX values
 
@@ -17,7 +48,9 @@ class TipoCambioUSDCatalog:
     Banco de México for transactions in foreign currency.
     """
 
-    _data: list[dict] | None = None
+    _data: list[TipoCambioRecord] | None = None
+    _series = None
+    _value_field = "tipo_cambio"
     _by_fecha: dict[str, dict] | None = None
     _by_anio: dict[int, list[dict]] | None = None
 
@@ -25,18 +58,10 @@ class TipoCambioUSDCatalog:
     def _load_data(cls) -> None:
         """Load exchange rate data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/banxico/tipo_cambio_usd.py
-            # Target: catalogmx/packages/shared-data/banxico/tipo_cambio_usd.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "tipo_cambio_usd.json"
-            )
-
-            with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+            shared_data_path = data_path(cls)
+
+            # Uses the binary snapshot (.snap) when it is up to date with the JSON
+            cls._data = load_records(shared_data_path, TipoCambioRecord)
 
         if cls._by_fecha is not None:
             return
@@ -69,7 +94,7 @@ class TipoCambioUSDCatalog:
         :return: List of all exchange rate records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_fecha(cls, fecha: str) -> dict | None:
@@ -81,7 +106,7 @@ class TipoCambioUSDCatalog:
         """
         cls._load_data()
         record = cls._by_fecha.get(fecha)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> list[dict]:
@@ -93,7 +118,7 @@ class TipoCambioUSDCatalog:
         """
         cls._load_data()
         records = cls._by_anio.get(anio, [])
-        return [record.copy() for record in records]
+        return copy_dicts(records)
 
     @classmethod
     def get_actual(cls) -> dict | None:
@@ -109,7 +134,7 @@ class TipoCambioUSDCatalog:
 
         # Get the most recent record
         record = max(cls._data, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_valor_actual(cls) -> float | None:
@@ -161,6 +186,31 @@ class TipoCambioUSDCatalog:
         rate = record.get("tipo_cambio")
         return mxn / rate if rate else None
 
+    @classmethod
+    def usd_a_mxn_many(cls, usd: Any, fechas: Any, fill: str = "exact") -> Any:
+        """
+        Convert many USD amounts to MXN (batch version of usd_a_mxn)
+
+        :param usd: Amounts in USD (list, array.array or NumPy array)
+        :param fechas: Dates, one per amount
+        :param fill: Policy for dates without a FIX ("exact" like usd_a_mxn,
+            "previous", "next" or "nearest")
+        :return: Amounts in MXN, same container type as usd
+        """
+        return cls.convert_many(usd, fechas, fill=fill)
+
+    @classmethod
+    def mxn_a_usd_many(cls, mxn: Any, fechas: Any, fill: str = "exact") -> Any:
+        """
+        Convert many MXN amounts to USD (batch version of mxn_a_usd)
+
+        :param mxn: Amounts in MXN (list, array.array or NumPy array)
+        :param fechas: Dates, one per amount
+        :param fill: Policy for dates without a FIX (see usd_a_mxn_many)
+        :return: Amounts in USD, same container type as mxn
+        """
+        return cls.convert_many(mxn, fechas, divide=True, fill=fill)
+
     @classmethod
     def calcular_variacion(cls, fecha_inicio: str, fecha_fin: str) -> float | None:
         """
@@ -5,12 +5,32 @@ This module provides access to UDI values from Banco de México.
 UDIs are inflation-indexed investment units used in Mexico.
 """
 
-import json
-from datetime import datetime
-from pathlib import Path
+from typing import Any
 
+from catalogmx.catalogs.banxico.series import BanxicoSeriesCatalog
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.snapshot import load_records
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
 
-class UDICatalog:
+
+class UDIRecord(Record):
+    """UDI value (daily value or monthly/annual average)"""
+
+    fecha: str
+    valor: float
+    moneda: str
+    tipo: str
+    año: int
+    mes: int
+    notas: str
+
+    __slots__ = ("fecha", "valor", "moneda", "tipo", "año", "mes", "notas")
+    _intern = frozenset({"moneda", "tipo", "año", "mes", "notas"})
+
+
+@register("banxico/udis.json")
+class UDICatalog(BanxicoSeriesCatalog):
     """
     Catalog of UDI (Unidades de Inversión) values
 
@@ -18,32 +38,29 @@ class UDICatalog:
     They are commonly used for mortgage loans and other long-term financial obligations.
     """
 
-    _data: list[dict] | None = None
+    _data: list[UDIRecord] | None = None
+    _series = None
+    _value_field = "valor"
     _by_fecha: dict[str, dict] | None = None
     _mensual: dict[str, dict] | None = None
     _anual: dict[int, dict] | None = None
     _daily: list[dict] | None = None
+    #: The ``_data`` list the indexes were built from
+    _indexed_data: list[UDIRecord] | None = None
 
     @classmethod
     def _load_data(cls) -> None:
         """Load UDI data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/banxico/udis.py
-            # Target: catalogmx/packages/shared-data/banxico/udis.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "banxico"
-                / "udis.json"
-            )
-
-            with open(shared_data_path, encoding="utf-8") as f:
-                cls._data = json.load(f)
-
-        if cls._by_fecha is not None:
+            shared_data_path = data_path(cls)
+
+            # Uses the binary snapshot (.snap) when it is up to date with the JSON
+            cls._data = load_records(shared_data_path, UDIRecord)
+
+        if cls._by_fecha is not None and cls._indexed_data is cls._data:
             return
 
+        cls._indexed_data = cls._data
         cls._by_fecha = {}
         cls._mensual = {}
         cls._anual = {}
@@ -83,7 +100,7 @@ class UDICatalog:
         :return: List of all UDI records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def _get_by_fecha(cls, fecha: str) -> dict | None:
@@ -108,7 +125,7 @@ class UDICatalog:
         :return: UDI record or None if not found
         """
         record = cls._get_by_fecha(fecha)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_mes(cls, anio: int, mes: int) -> dict | None:
@@ -122,7 +139,7 @@ class UDICatalog:
         cls._load_data()
         key = f"{anio}-{mes:02d}"
         record = cls._mensual.get(key) if cls._mensual else None
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_promedio_anual(cls, anio: int) -> dict | None:
@@ -135,7 +152,7 @@ class UDICatalog:
         cls._load_data()
 
         record = cls._anual.get(anio) if cls._anual else None
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> list[dict]:
@@ -147,7 +164,7 @@ class UDICatalog:
             if cls._daily
             else [r for r in cls._data if r.get("tipo") == "promedio_mensual"]
         )
-        return [record.copy() for record in source if record.get("año") == anio]
+        return copy_dicts(record for record in source if record.get("año") == anio)
 
     @classmethod
     def get_actual(cls) -> dict | None:
@@ -159,31 +176,25 @@ class UDICatalog:
         cls._load_data()
 
         if cls._daily:
-            return cls._daily[-1].copy()
+            return copy_dict(cls._daily[-1])
 
         if not cls._data:
             return None
 
         record = max(cls._data, key=lambda r: r.get("fecha", ""), default=None)
-        return record.copy() if record else None
+        return copy_dict(record)
 
     @classmethod
-    def _get_valor_cercano(cls, fecha: str) -> dict | None:
+    def _series_records(cls) -> list[dict]:
+        """Daily values, or monthly averages when there is no daily data"""
         cls._load_data()
-        objetivo = datetime.fromisoformat(fecha)
-
-        candidatos = (
-            cls._daily
-            if cls._daily
-            else [r for r in cls._data if r.get("tipo") == "promedio_mensual"]
-        )
-        if not candidatos:
-            return None
-
-        def _diff(record: dict) -> float:
-            return abs((datetime.fromisoformat(record["fecha"]) - objetivo).total_seconds())
+        if cls._daily:
+            return cls._daily
+        return [r for r in cls._data if r.get("tipo") == "promedio_mensual"]
 
-        return min(candidatos, key=_diff)
+    @classmethod
+    def _get_valor_cercano(cls, fecha: str) -> dict | None:
+        return cls._get_series().record(fecha, fill="nearest")
 
     @classmethod
     def pesos_a_udis(cls, pesos: float, fecha: str) -> float | None:
@@ -227,6 +238,31 @@ class UDICatalog:
 
         return udis * valor_udi
 
+    @classmethod
+    def pesos_a_udis_many(cls, pesos: Any, fechas: Any, fill: str = "nearest") -> Any:
+        """
+        Convert many peso amounts to UDIs (batch version of pesos_a_udis)
+
+        :param pesos: Amounts in pesos (list, array.array or NumPy array)
+        :param fechas: Dates, one per amount
+        :param fill: Policy for dates without a UDI value ("nearest" like
+            pesos_a_udis, "exact", "previous" or "next")
+        :return: Amounts in UDIs, same container type as pesos
+        """
+        return cls.convert_many(pesos, fechas, divide=True, fill=fill)
+
+    @classmethod
+    def udis_a_pesos_many(cls, udis: Any, fechas: Any, fill: str = "nearest") -> Any:
+        """
+        Convert many UDI amounts to pesos (batch version of udis_a_pesos)
+
+        :param udis: Amounts in UDIs (list, array.array or NumPy array)
+        :param fechas: Dates, one per amount
+        :param fill: Policy for dates without a UDI value (see pesos_a_udis_many)
+        :return: Amounts in pesos, same container type as udis
+        """
+        return cls.convert_many(udis, fechas, fill=fill)
+
     @classmethod
     def calcular_variacion(cls, fecha_inicio: str, fecha_fin: str) -> float | None:
         """
@@ -255,7 +291,7 @@ class UDICatalog:
 def get_udi_actual() -> dict | None:
     """Get most recent UDI value"""
     record = UDICatalog.get_actual()
-    return record.copy() if record else None
+    return copy_dict(record)
 
 
 def get_udi_por_fecha(fecha: str) -> dict | None:
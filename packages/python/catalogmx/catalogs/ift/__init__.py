@@ -5,7 +5,14 @@ Catálogos del Instituto Federal de Telecomunicaciones:
 - OperadoresMovilesCatalog: Operadores de telefonía móvil
 """
 
-from .operadores_moviles import OperadoresMovilesCatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .operadores_moviles import OperadoresMovilesCatalog
+
+__getattr__, __dir__ = lazy_exports(__name__, {"OperadoresMovilesCatalog": ".operadores_moviles"})
 
 __all__ = [
     "OperadoresMovilesCatalog",
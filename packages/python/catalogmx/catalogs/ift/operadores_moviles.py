@@ -6,9 +6,11 @@ registrados ante el Instituto Federal de Telecomunicaciones (IFT).
 """
 
 import json
-from pathlib import Path
 from typing import TypedDict
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
+
 
 class OperadorMovil(TypedDict):
     """Estructura de un operador móvil"""
@@ -25,6 +27,7 @@ class OperadorMovil(TypedDict):
     activo: bool
 
 
+@register("ift/operadores_moviles.json")
 class OperadoresMovilesCatalog:
     """
     Catálogo de operadores de telefonía móvil en México.
@@ -61,16 +64,9 @@ class OperadoresMovilesCatalog:
         if cls._data is not None:
             return
 
-        # Path: catalogmx/packages/python/catalogmx/catalogs/ift/operadores_moviles.py
-        # Target: catalogmx/packages/shared-data/ift/operadores_moviles.json
-        data_path = (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "shared-data"
-            / "ift"
-            / "operadores_moviles.json"
-        )
+        path = data_path(cls)
 
-        with open(data_path, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             json_data = json.load(f)
             cls._data = json_data["operadores"]
 
@@ -90,7 +86,7 @@ class OperadoresMovilesCatalog:
             >>> print(f"Total operadores: {len(operadores)}")
         """
         cls._load_data()
-        return cls._data.copy()  # type: ignore
+        return copy_list(cls._data)  # type: ignore
 
     @classmethod
     def get_activos(cls) -> list[OperadorMovil]:
@@ -8,14 +8,33 @@ Catálogos incluidos:
 - StateCatalog: Estados de México
 """
 
-from .localidades import LocalidadesCatalog
-from .municipios import MunicipiosCatalog
-from .municipios_completo import MunicipiosCompletoCatalog
-from .states import StateCatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .localidades import Localidad, LocalidadesCatalog
+    from .municipios import MunicipiosCatalog
+    from .municipios_completo import Municipio, MunicipiosCompletoCatalog
+    from .states import StateCatalog
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Localidad": ".localidades",
+        "LocalidadesCatalog": ".localidades",
+        "MunicipiosCatalog": ".municipios",
+        "Municipio": ".municipios_completo",
+        "MunicipiosCompletoCatalog": ".municipios_completo",
+        "StateCatalog": ".states",
+    },
+)
 
 __all__ = [
     "MunicipiosCatalog",
     "MunicipiosCompletoCatalog",
     "LocalidadesCatalog",
     "StateCatalog",
+    "Localidad",
+    "Municipio",
 ]
@@ -1,11 +1,66 @@
 """Catálogo de Localidades INEGI (filtrado por población)"""
 
 import json
-from pathlib import Path
-
-from catalogmx.utils.text import normalize_text
-
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.geo import GridIndex
+from catalogmx.utils.records import Record
+from catalogmx.utils.search import TokenIndex
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
+
+
+class Localidad(Record):
+    """Localidad INEGI (una fila del catálogo)"""
+
+    cvegeo: str
+    cve_entidad: str
+    nom_entidad: str
+    nom_abr_entidad: str
+    cve_municipio: str
+    nom_municipio: str
+    cve_localidad: str
+    nom_localidad: str
+    ambito: str
+    latitud: float | None
+    longitud: float | None
+    altitud: int | None
+    poblacion_total: int
+    poblacion_masculina: int
+    poblacion_femenina: int
+    viviendas_habitadas: int
+
+    __slots__ = (
+        "cvegeo",
+        "cve_entidad",
+        "nom_entidad",
+        "nom_abr_entidad",
+        "cve_municipio",
+        "nom_municipio",
+        "cve_localidad",
+        "nom_localidad",
+        "ambito",
+        "latitud",
+        "longitud",
+        "altitud",
+        "poblacion_total",
+        "poblacion_masculina",
+        "poblacion_femenina",
+        "viviendas_habitadas",
+    )
+    _intern = frozenset(
+        {
+            "cve_entidad",
+            "nom_entidad",
+            "nom_abr_entidad",
+            "cve_municipio",
+            "nom_municipio",
+            "cve_localidad",
+            "ambito",
+        }
+    )
+
+
+@register("inegi/localidades.json")
 class LocalidadesCatalog:
     """
     Catálogo de localidades de México con 1,000+ habitantes.
@@ -17,24 +72,19 @@ class LocalidadesCatalog:
     - Clasificación urbano/rural
     """
 
-    _data: list[dict] | None = None
+    _data: list[Localidad] | None = None
     _by_cvegeo: dict[str, dict] | None = None
     _by_municipio: dict[str, list[dict]] | None = None
     _by_entidad: dict[str, list[dict]] | None = None
+    _name_index: TokenIndex | None = None
+    _geo_index: GridIndex | None = None
 
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/inegi/localidades.py
-            # Target: catalogmx/packages/shared-data/inegi/localidades.json
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent
-                / "shared-data"
-                / "inegi"
-                / "localidades.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+                cls._data = Localidad.from_dicts(json.load(f))
 
             # Crear índices
             cls._by_cvegeo = {item["cvegeo"]: item for item in cls._data}
@@ -55,6 +105,14 @@ class LocalidadesCatalog:
                     cls._by_entidad[cve_ent] = []
                 cls._by_entidad[cve_ent].append(item)
 
+            # Índice invertido para búsqueda por nombre (insensible a acentos)
+            cls._name_index = TokenIndex(cls._data, key=lambda loc: loc["nom_localidad"])
+
+            # Índice espacial (celdas de 0.25°) para búsquedas por coordenadas
+            cls._geo_index = GridIndex(
+                cls._data, lat=lambda loc: loc["latitud"], lon=lambda loc: loc["longitud"]
+            )
+
     @classmethod
     def get_localidad(cls, cvegeo: str) -> dict | None:
         """
@@ -67,7 +125,7 @@ class LocalidadesCatalog:
             Diccionario con datos de la localidad o None si no existe
         """
         cls._load_data()
-        return cls._by_cvegeo.get(cvegeo)
+        return copy_dict(cls._by_cvegeo.get(cvegeo))
 
     @classmethod
     def is_valid(cls, cvegeo: str) -> bool:
@@ -86,7 +144,7 @@ class LocalidadesCatalog:
             Lista de localidades del municipio
         """
         cls._load_data()
-        return cls._by_municipio.get(cve_municipio, []).copy()
+        return copy_list(cls._by_municipio.get(cve_municipio, []))
 
     @classmethod
     def get_by_entidad(cls, cve_entidad: str) -> list[dict]:
@@ -101,25 +159,25 @@ class LocalidadesCatalog:
         """
         cls._load_data()
         cve_ent = cve_entidad.zfill(2)
-        return cls._by_entidad.get(cve_ent, []).copy()
+        return copy_list(cls._by_entidad.get(cve_ent, []))
 
     @classmethod
     def get_all(cls) -> list[dict]:
         """Obtiene todas las localidades"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_urbanas(cls) -> list[dict]:
         """Obtiene solo localidades urbanas"""
         cls._load_data()
-        return [loc for loc in cls._data if loc["ambito"] == "U"]
+        return copy_dicts(loc for loc in cls._data if loc["ambito"] == "U")
 
     @classmethod
     def get_rurales(cls) -> list[dict]:
         """Obtiene solo localidades rurales"""
         cls._load_data()
-        return [loc for loc in cls._data if loc["ambito"] == "R"]
+        return copy_dicts(loc for loc in cls._data if loc["ambito"] == "R")
 
     @classmethod
     def search_by_name(cls, nombre: str) -> list[dict]:
@@ -138,10 +196,7 @@ class LocalidadesCatalog:
             >>> locs = LocalidadesCatalog.search_by_name("san josé")  # mismo resultado
         """
         cls._load_data()
-        nombre_normalized = normalize_text(nombre)
-        return [
-            loc for loc in cls._data if nombre_normalized in normalize_text(loc["nom_localidad"])
-        ]
+        return copy_dicts(cls._name_index.search(nombre))
 
     @classmethod
     def get_by_coordinates(cls, lat: float, lon: float, radio_km: float = 10) -> list[dict]:
@@ -156,36 +211,60 @@ class LocalidadesCatalog:
         Returns:
             Lista de localidades dentro del radio, ordenadas por distancia
         """
-        from math import atan2, cos, radians, sin, sqrt
-
         cls._load_data()
+        # Mismo orden que un recorrido completo: por distancia redondeada y,
+        # en empate, por posición en el catálogo
+        hits = sorted(cls._geo_index.within(lat, lon, radio_km))
+        resultados = [cls._con_distancia(doc, distancia) for doc, distancia in hits]
+        resultados.sort(key=lambda x: x["distancia_km"])
+        return resultados
 
-        def distancia_haversine(lat1, lon1, lat2, lon2):
-            """Calcula distancia en km entre dos puntos GPS"""
-            R = 6371  # Radio de la Tierra en km
+    @classmethod
+    def _con_distancia(cls, doc: int, distancia: float) -> dict:
+        loc_con_distancia = dict(cls._data[doc])
+        loc_con_distancia["distancia_km"] = round(distancia, 2)
+        return loc_con_distancia
 
-            dlat = radians(lat2 - lat1)
-            dlon = radians(lon2 - lon1)
+    @classmethod
+    def nearest(cls, lat: float, lon: float, k: int = 1) -> list[dict]:
+        """
+        Obtiene las k localidades más cercanas a unas coordenadas.
 
-            a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-            c = 2 * atan2(sqrt(a), sqrt(1 - a))
+        Args:
+            lat: Latitud
+            lon: Longitud
+            k: Número de localidades a devolver (default: 1)
 
-            return R * c
+        Returns:
+            Lista de localidades con "distancia_km", de la más cercana a la más lejana
 
-        resultados = []
-        for loc in cls._data:
-            if loc["latitud"] is None or loc["longitud"] is None:
-                continue
+        Ejemplo:
+            >>> LocalidadesCatalog.nearest(21.8853, -102.2916, k=3)
+        """
+        cls._load_data()
+        return [cls._con_distancia(doc, d) for doc, d in cls._geo_index.nearest(lat, lon, k)]
 
-            distancia = distancia_haversine(lat, lon, loc["latitud"], loc["longitud"])
-            if distancia <= radio_km:
-                loc_con_distancia = loc.copy()
-                loc_con_distancia["distancia_km"] = round(distancia, 2)
-                resultados.append(loc_con_distancia)
+    @classmethod
+    def nearest_many(cls, points: list[tuple[float, float]], k: int = 1) -> list[list[dict]]:
+        """
+        Versión por lotes de nearest() para muchas coordenadas (usa NumPy si está instalado).
 
-        # Ordenar por distancia
-        resultados.sort(key=lambda x: x["distancia_km"])
-        return resultados
+        Args:
+            points: Lista de tuplas (latitud, longitud)
+            k: Número de localidades por punto (default: 1)
+
+        Returns:
+            Una lista de localidades por punto, en el mismo orden que points
+
+        Ejemplo:
+            >>> paradas = [(19.4326, -99.1332), (20.6597, -103.3496)]
+            >>> LocalidadesCatalog.nearest_many(paradas)
+        """
+        cls._load_data()
+        return [
+            [cls._con_distancia(doc, d) for doc, d in hits]
+            for hits in cls._geo_index.nearest_many(points, k)
+        ]
 
     @classmethod
     def get_by_population_range(cls, min_pob: int, max_pob: int | None = None) -> list[dict]:
@@ -202,6 +281,8 @@ class LocalidadesCatalog:
         cls._load_data()
 
         if max_pob is None:
-            return [loc for loc in cls._data if loc["poblacion_total"] >= min_pob]
+            return copy_dicts(loc for loc in cls._data if loc["poblacion_total"] >= min_pob)
         else:
-            return [loc for loc in cls._data if min_pob <= loc["poblacion_total"] <= max_pob]
+            return copy_dicts(
+                loc for loc in cls._data if min_pob <= loc["poblacion_total"] <= max_pob
+            )
@@ -1,11 +1,13 @@
 """Catálogo de Municipios INEGI"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_list
 
 
+@register("inegi/municipios_completo.json")
 class MunicipiosCatalog:
     _data: list[dict] | None = None
     _by_cve_completa: dict[str, dict] | None = None
@@ -14,14 +16,7 @@ class MunicipiosCatalog:
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/inegi/municipios.py
-            # Target: catalogmx/packages/shared-data/inegi/municipios_completo.json
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent
-                / "shared-data"
-                / "inegi"
-                / "municipios_completo.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 cls._data = json.load(f)
 
@@ -56,7 +51,7 @@ class MunicipiosCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los municipios"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def search_by_name(cls, nombre: str) -> list[dict]:
@@ -5,10 +5,55 @@ Catálogo completo de todos los 2,469 municipios de México
 (2,462 municipios + 7 alcaldías CDMX)
 """
 
-import json
-from pathlib import Path
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.search import TokenIndex
+from catalogmx.utils.snapshot import load_records
+from catalogmx.utils.views import copy_dict, copy_dicts, copy_list
+
+
+class Municipio(Record):
+    """Municipio INEGI con datos de población"""
+
+    cve_entidad: str
+    nom_entidad: str
+    nom_abr_entidad: str
+    cve_municipio: str
+    nom_municipio: str
+    cve_completa: str
+    cve_cabecera: str
+    nom_cabecera: str
+    poblacion_total: int
+    poblacion_masculina: int
+    poblacion_femenina: int
+    viviendas_habitadas: int
+
+    __slots__ = (
+        "cve_entidad",
+        "nom_entidad",
+        "nom_abr_entidad",
+        "cve_municipio",
+        "nom_municipio",
+        "cve_completa",
+        "cve_cabecera",
+        "nom_cabecera",
+        "poblacion_total",
+        "poblacion_masculina",
+        "poblacion_femenina",
+        "viviendas_habitadas",
+    )
+    _intern = frozenset(
+        {
+            "cve_entidad",
+            "nom_entidad",
+            "nom_abr_entidad",
+            "cve_municipio",
+            "cve_cabecera",
+        }
+    )
 
 
+@register("inegi/municipios_completo.json")
 class MunicipiosCompletoCatalog:
     """
     Catálogo completo de municipios mexicanos.
@@ -42,7 +87,8 @@ class MunicipiosCompletoCatalog:
         >>> print(f"Jalisco tiene {len(jalisco)} municipios")
     """
 
-    _data: list[dict] | None = None
+    _data: list[Municipio] | None = None
+    _name_index: TokenIndex | None = None
 
     @classmethod
     def _load_data(cls) -> None:
@@ -50,17 +96,12 @@ class MunicipiosCompletoCatalog:
         if cls._data is not None:
             return
 
-        # Path: catalogmx/packages/python/catalogmx/catalogs/inegi/municipios_completo.py
-        # Target: catalogmx/packages/shared-data/inegi/municipios_completo.json
-        data_path = (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "shared-data"
-            / "inegi"
-            / "municipios_completo.json"
-        )
+        path = data_path(cls)
 
-        with open(data_path, encoding="utf-8") as f:
-            cls._data = json.load(f)
+        # Usa el snapshot binario (.snap) si está al día con el JSON
+        cls._data = load_records(path, Municipio)
+
+        cls._name_index = TokenIndex(cls._data, key=lambda mun: mun["nom_municipio"])
 
     @classmethod
     def get_all(cls) -> list[dict]:
@@ -77,7 +118,7 @@ class MunicipiosCompletoCatalog:
             >>> print(f"Total: {len(municipios)}")  # 2469
         """
         cls._load_data()
-        return cls._data.copy()  # type: ignore
+        return copy_list(cls._data)  # type: ignore
 
     @classmethod
     def get_municipio(cls, cve_completa: str) -> dict | None:
@@ -97,7 +138,7 @@ class MunicipiosCompletoCatalog:
         cls._load_data()
         for mun in cls._data:  # type: ignore
             if mun["cve_completa"] == cve_completa:
-                return mun
+                return copy_dict(mun)  # type: ignore
         return None
 
     @classmethod
@@ -116,12 +157,12 @@ class MunicipiosCompletoCatalog:
             >>> print(f"Jalisco: {len(jalisco)} municipios")
         """
         cls._load_data()
-        return [mun for mun in cls._data if mun["cve_entidad"] == cve_entidad]  # type: ignore
+        return copy_dicts(mun for mun in cls._data if mun["cve_entidad"] == cve_entidad)  # type: ignore
 
     @classmethod
     def search_by_name(cls, name: str) -> list[dict]:
         """
-        Busca municipios por nombre (case-insensitive).
+        Busca municipios por nombre (insensible a acentos y mayúsculas).
 
         Args:
             name: Nombre o parte del nombre a buscar
@@ -135,10 +176,7 @@ class MunicipiosCompletoCatalog:
             ...     print(f"{mun['nom_municipio']}, {mun['nom_entidad']}")
         """
         cls._load_data()
-        search_term = name.upper()
-        return [
-            mun for mun in cls._data if search_term in mun["nom_municipio"].upper()  # type: ignore
-        ]
+        return copy_dicts(cls._name_index.search(name))  # type: ignore
 
     @classmethod
     def get_by_state_name(cls, state_name: str) -> list[dict]:
@@ -158,9 +196,9 @@ class MunicipiosCompletoCatalog:
         """
         cls._load_data()
         search_term = state_name.upper()
-        return [
+        return copy_dicts(
             mun for mun in cls._data if mun["nom_entidad"].upper() == search_term  # type: ignore
-        ]
+        )
 
     @classmethod
     def get_count_by_entidad(cls, cve_entidad: str) -> int:
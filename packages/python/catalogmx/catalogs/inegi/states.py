@@ -6,11 +6,13 @@ This module provides access to the official catalog of Mexican states
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_dict, copy_list
 
 
+@register("inegi/states.json")
 class StateCatalog:
     """
     Catalog of Mexican states
@@ -26,14 +28,7 @@ class StateCatalog:
     def _load_data(cls) -> None:
         """Load state data from JSON file"""
         if cls._data is None:
-            # Get path to shared data
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "inegi"
-                / "states.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -61,7 +56,7 @@ class StateCatalog:
         :return: List of state dictionaries
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_state_by_code(cls, code: str) -> dict | None:
@@ -132,7 +127,7 @@ class StateCatalog:
 def get_states_dict() -> dict[str, dict]:
     """Get dictionary of all states indexed by CURP code"""
     StateCatalog._load_data()
-    return StateCatalog._state_by_code.copy()
+    return copy_dict(StateCatalog._state_by_code)
 
 
 def get_state_names() -> list[str]:
@@ -4,10 +4,25 @@ Mexican National Catalogs
 This module provides access to various Mexican national catalogs.
 """
 
-from .hoy_no_circula import HoyNoCirculaCatalog
-from .placas_formatos import PlacasFormatosCatalog
-from .salarios_minimos import SalariosMinimos
-from .uma import UMACatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .hoy_no_circula import HoyNoCirculaCatalog
+    from .placas_formatos import PlacasFormatosCatalog
+    from .salarios_minimos import SalariosMinimos
+    from .uma import UMACatalog
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "HoyNoCirculaCatalog": ".hoy_no_circula",
+        "PlacasFormatosCatalog": ".placas_formatos",
+        "SalariosMinimos": ".salarios_minimos",
+        "UMACatalog": ".uma",
+    },
+)
 
 __all__ = [
     "PlacasFormatosCatalog",
@@ -6,9 +6,12 @@ for Mexico City (CDMX) and Estado de México.
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_dict, copy_list
 
+
+@register("mexico/hoy_no_circula_cdmx.json")
 class HoyNoCirculaCatalog:
     """
     Catalog for Hoy No Circula traffic restriction program
@@ -24,15 +27,7 @@ class HoyNoCirculaCatalog:
     def _load_data(cls) -> None:
         """Load Hoy No Circula data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/mexico/hoy_no_circula.py
-            # Target: catalogmx/packages/shared-data/mexico/hoy_no_circula_cdmx.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "mexico"
-                / "hoy_no_circula_cdmx.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -45,7 +40,7 @@ class HoyNoCirculaCatalog:
         :return: Complete Hoy No Circula data dictionary
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_dict(cls._data)
 
     @classmethod
     def get_restricciones(cls) -> list[dict]:
@@ -55,7 +50,7 @@ class HoyNoCirculaCatalog:
         :return: List of restriction dictionaries
         """
         cls._load_data()
-        return cls._data.get("restricciones_por_dia", []).copy()
+        return copy_list(cls._data.get("restricciones_por_dia", []))
 
     @classmethod
     def get_restriccion_por_dia(cls, dia: str) -> dict | None:
@@ -70,7 +65,7 @@ class HoyNoCirculaCatalog:
 
         for restriccion in restricciones:
             if restriccion.get("dia", "").lower() == dia.lower():
-                return restriccion.copy()
+                return copy_dict(restriccion)
 
         return None
 
@@ -82,7 +77,7 @@ class HoyNoCirculaCatalog:
         :return: List of exemption dictionaries
         """
         cls._load_data()
-        return cls._data.get("exenciones_por_holograma", []).copy()
+        return copy_list(cls._data.get("exenciones_por_holograma", []))
 
     @classmethod
     def get_exencion_por_holograma(cls, holograma: str) -> dict | None:
@@ -97,7 +92,7 @@ class HoyNoCirculaCatalog:
 
         for exencion in exenciones:
             if exencion.get("holograma") == holograma:
-                return exencion.copy()
+                return copy_dict(exencion)
 
         return None
 
@@ -177,7 +172,7 @@ class HoyNoCirculaCatalog:
         :return: Dictionary with environmental contingency rules
         """
         cls._load_data()
-        return cls._data.get("contingencias_ambientales", {}).copy()
+        return copy_dict(cls._data.get("contingencias_ambientales", {}))
 
     @classmethod
     def get_sabatinos(cls) -> dict:
@@ -187,7 +182,7 @@ class HoyNoCirculaCatalog:
         :return: Dictionary with Saturday restriction rules
         """
         cls._load_data()
-        return cls._data.get("sabatinos", {}).copy()
+        return copy_dict(cls._data.get("sabatinos", {}))
 
 
 # Convenience functions
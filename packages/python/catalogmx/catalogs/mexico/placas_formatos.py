@@ -7,9 +7,12 @@ according to NOM-001-SCT-2-2016.
 
 import json
 import re
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_dict, copy_list
 
+
+@register("mexico/placas_formatos.json")
 class PlacasFormatosCatalog:
     """
     Catalog of Mexican license plate formats
@@ -24,15 +27,7 @@ class PlacasFormatosCatalog:
     def _load_data(cls) -> None:
         """Load license plate formats from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/mexico/placas_formatos.py
-            # Target: catalogmx/packages/shared-data/mexico/placas_formatos.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "mexico"
-                / "placas_formatos.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -45,7 +40,7 @@ class PlacasFormatosCatalog:
         :return: List of all plate format dictionaries
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def validate_placa(cls, placa: str) -> bool:
@@ -109,7 +104,7 @@ class PlacasFormatosCatalog:
         for formato in cls._data:
             pattern = formato["pattern"]
             if re.match(pattern, normalized_placa):
-                return formato.copy()
+                return copy_dict(formato)
 
         return None
 
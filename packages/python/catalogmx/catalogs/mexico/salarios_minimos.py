@@ -5,9 +5,12 @@ This module provides access to historical minimum wage data for Mexico.
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_dict, copy_list
 
+
+@register("mexico/salarios_minimos.json")
 class SalariosMinimos:
     """
     Catalog of Mexican minimum wages
@@ -22,15 +25,7 @@ class SalariosMinimos:
     def _load_data(cls) -> None:
         """Load minimum wage data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/mexico/salarios_minimos.py
-            # Target: catalogmx/packages/shared-data/mexico/salarios_minimos.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "mexico"
-                / "salarios_minimos.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -43,7 +38,7 @@ class SalariosMinimos:
         :return: List of all minimum wage records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> dict | None:
@@ -57,7 +52,7 @@ class SalariosMinimos:
 
         for record in cls._data:
             if record["año"] == anio:
-                return record.copy()
+                return copy_dict(record)
 
         return None
 
@@ -74,7 +69,7 @@ class SalariosMinimos:
             return None
 
         # Data is sorted by year descending, so first element is most recent
-        return cls._data[0].copy()
+        return copy_dict(cls._data[0])
 
     @classmethod
     def calcular_mensual(cls, diario: float, dias: int = 30) -> float:
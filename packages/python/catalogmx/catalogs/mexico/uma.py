@@ -6,11 +6,14 @@ units for fines, taxes, and other obligations in Mexico.
 """
 
 import json
-from pathlib import Path
+
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_dict, copy_list
 
 from .salarios_minimos import SalariosMinimos
 
 
+@register("mexico/uma.json")
 class UMACatalog:
     """
     Catalog of UMA (Unidad de Medida y Actualización) values
@@ -26,15 +29,7 @@ class UMACatalog:
     def _load_data(cls) -> None:
         """Load UMA data from JSON file"""
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/mexico/uma.py
-            # Target: catalogmx/packages/shared-data/mexico/uma.json
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "mexico"
-                / "uma.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -47,7 +42,7 @@ class UMACatalog:
         :return: List of all UMA records
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_por_anio(cls, anio: int) -> dict | None:
@@ -61,7 +56,7 @@ class UMACatalog:
 
         for record in cls._data:
             if record["año"] == anio:
-                return record.copy()
+                return copy_dict(record)
 
         # Fallback to salary minimum equivalence for pre-2017 years
         salario = SalariosMinimos.get_por_anio(anio)
@@ -106,7 +101,7 @@ class UMACatalog:
             return None
 
         # Data is sorted by year descending, so first element is most recent
-        return cls._data[0].copy()
+        return copy_dict(cls._data[0])
 
     @classmethod
     def get_valor(cls, anio: int, tipo: str = "diario") -> float | None:
@@ -8,6 +8,21 @@ Módulos disponibles:
 - nomina: Catálogos para Complemento de Nómina 1.2
 """
 
-from . import carta_porte, cfdi_4, comercio_exterior, nomina
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from . import carta_porte, cfdi_4, comercio_exterior, nomina
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "carta_porte": ".carta_porte",
+        "cfdi_4": ".cfdi_4",
+        "comercio_exterior": ".comercio_exterior",
+        "nomina": ".nomina",
+    },
+)
 
 __all__ = ["cfdi_4", "comercio_exterior", "carta_porte", "nomina"]
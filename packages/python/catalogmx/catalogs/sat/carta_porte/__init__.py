@@ -1,12 +1,30 @@
 """Catálogos SAT Carta Porte 3.0"""
 
-from .aeropuertos import AeropuertosCatalog
-from .carreteras import CarreterasCatalog
-from .config_autotransporte import ConfigAutotransporteCatalog
-from .material_peligroso import MaterialPeligrosoCatalog
-from .puertos_maritimos import PuertosMaritimos
-from .tipo_embalaje import TipoEmbalajeCatalog
-from .tipo_permiso import TipoPermisoCatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .aeropuertos import AeropuertosCatalog
+    from .carreteras import CarreterasCatalog
+    from .config_autotransporte import ConfigAutotransporteCatalog
+    from .material_peligroso import MaterialPeligrosoCatalog
+    from .puertos_maritimos import PuertosMaritimos
+    from .tipo_embalaje import TipoEmbalajeCatalog
+    from .tipo_permiso import TipoPermisoCatalog
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AeropuertosCatalog": ".aeropuertos",
+        "CarreterasCatalog": ".carreteras",
+        "ConfigAutotransporteCatalog": ".config_autotransporte",
+        "MaterialPeligrosoCatalog": ".material_peligroso",
+        "PuertosMaritimos": ".puertos_maritimos",
+        "TipoEmbalajeCatalog": ".tipo_embalaje",
+        "TipoPermisoCatalog": ".tipo_permiso",
+    },
+)
 
 __all__ = [
     "AeropuertosCatalog",
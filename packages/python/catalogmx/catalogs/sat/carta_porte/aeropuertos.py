@@ -1,32 +1,31 @@
 """Catálogo c_CodigoTransporteAereo - Aeropuertos"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.search import TokenIndex
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_list
 
 
+@register("sat/carta_porte_3/aeropuertos.json")
 class AeropuertosCatalog:
     _data: list[dict] | None = None
     _by_code: dict[str, dict] | None = None
     _by_iata: dict[str, dict] | None = None
     _by_icao: dict[str, dict] | None = None
+    _name_index: TokenIndex | None = None
 
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "carta_porte_3"
-                / "aeropuertos.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 cls._data = json.load(f)
             cls._by_code = {item["code"]: item for item in cls._data}
             cls._by_iata = {item["iata"]: item for item in cls._data}
             cls._by_icao = {item["icao"]: item for item in cls._data}
+            cls._name_index = TokenIndex(cls._data, key=lambda a: a["name"])
 
     @classmethod
     def get_aeropuerto(cls, code: str) -> dict | None:
@@ -55,7 +54,7 @@ class AeropuertosCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los aeropuertos"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_by_state(cls, state: str) -> list[dict]:
@@ -72,5 +71,4 @@ class AeropuertosCatalog:
     def search_by_name(cls, name: str) -> list[dict]:
         """Busca aeropuertos por nombre (insensible a acentos)"""
         cls._load_data()
-        name_normalized = normalize_text(name)
-        return [a for a in cls._data if name_normalized in normalize_text(a["name"])]
+        return cls._name_index.search(name)
@@ -1,11 +1,13 @@
 """Catálogo c_Carreteras - Carreteras Federales"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_list
 
 
+@register("sat/carta_porte_3/carreteras.json")
 class CarreterasCatalog:
     _data: list[dict] | None = None
     _by_code: dict[str, dict] | None = None
@@ -13,13 +15,7 @@ class CarreterasCatalog:
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "carta_porte_3"
-                / "carreteras.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 cls._data = json.load(f)
             cls._by_code = {item["code"]: item for item in cls._data}
@@ -39,7 +35,7 @@ class CarreterasCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todas las carreteras"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_by_type(cls, tipo: str) -> list[dict]:
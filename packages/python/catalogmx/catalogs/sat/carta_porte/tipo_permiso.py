@@ -1,9 +1,12 @@
 """Catálogo c_TipoPermiso - Tipos de Permiso"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/carta_porte_3/tipo_permiso.json")
 class TipoPermisoCatalog:
     _data: list[dict] | None = None
     _by_code: dict[str, dict] | None = None
@@ -11,13 +14,7 @@ class TipoPermisoCatalog:
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "carta_porte_3"
-                / "tipo_permiso.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
                 # Handle both list and dict formats
@@ -39,7 +36,7 @@ class TipoPermisoCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los permisos"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_by_type(cls, tipo: str) -> list[dict]:
@@ -13,19 +13,51 @@ Catálogos incluidos:
 - c_ObjetoImp: Objeto de impuesto
 - c_ClaveUnidad: Claves de unidad de medida (~2,400 unidades)
 - c_ClaveProdServ: Claves de productos y servicios (~52,000 códigos - SQLite)
+
+CFDIValidator valida las claves de catálogo de un comprobante completo y
+xml_stream lee y valida comprobantes en XML (archivos, directorios y .zip).
 """
 
-from .clave_prod_serv import ClaveProdServCatalog
-from .clave_unidad import ClaveUnidadCatalog
-from .exportacion import ExportacionCatalog
-from .forma_pago import FormaPagoCatalog
-from .impuesto import ImpuestoCatalog
-from .metodo_pago import MetodoPagoCatalog
-from .objeto_imp import ObjetoImpCatalog
-from .regimen_fiscal import RegimenFiscalCatalog
-from .tipo_comprobante import TipoComprobanteCatalog
-from .tipo_relacion import TipoRelacionCatalog
-from .uso_cfdi import UsoCFDICatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .clave_prod_serv import ClaveProdServCatalog
+    from .clave_unidad import ClaveUnidadCatalog
+    from .exportacion import ExportacionCatalog
+    from .forma_pago import FormaPagoCatalog
+    from .impuesto import ImpuestoCatalog
+    from .metodo_pago import MetodoPagoCatalog
+    from .objeto_imp import ObjetoImpCatalog
+    from .regimen_fiscal import RegimenFiscalCatalog
+    from .tipo_comprobante import TipoComprobanteCatalog
+    from .tipo_relacion import TipoRelacionCatalog
+    from .uso_cfdi import UsoCFDICatalog
+    from .validator import CFDIValidator
+    from .xml_stream import iter_cfdi_xml, parse_cfdi_xml, validate_cfdi, validate_cfdi_path
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClaveProdServCatalog": ".clave_prod_serv",
+        "ClaveUnidadCatalog": ".clave_unidad",
+        "ExportacionCatalog": ".exportacion",
+        "FormaPagoCatalog": ".forma_pago",
+        "ImpuestoCatalog": ".impuesto",
+        "MetodoPagoCatalog": ".metodo_pago",
+        "ObjetoImpCatalog": ".objeto_imp",
+        "RegimenFiscalCatalog": ".regimen_fiscal",
+        "TipoComprobanteCatalog": ".tipo_comprobante",
+        "TipoRelacionCatalog": ".tipo_relacion",
+        "UsoCFDICatalog": ".uso_cfdi",
+        "CFDIValidator": ".validator",
+        "iter_cfdi_xml": ".xml_stream",
+        "parse_cfdi_xml": ".xml_stream",
+        "validate_cfdi": ".xml_stream",
+        "validate_cfdi_path": ".xml_stream",
+    },
+)
 
 __all__ = [
     "RegimenFiscalCatalog",
@@ -39,4 +71,9 @@ __all__ = [
     "ObjetoImpCatalog",
     "ClaveUnidadCatalog",
     "ClaveProdServCatalog",
+    "CFDIValidator",
+    "parse_cfdi_xml",
+    "iter_cfdi_xml",
+    "validate_cfdi",
+    "validate_cfdi_path",
 ]
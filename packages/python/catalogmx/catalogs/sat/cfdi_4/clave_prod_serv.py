@@ -6,12 +6,20 @@ Contiene ~52,000 códigos oficiales basados en UNSPSC (United Nations
 Standard Products and Services Code).
 
 Este módulo usa SQLite con FTS5 para búsqueda eficiente de texto completo.
+Opcionalmente el catálogo puede cargarse completo en memoria con
+load_into_memory() para resolver claves y prefijos sin consultar SQLite.
 """
 
 import sqlite3
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TypedDict
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.sqlite import SQLiteConnectionPool, fts_prefix_query
+
 
 class ClaveProdServ(TypedDict):
     """Estructura de una clave de producto/servicio"""
@@ -27,6 +35,7 @@ class ClaveProdServ(TypedDict):
     estimuloFranjaFronteriza: str
 
 
+@register("sqlite/clave_prod_serv.db", backend="sqlite", loader="_get_pool")
 class ClaveProdServCatalog:
     """
     Catálogo de claves de productos y servicios SAT CFDI 4.0.
@@ -61,36 +70,54 @@ class ClaveProdServCatalog:
     """
 
     _db_path: Path | None = None
-    _connection: sqlite3.Connection | None = None
+    _pool: SQLiteConnectionPool | None = None
+    # Árbol segmento → familia → clase con conteos, calculado una sola vez
+    _jerarquia: dict[str, dict] | None = None
+    # Modo en memoria: claves ordenadas como enteros (búsqueda binaria por
+    # prefijo) y filas paralelas a ese índice
+    _memory_index: array | None = None
+    _memory_rows: list[sqlite3.Row] | None = None
+    # Claves ordenadas como enteros para is_valid / is_valid_many (~210 KB)
+    _valid_index: array | None = None
 
     @classmethod
     def _get_db_path(cls) -> Path:
         """Obtiene la ruta a la base de datos SQLite"""
         if cls._db_path is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/sat/cfdi_4/clave_prod_serv.py
-            # Target: catalogmx/packages/shared-data/sqlite/clave_prod_serv.db
-            cls._db_path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sqlite"
-                / "clave_prod_serv.db"
-            )
+            cls._db_path = data_path(cls)
         return cls._db_path
 
+    @classmethod
+    def _get_pool(cls) -> SQLiteConnectionPool:
+        """Obtiene el pool de conexiones de solo lectura (una conexión por hilo)"""
+        if cls._pool is None:
+            cls._pool = SQLiteConnectionPool(
+                cls._get_db_path,
+                bootstrap=cls._ensure_schema,
+                needs_bootstrap=cls._needs_schema,
+            )
+        return cls._pool
+
     @classmethod
     def _get_connection(cls) -> sqlite3.Connection:
-        """Obtiene conexión a la base de datos (singleton)"""
-        if cls._connection is None:
-            db_path = cls._get_db_path()
-            if not db_path.exists():
-                raise FileNotFoundError(
-                    f"Database not found at {db_path}. "
-                    "Please ensure the clave_prod_serv.db file exists."
-                )
-            cls._connection = sqlite3.connect(str(db_path))
-            cls._connection.row_factory = sqlite3.Row
-            cls._ensure_schema(cls._connection)
-        return cls._connection
+        """Obtiene la conexión de solo lectura del hilo actual"""
+        db_path = cls._get_db_path()
+        if not db_path.exists():
+            raise FileNotFoundError(
+                f"Database not found at {db_path}. "
+                "Please ensure the clave_prod_serv.db file exists."
+            )
+        return cls._get_pool().get_connection()
+
+    @classmethod
+    def _needs_schema(cls, conn: sqlite3.Connection) -> bool:
+        """Indica si el archivo carece de las tablas o de datos"""
+        tables = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if not {"clave_prod_serv", "clave_prod_serv_fts"} <= tables:
+            return True
+        return conn.execute("SELECT 1 FROM clave_prod_serv LIMIT 1").fetchone() is None
 
     @classmethod
     def _ensure_schema(cls, conn: sqlite3.Connection) -> None:
@@ -118,7 +145,8 @@ class ClaveProdServCatalog:
                 complemento,
                 palabras_similares,
                 content='clave_prod_serv',
-                content_rowid='rowid'
+                content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2'
             )
             """
         )
@@ -155,10 +183,7 @@ class ClaveProdServCatalog:
                 """,
                 sample_rows,
             )
-            cursor.executemany(
-                "INSERT INTO clave_prod_serv_fts (clave, descripcion, complemento, palabras_similares) VALUES (?, ?, ?, ?)",
-                [(row[0], row[1], row[4], row[5]) for row in sample_rows],
-            )
+            cursor.execute("INSERT INTO clave_prod_serv_fts(clave_prod_serv_fts) VALUES('rebuild')")
             conn.commit()
 
     @classmethod
@@ -176,6 +201,58 @@ class ClaveProdServCatalog:
             "estimuloFranjaFronteriza": "",
         }
 
+    @staticmethod
+    def _prefix_upper(prefix: str) -> str:
+        """
+        Cota superior exclusiva de las claves con un prefijo ("4321" -> "4322").
+
+        Con ``clave >= prefix AND clave < upper`` SQLite recorre un rango del
+        índice de clave; ``LIKE 'prefix%'`` no puede usarlo porque por omisión
+        LIKE no distingue mayúsculas.
+        """
+        return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    @classmethod
+    def _memory_range(cls, prefix: str) -> tuple[int, int]:
+        """Posiciones [inicio, fin) del prefijo en el índice en memoria"""
+        index = cls._memory_index
+        if not prefix:
+            return 0, len(index)
+        if not prefix.isdigit() or len(prefix) > 8:
+            return 0, 0
+        scale = 10 ** (8 - len(prefix))
+        start = bisect_left(index, int(prefix) * scale)
+        end = bisect_left(index, (int(prefix) + 1) * scale)
+        return start, end
+
+    @classmethod
+    def load_into_memory(cls) -> None:
+        """
+        Carga el catálogo completo en memoria.
+
+        Las claves se guardan ordenadas en un arreglo compacto de enteros, de
+        modo que get_clave(), is_valid(), get_by_prefix() y count_by_prefix()
+        se resuelven con búsqueda binaria sin consultar SQLite. Las búsquedas
+        de texto (search, search_simple) siguen usando la base de datos.
+
+        Ejemplo:
+            >>> ClaveProdServCatalog.load_into_memory()
+            >>> ClaveProdServCatalog.get_by_prefix("432115")  # sin SQLite
+        """
+        if cls._memory_index is not None:
+            return
+        conn = cls._get_connection()
+        rows = conn.execute("SELECT * FROM clave_prod_serv").fetchall()
+        rows = [row for row in rows if row["clave"] and row["clave"].isdigit()]
+        rows.sort(key=lambda row: int(row["clave"]))
+        cls._memory_rows = rows
+        cls._memory_index = array("I", [int(row["clave"]) for row in rows])
+
+    @classmethod
+    def is_in_memory(cls) -> bool:
+        """Indica si el catálogo fue cargado con load_into_memory()"""
+        return cls._memory_index is not None
+
     @classmethod
     def get_all(cls) -> list[ClaveProdServ]:
         """
@@ -212,6 +289,12 @@ class ClaveProdServCatalog:
             >>> if producto:
             ...     print(producto['descripcion'])
         """
+        if cls._memory_index is not None:
+            start, end = cls._memory_range(id)
+            if len(id) == 8 and end > start:
+                return cls._row_to_clave(cls._memory_rows[start])
+            return None
+
         conn = cls._get_connection()
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM clave_prod_serv WHERE clave = ?", (id,))
@@ -233,18 +316,78 @@ class ClaveProdServCatalog:
             >>> ClaveProdServCatalog.is_valid("43211500")  # True
             >>> ClaveProdServCatalog.is_valid("99999999")  # False
         """
-        return cls.get_clave(id) is not None
+        if not isinstance(id, str) or len(id) != 8 or not id.isdigit():
+            return False
+        index = cls._get_valid_index()
+        value = int(id)
+        pos = bisect_left(index, value)
+        return pos < len(index) and index[pos] == value
+
+    @classmethod
+    def _get_valid_index(cls) -> array:
+        """Arreglo ordenado con todas las claves como enteros, construido una sola vez"""
+        if cls._valid_index is None:
+            if cls._memory_index is not None:
+                cls._valid_index = cls._memory_index
+            else:
+                conn = cls._get_connection()
+                rows = conn.execute("SELECT clave FROM clave_prod_serv")
+                claves = (row[0] for row in rows)
+                cls._valid_index = array(
+                    "I", sorted(int(c) for c in claves if c and len(c) == 8 and c.isdigit())
+                )
+        return cls._valid_index
+
+    @classmethod
+    def _preload(cls) -> None:
+        """Carga anticipada (catalogmx.preload): sólo el índice de claves válidas"""
+        cls._get_valid_index()
+
+    @classmethod
+    def is_valid_many(cls, ids: Iterable[str]) -> list[bool]:
+        """
+        Verifica la existencia de muchas claves sin consultar SQLite por cada una.
+
+        Args:
+            ids: Claves de 8 dígitos
+
+        Returns:
+            Lista de booleanos en el mismo orden que ids
+
+        Ejemplo:
+            >>> ClaveProdServCatalog.is_valid_many(["43211500", "99999999"])
+            [True, False]
+        """
+        index = cls._get_valid_index()
+        size = len(index)
+        results = []
+        append = results.append
+        for id in ids:
+            if isinstance(id, str) and len(id) == 8 and id.isdigit():
+                value = int(id)
+                pos = bisect_left(index, value)
+                append(pos < size and index[pos] == value)
+            else:
+                append(False)
+        return results
 
     @classmethod
-    def search(cls, keyword: str, limit: int = 100) -> list[ClaveProdServ]:
+    def search(
+        cls, keyword: str, limit: int = 100, ranked: bool = False, raw: bool = False
+    ) -> list[ClaveProdServ]:
         """
         Busca productos/servicios usando FTS5 full-text search.
 
-        Busca en: descripción, complemento y palabras similares.
+        Busca en: descripción, complemento y palabras similares. La búsqueda
+        no distingue acentos ("computacion" encuentra "computación"). Cada
+        palabra se busca como prefijo, y la puntuación o palabras como "AND"
+        se buscan como texto.
 
         Args:
-            keyword: Palabra clave a buscar
+            keyword: Palabras a buscar
             limit: Máximo número de resultados (default: 100)
+            ranked: Si es True, ordena los resultados por relevancia (bm25)
+            raw: Si es True, ``keyword`` se pasa sin cambios como consulta FTS5
 
         Returns:
             Lista de productos/servicios que coinciden
@@ -253,20 +396,30 @@ class ClaveProdServCatalog:
             >>> resultados = ClaveProdServCatalog.search("computadora", limit=20)
             >>> for item in resultados:
             ...     print(f"{item['id']}: {item['descripcion']}")
+            >>>
+            >>> # Los más relevantes primero
+            >>> ClaveProdServCatalog.search("leche", limit=5, ranked=True)
+            >>>
+            >>> # Sintaxis FTS5 completa
+            >>> ClaveProdServCatalog.search("leche NOT polvo", raw=True)
         """
+        match = keyword if raw else fts_prefix_query(keyword)
+        if not match:
+            return []
         conn = cls._get_connection()
         cursor = conn.cursor()
 
-        # Use FTS5 for fast full-text search
-        query = """
+        # Use FTS5 for fast full-text search; join back to the table by rowid
+        query = f"""
             SELECT cps.*
             FROM clave_prod_serv_fts fts
-            JOIN clave_prod_serv cps ON fts.clave = cps.clave
+            JOIN clave_prod_serv cps ON cps.rowid = fts.rowid
             WHERE clave_prod_serv_fts MATCH ?
+            {"ORDER BY bm25(clave_prod_serv_fts)" if ranked else ""}
             LIMIT ?
         """
 
-        cursor.execute(query, (keyword, limit))
+        cursor.execute(query, (match, limit))
         return [cls._row_to_clave(row) for row in cursor.fetchall()]
 
     @classmethod
@@ -322,17 +475,96 @@ class ClaveProdServCatalog:
             >>> # Familia 4321 (Computadoras)
             >>> comps = ClaveProdServCatalog.get_by_prefix("4321", limit=50)
         """
+        if cls._memory_index is not None:
+            start, end = cls._memory_range(prefix)
+            rows = cls._memory_rows[start : min(end, start + limit)]
+            return [cls._row_to_clave(row) for row in rows]
+
         conn = cls._get_connection()
-        cursor = conn.cursor()
+        if not prefix:
+            rows = conn.execute("SELECT * FROM clave_prod_serv ORDER BY clave LIMIT ?", (limit,))
+        else:
+            query = """
+                SELECT * FROM clave_prod_serv
+                WHERE clave >= ? AND clave < ?
+                ORDER BY clave
+                LIMIT ?
+            """
+            rows = conn.execute(query, (prefix, cls._prefix_upper(prefix), limit))
+        return [cls._row_to_clave(row) for row in rows]
 
-        query = """
-            SELECT * FROM clave_prod_serv
-            WHERE clave LIKE ?
-            LIMIT ?
+    @classmethod
+    def count_by_prefix(cls, prefix: str) -> int:
         """
+        Cuenta las claves que comienzan con un prefijo.
 
-        cursor.execute(query, (f"{prefix}%", limit))
-        return [cls._row_to_clave(row) for row in cursor.fetchall()]
+        Args:
+            prefix: Prefijo de la clave (2, 4, 6 u 8 dígitos)
+
+        Returns:
+            Número de claves con ese prefijo
+
+        Ejemplo:
+            >>> ClaveProdServCatalog.count_by_prefix("4321")
+        """
+        if cls._memory_index is not None:
+            start, end = cls._memory_range(prefix)
+            return end - start
+        if not prefix:
+            return cls.get_total_count()
+        conn = cls._get_connection()
+        row = conn.execute(
+            "SELECT COUNT(*) FROM clave_prod_serv WHERE clave >= ? AND clave < ?",
+            (prefix, cls._prefix_upper(prefix)),
+        ).fetchone()
+        return row[0]
+
+    @classmethod
+    def get_jerarquia(cls) -> dict[str, dict]:
+        """
+        Obtiene el árbol segmento → familia → clase con el número de claves.
+
+        Se calcula una sola vez (una consulta agrupada, o el índice en memoria
+        si está cargado) y se reutiliza en llamadas posteriores.
+
+        Returns:
+            Diccionario {segmento: {"count": n, "familias": {familia:
+            {"count": n, "clases": {clase: n}}}}} con prefijos de 2, 4 y 6
+            dígitos, en orden ascendente
+
+        Ejemplo:
+            >>> arbol = ClaveProdServCatalog.get_jerarquia()
+            >>> arbol["43"]["familias"]["4321"]["clases"]["432115"]
+        """
+        if cls._jerarquia is not None:
+            return cls._jerarquia
+
+        if cls._memory_rows is not None:
+            clases: dict[str, int] = {}
+            for row in cls._memory_rows:
+                clase = row["clave"][:6]
+                clases[clase] = clases.get(clase, 0) + 1
+            conteos = sorted(clases.items())
+        else:
+            conn = cls._get_connection()
+            conteos = conn.execute(
+                """
+                SELECT substr(clave, 1, 6) AS clase, COUNT(*)
+                FROM clave_prod_serv
+                GROUP BY clase
+                ORDER BY clase
+                """
+            ).fetchall()
+
+        jerarquia: dict[str, dict] = {}
+        for clase, count in conteos:
+            segmento = jerarquia.setdefault(clase[:2], {"count": 0, "familias": {}})
+            segmento["count"] += count
+            familia = segmento["familias"].setdefault(clase[:4], {"count": 0, "clases": {}})
+            familia["count"] += count
+            familia["clases"][clase] = count
+        cls._jerarquia = jerarquia
+        return jerarquia
 
     @classmethod
     def get_con_iva(cls, limit: int = 1000) -> list[ClaveProdServ]:
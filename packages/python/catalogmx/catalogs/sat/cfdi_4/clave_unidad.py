@@ -7,9 +7,12 @@ recomendaciones 20 y 21 de UN/ECE.
 """
 
 import json
-from pathlib import Path
 from typing import TypedDict
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.search import TokenIndex
+from catalogmx.utils.views import copy_list
+
 
 class ClaveUnidad(TypedDict):
     """Estructura de una unidad de medida"""
@@ -23,6 +26,7 @@ class ClaveUnidad(TypedDict):
     simbolo: str
 
 
+@register("sat/cfdi_4.0/clave_unidad.json")
 class ClaveUnidadCatalog:
     """
     Catálogo de claves de unidad SAT CFDI 4.0.
@@ -53,6 +57,7 @@ class ClaveUnidadCatalog:
 
     _data: list[ClaveUnidad] | None = None
     _by_id: dict[str, ClaveUnidad] | None = None
+    _name_index: TokenIndex | None = None
 
     @classmethod
     def _load_data(cls) -> None:
@@ -60,22 +65,17 @@ class ClaveUnidadCatalog:
         if cls._data is not None:
             return
 
-        # Path: catalogmx/packages/python/catalogmx/catalogs/sat/cfdi_4/clave_unidad.py
-        # Target: catalogmx/packages/shared-data/sat/cfdi_4.0/clave_unidad.json
-        data_path = (
-            Path(__file__).parent.parent.parent.parent.parent.parent
-            / "shared-data"
-            / "sat"
-            / "cfdi_4.0"
-            / "clave_unidad.json"
-        )
+        path = data_path(cls)
 
-        with open(data_path, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             cls._data = json.load(f)
 
         # Crear índice por ID
         cls._by_id = {item["id"]: item for item in cls._data}
 
+        # Índice invertido por nombre (insensible a acentos y mayúsculas)
+        cls._name_index = TokenIndex(cls._data, key=lambda u: u["nombre"])
+
     @classmethod
     def get_all(cls) -> list[ClaveUnidad]:
         """
@@ -91,7 +91,7 @@ class ClaveUnidadCatalog:
             >>> print(f"Total unidades: {len(unidades)}")
         """
         cls._load_data()
-        return cls._data.copy()  # type: ignore
+        return copy_list(cls._data)  # type: ignore
 
     @classmethod
     def get_unidad(cls, id: str) -> ClaveUnidad | None:
@@ -132,7 +132,7 @@ class ClaveUnidadCatalog:
     @classmethod
     def search_by_name(cls, keyword: str) -> list[ClaveUnidad]:
         """
-        Busca unidades por nombre (búsqueda parcial, case-insensitive).
+        Busca unidades por nombre (búsqueda parcial, insensible a acentos y mayúsculas).
 
         Args:
             keyword: Palabra clave a buscar en el nombre
@@ -146,8 +146,7 @@ class ClaveUnidadCatalog:
             ...     print(f"{u['id']}: {u['nombre']}")
         """
         cls._load_data()
-        keyword_lower = keyword.lower()
-        return [u for u in cls._data if keyword_lower in u["nombre"].lower()]  # type: ignore
+        return cls._name_index.search(keyword)  # type: ignore
 
     @classmethod
     def search_by_symbol(cls, simbolo: str) -> list[ClaveUnidad]:
@@ -1,9 +1,12 @@
 """Catálogo c_Exportacion"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/cfdi_4.0/exportacion.json")
 class ExportacionCatalog:
     """Catálogo de Exportaciones del SAT (c_Exportacion)"""
 
@@ -14,13 +17,7 @@ class ExportacionCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo si aún no han sido cargados"""
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "cfdi_4.0"
-                / "exportacion.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
                 # Handle both list and dict formats
@@ -42,4 +39,4 @@ class ExportacionCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todas las exportaciones"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
@@ -1,9 +1,12 @@
 """Catálogo c_RegimenFiscal"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/cfdi_4.0/regimen_fiscal.json")
 class RegimenFiscalCatalog:
     """Catálogo de Regímenes Fiscales del SAT (c_RegimenFiscal)"""
 
@@ -14,13 +17,7 @@ class RegimenFiscalCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo si aún no han sido cargados"""
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "cfdi_4.0"
-                / "regimen_fiscal.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
                 # Handle both list and dict formats
@@ -54,4 +51,4 @@ class RegimenFiscalCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los regímenes fiscales"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
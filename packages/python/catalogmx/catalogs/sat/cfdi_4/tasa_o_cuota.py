@@ -1,22 +1,18 @@
 """Catálogo de Tasa o Cuota (SAT)"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 
+
+@register("sat/cfdi_4.0/c_TasaOCuota.json")
 class TasaOCuota:
     _data = None
 
     @classmethod
     def _load_data(cls):
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "cfdi_4.0"
-                / "c_TasaOCuota.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 json_data = json.load(f)
                 # This catalog has a more complex structure, let's index by a combination of fields
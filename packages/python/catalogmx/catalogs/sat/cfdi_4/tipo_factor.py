@@ -2,9 +2,12 @@
 
 import json
 
+from catalogmx.registry import register
+
 from ....helpers import get_project_root
 
 
+@register("sat/cfdi_4.0/c_TipoFactor.json")
 class TipoFactor:
     _data = None
 
@@ -0,0 +1,249 @@
+"""
+Validador de comprobantes CFDI 4.0
+
+Verifica las claves de catálogo del comprobante base (sin complementos):
+TipoDeComprobante, FormaPago, MetodoPago, Exportacion, UsoCFDI contra el
+RegimenFiscal del receptor, RegimenFiscal del emisor y ClaveProdServ,
+ClaveUnidad y ObjetoImp de cada concepto.
+
+Los catálogos se cargan una sola vez al crear el validador y se guardan como
+frozensets, de modo que validar un comprobante sólo hace pruebas de
+pertenencia a conjuntos. ClaveProdServ (~52,000 claves) se verifica con el
+índice empaquetado de ClaveProdServCatalog.is_valid_many.
+"""
+
+from collections.abc import Iterable, Iterator
+
+from .clave_prod_serv import ClaveProdServCatalog
+from .clave_unidad import ClaveUnidadCatalog
+from .exportacion import ExportacionCatalog
+from .forma_pago import FormaPagoCatalog
+from .metodo_pago import MetodoPagoCatalog
+from .objeto_imp import ObjetoImpCatalog
+from .regimen_fiscal import RegimenFiscalCatalog
+from .tipo_comprobante import TipoComprobanteCatalog
+from .uso_cfdi import UsoCFDICatalog
+
+# RFC genéricos: público en general (nacional) y residentes en el extranjero
+RFC_GENERICOS = frozenset({"XAXX010101000", "XEXX010101000"})
+
+
+def _codes(items: list[dict], flag: str | None = None) -> frozenset[str]:
+    """Códigos de un catálogo, opcionalmente sólo los que tienen flag=True"""
+    return frozenset(item["code"] for item in items if flag is None or item.get(flag))
+
+
+class CFDIValidator:
+    """
+    Validador de catálogos del comprobante CFDI 4.0
+
+    Args:
+        validar_clave_prod_serv: Si es False no se carga c_ClaveProdServ
+            (SQLite) ni se valida esa clave en los conceptos
+
+    Example:
+        >>> validator = CFDIValidator()
+        >>> result = validator.validate({
+        ...     'tipo_comprobante': 'I',
+        ...     'exportacion': '01',
+        ...     'metodo_pago': 'PUE',
+        ...     'forma_pago': '03',
+        ...     'emisor': {'rfc': 'EKU9003173C9', 'regimen_fiscal': '601'},
+        ...     'receptor': {'rfc': 'XAXX010101000', 'regimen_fiscal': '616', 'uso_cfdi': 'S01'},
+        ...     'conceptos': [
+        ...         {'clave_prod_serv': '43211500', 'clave_unidad': 'H87', 'objeto_imp': '02'},
+        ...     ],
+        ... })
+        >>> result['valid']
+        True
+    """
+
+    def __init__(self, validar_clave_prod_serv: bool = True) -> None:
+        self.tipos_comprobante = _codes(TipoComprobanteCatalog.get_all())
+        self.formas_pago = _codes(FormaPagoCatalog.get_all())
+        self.metodos_pago = _codes(MetodoPagoCatalog.get_all())
+        self.exportaciones = _codes(ExportacionCatalog.get_all())
+        self.objetos_imp = _codes(ObjetoImpCatalog.get_all())
+        self.regimenes = _codes(RegimenFiscalCatalog.get_all())
+        self.usos = _codes(UsoCFDICatalog.get_all())
+
+        regimenes = RegimenFiscalCatalog.get_all()
+        usos = UsoCFDICatalog.get_all()
+        self.regimenes_fisica = _codes(regimenes, "fisica")
+        self.regimenes_moral = _codes(regimenes, "moral")
+        self.usos_fisica = _codes(usos, "fisica")
+        self.usos_moral = _codes(usos, "moral")
+        # Pares (uso, régimen) que comparten al menos un tipo de persona
+        self.usos_por_regimen = frozenset(
+            (uso, regimen)
+            for usos_tipo, regimenes_tipo in (
+                (self.usos_fisica, self.regimenes_fisica),
+                (self.usos_moral, self.regimenes_moral),
+            )
+            for uso in usos_tipo
+            for regimen in regimenes_tipo
+        )
+
+        self.claves_unidad = frozenset(item["id"] for item in ClaveUnidadCatalog.get_all())
+        self.validar_clave_prod_serv = validar_clave_prod_serv
+        if validar_clave_prod_serv:
+            # Construye el índice de claves ahora y no en el primer comprobante
+            ClaveProdServCatalog.is_valid_many(())
+
+    def validate(self, cfdi: dict) -> dict:
+        """
+        Valida las claves de catálogo de un comprobante CFDI 4.0
+
+        Args:
+            cfdi: Dict con tipo_comprobante, forma_pago, metodo_pago, exportacion,
+                emisor ({rfc, regimen_fiscal}), receptor ({rfc, regimen_fiscal,
+                uso_cfdi}) y conceptos ([{clave_prod_serv, clave_unidad, objeto_imp}])
+
+        Returns:
+            Dict con 'valid' (bool), 'errors' (list), 'warnings' (list)
+        """
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        # 1. Tipo de comprobante
+        tipo = cfdi.get("tipo_comprobante")
+        if not tipo:
+            errors.append("TipoDeComprobante es obligatorio")
+        elif tipo not in self.tipos_comprobante:
+            errors.append(f"TipoDeComprobante {tipo} no válido")
+
+        # 2. Forma y método de pago
+        forma_pago = cfdi.get("forma_pago")
+        metodo_pago = cfdi.get("metodo_pago")
+        if tipo in ("T", "P"):
+            if forma_pago:
+                errors.append(f"FormaPago no debe existir en CFDI tipo {tipo}")
+            if metodo_pago:
+                errors.append(f"MetodoPago no debe existir en CFDI tipo {tipo}")
+        else:
+            if forma_pago and forma_pago not in self.formas_pago:
+                errors.append(f"FormaPago {forma_pago} no válida")
+            if metodo_pago and metodo_pago not in self.metodos_pago:
+                errors.append(f"MetodoPago {metodo_pago} no válido")
+            if metodo_pago == "PPD" and forma_pago and forma_pago != "99":
+                errors.append("FormaPago debe ser 99 (Por definir) cuando MetodoPago es PPD")
+            if tipo == "I" and not metodo_pago:
+                warnings.append("MetodoPago no especificado")
+
+        # 3. Exportación
+        exportacion = cfdi.get("exportacion")
+        if not exportacion:
+            errors.append("Exportacion es obligatoria")
+        elif exportacion not in self.exportaciones:
+            errors.append(f"Exportacion {exportacion} no válida")
+
+        # 4. Emisor
+        emisor = cfdi.get("emisor") or {}
+        regimen_emisor = emisor.get("regimen_fiscal")
+        if not regimen_emisor:
+            errors.append("Emisor.RegimenFiscal es obligatorio")
+        elif regimen_emisor not in self.regimenes:
+            errors.append(f"Emisor.RegimenFiscal {regimen_emisor} no válido")
+
+        # 5. Receptor: UsoCFDI compatible con su régimen y tipo de persona
+        errors.extend(self._validate_receptor(cfdi.get("receptor") or {}))
+
+        # 6. Conceptos
+        conceptos = cfdi.get("conceptos") or []
+        if not conceptos:
+            errors.append("Debe incluir al menos un concepto")
+        validas = (
+            ClaveProdServCatalog.is_valid_many(c.get("clave_prod_serv") for c in conceptos)
+            if self.validar_clave_prod_serv
+            else None
+        )
+        claves_unidad = self.claves_unidad
+        objetos_imp = self.objetos_imp
+        for i, concepto in enumerate(conceptos):
+            prefix = f"Concepto[{i}]"
+            clave = concepto.get("clave_prod_serv")
+            if not clave:
+                errors.append(f"{prefix}: ClaveProdServ es obligatoria")
+            elif validas is not None and not validas[i]:
+                errors.append(f"{prefix}: ClaveProdServ {clave} no válida")
+            unidad = concepto.get("clave_unidad")
+            if not unidad:
+                errors.append(f"{prefix}: ClaveUnidad es obligatoria")
+            elif unidad not in claves_unidad:
+                errors.append(f"{prefix}: ClaveUnidad {unidad} no válida")
+            objeto = concepto.get("objeto_imp")
+            if not objeto:
+                errors.append(f"{prefix}: ObjetoImp es obligatorio")
+            elif objeto not in objetos_imp:
+                errors.append(f"{prefix}: ObjetoImp {objeto} no válido")
+
+        return {"valid": len(errors) == 0, "errors": errors, "warnings": warnings}
+
+    def _validate_receptor(self, receptor: dict) -> list[str]:
+        """Valida régimen fiscal y uso del CFDI del receptor"""
+        errors = []
+        regimen = receptor.get("regimen_fiscal")
+        uso = receptor.get("uso_cfdi")
+        if not regimen:
+            errors.append("Receptor.RegimenFiscalReceptor es obligatorio")
+        elif regimen not in self.regimenes:
+            errors.append(f"Receptor.RegimenFiscalReceptor {regimen} no válido")
+        if not uso:
+            errors.append("Receptor.UsoCFDI es obligatorio")
+        elif uso not in self.usos:
+            errors.append(f"Receptor.UsoCFDI {uso} no válido")
+        if errors:
+            return errors
+
+        rfc = receptor.get("rfc")
+        if rfc in RFC_GENERICOS:
+            if uso != "S01":
+                errors.append(f"UsoCFDI debe ser S01 para el RFC genérico {rfc}")
+            if regimen != "616":
+                errors.append(f"RegimenFiscalReceptor debe ser 616 para el RFC genérico {rfc}")
+            return errors
+
+        if (uso, regimen) not in self.usos_por_regimen:
+            errors.append(f"UsoCFDI {uso} no aplica para el RegimenFiscalReceptor {regimen}")
+        elif rfc:
+            # RFC de 13 posiciones: persona física; de 12: persona moral
+            if len(rfc) == 13:
+                regimenes, usos, persona = self.regimenes_fisica, self.usos_fisica, "física"
+            elif len(rfc) == 12:
+                regimenes, usos, persona = self.regimenes_moral, self.usos_moral, "moral"
+            else:
+                return errors
+            if regimen not in regimenes:
+                errors.append(f"RegimenFiscalReceptor {regimen} no aplica para persona {persona}")
+            if uso not in usos:
+                errors.append(f"UsoCFDI {uso} no aplica para persona {persona}")
+        return errors
+
+    def validate_many(self, cfdis: Iterable[dict]) -> list[dict]:
+        """
+        Valida muchos comprobantes con los mismos catálogos precargados
+
+        Args:
+            cfdis: Iterable de dicts de comprobante (ver validate)
+
+        Returns:
+            Lista de resultados de validate, en el mismo orden
+        """
+        validate = self.validate
+        return [validate(cfdi) for cfdi in cfdis]
+
+    def iter_invalid(self, cfdis: Iterable[dict]) -> Iterator[tuple[int, dict]]:
+        """
+        Recorre muchos comprobantes y entrega sólo los inválidos
+
+        Args:
+            cfdis: Iterable de dicts de comprobante (ver validate)
+
+        Yields:
+            (posición, resultado) de cada comprobante con errores
+        """
+        validate = self.validate
+        for i, cfdi in enumerate(cfdis):
+            result = validate(cfdi)
+            if not result["valid"]:
+                yield i, result
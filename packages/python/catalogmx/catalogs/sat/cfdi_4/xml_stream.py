@@ -0,0 +1,339 @@
+"""
+Lectura y validación de CFDI 4.0 en XML
+
+Lee comprobantes CFDI 4.0 (archivos sueltos, directorios o archivos .zip)
+con ``xml.etree.ElementTree.iterparse`` y convierte sus atributos en los
+dicts que esperan ``CFDIValidator`` y ``ComercioExteriorValidator``.
+
+Cada elemento se descarta en cuanto termina de leerse, por lo que la memoria
+usada no depende del tamaño del comprobante ni del archivo .zip. La
+validación de muchos archivos puede repartirse entre procesos.
+
+Ejemplo:
+    >>> for nombre, result in validate_cfdi_path("recibidos.zip"):
+    ...     if not result["valid"]:
+    ...         print(nombre, result["errors"])
+"""
+
+import zipfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+from xml.etree.ElementTree import Element, ParseError, iterparse
+
+from catalogmx.catalogs.sat.comercio_exterior import ComercioExteriorValidator
+
+from .validator import CFDIValidator
+
+# Un origen es un archivo XML o un miembro de un .zip: (ruta, miembro | None)
+Source = tuple[str, str | None]
+
+
+def _local(tag: str) -> str:
+    """Nombre local de una etiqueta con espacio de nombres ({ns}Nombre -> Nombre)"""
+    return tag.rpartition("}")[2]
+
+
+def _float(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_cfdi_xml(source: str | Path | IO[bytes]) -> dict[str, Any]:
+    """
+    Lee un CFDI 4.0 y devuelve sus claves de catálogo
+
+    Args:
+        source: Ruta o archivo binario con el XML del comprobante
+
+    Returns:
+        Dict con los campos de ``CFDIValidator.validate``; si el comprobante
+        trae complemento de Comercio Exterior, se agrega en la llave
+        ``comercio_exterior`` con los campos de ``ComercioExteriorValidator.validate``
+
+    Raises:
+        xml.etree.ElementTree.ParseError: Si el XML está mal formado
+    """
+    cfdi: dict[str, Any] = {"conceptos": []}
+    cce: dict[str, Any] | None = None
+    parents: list[Element] = []
+    path: list[str] = []
+
+    for event, elem in iterparse(source, events=("start", "end")):
+        if event == "end":
+            parents.pop()
+            path.pop()
+            elem.clear()
+            # Quitar el elemento ya leído de su padre mantiene la memoria constante
+            if parents:
+                parents[-1].remove(elem)
+            continue
+
+        name = _local(elem.tag)
+        parent = path[-1] if path else None
+        parents.append(elem)
+        path.append(name)
+        attrib = elem.attrib
+
+        if name == "Comprobante" and parent is None:
+            cfdi["tipo_comprobante"] = attrib.get("TipoDeComprobante")
+            cfdi["forma_pago"] = attrib.get("FormaPago")
+            cfdi["metodo_pago"] = attrib.get("MetodoPago")
+            cfdi["exportacion"] = attrib.get("Exportacion")
+            cfdi["moneda"] = attrib.get("Moneda")
+            cfdi["total"] = _float(attrib.get("Total"))
+        elif name == "ComercioExterior":
+            cce = {
+                "tipo_comprobante": cfdi.get("tipo_comprobante"),
+                "moneda": cfdi.get("moneda") or "",
+                "total": cfdi.get("total"),
+                "incoterm": attrib.get("Incoterm"),
+                "clave_pedimento": attrib.get("ClaveDePedimento"),
+                "certificado_origen": attrib.get("CertificadoOrigen"),
+                "motivo_traslado": attrib.get("MotivoTraslado"),
+                "tipo_cambio_usd": _float(attrib.get("TipoCambioUSD")),
+                "total_usd": _float(attrib.get("TotalUSD")),
+                "mercancias": [],
+                "propietarios": [],
+            }
+        elif cce is not None:
+            if name == "Mercancia":
+                cce["mercancias"].append(
+                    {
+                        "fraccion_arancelaria": attrib.get("FraccionArancelaria"),
+                        "unidad_aduana": attrib.get("UnidadAduana"),
+                        "cantidad_aduana": _float(attrib.get("CantidadAduana")),
+                        "valor_unitario_aduana": _float(attrib.get("ValorUnitarioAduana")),
+                        "pais_origen": attrib.get("PaisOrigen"),
+                    }
+                )
+            elif name == "Propietario":
+                cce["propietarios"].append(dict(attrib))
+            elif name == "Domicilio" and parent == "Receptor":
+                cce["receptor"] = {
+                    "pais": attrib.get("Pais"),
+                    "estado": attrib.get("Estado", ""),
+                    "num_reg_id_trib": cfdi.get("receptor", {}).get("num_reg_id_trib"),
+                }
+        elif parent == "Comprobante":
+            if name == "Emisor":
+                cfdi["emisor"] = {
+                    "rfc": attrib.get("Rfc"),
+                    "regimen_fiscal": attrib.get("RegimenFiscal"),
+                }
+            elif name == "Receptor":
+                cfdi["receptor"] = {
+                    "rfc": attrib.get("Rfc"),
+                    "regimen_fiscal": attrib.get("RegimenFiscalReceptor"),
+                    "uso_cfdi": attrib.get("UsoCFDI"),
+                    "num_reg_id_trib": attrib.get("NumRegIdTrib"),
+                }
+        elif name == "Concepto" and parent == "Conceptos":
+            cfdi["conceptos"].append(
+                {
+                    "clave_prod_serv": attrib.get("ClaveProdServ"),
+                    "clave_unidad": attrib.get("ClaveUnidad"),
+                    "objeto_imp": attrib.get("ObjetoImp"),
+                }
+            )
+
+    if cce is not None:
+        cfdi["comercio_exterior"] = cce
+    return cfdi
+
+
+def _is_zip(path: Path) -> bool:
+    return path.suffix.lower() == ".zip"
+
+
+def iter_sources(path: str | Path) -> Iterator[Source]:
+    """
+    Orígenes XML de una ruta: el archivo mismo, los XML de un .zip o, para un
+    directorio, todos los .xml y .zip que contiene (recursivo, en orden)
+
+    Args:
+        path: Archivo .xml, archivo .zip o directorio
+
+    Yields:
+        (ruta, miembro del .zip o None)
+    """
+    path = Path(path)
+    if path.is_dir():
+        for child in sorted(path.rglob("*")):
+            if child.is_file() and child.suffix.lower() in (".xml", ".zip"):
+                yield from iter_sources(child)
+    elif _is_zip(path):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = [
+                    info.filename
+                    for info in archive.infolist()
+                    if not info.is_dir() and info.filename.lower().endswith(".xml")
+                ]
+        except zipfile.BadZipFile:
+            # Se reporta al leerlo como XML
+            yield str(path), None
+            return
+        for name in names:
+            yield str(path), name
+    else:
+        yield str(path), None
+
+
+def _source_name(source: Source) -> str:
+    path, member = source
+    return f"{path}!{member}" if member is not None else path
+
+
+def _parse_sources(sources: Iterable[Source]) -> Iterator[tuple[str, dict | Exception]]:
+    """Lee orígenes en orden, abriendo cada .zip una sola vez por tramo consecutivo"""
+    archive: zipfile.ZipFile | None = None
+    try:
+        for source in sources:
+            path, member = source
+            try:
+                if member is None:
+                    cfdi = parse_cfdi_xml(path)
+                else:
+                    if archive is None or archive.filename != path:
+                        if archive is not None:
+                            archive.close()
+                            archive = None
+                        archive = zipfile.ZipFile(path)
+                    with archive.open(member) as f:
+                        cfdi = parse_cfdi_xml(f)
+            except (ParseError, OSError, zipfile.BadZipFile, KeyError) as exc:
+                yield _source_name(source), exc
+            else:
+                yield _source_name(source), cfdi
+    finally:
+        if archive is not None:
+            archive.close()
+
+
+def iter_cfdi_xml(path: str | Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Lee todos los CFDI de un archivo, directorio o .zip, uno a la vez
+
+    Args:
+        path: Archivo .xml, archivo .zip o directorio
+
+    Yields:
+        (nombre, cfdi) donde nombre es la ruta (``archivo.zip!miembro.xml``
+        para miembros de un .zip) y cfdi el resultado de ``parse_cfdi_xml``
+
+    Raises:
+        xml.etree.ElementTree.ParseError: Si un XML está mal formado
+    """
+    for name, cfdi in _parse_sources(iter_sources(path)):
+        if isinstance(cfdi, Exception):
+            raise cfdi
+        yield name, cfdi
+
+
+# Validador por proceso: se crea una vez y se reutiliza para todos los archivos
+_validator: CFDIValidator | None = None
+
+
+def _get_validator() -> CFDIValidator:
+    global _validator
+    if _validator is None:
+        _validator = CFDIValidator()
+    return _validator
+
+
+def validate_cfdi(cfdi: dict[str, Any], validator: CFDIValidator | None = None) -> dict:
+    """
+    Valida un CFDI leído con ``parse_cfdi_xml``, incluido su complemento de
+    Comercio Exterior si lo trae
+
+    Args:
+        cfdi: Dict de ``parse_cfdi_xml``
+        validator: Validador a usar (por omisión, uno compartido por proceso)
+
+    Returns:
+        Dict con 'valid' (bool), 'errors' (list), 'warnings' (list)
+    """
+    result = (validator or _get_validator()).validate(cfdi)
+    cce = cfdi.get("comercio_exterior")
+    if cce is not None:
+        cce_result = ComercioExteriorValidator.validate(cce)
+        result["errors"].extend(f"ComercioExterior: {error}" for error in cce_result["errors"])
+        result["warnings"].extend(cce_result["warnings"])
+        result["valid"] = not result["errors"]
+    return result
+
+
+def _iter_validated(sources: Iterable[Source]) -> Iterator[tuple[str, dict]]:
+    for name, cfdi in _parse_sources(sources):
+        if isinstance(cfdi, Exception):
+            yield name, {"valid": False, "errors": [f"XML no legible: {cfdi}"], "warnings": []}
+        else:
+            yield name, validate_cfdi(cfdi)
+
+
+def _validate_sources(sources: list[Source]) -> list[tuple[str, dict]]:
+    return list(_iter_validated(sources))
+
+
+def _chunks(sources: Iterable[Source], size: int) -> Iterator[list[Source]]:
+    chunk: list[Source] = []
+    for source in sources:
+        chunk.append(source)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_cfdi_path(
+    path: str | Path | Iterable[str | Path],
+    processes: int | None = None,
+    chunksize: int = 256,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Valida todos los CFDI de uno o varios archivos, directorios o .zip
+
+    Los XML mal formados o ilegibles se reportan como inválidos en lugar de
+    interrumpir el recorrido.
+
+    Args:
+        path: Archivo .xml, archivo .zip, directorio, o varios de ellos
+        processes: Número de procesos para repartir los archivos (None o 1:
+            en el proceso actual)
+        chunksize: Comprobantes por tarea enviada a cada proceso; los miembros
+            de un mismo .zip en una tarea comparten una sola apertura del archivo
+
+    Yields:
+        (nombre, resultado) en el orden de los archivos
+    """
+    paths = [path] if isinstance(path, (str, Path)) else path
+    sources = (source for item in paths for source in iter_sources(item))
+    if not processes or processes <= 1:
+        yield from _iter_validated(sources)
+        return
+
+    # Executor.map enviaría todas las tareas de inmediato; con a lo más
+    # processes + 1 tareas pendientes la memoria no depende del número de archivos
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: deque[Future] = deque()
+        for chunk in _chunks(sources, chunksize):
+            pending.append(executor.submit(_validate_sources, chunk))
+            if len(pending) > processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+__all__ = [
+    "iter_cfdi_xml",
+    "iter_sources",
+    "parse_cfdi_xml",
+    "validate_cfdi",
+    "validate_cfdi_path",
+]
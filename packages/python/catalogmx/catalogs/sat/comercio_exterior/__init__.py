@@ -16,15 +16,35 @@ Catálogos incluidos:
 - c_FraccionArancelaria: ~20,000 fracciones arancelarias TIGIE/NICO
 """
 
-from .claves_pedimento import ClavePedimentoCatalog
-from .estados import EstadoCatalog
-from .incoterms import IncotermsValidator
-from .monedas import MonedaCatalog
-from .motivos_traslado import MotivoTrasladoCatalog
-from .paises import PaisCatalog
-from .registro_ident_trib import RegistroIdentTribCatalog
-from .unidades_aduana import UnidadAduanaCatalog
-from .validator import ComercioExteriorValidator
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .claves_pedimento import ClavePedimentoCatalog
+    from .estados import EstadoCatalog
+    from .incoterms import IncotermsValidator
+    from .monedas import MonedaCatalog
+    from .motivos_traslado import MotivoTrasladoCatalog
+    from .paises import PaisCatalog
+    from .registro_ident_trib import RegistroIdentTribCatalog
+    from .unidades_aduana import UnidadAduanaCatalog
+    from .validator import ComercioExteriorValidator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClavePedimentoCatalog": ".claves_pedimento",
+        "EstadoCatalog": ".estados",
+        "IncotermsValidator": ".incoterms",
+        "MonedaCatalog": ".monedas",
+        "MotivoTrasladoCatalog": ".motivos_traslado",
+        "PaisCatalog": ".paises",
+        "RegistroIdentTribCatalog": ".registro_ident_trib",
+        "UnidadAduanaCatalog": ".unidades_aduana",
+        "ComercioExteriorValidator": ".validator",
+    },
+)
 
 __all__ = [
     "IncotermsValidator",
@@ -7,9 +7,12 @@ Fuente: SAT - Anexo 22 de las RGCE
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/claves_pedimento.json")
 class ClavePedimentoCatalog:
     """Catálogo de claves de pedimento aduanero"""
 
@@ -20,14 +23,7 @@ class ClavePedimentoCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "claves_pedimento.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -74,4 +70,4 @@ class ClavePedimentoCatalog:
     def get_all(cls) -> list[dict]:
         """Retorna todas las claves de pedimento"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
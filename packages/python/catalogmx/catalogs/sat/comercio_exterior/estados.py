@@ -1,9 +1,12 @@
 """Catálogo c_Estado - Estados de USA y Provincias de Canadá"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/estados_usa_canada.json")
 class EstadoCatalog:
     """Catálogo de estados/provincias de USA y Canadá para comercio exterior"""
 
@@ -15,14 +18,7 @@ class EstadoCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._estados_usa is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "estados_usa_canada.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -83,13 +79,13 @@ class EstadoCatalog:
     def get_all_usa(cls) -> list[dict]:
         """Retorna todos los estados de USA"""
         cls._load_data()
-        return cls._estados_usa.copy()
+        return copy_list(cls._estados_usa)
 
     @classmethod
     def get_all_canada(cls) -> list[dict]:
         """Retorna todas las provincias de Canadá"""
         cls._load_data()
-        return cls._provincias_canada.copy()
+        return copy_list(cls._provincias_canada)
 
     @classmethod
     def get_all(cls) -> list[dict]:
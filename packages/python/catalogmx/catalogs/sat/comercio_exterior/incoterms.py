@@ -8,9 +8,12 @@ Fuente: ICC - International Chamber of Commerce / SAT México
 """
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/incoterms.json")
 class IncotermsValidator:
     """Validador y catálogo de INCOTERMS 2020 para Comercio Exterior"""
 
@@ -21,15 +24,8 @@ class IncotermsValidator:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
             # Navegar a shared-data desde packages/python/catalogmx/catalogs/sat/comercio_exterior
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "incoterms.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -194,7 +190,7 @@ class IncotermsValidator:
             11
         """
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def search(cls, query: str) -> list[dict]:
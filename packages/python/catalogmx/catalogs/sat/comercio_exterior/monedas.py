@@ -1,9 +1,12 @@
 """Catálogo c_Moneda - Códigos de Monedas ISO 4217"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/monedas.json")
 class MonedaCatalog:
     """Catálogo de monedas para operaciones de comercio exterior"""
 
@@ -14,14 +17,7 @@ class MonedaCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "monedas.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -88,7 +84,7 @@ class MonedaCatalog:
     def get_all(cls) -> list[dict]:
         """Retorna todas las monedas"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def search(cls, query: str) -> list[dict]:
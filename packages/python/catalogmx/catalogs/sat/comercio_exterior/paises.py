@@ -1,11 +1,13 @@
 """Catálogo c_Pais - Códigos de Países ISO 3166-1"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_list
 
 
+@register("sat/comercio_exterior/paises.json")
 class PaisCatalog:
     """Catálogo de países para identificar origen/destino en comercio exterior"""
 
@@ -17,14 +19,7 @@ class PaisCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "paises.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 cls._data = json.load(f)
@@ -69,7 +64,7 @@ class PaisCatalog:
     def get_all(cls) -> list[dict]:
         """Retorna todos los países"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def search(cls, query: str) -> list[dict]:
@@ -2,9 +2,12 @@
 
 import json
 import re
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/registro_ident_trib.json")
 class RegistroIdentTribCatalog:
     """Catálogo de tipos de registro tributario del receptor extranjero"""
 
@@ -15,14 +18,7 @@ class RegistroIdentTribCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "registro_ident_trib.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -73,4 +69,4 @@ class RegistroIdentTribCatalog:
     def get_all(cls) -> list[dict]:
         """Retorna todos los tipos de registro tributario"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
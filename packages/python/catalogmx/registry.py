@@ -0,0 +1,423 @@
+"""
+Catalog registry for catalogmx
+==============================
+
+Every catalog class under ``catalogmx.catalogs`` registers itself here with
+the ``@register`` decorator, declaring its data file and backend. The
+registry times each catalog's first load and reports what is resident
+(``stats()``, or ``catalogmx stats`` on the command line).
+
+Catalogs load lazily on their first query, so in a pre-forked server each
+worker would pay JSON parsing and index building on its first request.
+``preload()`` loads them up front, ideally in the master process before
+``fork()``, so workers inherit the parsed data through copy-on-write pages.
+
+Example:
+    >>> import catalogmx
+    >>> report = catalogmx.preload(["FormaPagoCatalog", "CodigosPostales"])
+    >>> report["CodigosPostales"]["seconds"]
+"""
+
+from __future__ import annotations
+
+import functools
+import gc
+import importlib
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import ModuleType
+
+# Class methods that load a catalog, in order of preference. ``_preload`` lets
+# a catalog warm only part of its state (e.g. SQLite-backed catalogs).
+LOADER_NAMES = ("_preload", "_load_data", "_load")
+
+BACKENDS = ("json", "sqlite")
+
+# packages/shared-data, next to packages/python
+DATA_ROOT = Path(__file__).resolve().parent.parent.parent / "shared-data"
+
+
+def data_path(source: str | type) -> Path:
+    """
+    Absolute path of a file in shared-data.
+
+    Args:
+        source: File relative to shared-data (e.g. "sat/cfdi_4.0/forma_pago.json"),
+            or a catalog class for the file it declared with ``@register``
+
+    Raises:
+        KeyError: If the class (or a base class) is not a registered catalog
+
+    Example:
+        >>> from catalogmx.catalogs.sat.cfdi_4 import FormaPagoCatalog
+        >>> data_path(FormaPagoCatalog) == data_path("sat/cfdi_4.0/forma_pago.json")
+        True
+    """
+    if isinstance(source, str):
+        return DATA_ROOT / source
+    for cls in source.__mro__:
+        info = _by_class.get(cls)
+        if info is not None:
+            return info.path
+    raise KeyError(f"Not a registered catalog: {source.__name__}")
+
+
+class CatalogInfo:
+    """
+    Registry entry of a catalog class and the metrics of its first load.
+
+    A plain class rather than a dataclass: every catalog module imports the
+    registry, and ``dataclasses`` would add ``inspect`` to ``import`` time.
+    """
+
+    __slots__ = ("name", "cls", "source", "backend", "loaded", "load_seconds", "bytes_parsed")
+
+    def __init__(self, name: str, cls: type, source: str, backend: str = "json") -> None:
+        self.name = name
+        self.cls = cls
+        self.source = source
+        self.backend = backend
+        self.loaded = False
+        self.load_seconds: float | None = None
+        self.bytes_parsed: int | None = None
+
+    def __repr__(self) -> str:
+        return f"CatalogInfo({self.name!r}, source={self.source!r}, loaded={self.loaded})"
+
+    @property
+    def path(self) -> Path:
+        return data_path(self.source)
+
+
+_registry: dict[str, CatalogInfo] = {}
+_by_class: dict[type, CatalogInfo] = {}
+_discovered = False
+
+
+def _instrument(cls: type, loader_name: str) -> None:
+    """Wraps a loader class method so its first call is timed and recorded."""
+    method = _static_attr(cls, loader_name)
+    if not isinstance(method, classmethod):
+        raise TypeError(f"{cls.__name__}.{loader_name} is not a class method")
+    func = method.__func__
+
+    @functools.wraps(func)
+    def loader(klass, *args, **kwargs):
+        info = _by_class.get(klass)
+        if info is None or info.loaded:
+            return func(klass, *args, **kwargs)
+        start = time.perf_counter()
+        result = func(klass, *args, **kwargs)
+        info.load_seconds = time.perf_counter() - start
+        if info.backend == "json":
+            info.bytes_parsed = _parsed_size(info.path)
+        info.loaded = True
+        return result
+
+    setattr(cls, loader_name, classmethod(loader))
+
+
+def _parsed_size(path: Path) -> int | None:
+    """Size of the file a JSON catalog was read from (its binary snapshot, if it used one)."""
+    snapshot = sys.modules.get("catalogmx.utils.snapshot")
+    read = snapshot.source_read(path) if snapshot is not None else None
+    path = read or path
+    return path.stat().st_size if path.exists() else None
+
+
+def register(
+    source: str, backend: str = "json", loader: str | None = None
+) -> Callable[[type], type]:
+    """
+    Class decorator that adds a catalog to the registry.
+
+    Args:
+        source: Data file relative to shared-data (e.g. "sat/cfdi_4.0/forma_pago.json")
+        backend: "json" for catalogs parsed into memory, "sqlite" for
+            catalogs queried from a database file
+        loader: Class method whose first call loads the catalog (default:
+            ``_load_data`` or ``_load``)
+
+    Raises:
+        ValueError: If the backend is unknown or another module already
+            registered a catalog with the same class name
+
+    Example:
+        >>> @register("sat/cfdi_4.0/forma_pago.json")
+        ... class FormaPagoCatalog:
+        ...     _data = None
+        ...
+        ...     @classmethod
+        ...     def _load_data(cls) -> None: ...
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+
+    def decorator(cls: type) -> type:
+        previous = _registry.get(cls.__name__)
+        if previous is not None:
+            # Reloading a module registers a new class under the same name
+            if (previous.cls.__module__, previous.cls.__qualname__) != (
+                cls.__module__,
+                cls.__qualname__,
+            ):
+                raise ValueError(f"Catalog already registered: {cls.__name__}")
+            _by_class.pop(previous.cls, None)
+        name = loader or next(n for n in LOADER_NAMES[1:] if n in vars(cls))
+        _instrument(cls, name)
+        info = CatalogInfo(name=cls.__name__, cls=cls, source=source, backend=backend)
+        _registry[info.name] = info
+        _by_class[cls] = info
+        return cls
+
+    return decorator
+
+
+def _static_attr(cls: type, name: str) -> object:
+    """Like ``inspect.getattr_static`` (without importing inspect for every catalog)."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    return None
+
+
+def _loader_name(cls: type) -> str | None:
+    for name in LOADER_NAMES:
+        if isinstance(_static_attr(cls, name), classmethod):
+            return name
+    return None
+
+
+def discover() -> dict[str, type]:
+    """
+    Imports every module under ``catalogmx.catalogs`` so their catalogs register.
+
+    Returns:
+        Dict mapping class name to catalog class, sorted by name
+    """
+    global _discovered
+    if not _discovered:
+        import pkgutil
+
+        import catalogmx.catalogs as package
+
+        for module in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+            importlib.import_module(module.name)
+        _discovered = True
+    return {name: _registry[name].cls for name in sorted(_registry)}
+
+
+def get_catalog(name: str) -> type:
+    """
+    Returns a catalog class by its class name (e.g. "FormaPagoCatalog").
+
+    Raises:
+        KeyError: If no catalog has that name
+    """
+    catalogs = discover()
+    if name not in catalogs:
+        raise KeyError(f"Unknown catalog: {name}")
+    return catalogs[name]
+
+
+def _deep_sizeof(root: object, seen: set[int] | None = None) -> int:
+    """
+    Approximate bytes held by an object graph, counting shared objects once.
+
+    Objects whose id is already in ``seen`` are skipped, so passing the same
+    set to successive calls counts only what each graph adds.
+    """
+    if seen is None:
+        seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, array)):
+            continue
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(vars(obj))
+            for slot in getattr(type(obj), "__slots__", ()):
+                if slot != "__weakref__" and hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return total
+
+
+def _state(cls: type) -> dict[str, object]:
+    """Loaded class-level data of a catalog (underscore attributes that are not None)."""
+    state = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, value in vars(klass).items():
+            if (
+                name.startswith("_")
+                and not name.startswith("__")
+                and value is not None
+                and not callable(value)
+                and not isinstance(value, (classmethod, staticmethod, property))
+            ):
+                state[name] = value
+    return state
+
+
+def _record_count(cls: type) -> int | None:
+    data = getattr(cls, "_data", None)
+    if isinstance(data, (list, tuple, dict)):
+        return len(data)
+    info = _by_class.get(cls)
+    if info is not None and info.backend == "sqlite" and info.loaded:
+        count: int | None = getattr(cls, "get_total_count", lambda: None)()
+        return count
+    return None
+
+
+def _load(cls: type, measure_memory: bool) -> dict:
+    start = time.perf_counter()
+    error = None
+    loader = _loader_name(cls)
+    try:
+        if loader is None:
+            raise TypeError(f"{cls.__name__} has no loader class method")
+        getattr(cls, loader)()
+    except Exception as exc:  # missing data files, optional dependencies, ...
+        error = f"{type(exc).__name__}: {exc}"
+    return {
+        "seconds": time.perf_counter() - start,
+        "records": _record_count(cls),
+        "memory_bytes": _deep_sizeof(_state(cls)) if measure_memory and not error else None,
+        "error": error,
+    }
+
+
+def preload(
+    catalogs: Iterable[str | type] | None = None,
+    parallel: bool = True,
+    max_workers: int | None = None,
+    measure_memory: bool = True,
+    freeze_gc: bool = False,
+) -> dict[str, dict]:
+    """
+    Loads catalogs eagerly and reports what each one cost.
+
+    Call it in the master process of a pre-forked server (e.g. a gunicorn
+    ``on_starting`` hook with ``preload_app``) so workers start with every
+    catalog already parsed and indexed.
+
+    Args:
+        catalogs: Class names or classes to load (None for every catalog)
+        parallel: Load catalogs concurrently in a thread pool
+        max_workers: Thread pool size (default: ThreadPoolExecutor's)
+        measure_memory: Walk each catalog's loaded data to estimate its size
+        freeze_gc: Call ``gc.freeze()`` afterwards, so the garbage collector
+            never writes to the preloaded objects and forked workers keep
+            sharing their pages
+
+    Returns:
+        Dict mapping catalog name to {"seconds", "records", "memory_bytes",
+        "error"}. Catalogs that fail to load (e.g. a missing data file) are
+        reported with their error instead of raising.
+
+    Raises:
+        KeyError: If a catalog name is unknown
+
+    Example:
+        >>> report = preload()
+        >>> slowest = max(report.items(), key=lambda item: item[1]["seconds"])
+    """
+    if catalogs is None:
+        classes = list(discover().values())
+    else:
+        classes = [get_catalog(c) if isinstance(c, str) else c for c in catalogs]
+
+    if parallel and len(classes) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda cls: _load(cls, measure_memory), classes))
+    else:
+        results = [_load(cls, measure_memory) for cls in classes]
+
+    if freeze_gc:
+        gc.collect()
+        gc.freeze()
+    return {cls.__name__: result for cls, result in zip(classes, results, strict=True)}
+
+
+def stats(load: bool = False, measure_memory: bool = True) -> list[dict]:
+    """
+    Reports every registered catalog, whether it is resident and what it cost.
+
+    Args:
+        load: Preload every catalog first (otherwise only catalogs already
+            used by this process show as loaded)
+        measure_memory: Walk each loaded catalog's data to estimate its size
+
+    Returns:
+        One dict per catalog, sorted by name, with:
+            - name, module, source (absolute path), backend ("json"/"sqlite")
+            - exists: Whether the source file is present
+            - loaded: Whether the catalog has been loaded in this process
+            - records: Number of records (None if not loaded)
+            - load_seconds: Duration of the first load
+            - bytes_parsed: Size of the file read by the first load (the JSON,
+              or its ``.snap`` snapshot when that was used)
+            - data_bytes: Memory held by the records (``_data``)
+            - index_bytes: Memory held by lookup indexes on top of the records
+
+    Example:
+        >>> for row in stats():
+        ...     print(row["name"], row["loaded"], row["index_bytes"])
+    """
+    catalogs = discover()
+    if load:
+        preload(list(catalogs.values()), measure_memory=False)
+    rows = []
+    for name in catalogs:
+        info = _registry[name]
+        row = {
+            "name": name,
+            "module": info.cls.__module__,
+            "source": str(info.path),
+            "backend": info.backend,
+            "exists": info.path.exists(),
+            "loaded": info.loaded,
+            "records": _record_count(info.cls) if info.loaded else None,
+            "load_seconds": info.load_seconds,
+            "bytes_parsed": info.bytes_parsed,
+            "data_bytes": None,
+            "index_bytes": None,
+        }
+        if info.loaded and measure_memory:
+            state = _state(info.cls)
+            seen: set[int] = set()
+            data = state.pop("_data", None)
+            row["data_bytes"] = _deep_sizeof(data, seen) if data is not None else 0
+            row["index_bytes"] = sum(_deep_sizeof(value, seen) for value in state.values())
+        rows.append(row)
+    return rows
+
+
+__all__ = [
+    "BACKENDS",
+    "DATA_ROOT",
+    "LOADER_NAMES",
+    "CatalogInfo",
+    "data_path",
+    "discover",
+    "get_catalog",
+    "preload",
+    "register",
+    "stats",
+]
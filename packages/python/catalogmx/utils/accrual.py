@@ -0,0 +1,177 @@
+"""
+Interest accrual for catalogmx
+==============================
+
+Day-count accrual over a rate series (TIIE, CETES) with ACT/360 or ACT/365.
+
+``AccrualTable`` expands a published rate series to one entry per calendar
+day (each day uses the last rate published on or before it) and stores two
+prefix sums: the daily rates and the logs of the daily growth factors. The
+simple interest or the compound factor between any two dates is then the
+difference of two prefix sums, O(1) per query after the table is built.
+
+Accrual periods follow the usual convention: the first day accrues, the last
+one does not, so ``[fecha_inicio, fecha_fin)`` accrues ``fecha_fin -
+fecha_inicio`` days.
+"""
+
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from math import exp, expm1, log1p
+from typing import Any
+
+from catalogmx.utils.lazy import is_ndarray, optional_numpy
+from catalogmx.utils.timeseries import TimeSeries, to_ordinal, to_ordinals
+
+#: Supported day-count bases (ACT/360 and ACT/365)
+DAY_COUNT_BASES = (360, 365)
+
+
+class AccrualTable:
+    """
+    Prefix-summed daily accrual over a rate series.
+
+    The table covers every calendar day from the first published rate to the
+    last one, inclusive. Periods that start before or end after that range
+    cannot be accrued and give None.
+
+    Args:
+        series: Rate series (values in percent, e.g. 11.25)
+        basis: Day-count basis, 360 (ACT/360) or 365 (ACT/365)
+
+    Example:
+        >>> table = AccrualTable(tiie_series, basis=360)
+        >>> table.simple("2024-01-01", "2024-01-31")     # sum of daily rates
+        >>> table.factor("2024-01-01", "2024-01-31")     # daily compounding
+    """
+
+    def __init__(self, series: TimeSeries, basis: int = 360) -> None:
+        if basis not in DAY_COUNT_BASES:
+            raise ValueError(f"basis must be one of {DAY_COUNT_BASES}")
+        self.basis = basis
+        days, values = series.days, series.values
+        self.first_day = days[0] if len(days) else 0
+        # Accrual is possible up to (not including) the day after the last rate
+        self.end_day = days[-1] + 1 if len(days) else 0
+
+        rate_sums = array("d", [0.0])
+        log_sums = array("d", [0.0])
+        rate_total = 0.0
+        log_total = 0.0
+        j = 0
+        for day in range(self.first_day, self.end_day):
+            while j + 1 < len(days) and days[j + 1] <= day:
+                j += 1
+            daily = values[j] / 100 / basis
+            rate_total += daily
+            log_total += log1p(daily)
+            rate_sums.append(rate_total)
+            log_sums.append(log_total)
+        self.rate_sums = rate_sums
+        self.log_sums = log_sums
+
+    def _offsets(self, fecha_inicio: str | date, fecha_fin: str | date) -> tuple[int, int] | None:
+        start, end = to_ordinal(fecha_inicio), to_ordinal(fecha_fin)
+        if end < start:
+            raise ValueError("fecha_fin must not be before fecha_inicio")
+        if start < self.first_day or end > self.end_day:
+            return None
+        return start - self.first_day, end - self.first_day
+
+    def simple(self, fecha_inicio: str | date, fecha_fin: str | date) -> float | None:
+        """
+        Simple interest per unit of capital: sum of daily rates (rate / basis).
+
+        Returns:
+            Interest per unit of capital, or None outside the covered dates
+        """
+        offsets = self._offsets(fecha_inicio, fecha_fin)
+        if offsets is None:
+            return None
+        return self.rate_sums[offsets[1]] - self.rate_sums[offsets[0]]
+
+    def factor(self, fecha_inicio: str | date, fecha_fin: str | date) -> float | None:
+        """
+        Compound growth factor with daily capitalization: prod(1 + rate / basis).
+
+        Returns:
+            Growth factor (1.0 for an empty period), or None outside the covered dates
+        """
+        offsets = self._offsets(fecha_inicio, fecha_fin)
+        if offsets is None:
+            return None
+        return exp(self.log_sums[offsets[1]] - self.log_sums[offsets[0]])
+
+    def compound(self, fecha_inicio: str | date, fecha_fin: str | date) -> float | None:
+        """
+        Compound interest per unit of capital: ``factor - 1``.
+
+        Computed with ``expm1`` so short periods keep their precision and match
+        ``accrue_many(..., compound=True)`` exactly.
+
+        Returns:
+            Interest per unit of capital, or None outside the covered dates
+        """
+        offsets = self._offsets(fecha_inicio, fecha_fin)
+        if offsets is None:
+            return None
+        return expm1(self.log_sums[offsets[1]] - self.log_sums[offsets[0]])
+
+    def accrue_many(
+        self,
+        capitals: Any,
+        fechas_inicio: Sequence[Any],
+        fechas_fin: Sequence[Any],
+        compound: bool = False,
+    ) -> Any:
+        """
+        Interest on many (capital, start, end) periods at once.
+
+        Args:
+            capitals: Capitals as a list or NumPy array
+            fechas_inicio: Start dates, one per capital
+            fechas_fin: End dates, one per capital
+            compound: Daily compounding instead of simple accrual
+
+        Returns:
+            Interest per period, same container type as ``capitals`` (None in
+            lists and NaN in NumPy arrays where the period is not covered)
+
+        Raises:
+            ValueError: If lengths differ or a period ends before it starts
+        """
+        if not len(capitals) == len(fechas_inicio) == len(fechas_fin):
+            raise ValueError("capitals, fechas_inicio and fechas_fin must have the same length")
+        sums = self.log_sums if compound else self.rate_sums
+
+        if is_ndarray(capitals):
+            np = optional_numpy()
+            starts_np = np.asarray(to_ordinals(fechas_inicio), dtype=np.int64) - self.first_day
+            ends_np = np.asarray(to_ordinals(fechas_fin), dtype=np.int64) - self.first_day
+            if (ends_np < starts_np).any():
+                raise ValueError("fecha_fin must not be before fecha_inicio")
+            limit = self.end_day - self.first_day
+            covered = (starts_np >= 0) & (ends_np <= limit)
+            table = np.frombuffer(sums, dtype=np.float64)
+            deltas = np.full(len(capitals), np.nan)
+            deltas[covered] = table[ends_np[covered]] - table[starts_np[covered]]
+            growth = np.expm1(deltas) if compound else deltas
+            return capitals.astype(np.float64, copy=False) * growth
+
+        starts = to_ordinals(fechas_inicio)
+        ends = to_ordinals(fechas_fin)
+        first, end_day = self.first_day, self.end_day
+        result: list[float | None] = []
+        for capital, start, end in zip(capitals, starts, ends, strict=True):
+            if end < start:
+                raise ValueError("fecha_fin must not be before fecha_inicio")
+            if start < first or end > end_day:
+                result.append(None)
+                continue
+            delta = sums[end - first] - sums[start - first]
+            result.append(capital * (expm1(delta) if compound else delta))
+        return result
+
+
+__all__ = ["AccrualTable", "DAY_COUNT_BASES"]
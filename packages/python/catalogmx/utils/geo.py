@@ -0,0 +1,292 @@
+"""
+Spatial index for catalogmx
+===========================
+
+Provides a lat/lon grid index for radius and k-nearest-neighbour queries over
+in-memory catalogs with GPS coordinates.
+
+``GridIndex`` is built once when a catalog loads. Coordinates are stored in
+``array('d')`` columns and bucketed into fixed-size grid cells, so a query only
+visits the cells that overlap its bounding box and runs haversine on the points
+that pass a cheap bounding-box prefilter.
+"""
+
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from math import asin, atan2, cos, degrees, floor, pi, radians, sin, sqrt
+from typing import Generic, TypeVar
+
+from catalogmx.utils.lazy import optional_numpy
+
+T = TypeVar("T")
+
+EARTH_RADIUS_KM = 6371
+KM_PER_DEGREE = radians(1) * EARTH_RADIUS_KM
+
+# Slack (degrees) on the bounding-box prefilter so float rounding never drops
+# a point that haversine places exactly on the radius
+_BBOX_EPSILON = 1e-9
+
+# Points per chunk in the NumPy batch path (chunk x catalog distance matrix)
+_NUMPY_CHUNK = 256
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance in kilometers between two GPS points.
+
+    Example:
+        >>> round(haversine_km(19.4326, -99.1332, 20.6597, -103.3496), 1)
+        461.2
+    """
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    return EARTH_RADIUS_KM * c
+
+
+def _lon_span_deg(lat: float, radius_km: float) -> float:
+    """Maximum longitude difference (degrees) of points within radius_km of a point at lat."""
+    angular = radius_km / EARTH_RADIUS_KM
+    if angular >= 1.5:
+        return 360.0
+    cos_lat = cos(radians(lat))
+    s = sin(angular)
+    if s >= cos_lat:
+        return 360.0
+    return degrees(asin(s / cos_lat))
+
+
+class GridIndex(Generic[T]):
+    """
+    Grid-bucket spatial index over a list of records with coordinates.
+
+    Records whose latitude or longitude is None are left out of the index.
+
+    Args:
+        items: Records to index (kept by reference, in order)
+        lat: Callable returning the latitude of a record
+        lon: Callable returning the longitude of a record
+        cell_deg: Size of a grid cell in degrees (default: 0.25)
+
+    Example:
+        >>> index = GridIndex(localidades, lat=lambda r: r["latitud"], lon=lambda r: r["longitud"])
+        >>> index.within(19.43, -99.13, 10)   # [(doc, km), ...] sorted by distance
+        >>> index.nearest(19.43, -99.13, k=3)
+    """
+
+    # Neighbours per point from which nearest_many() uses the NumPy dense path
+    numpy_min_k = 128
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        lat: Callable[[T], float | None],
+        lon: Callable[[T], float | None],
+        cell_deg: float = 0.25,
+    ) -> None:
+        if cell_deg <= 0:
+            raise ValueError("cell_deg must be > 0")
+        self._items = items
+        self.cell_deg = cell_deg
+        self.docs = array("I")
+        self.lats = array("d")
+        self.lons = array("d")
+        cells: dict[tuple[int, int], array] = {}
+        for doc, item in enumerate(items):
+            item_lat, item_lon = lat(item), lon(item)
+            if item_lat is None or item_lon is None:
+                continue
+            pos = len(self.docs)
+            self.docs.append(doc)
+            self.lats.append(item_lat)
+            self.lons.append(item_lon)
+            key = self._cell(item_lat, item_lon)
+            bucket = cells.get(key)
+            if bucket is None:
+                bucket = cells[key] = array("I")
+            bucket.append(pos)
+        self._cells = cells
+        if cells:
+            rows = [key[0] for key in cells]
+            cols = [key[1] for key in cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+            self._max_abs_lat = max(abs(v) for v in self.lats)
+        else:
+            self._bounds = (0, -1, 0, -1)
+            self._max_abs_lat = 0.0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return floor(lat / self.cell_deg), floor(lon / self.cell_deg)
+
+    def _positions(self, rows: range, cols: range) -> Iterable[int]:
+        cells = self._cells
+        for row in rows:
+            for col in cols:
+                bucket = cells.get((row, col))
+                if bucket is not None:
+                    yield from bucket
+
+    def within(self, lat: float, lon: float, radius_km: float) -> list[tuple[int, float]]:
+        """
+        Records within radius_km of a point.
+
+        Args:
+            lat: Latitude of the point
+            lon: Longitude of the point
+            radius_km: Search radius in kilometers
+
+        Returns:
+            List of (record position, distance in km), closest first
+        """
+        if radius_km < 0 or not self._cells:
+            return []
+        dlat = radius_km / KM_PER_DEGREE + _BBOX_EPSILON
+        dlon = _lon_span_deg(lat, radius_km) + _BBOX_EPSILON
+        min_lat, max_lat = lat - dlat, lat + dlat
+        min_row, max_row, min_col, max_col = self._bounds
+        rows = range(
+            max(min_row, floor(min_lat / self.cell_deg)),
+            min(max_row, floor(max_lat / self.cell_deg)) + 1,
+        )
+        if dlon >= 180:
+            cols = range(min_col, max_col + 1)
+            lon_ok = None
+        else:
+            cols = range(
+                max(min_col, floor((lon - dlon) / self.cell_deg)),
+                min(max_col, floor((lon + dlon) / self.cell_deg)) + 1,
+            )
+            lon_ok = (lon - dlon, lon + dlon)
+
+        lats, lons, docs = self.lats, self.lons, self.docs
+        hits = []
+        for pos in self._positions(rows, cols):
+            p_lat = lats[pos]
+            if p_lat < min_lat or p_lat > max_lat:
+                continue
+            p_lon = lons[pos]
+            if lon_ok is not None and (p_lon < lon_ok[0] or p_lon > lon_ok[1]):
+                continue
+            distance = haversine_km(lat, lon, p_lat, p_lon)
+            if distance <= radius_km:
+                hits.append((docs[pos], distance))
+        hits.sort(key=lambda hit: (hit[1], hit[0]))
+        return hits
+
+    def _ring_min_km(self, lat: float, ring: int) -> float:
+        """Lower bound of the distance from a point to any cell outside the given ring."""
+        if ring <= 0:
+            return 0.0
+        span = radians(ring * self.cell_deg)
+        if span >= pi:
+            return float("inf")
+        # A longitude gap is shortest at the highest latitude involved
+        max_lat = min(max(abs(lat), self._max_abs_lat), 90.0)
+        return 2 * EARTH_RADIUS_KM * asin(min(1.0, cos(radians(max_lat)) * sin(span / 2)))
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> list[tuple[int, float]]:
+        """
+        The k records closest to a point.
+
+        Visits grid rings around the point's cell until no unvisited cell can
+        hold a closer record than the current k-th one.
+
+        Args:
+            lat: Latitude of the point
+            lon: Longitude of the point
+            k: Number of records to return
+
+        Returns:
+            List of (record position, distance in km), closest first
+        """
+        if k <= 0 or not self._cells:
+            return []
+        row0, col0 = self._cell(lat, lon)
+        min_row, max_row, min_col, max_col = self._bounds
+        max_ring = max(
+            abs(row0 - min_row), abs(row0 - max_row), abs(col0 - min_col), abs(col0 - max_col)
+        )
+        lats, lons, docs = self.lats, self.lons, self.docs
+        found: list[tuple[float, int]] = []
+        ring = 0
+        while ring <= max_ring:
+            if ring == 0:
+                positions: Iterable[int] = self._positions(
+                    range(row0, row0 + 1), range(col0, col0 + 1)
+                )
+            else:
+                top, bottom = row0 - ring, row0 + ring
+                inner_cols = range(col0 - ring, col0 + ring + 1)
+                inner_rows = range(top + 1, bottom)
+                positions = (
+                    *self._positions(range(top, top + 1), inner_cols),
+                    *self._positions(range(bottom, bottom + 1), inner_cols),
+                    *self._positions(inner_rows, range(col0 - ring, col0 - ring + 1)),
+                    *self._positions(inner_rows, range(col0 + ring, col0 + ring + 1)),
+                )
+            for pos in positions:
+                found.append((haversine_km(lat, lon, lats[pos], lons[pos]), docs[pos]))
+            if len(found) >= k:
+                found.sort()
+                del found[k:]
+                if found[-1][0] <= self._ring_min_km(lat, ring):
+                    break
+            ring += 1
+        found.sort()
+        return [(doc, distance) for distance, doc in found[:k]]
+
+    def nearest_many(
+        self, points: Iterable[tuple[float, float]], k: int = 1
+    ) -> list[list[tuple[int, float]]]:
+        """
+        nearest() for many points at once.
+
+        For small k each point goes through the grid (nearest()), which only
+        visits a few cells. From ``numpy_min_k`` neighbours on, rings grow large
+        and, with NumPy installed, distances are computed in chunks against the
+        whole index instead.
+
+        Args:
+            points: Iterable of (lat, lon)
+            k: Number of records per point
+
+        Returns:
+            One list of (record position, distance in km) per point, closest first
+        """
+        points = list(points)
+        np = optional_numpy() if k >= self.numpy_min_k and points and self._cells else None
+        if np is None:
+            return [self.nearest(lat, lon, k) for lat, lon in points]
+
+        k = min(k, len(self.docs))
+        p_lat = np.radians(np.frombuffer(self.lats, dtype=np.float64))
+        p_lon = np.radians(np.frombuffer(self.lons, dtype=np.float64))
+        p_cos = np.cos(p_lat)
+        docs = np.frombuffer(self.docs, dtype=np.uint32)
+        results: list[list[tuple[int, float]]] = []
+        for start in range(0, len(points), _NUMPY_CHUNK):
+            chunk = np.radians(np.asarray(points[start : start + _NUMPY_CHUNK], dtype=np.float64))
+            q_lat = chunk[:, 0:1]
+            q_lon = chunk[:, 1:2]
+            a = (
+                np.sin((p_lat - q_lat) / 2) ** 2
+                + np.cos(q_lat) * p_cos * np.sin((p_lon - q_lon) / 2) ** 2
+            )
+            dist = EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+            if k < dist.shape[1]:
+                top = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(dist.shape[1]), dist.shape)
+            for row, cols in enumerate(top):
+                row_dist = dist[row, cols]
+                order = np.lexsort((docs[cols], row_dist))
+                results.append([(int(docs[cols[i]]), float(row_dist[i])) for i in order])
+        return results
+
+
+__all__ = ["EARTH_RADIUS_KM", "GridIndex", "haversine_km"]
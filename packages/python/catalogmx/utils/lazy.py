@@ -0,0 +1,86 @@
+"""
+Lazy package exports (PEP 562)
+==============================
+
+Packages re-export their catalogs and helpers from ``__init__`` for
+convenience, but importing every submodule up front makes ``import catalogmx``
+pay for JSON loaders, validators and NumPy that most programs never touch.
+``lazy_exports`` builds the module-level ``__getattr__`` and ``__dir__`` that
+import a submodule only when one of its names is first accessed.
+
+NumPy is optional and only speeds up batch calls, so modules get it from
+``optional_numpy()`` inside those calls rather than importing it at the top.
+``is_ndarray`` recognizes NumPy input without importing NumPy at all.
+
+Example:
+    >>> # catalogmx/catalogs/sepomex/__init__.py
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"CodigosPostales": ".codigos_postales"})
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import TypeGuard
+
+    import numpy
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Creates ``__getattr__``/``__dir__`` for a package with lazily imported names.
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Maps each exported name to the relative module that defines
+            it (e.g. {"BankCatalog": ".banks"}). A name mapped to its own
+            submodule (e.g. {"cfdi_4": ".cfdi_4"}) exports the submodule.
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level. Resolved names are
+        stored in the package namespace, so each import happens once.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def _getattr(name: str) -> object:
+        try:
+            target = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        module = importlib.import_module(target, package)
+        value = module if target == f".{name}" else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def _dir() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return _getattr, _dir
+
+
+@functools.cache
+def optional_numpy():
+    """NumPy if installed, imported on the first batch call that uses it (not on ``import``)."""
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional; the pure-Python path is always available
+        return None
+    return numpy
+
+
+def is_ndarray(value: object) -> TypeGuard[numpy.ndarray]:
+    """
+    Whether value is a NumPy array.
+
+    An array can only exist once its caller imported NumPy, so this looks
+    NumPy up in ``sys.modules`` instead of importing it.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
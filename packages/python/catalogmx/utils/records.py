@@ -0,0 +1,176 @@
+"""
+Compact catalog records
+=======================
+
+The large catalogs (INEGI localidades and municipios, SEPOMEX códigos
+postales, the Banxico series) keep tens of thousands of rows in memory. A
+``dict`` per row takes several hundred bytes. A ``__slots__`` object with the
+same fields takes 8 bytes per field plus a small header.
+
+``Record`` is the base of those row types. It is immutable and implements
+the read-only ``Mapping`` protocol, so existing code keeps using
+``record["campo"]``, ``record.get("campo")``, ``dict(record)`` and
+comparisons with plain dicts. Use ``to_dict()`` to get a mutable dict, e.g.
+for ``json.dumps``.
+
+Fields listed in ``_intern`` hold a few repeated values (estado, municipio,
+moneda, notas, ...). Their strings are interned and their integers shared, so
+every record points to one copy.
+
+Example:
+    >>> class Moneda(Record):
+    ...     __slots__ = ("clave", "nombre")
+    ...     _intern = frozenset({"nombre"})
+    >>> moneda = Moneda.from_dict({"clave": "MXN", "nombre": "Peso"})
+    >>> moneda["nombre"], moneda.to_dict()
+    ('Peso', {'clave': 'MXN', 'nombre': 'Peso'})
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, TypeVar
+
+R = TypeVar("R", bound="Record")
+
+# Shared int objects for interned fields (CPython only caches -5..256)
+_ints: dict[int, int] = {}
+_set = object.__setattr__
+
+
+def _intern(value: Any) -> Any:
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is int:
+        return _ints.setdefault(value, value)
+    return value
+
+
+class Record(Mapping):
+    """
+    Immutable ``__slots__`` record with dict-style read access.
+
+    Subclasses list their fields in ``__slots__``. A field missing from the
+    source row stays unset and reads as a missing key. Keys that are not
+    fields are kept in a small ``_extra`` dict, so no data is lost when a
+    source file gains columns.
+    """
+
+    __slots__ = ("_extra",)
+
+    _extra: dict[str, Any] | None
+
+    #: Field names, in order (set for each subclass from its ``__slots__``)
+    _fields: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+    #: Fields whose values repeat across records and are interned on load
+    _intern: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in vars(klass).get("__slots__", ())
+            if not name.startswith("_")
+        )
+        cls._field_set = frozenset(cls._fields)
+
+    @classmethod
+    def from_dict(cls: type[R], data: Mapping[str, Any]) -> R:
+        """Builds a record from a row (e.g. a parsed JSON object)."""
+        record = cls.__new__(cls)
+        fields = cls._field_set
+        intern = cls._intern
+        extra = None
+        for key, value in data.items():
+            if key in intern:
+                if type(value) is str:
+                    value = sys.intern(value)
+                elif type(value) is int:
+                    value = _ints.setdefault(value, value)
+            if key in fields:
+                _set(record, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        _set(record, "_extra", extra)
+        return record
+
+    @classmethod
+    def from_dicts(cls: type[R], rows: Iterable[Mapping[str, Any]]) -> list[R]:
+        """Builds a list of records from rows."""
+        return [cls.from_dict(row) for row in rows]
+
+    @classmethod
+    def from_columns(
+        cls: type[R], names: list[str], columns: list[list[Any]], rows: int
+    ) -> list[R]:
+        """
+        Builds records from columns (e.g. a binary snapshot) without a dict per row.
+
+        Each field is filled for every record at once through its slot
+        descriptor, and interned fields are interned column by column.
+        """
+        new = cls.__new__
+        records = [new(cls) for _ in range(rows)]
+        extra = []
+        for name, column in zip(names, columns, strict=True):
+            if name in cls._intern:
+                column = list(map(_intern, column))
+            if name in cls._field_set:
+                slot = next(vars(k)[name] for k in cls.__mro__ if name in vars(k))
+                for _ in map(slot.__set__, records, column):
+                    pass
+            else:
+                extra.append((name, column))
+        if extra:
+            for i, record in enumerate(records):
+                _set(record, "_extra", {name: column[i] for name, column in extra})
+        else:
+            for record in records:
+                _set(record, "_extra", None)
+        return records
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._fields:
+            if hasattr(self, name):
+                yield name
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self) -> tuple:
+        # Unpickling would go through the read-only __setattr__
+        return (type(self).from_dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Mutable ``dict`` with the same keys and values."""
+        return {key: self[key] for key in self}
+
+
+__all__ = ["Record"]
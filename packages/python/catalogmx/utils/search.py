@@ -0,0 +1,171 @@
+"""
+Search indexes for catalogmx
+============================
+
+Provides an inverted index for accent-insensitive search over in-memory catalogs.
+
+``TokenIndex`` is built once when a catalog loads. It stores the normalized text
+of every record, word-token postings lists and character n-gram postings lists,
+so substring queries only verify the few records that share every n-gram of the
+query instead of normalizing and scanning the whole catalog.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Generic, TypeVar
+
+from catalogmx.utils.text import normalize_text
+
+T = TypeVar("T")
+
+_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+
+
+def _contains(postings: array, doc: int) -> bool:
+    """Membership test on a sorted postings list."""
+    i = bisect_left(postings, doc)
+    return i < len(postings) and postings[i] == doc
+
+
+def _intersect(lists: list[array]) -> list[int]:
+    """Intersects sorted postings lists, driving from the shortest one."""
+    if not lists:
+        return []
+    lists = sorted(lists, key=len)
+    smallest, rest = lists[0], lists[1:]
+    return [doc for doc in smallest if all(_contains(p, doc) for p in rest)]
+
+
+class TokenIndex(Generic[T]):
+    """
+    Inverted index over a list of records with accent-insensitive search.
+
+    Args:
+        items: Records to index (kept by reference, in order)
+        key: Callable returning the text to index for a record
+        ngram: N-gram size used for substring search (default: 3)
+        normalize: Normalization applied to indexed texts and queries
+
+    Example:
+        >>> index = TokenIndex(localidades, key=lambda loc: loc["nom_localidad"])
+        >>> index.search("san josé")        # substring, same as `q in text`
+        >>> index.search_tokens("jose san")  # every word, in any order (prefixes)
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        key: Callable[[T], str],
+        ngram: int = 3,
+        normalize: Callable[[str], str] = normalize_text,
+    ) -> None:
+        if ngram < 1:
+            raise ValueError("ngram must be >= 1")
+        self._items = items
+        self._normalize = normalize
+        self.ngram = ngram
+        self.texts: list[str] = [normalize(key(item) or "") for item in items]
+
+        grams: dict[str, array] = {}
+        tokens: dict[str, array] = {}
+        n = ngram
+        for doc, text in enumerate(self.texts):
+            for gram in {text[i : i + n] for i in range(len(text) - n + 1)}:
+                postings = grams.get(gram)
+                if postings is None:
+                    postings = grams[gram] = array("I")
+                postings.append(doc)
+            for token in set(_TOKEN_RE.findall(text)):
+                postings = tokens.get(token)
+                if postings is None:
+                    postings = tokens[token] = array("I")
+                postings.append(doc)
+        self._grams = grams
+        self._tokens = tokens
+        self._vocabulary = sorted(tokens)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _results(self, docs: Iterable[int], limit: int | None) -> list[T]:
+        items = self._items
+        if limit is None:
+            return [items[doc] for doc in docs]
+        results: list[T] = []
+        for doc in docs:
+            if len(results) >= limit:
+                break
+            results.append(items[doc])
+        return results
+
+    def search(self, query: str, limit: int | None = None) -> list[T]:
+        """
+        Substring search: records whose normalized text contains the normalized query.
+
+        Equivalent to ``[r for r in items if normalize(q) in normalize(key(r))]``,
+        in the original order, without touching records that cannot match.
+
+        Args:
+            query: Text to look for (accents and case are ignored)
+            limit: Maximum number of results (None for all)
+        """
+        q = self._normalize(query)
+        if not q:
+            return self._results(range(len(self._items)), limit)
+        texts = self.texts
+        n = self.ngram
+        if len(q) >= n:
+            lists = []
+            for gram in {q[i : i + n] for i in range(len(q) - n + 1)}:
+                postings = self._grams.get(gram)
+                if postings is None:
+                    return []
+                lists.append(postings)
+            candidates: Iterable[int] = _intersect(lists)
+        else:
+            # Shorter than an n-gram: union of postings of every n-gram containing it
+            docs: set[int] = set()
+            for gram, postings in self._grams.items():
+                if q in gram:
+                    docs.update(postings)
+            # Texts shorter than n have no n-grams at all
+            docs.update(doc for doc, text in enumerate(texts) if len(text) < n and q in text)
+            candidates = sorted(docs)
+        return self._results((doc for doc in candidates if q in texts[doc]), limit)
+
+    def search_tokens(self, query: str, prefix: bool = True, limit: int | None = None) -> list[T]:
+        """
+        Word search: records containing every word of the query, in any order.
+
+        Args:
+            query: Words to look for (accents and case are ignored)
+            prefix: If True, query words match the beginning of indexed words
+                ("guad" matches "GUADALAJARA")
+            limit: Maximum number of results (None for all)
+        """
+        words = set(_TOKEN_RE.findall(self._normalize(query)))
+        if not words:
+            return []
+        lists = []
+        for word in words:
+            if not prefix:
+                postings = self._tokens.get(word)
+                if postings is None:
+                    return []
+                lists.append(postings)
+                continue
+            vocabulary = self._vocabulary
+            i = bisect_left(vocabulary, word)
+            matched: set[int] = set()
+            while i < len(vocabulary) and vocabulary[i].startswith(word):
+                matched.update(self._tokens[vocabulary[i]])
+                i += 1
+            if not matched:
+                return []
+            lists.append(array("I", sorted(matched)))
+        return self._results(_intersect(lists), limit)
+
+
+__all__ = ["TokenIndex"]
@@ -0,0 +1,330 @@
+"""
+Binary catalog snapshots for catalogmx
+======================================
+
+Columnar, memory-mappable alternative to the large JSON catalogs in
+``packages/shared-data`` (Banxico series, INEGI municipios).
+
+A snapshot stores a list of flat records (same keys in every record) as one
+typed column per key plus a table of unique strings, so repeated values such
+as ``"notas"`` or ``"moneda"`` are stored, decoded and kept in memory once.
+Loading maps the file with ``mmap`` and reads columns straight from the
+mapping instead of parsing JSON.
+
+Snapshots are generated next to their JSON source (``udis.json`` ->
+``udis.snap``) by ``packages/shared-data/build_snapshots.py``. They record the
+size and CRC-32 of the JSON they were built from. ``load_records`` ignores a
+snapshot whose recorded size no longer matches its source, or that is older
+than it, and parses the JSON instead; checking the CRC-32 needs reading the
+whole JSON, so only ``build_snapshots.py --check`` does it.
+
+File layout (little-endian)::
+
+    b"CMXSNAP1" | uint32 header length | JSON header | column and string blocks
+
+Every block starts at an 8-byte aligned offset given in the header. The string
+table is two blocks: uint64 code-point offsets and the UTF-8 text of all
+strings concatenated.
+"""
+
+import json
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from catalogmx.utils.records import Record
+
+R = TypeVar("R", bound="Record")
+
+MAGIC = b"CMXSNAP1"
+VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+
+_LENGTH = struct.Struct("<I")
+_ALIGN = 8
+_INT_TYPECODES = (("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31), ("q", 1 << 63))
+
+
+def _column_kind(values: list[Any]) -> tuple[str, str]:
+    """(kind, typecode) used to store a column."""
+    types = {type(value) for value in values}
+    if types == {int}:
+        low, high = min(values), max(values)
+        for typecode, limit in _INT_TYPECODES:
+            if -limit <= low and high < limit:
+                return "int", typecode
+    if types == {float}:
+        return "float", "d"
+    if types == {str}:
+        return "str", "I"
+    # Mixed types, None, bools or nested values: stored as JSON text
+    return "json", "I"
+
+
+def _source_signature(path: Path) -> dict[str, int]:
+    data = path.read_bytes()
+    return {"size": len(data), "crc32": zlib.crc32(data)}
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(
+    records: list[dict[str, Any]], path: str | Path, source: str | Path | None = None
+) -> Path:
+    """
+    Writes records as a binary snapshot.
+
+    Args:
+        records: Flat records, all with the same keys in the same order
+        path: Output file
+        source: JSON file the records come from (its signature is stored so
+            stale snapshots are detected)
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        ValueError: If records do not share the same keys
+    """
+    path = Path(path)
+    names = list(records[0]) if records else []
+    for record in records:
+        if list(record) != names:
+            raise ValueError("All records must have the same keys in the same order")
+
+    strings: dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    blocks: list[bytes] = []
+    columns = []
+    for name in names:
+        values = [record[name] for record in records]
+        kind, typecode = _column_kind(values)
+        if kind == "str":
+            values = [intern(value) for value in values]
+        elif kind == "json":
+            values = [intern(json.dumps(value, ensure_ascii=False)) for value in values]
+        blocks.append(_little_endian(array(typecode, values)))
+        columns.append({"name": name, "kind": kind, "typecode": typecode})
+
+    # Offsets are in code points: the whole table is decoded once and sliced
+    offsets = array("Q", [0])
+    for text in strings:
+        offsets.append(offsets[-1] + len(text))
+    blocks.append(_little_endian(offsets))
+    blocks.append("".join(strings).encode("utf-8"))
+
+    header: dict[str, Any] = {
+        "version": VERSION,
+        "rows": len(records),
+        "strings": len(strings),
+        "source": _source_signature(Path(source)) if source is not None else None,
+        "columns": columns,
+        "blocks": [],
+    }
+    # Block offsets depend on the header length, which depends on the offsets
+    header_size = 0
+    while True:
+        position = len(MAGIC) + _LENGTH.size + header_size
+        layout = []
+        for block in blocks:
+            position += -position % _ALIGN
+            layout.append([position, len(block)])
+            position += len(block)
+        header["blocks"] = layout
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        if len(header_bytes) == header_size:
+            break
+        header_size = len(header_bytes)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for block, (offset, _) in zip(blocks, layout, strict=True):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(block)
+    return path
+
+
+def _read_header(view: memoryview) -> dict[str, Any]:
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a catalogmx snapshot")
+    (length,) = _LENGTH.unpack_from(view, len(MAGIC))
+    start = len(MAGIC) + _LENGTH.size
+    header: dict[str, Any] = json.loads(bytes(view[start : start + length]))
+    if header.get("version") != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+    return header
+
+
+def _read_columns(path: str | Path) -> tuple[list[str], list[list[Any]], int]:
+    """(column names, column values, row count) of a snapshot file."""
+    if sys.byteorder != "little":  # pragma: no cover - no big-endian CI
+        raise ValueError("Snapshots can only be mapped on little-endian platforms")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            header = _read_header(view)
+            blocks = header["blocks"]
+
+            def block(index: int, typecode: str | None = None) -> memoryview:
+                offset, size = blocks[index]
+                data = view[offset : offset + size]
+                # typeshed types cast() per literal format; typecodes come from the header
+                return data.cast(typecode) if typecode else data  # type: ignore[call-overload]
+
+            offsets = block(len(blocks) - 2, "Q")
+            text_block = block(len(blocks) - 1)
+            text = str(text_block, "utf-8")
+            text_block.release()
+            strings = [text[offsets[i] : offsets[i + 1]] for i in range(header["strings"])]
+            offsets.release()
+
+            names = []
+            values = []
+            for index, column in enumerate(header["columns"]):
+                data = block(index, column["typecode"])
+                raw: list[int] = data.tolist()
+                data.release()
+                column_values: list[Any] = raw
+                if column["kind"] == "str":
+                    column_values = [strings[i] for i in raw]
+                elif column["kind"] == "json":
+                    decoded = {i: json.loads(strings[i]) for i in set(raw)}
+                    column_values = [decoded[i] for i in raw]
+                names.append(column["name"])
+                values.append(column_values)
+        finally:
+            view.release()
+    return names, values, header["rows"]
+
+
+def read_snapshot(path: str | Path) -> list[dict[str, Any]]:
+    """
+    Reads a binary snapshot into a list of records.
+
+    The file is memory-mapped and columns are read directly from the mapping.
+    Each distinct string is decoded once and shared by every record using it.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Records, equal to the ones the snapshot was written from
+
+    Raises:
+        ValueError: If the file is not a valid snapshot
+    """
+    return _to_dicts(*_read_columns(path))
+
+
+def _to_dicts(names: list[str], values: list[list[Any]], rows: int) -> list[dict[str, Any]]:
+    if not names:
+        return [{} for _ in range(rows)]
+    return list(map(dict, map(zip, repeat(names), zip(*values, strict=True))))
+
+
+def snapshot_path(json_path: str | Path) -> Path:
+    """Snapshot file that goes with a JSON catalog (same name, ``.snap`` suffix)."""
+    return Path(json_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _read_file_header(path: Path) -> dict[str, Any]:
+    """Header of a snapshot file, reading only its first bytes."""
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC) + _LENGTH.size)
+        if len(head) < len(MAGIC) + _LENGTH.size:
+            raise ValueError("Not a catalogmx snapshot")
+        (length,) = _LENGTH.unpack_from(head, len(MAGIC))
+        return _read_header(memoryview(head + f.read(length)))
+
+
+def is_fresh(json_path: str | Path, verify: bool = False) -> bool:
+    """
+    True if the snapshot of a JSON catalog exists and matches its current source.
+
+    By default only file metadata is compared, so checking never reads the
+    JSON: the snapshot must record the JSON's current size and be at least as
+    new as it. ``verify=True`` also compares the CRC-32 of the JSON contents
+    (``build_snapshots.py --check`` does).
+    """
+    json_path = Path(json_path)
+    path = snapshot_path(json_path)
+    try:
+        source_stat = json_path.stat()
+        if path.stat().st_mtime_ns < source_stat.st_mtime_ns:
+            return False
+        source = _read_file_header(path).get("source") or {}
+    except (OSError, ValueError):
+        return False
+    if source.get("size") != source_stat.st_size:
+        return False
+    return not verify or source == _source_signature(json_path)
+
+
+# File each JSON catalog was last loaded from (its snapshot or the JSON itself)
+_read_from: dict[Path, Path] = {}
+
+
+def source_read(json_path: str | Path) -> Path | None:
+    """File ``load_records`` last read for a JSON catalog, or None if never loaded."""
+    return _read_from.get(Path(json_path).resolve())
+
+
+def load_records(json_path: str | Path, record_type: type[R] | None = None) -> list[Any]:
+    """
+    Loads a JSON catalog, using its binary snapshot when it is up to date.
+
+    Args:
+        json_path: JSON catalog (list of flat records)
+        record_type: ``Record`` subclass to build; snapshot columns are turned
+            into records directly, without a dict per row (default: dicts)
+
+    Returns:
+        The records of the catalog
+    """
+    json_path = Path(json_path)
+    key = json_path.resolve()
+    if is_fresh(json_path):
+        path = snapshot_path(json_path)
+        try:
+            names, values, rows = _read_columns(path)
+        except (OSError, ValueError):
+            pass
+        else:
+            _read_from[key] = path
+            if record_type is not None:
+                return record_type.from_columns(names, values, rows)
+            return _to_dicts(names, values, rows)
+    with open(json_path, encoding="utf-8") as f:
+        records: list[dict[str, Any]] = json.load(f)
+    _read_from[key] = json_path
+    return records if record_type is None else record_type.from_dicts(records)
+
+
+__all__ = [
+    "SNAPSHOT_SUFFIX",
+    "is_fresh",
+    "load_records",
+    "read_snapshot",
+    "snapshot_path",
+    "source_read",
+    "write_snapshot",
+]
@@ -0,0 +1,192 @@
+"""
+SQLite connection management for catalogmx
+===========================================
+
+Provides a thread-safe, fork-safe pool of read-only connections shared by all
+SQLite-backed catalogs.
+
+Each thread gets its own connection (``sqlite3`` connections must not be shared
+across threads), opened through a ``mode=ro&immutable=1`` URI so SQLite skips
+file locking and change detection entirely. After ``os.fork()`` every pool
+discards the connections inherited from the parent, so pre-forked servers
+(gunicorn, uWSGI) can warm up in the master and query safely in the workers.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import quote
+
+# 256 MiB of memory-mapped I/O and a 16 MiB page cache per connection
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHE_SIZE_KIB = 16 * 1024
+
+
+class _ConnectionHolder:
+    """Weak-referenceable wrapper so pools can track per-thread connections."""
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+
+
+class SQLiteConnectionPool:
+    """
+    Per-thread pool of read-only SQLite connections for a single database file.
+
+    Args:
+        path_factory: Callable returning the database path (resolved lazily)
+        bootstrap: Optional callable receiving a writable connection. It runs
+            once per process before the first read-only connection is opened,
+            and only when ``needs_bootstrap`` reports the schema is missing.
+        needs_bootstrap: Optional callable receiving a read-only connection and
+            returning True when ``bootstrap`` must run
+        mmap_size: Value for ``PRAGMA mmap_size`` (bytes)
+        cache_size_kib: Page cache size per connection (KiB)
+
+    Example:
+        >>> pool = SQLiteConnectionPool(lambda: Path("catalog.db"))
+        >>> conn = pool.get_connection()  # one connection per calling thread
+        >>> conn.execute("SELECT 1").fetchone()
+    """
+
+    def __init__(
+        self,
+        path_factory: Callable[[], Path],
+        *,
+        bootstrap: Callable[[sqlite3.Connection], None] | None = None,
+        needs_bootstrap: Callable[[sqlite3.Connection], bool] | None = None,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+    ) -> None:
+        self._path_factory = path_factory
+        self._bootstrap = bootstrap
+        self._needs_bootstrap = needs_bootstrap
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self._bootstrapped = bootstrap is None
+        self._reset_state()
+        _POOLS.add(self)
+
+    def _reset_state(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._holders: weakref.WeakSet[_ConnectionHolder] = weakref.WeakSet()
+        self._pid = os.getpid()
+
+    @property
+    def path(self) -> Path:
+        """Database file path."""
+        return self._path_factory()
+
+    def _uri(self, path: Path) -> str:
+        return f"file:{quote(str(path.resolve()))}?mode=ro&immutable=1"
+
+    def _open(self, path: Path) -> sqlite3.Connection:
+        # Each connection is only used by the thread that opened it; the flag is
+        # relaxed solely so close_all() can release connections from any thread.
+        conn = sqlite3.connect(self._uri(path), uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        conn.execute("PRAGMA query_only = 1")
+        return conn
+
+    def _ensure_bootstrapped(self, path: Path) -> None:
+        """Runs the schema bootstrap once, on a short-lived writable connection."""
+        if self._bootstrapped:
+            return
+        with self._lock:
+            if self._bootstrapped:
+                return
+            probe = sqlite3.connect(self._uri(path), uri=True)
+            try:
+                required = self._needs_bootstrap is None or self._needs_bootstrap(probe)
+            finally:
+                probe.close()
+            if required and self._bootstrap is not None:
+                writer = sqlite3.connect(str(path))
+                try:
+                    self._bootstrap(writer)
+                    writer.commit()
+                finally:
+                    writer.close()
+            self._bootstrapped = True
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's read-only connection, opening it on first use.
+
+        Raises:
+            FileNotFoundError: If the database file does not exist
+        """
+        if self._pid != os.getpid():
+            # Fork without register_at_fork (e.g. multiprocessing on some platforms)
+            self._after_fork()
+        holder: _ConnectionHolder | None = getattr(self._local, "holder", None)
+        if holder is not None:
+            return holder.connection
+
+        path = self.path
+        if not path.exists():
+            raise FileNotFoundError(f"Database not found at {path}.")
+        self._ensure_bootstrapped(path)
+
+        holder = _ConnectionHolder(self._open(path))
+        self._local.holder = holder
+        with self._lock:
+            self._holders.add(holder)
+        return holder.connection
+
+    def close_all(self) -> None:
+        """Close every connection opened by this pool, across all threads."""
+        with self._lock:
+            holders = list(self._holders)
+            self._holders = weakref.WeakSet()
+            self._local = threading.local()
+        for holder in holders:
+            holder.connection.close()
+
+    def _after_fork(self) -> None:
+        # Never touch connections inherited from the parent process: just drop them
+        self._reset_state()
+
+
+_POOLS: weakref.WeakSet[SQLiteConnectionPool] = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_POOLS):
+        pool._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def fts_prefix_query(text: str) -> str:
+    """
+    FTS5 query matching every word of text as a prefix.
+
+    Each word is quoted as an FTS5 string, so punctuation ("pan-dulce", "c++")
+    and operator words ("AND", "NOT") are searched as text instead of parsed.
+
+    Example:
+        >>> fts_prefix_query('pan-dulce AND')
+        '"pan-dulce"* "AND"*'
+    """
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
+
+
+__all__ = [
+    "SQLiteConnectionPool",
+    "DEFAULT_MMAP_SIZE",
+    "DEFAULT_CACHE_SIZE_KIB",
+    "fts_prefix_query",
+]
@@ -3,9 +3,16 @@ Text normalization utilities for catalogmx
 ==========================================
 
 Provides accent-insensitive text normalization for searching across catalogs.
+
+``normalize_text`` is on the hot path of every accent-insensitive lookup, so it
+avoids calling unidecode whenever possible: ASCII text is only uppercased,
+Latin-1 text (every Spanish letter) goes through a precomputed ``str.translate``
+table, and only text with other characters falls back to unidecode. Results are
+kept in a bounded LRU cache, since place names repeat a lot across catalogs.
 """
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import cast
 
 try:
@@ -22,6 +29,31 @@ except ImportError:
         return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
 
 
+#: Maximum number of distinct strings kept by the normalize_text cache
+NORMALIZE_CACHE_SIZE = 16384
+
+# Latin-1 range (U+0000-U+00FF), covers á é í ó ú ü ñ and their uppercase forms.
+# unidecode maps every character on its own, so translating character by
+# character gives exactly the same result as unidecode(text).upper().
+_LATIN1_MAX = "\xff"
+_LATIN1_TABLE = {code: unidecode(chr(code)).upper() for code in range(0x80, 0x100)}
+_LATIN1_TABLE.update({code: chr(code).upper() for code in range(0x80)})
+
+
+def _normalize_uncached(text: str) -> str:
+    """normalize_text without the cache (ASCII / Latin-1 fast paths, unidecode fallback)."""
+    if text.isascii():
+        return text.upper()
+    if max(text) <= _LATIN1_MAX:
+        return text.translate(_LATIN1_TABLE)
+    return str(unidecode(text)).upper()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(text: str) -> str:
+    return _normalize_uncached(text)
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text by removing accents and converting to uppercase.
@@ -41,8 +73,32 @@ def normalize_text(text: str) -> str:
         >>> normalize_text("Michoacán de Ocampo")
         'MICHOACAN DE OCAMPO'
     """
-    result = unidecode(text)
-    return str(result).upper()
+    return _normalize_cached(text)
+
+
+def normalize_cache_info() -> dict[str, int]:
+    """
+    Statistics of the normalize_text cache.
+
+    Returns:
+        Dictionary with hits, misses, size and maxsize
+
+    Example:
+        >>> normalize_cache_info()
+        {'hits': 120, 'misses': 30, 'size': 30, 'maxsize': 16384}
+    """
+    info = _normalize_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize or 0,
+    }
+
+
+def clear_normalize_cache() -> None:
+    """Empties the normalize_text cache and resets its hit/miss counters."""
+    _normalize_cached.cache_clear()
 
 
 def normalize_for_search(text: str) -> str:
@@ -58,4 +114,11 @@ def normalize_for_search(text: str) -> str:
     return normalize_text(text)
 
 
-__all__ = ["normalize_text", "normalize_for_search", "unidecode"]
+__all__ = [
+    "NORMALIZE_CACHE_SIZE",
+    "clear_normalize_cache",
+    "normalize_cache_info",
+    "normalize_text",
+    "normalize_for_search",
+    "unidecode",
+]
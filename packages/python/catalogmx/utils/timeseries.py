@@ -0,0 +1,297 @@
+"""
+Time series lookups for catalogmx
+=================================
+
+Provides a sorted, array-backed daily series used by the Banxico catalogs
+(UDI, tipo de cambio FIX, TIIE, CETES, inflación).
+
+``TimeSeries`` stores each observation date as an ordinal day (``array('i')``)
+and its value as a double (``array('d')``), sorted by date, so looking up the
+value in force on any date is a binary search instead of a scan. Bulk lookups
+resolve a whole batch of dates in one merge pass over the sorted series (or
+``numpy.searchsorted`` for NumPy input).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from catalogmx.utils.lazy import is_ndarray, optional_numpy
+
+if TYPE_CHECKING:
+    import numpy
+
+#: Fill policies for dates without an observation
+FILL_POLICIES = ("exact", "previous", "next", "nearest")
+
+
+def to_ordinal(fecha: str | date) -> int:
+    """
+    Ordinal day of a date given as ``YYYY-MM-DD`` string, date or datetime.
+
+    Raises:
+        ValueError: If the string is not an ISO date
+    """
+    if isinstance(fecha, datetime):
+        return fecha.date().toordinal()
+    if isinstance(fecha, date):
+        return fecha.toordinal()
+    return date.fromisoformat(fecha[:10]).toordinal()
+
+
+def from_ordinal(day: int) -> str:
+    """``YYYY-MM-DD`` string of an ordinal day."""
+    return date.fromordinal(day).isoformat()
+
+
+# Ordinal day of 1970-01-01, the epoch of numpy.datetime64
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_ordinals(fechas: Iterable[Any]) -> list[int]:
+    """
+    Ordinal days of many dates (strings, dates, datetimes or numpy.datetime64).
+
+    Each distinct date is parsed once, since batches usually repeat dates.
+    """
+    if is_ndarray(fechas) and fechas.dtype.kind == "M":
+        np = optional_numpy()
+        days = fechas.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+        ordinals: list[int] = days.tolist()
+        return ordinals
+    cache: dict[Any, int] = {}
+    result = []
+    for fecha in fechas:
+        day = cache.get(fecha)
+        if day is None:
+            day = cache[fecha] = to_ordinal(fecha if isinstance(fecha, (str, date)) else str(fecha))
+        result.append(day)
+    return result
+
+
+def _check_fill(fill: str) -> None:
+    if fill not in FILL_POLICIES:
+        raise ValueError(f"Unknown fill policy {fill!r}; expected one of {FILL_POLICIES}")
+
+
+class TimeSeries:
+    """
+    Daily series with O(log n) lookups by date.
+
+    Records without a date or a numeric value are skipped. When several records
+    share a date, the first one (in the given order) is kept.
+
+    Args:
+        records: Records of the series, in any order
+        value_field: Key holding the numeric value
+        date_field: Key holding the ``YYYY-MM-DD`` date (default: "fecha")
+
+    Example:
+        >>> series = TimeSeries(records, value_field="valor")
+        >>> series.value("2024-01-06")                 # Saturday: Friday's value
+        >>> series.value("2024-01-06", fill="next")    # Monday's value
+    """
+
+    def __init__(
+        self, records: list[dict[str, Any]], value_field: str, date_field: str = "fecha"
+    ) -> None:
+        rows = []
+        for position, record in enumerate(records):
+            fecha = record.get(date_field)
+            value = record.get(value_field)
+            if not fecha or not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            rows.append((to_ordinal(fecha), position, float(value), record))
+        rows.sort(key=lambda row: (row[0], row[1]))
+
+        self.days = array("i")
+        self.values = array("d")
+        self.records: list[dict[str, Any]] = []
+        for day, _, value, record in rows:
+            if self.days and self.days[-1] == day:
+                continue
+            self.days.append(day)
+            self.values.append(value)
+            self.records.append(record)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def _index_of_day(self, day: int, fill: str) -> int | None:
+        _check_fill(fill)
+        return self._fill(bisect_left(self.days, day), day, fill)
+
+    def _fill(self, i: int, day: int, fill: str) -> int | None:
+        """Applies a fill policy given i = bisect_left(days, day)."""
+        days = self.days
+        if i < len(days) and days[i] == day:
+            return i
+        if fill == "previous":
+            return i - 1 if i > 0 else None
+        if fill == "next":
+            return i if i < len(days) else None
+        if fill == "nearest":
+            if i == 0:
+                return 0 if days else None
+            if i == len(days):
+                return i - 1
+            # Ties go to the earlier date
+            return i - 1 if day - days[i - 1] <= days[i] - day else i
+        return None
+
+    def index(self, fecha: str | date, fill: str = "previous") -> int | None:
+        """
+        Position of the observation used for a date.
+
+        Args:
+            fecha: Date (``YYYY-MM-DD``, date or datetime)
+            fill: What to use when the date has no observation:
+                "exact" (nothing), "previous" (last observation before it),
+                "next" (first observation after it) or "nearest" (closest one,
+                the earlier on ties)
+
+        Returns:
+            Position in ``days``/``values``/``records``, or None if there is none
+        """
+        return self._index_of_day(to_ordinal(fecha), fill)
+
+    def value(self, fecha: str | date, fill: str = "previous") -> float | None:
+        """Value in force on a date (see ``index`` for fill policies)."""
+        i = self.index(fecha, fill)
+        return None if i is None else self.values[i]
+
+    def record(self, fecha: str | date, fill: str = "previous") -> dict[str, Any] | None:
+        """Record in force on a date, not copied (see ``index`` for fill policies)."""
+        i = self.index(fecha, fill)
+        return None if i is None else self.records[i]
+
+    def previous_date(self, fecha: str | date) -> str | None:
+        """Last observation date strictly before a date (``YYYY-MM-DD``), or None."""
+        i = bisect_left(self.days, to_ordinal(fecha))
+        return from_ordinal(self.days[i - 1]) if i > 0 else None
+
+    def lookup_many(self, days: Sequence[int], fill: str = "previous") -> list[int]:
+        """
+        Positions used for many ordinal days, resolved in one merge pass.
+
+        The query days are visited in sorted order while a single cursor walks
+        the series, so a batch costs one sort plus one pass over both.
+
+        Args:
+            days: Ordinal days (see ``to_ordinals``)
+            fill: Fill policy (see ``index``)
+
+        Returns:
+            Position per query day, -1 where there is no value
+        """
+        _check_fill(fill)
+        series_days = self.days
+        n = len(series_days)
+        result = [-1] * len(days)
+        cursor = 0
+        for query in sorted(range(len(days)), key=days.__getitem__):
+            day = days[query]
+            while cursor < n and series_days[cursor] < day:
+                cursor += 1
+            i = self._fill(cursor, day, fill)
+            if i is not None:
+                result[query] = i
+        return result
+
+    def _lookup_many_numpy(self, days: "numpy.ndarray", fill: str) -> "numpy.ndarray":
+        _check_fill(fill)
+        np = optional_numpy()
+        n = len(self.days)
+        out: numpy.ndarray
+        if n == 0:
+            out = np.full(len(days), -1, dtype=np.int64)
+            return out
+        series_days = np.frombuffer(self.days, dtype=np.int32)
+        i = np.searchsorted(series_days, days, side="left")
+        at = np.minimum(i, n - 1)
+        exact = (i < n) & (series_days[at] == days)
+        if fill == "exact":
+            out = np.where(exact, i, -1)
+        elif fill == "previous":
+            out = np.where(exact, i, i - 1)
+        elif fill == "next":
+            out = np.where(i < n, i, -1)
+        else:
+            before = np.maximum(i - 1, 0)
+            use_before = (i == n) | (
+                (i > 0) & (days - series_days[before] <= series_days[at] - days)
+            )
+            out = np.where(exact, i, np.where(use_before, i - 1, i))
+        return out
+
+    def scale_many(
+        self, amounts: Any, fechas: Any, fill: str = "previous", divide: bool = False
+    ) -> Any:
+        """
+        Multiplies (or divides) many amounts by the value in force on each date.
+
+        No record is touched: values are read from the ``values`` array.
+
+        Args:
+            amounts: Amounts as a list, ``array`` or NumPy array
+            fechas: Dates, same length as amounts (strings, dates, datetimes
+                or a NumPy datetime64 array)
+            fill: Fill policy (see ``index``)
+            divide: Divide by the value instead of multiplying
+
+        Returns:
+            Converted amounts in the same container type as ``amounts``:
+            a list (None where there is no value), an ``array('d')`` or a
+            NumPy float64 array (NaN where there is no value)
+
+        Raises:
+            ValueError: If amounts and fechas have different lengths
+        """
+        if len(amounts) != len(fechas):
+            raise ValueError("amounts and fechas must have the same length")
+
+        if is_ndarray(amounts):
+            np = optional_numpy()
+            if isinstance(fechas, np.ndarray) and fechas.dtype.kind == "M":
+                days = np.asarray(to_ordinals(fechas), dtype=np.int64)
+            else:
+                # Batches repeat dates: parse each distinct one once
+                unique = dict.fromkeys(fechas)
+                ordinal = dict(zip(unique, to_ordinals(unique), strict=True))
+                days = np.fromiter(map(ordinal.__getitem__, fechas), np.int64, len(fechas))
+            idx = self._lookup_many_numpy(days, fill)
+            rates = np.full(len(idx), np.nan)
+            found = idx >= 0
+            if found.any():
+                rates[found] = np.frombuffer(self.values, dtype=np.float64)[idx[found]]
+            # A zero value cannot be divided by; report it as missing like the scalar API
+            if divide:
+                rates[rates == 0] = np.nan
+            amounts_np = amounts.astype(np.float64, copy=False)
+            return amounts_np / rates if divide else amounts_np * rates
+
+        values = self.values
+        unique = dict.fromkeys(fechas)
+        position = dict(zip(unique, self.lookup_many(to_ordinals(unique), fill), strict=True))
+        positions = map(position.__getitem__, fechas)
+        out: list[float | None] = []
+        for amount, i in zip(amounts, positions, strict=True):
+            if i < 0 or (divide and not values[i]):
+                out.append(None)
+            else:
+                out.append(amount / values[i] if divide else amount * values[i])
+        if isinstance(amounts, array):
+            return array("d", [float("nan") if v is None else v for v in out])
+        return out
+
+    def range(self, fecha_inicio: str | date, fecha_fin: str | date) -> slice:
+        """Slice of the observations between two dates, both included."""
+        return slice(
+            bisect_left(self.days, to_ordinal(fecha_inicio)),
+            bisect_right(self.days, to_ordinal(fecha_fin)),
+        )
+
+
+__all__ = ["FILL_POLICIES", "TimeSeries", "from_ordinal", "to_ordinal", "to_ordinals"]
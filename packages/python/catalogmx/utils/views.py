@@ -0,0 +1,128 @@
+"""
+Read-only catalog views
+=======================
+
+Catalog getters return copies (``get_all()`` copies the record list, the
+Banxico series copy every record dict) so callers can modify the results
+without corrupting the shared catalog. Loops over the catalogs then spend
+most of their time allocating.
+
+Read-only mode is opt-in. In that mode the same getters return
+``MappingProxyType`` views of the records, inside tuples instead of lists,
+and copy nothing. Records that are already immutable
+(``catalogmx.utils.records.Record``) are returned as they are. A full
+record list is converted once and cached, so repeated ``get_all()`` calls
+return the same tuple. The views are shallow: nested lists or dicts inside a
+record are still the catalog's own objects.
+
+Example:
+    >>> import catalogmx
+    >>> from catalogmx.catalogs.banxico import UDICatalog
+    >>> with catalogmx.read_only():
+    ...     total = sum(r["valor"] for r in UDICatalog.get_all())
+    >>> catalogmx.set_read_only(True)  # process-wide, e.g. at worker start-up
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any
+
+from catalogmx.utils.records import Record
+
+_default = False
+_override: ContextVar[bool | None] = ContextVar("catalogmx_read_only", default=None)
+
+# id(list) -> (list, tuple of views); the list is kept so its id is not reused.
+# Bounded by the catalogs' own lists: the record lists and per-key index lists.
+_list_views: dict[int, tuple[list, tuple]] = {}
+
+
+def set_read_only(enabled: bool = True) -> None:
+    """
+    Turns read-only mode on or off for the whole process (all threads).
+
+    Args:
+        enabled: True to return views, False for the default mutable copies
+    """
+    global _default
+    _default = enabled
+
+
+@contextmanager
+def read_only(enabled: bool = True) -> Iterator[None]:
+    """
+    Turns read-only mode on or off for the current thread or task.
+
+    Args:
+        enabled: True to return views, False to force mutable copies
+    """
+    token = _override.set(enabled)
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+def is_read_only() -> bool:
+    """Whether catalog getters currently return read-only views."""
+    override = _override.get()
+    return _default if override is None else override
+
+
+def _freeze(value: Any) -> Any:
+    return MappingProxyType(value) if isinstance(value, dict) else value
+
+
+def copy_list(data: list) -> list | tuple:
+    """
+    ``data.copy()``, or a cached tuple of read-only records in read-only mode.
+
+    Immutable records (``catalogmx.utils.records.Record``) are copied to
+    plain dicts outside read-only mode.
+
+    Args:
+        data: Catalog-owned list (e.g. ``cls._data``), not modified after loading
+    """
+    if not is_read_only():
+        # Catalog lists hold one kind of value; only record lists need converting
+        if data and isinstance(data[0], Record):
+            return [_copy(value) for value in data]
+        return data.copy()
+    if not data:  # e.g. a ``.get(key, [])`` default, created on every call
+        return ()
+    entry = _list_views.get(id(data))
+    if entry is None or entry[0] is not data or len(entry[1]) != len(data):
+        entry = _list_views[id(data)] = (data, tuple(_freeze(value) for value in data))
+    return entry[1]
+
+
+def _copy(value: Any) -> Any:
+    # Records have no .copy(); other values (dicts, lists) keep their own
+    return value.to_dict() if isinstance(value, Record) else value.copy()
+
+
+def copy_dict(record: Mapping | None) -> dict | Mapping | None:
+    """
+    A mutable ``dict`` copy of a record, or a read-only view in read-only mode.
+
+    Immutable records (``catalogmx.utils.records.Record``) are their own
+    read-only view. None stays None.
+    """
+    if record is None:
+        return None
+    result: dict | Mapping = _freeze(record) if is_read_only() else _copy(record)
+    return result
+
+
+def copy_dicts(records: Iterable[Mapping]) -> list[dict] | tuple[Mapping, ...]:
+    """``[dict(r) for r in records]``, or a tuple of read-only views in read-only mode."""
+    if is_read_only():
+        return tuple(map(_freeze, records))
+    return list(map(_copy, records))
+
+
+__all__ = ["copy_dict", "copy_dicts", "copy_list", "is_read_only", "read_only", "set_read_only"]
@@ -0,0 +1,131 @@
+"""
+Tests for day-count interest accrual (catalogmx.utils.accrual, TIIE/CETES catalogs)
+"""
+
+from datetime import date, timedelta
+from math import prod
+
+import pytest
+
+from catalogmx.catalogs.banxico import CETES28Catalog, TIIE28Catalog
+from catalogmx.utils.accrual import AccrualTable
+from catalogmx.utils.timeseries import TimeSeries
+
+# 36% on Jan 1st, 72% from Jan 4th (weekend/holiday gaps use the last rate)
+SERIES = TimeSeries(
+    [
+        {"fecha": "2024-01-01", "tasa": 36.0},
+        {"fecha": "2024-01-04", "tasa": 72.0},
+        {"fecha": "2024-01-10", "tasa": 36.0},
+    ],
+    value_field="tasa",
+)
+
+
+def _daily_rates(start, end, basis):
+    rates = []
+    day = date.fromisoformat(start)
+    while day < date.fromisoformat(end):
+        rates.append(SERIES.value(day) / 100 / basis)
+        day += timedelta(days=1)
+    return rates
+
+
+class TestAccrualTable:
+    """Prefix sums against a day-by-day loop"""
+
+    @pytest.mark.parametrize("basis", [360, 365])
+    @pytest.mark.parametrize(
+        "start, end",
+        [("2024-01-01", "2024-01-04"), ("2024-01-02", "2024-01-10"), ("2024-01-01", "2024-01-11")],
+    )
+    def test_matches_daily_loop(self, basis, start, end):
+        table = AccrualTable(SERIES, basis=basis)
+        rates = _daily_rates(start, end, basis)
+        assert table.simple(start, end) == pytest.approx(sum(rates))
+        assert table.factor(start, end) == pytest.approx(prod(1 + r for r in rates))
+        assert table.compound(start, end) == pytest.approx(prod(1 + r for r in rates) - 1)
+
+    def test_act_360(self):
+        table = AccrualTable(SERIES, basis=360)
+        # 3 days at 36% + 1 day at 72%
+        assert table.simple("2024-01-01", "2024-01-05") == pytest.approx((3 * 0.36 + 0.72) / 360)
+
+    def test_empty_period(self):
+        table = AccrualTable(SERIES)
+        assert table.simple("2024-01-05", "2024-01-05") == 0
+        assert table.factor("2024-01-05", "2024-01-05") == 1
+
+    def test_outside_coverage(self):
+        table = AccrualTable(SERIES)
+        assert table.simple("2023-12-31", "2024-01-05") is None
+        assert table.simple("2024-01-05", "2024-01-11") is not None  # last day accrues
+        assert table.factor("2024-01-05", "2024-01-12") is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            AccrualTable(SERIES, basis=252)
+        with pytest.raises(ValueError):
+            AccrualTable(SERIES).simple("2024-01-05", "2024-01-01")
+
+    @pytest.mark.parametrize("compound", [False, True])
+    def test_accrue_many(self, compound):
+        table = AccrualTable(SERIES)
+        starts = ["2024-01-01", "2024-01-02", "2023-01-01"]
+        ends = ["2024-01-05", "2024-01-10", "2024-01-05"]
+        capitals = [1000.0, 50.0, 10.0]
+        result = table.accrue_many(capitals, starts, ends, compound=compound)
+        covered = zip(capitals[:2], starts[:2], ends[:2], result[:2], strict=True)
+        for capital, start, end, value in covered:
+            per_unit = table.factor(start, end) - 1 if compound else table.simple(start, end)
+            assert value == pytest.approx(capital * per_unit)
+        assert result[2] is None
+
+        np = pytest.importorskip("numpy")
+        vector = table.accrue_many(np.array(capitals), starts, ends, compound=compound)
+        assert vector[:2].tolist() == pytest.approx(result[:2])
+        assert np.isnan(vector[2])
+
+
+class TestRateCatalogs:
+    """TIIE / CETES accrue over the actual date range"""
+
+    def test_tiie_interes_uses_actual_days(self):
+        enero = TIIE28Catalog.calcular_interes(10000, "2024-01-01", "2024-01-31")
+        febrero = TIIE28Catalog.calcular_interes(10000, "2024-01-01", "2024-03-01")
+        assert enero > 0
+        assert febrero == pytest.approx(enero * 60 / 30, rel=0.05)
+        tasa = TIIE28Catalog.as_of("2024-01-15")
+        assert enero == pytest.approx(10000 * tasa / 100 / 360 * 30, rel=0.02)
+
+    def test_tiie_bases_and_compounding(self):
+        act360 = TIIE28Catalog.calcular_interes(10000, "2024-01-01", "2024-07-01")
+        act365 = TIIE28Catalog.calcular_interes(10000, "2024-01-01", "2024-07-01", base=365)
+        compuesto = TIIE28Catalog.calcular_interes(
+            10000, "2024-01-01", "2024-07-01", compuesto=True
+        )
+        assert act365 == pytest.approx(act360 * 360 / 365)
+        assert compuesto > act360
+
+    def test_tiie_many_matches_scalar(self):
+        starts = ["2023-01-01", "2024-01-01"]
+        ends = ["2023-06-30", "2024-02-15"]
+        assert TIIE28Catalog.calcular_interes_many([1e6, 5e5], starts, ends) == pytest.approx(
+            [
+                TIIE28Catalog.calcular_interes(c, s, e)
+                for c, s, e in zip([1e6, 5e5], starts, ends, strict=True)
+            ]
+        )
+
+    @pytest.mark.parametrize("end", ["2024-01-02", "2024-01-08", "2024-07-01"])
+    def test_tiie_compound_scalar_equals_batch(self, end):
+        """Scalar and batch compound interest agree bit for bit, also for short periods"""
+        scalar = TIIE28Catalog.calcular_interes(1e6, "2024-01-01", end, compuesto=True)
+        batch = TIIE28Catalog.calcular_interes_many([1e6], ["2024-01-01"], [end], compuesto=True)
+        assert batch == [scalar]
+
+    def test_cetes_rendimiento(self):
+        final = CETES28Catalog.calcular_rendimiento(10000, "2024-01-01", "2024-01-29")
+        tasa = CETES28Catalog.as_of("2024-01-15")
+        assert final == pytest.approx(10000 * (1 + tasa / 100 * 28 / 360), rel=0.01)
+        assert CETES28Catalog.calcular_rendimiento(10000, "1990-01-01", "1990-02-01") is None
@@ -0,0 +1,211 @@
+"""
+Tests for streaming bulk validation (catalogmx.bulk and `catalogmx validate-file`)
+"""
+
+import csv
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from catalogmx.bulk import ValidationStats, detect_format, validate_columns, validate_file
+from catalogmx.cli import main
+
+ROWS = [
+    {
+        "id": "1",
+        "rfc": "MANO610814JL5",
+        "curp": "PEGJ900515HJCRRN05",
+        "clabe": "002010077777777771",
+    },
+    {"id": "2", "rfc": "INVALID", "curp": "XXX", "clabe": "123"},
+    {"id": "3", "rfc": "XAXX010101000", "curp": "", "clabe": "002010077777777771"},
+]
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "input.csv"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(ROWS[0]))
+        writer.writeheader()
+        writer.writerows(ROWS)
+    return path
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    path = tmp_path / "input.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for row in ROWS:
+            f.write(json.dumps(row) + "\n")
+    return path
+
+
+class TestValidateColumns:
+    """Column-level validation"""
+
+    def test_kinds(self):
+        result = validate_columns(
+            {"a": ["MANO610814JL5", None], "b": ["PEGJ900515HJCRRN05", 5]},
+            {"a": "rfc", "b": "curp"},
+        )
+        assert result == {"a": [True, False], "b": [True, False]}
+
+    def test_detect_format(self):
+        assert detect_format("x.csv") == "csv"
+        assert detect_format("x.JSONL") == "jsonl"
+        assert detect_format("x.ndjson") == "jsonl"
+        assert detect_format("x.parquet") == "parquet"
+
+
+class TestValidateFile:
+    """validate_file streaming driver"""
+
+    def test_csv_to_csv(self, csv_file, tmp_path):
+        out = tmp_path / "out.csv"
+        stats = validate_file(csv_file, out, {"rfc": "rfc", "curp": "curp"}, chunk_size=2)
+        assert isinstance(stats, ValidationStats)
+        assert stats.rows == 3
+        assert stats.chunks == 2
+        assert stats.invalid == {"rfc": 1, "curp": 2}
+        with open(out, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["rfc_valid"] for r in rows] == ["true", "false", "true"]
+        assert [r["curp_valid"] for r in rows] == ["true", "false", "false"]
+        assert rows[0]["clabe"] == ROWS[0]["clabe"]
+
+    def test_jsonl_to_jsonl(self, jsonl_file, tmp_path):
+        out = tmp_path / "out.jsonl"
+        validate_file(jsonl_file, out, {"clabe": "clabe"})
+        with open(out, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [r["clabe_valid"] for r in records] == [True, False, True]
+
+    def test_jsonl_to_csv(self, jsonl_file, tmp_path):
+        out = tmp_path / "out.csv"
+        validate_file(jsonl_file, out, {"rfc": "rfc"}, chunk_size=1)
+        with open(out, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["id", "rfc", "curp", "clabe", "rfc_valid"]
+        assert len(rows) == 4
+
+    def test_only_invalid(self, csv_file, tmp_path):
+        out = tmp_path / "out.csv"
+        validate_file(csv_file, out, {"rfc": "rfc"}, only_invalid=True)
+        with open(out, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["id"] for r in rows] == ["2"]
+
+    def test_workers(self, tmp_path):
+        path = tmp_path / "big.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["rfc"])
+            for i in range(1000):
+                writer.writerow(["MANO610814JL5" if i % 2 else "BAD"])
+        out = tmp_path / "out.csv"
+        stats = validate_file(path, out, {"rfc": "rfc"}, chunk_size=100, workers=2)
+        assert stats.rows == 1000
+        assert stats.invalid == {"rfc": 500}
+        with open(out, encoding="utf-8", newline="") as f:
+            flags = [r["rfc_valid"] for r in csv.DictReader(f)]
+        assert flags == ["false", "true"] * 500
+
+    def test_missing_column(self, csv_file, tmp_path):
+        with pytest.raises(KeyError):
+            validate_file(csv_file, tmp_path / "o.csv", {"nope": "rfc"})
+
+    def test_unknown_kind(self, csv_file, tmp_path):
+        with pytest.raises(ValueError):
+            validate_file(csv_file, tmp_path / "o.csv", {"rfc": "ine"})
+
+    def test_parquet_roundtrip(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"rfc": ["MANO610814JL5", "BAD"], "n": [1, 2]}), str(path))
+        out = tmp_path / "out.parquet"
+        stats = validate_file(path, out, {"rfc": "rfc"})
+        assert stats.rows == 2
+        assert pq.read_table(str(out)).column("rfc_valid").to_pylist() == [True, False]
+
+    def test_ragged_csv_rows(self, tmp_path):
+        """Short and long CSV rows are padded or trimmed to the header"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "ragged.csv"
+        path.write_text("id,rfc,nota\n1,MANO610814JL5\n2,BAD,x,extra\n", encoding="utf-8")
+        validate_file(path, tmp_path / "out.parquet", {"rfc": "rfc"})
+        table = pq.read_table(str(tmp_path / "out.parquet")).to_pydict()
+        assert table["nota"] == ["", "x"]
+        assert table["rfc_valid"] == [True, False]
+        validate_file(path, tmp_path / "out.csv", {"rfc": "rfc"})
+        with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["id", "rfc", "nota", "rfc_valid"],
+            ["1", "MANO610814JL5", "", "true"],
+            ["2", "BAD", "x", "false"],
+        ]
+
+    def test_jsonl_later_keys(self, tmp_path):
+        """Keys that first appear in later JSONL records are kept in CSV and Parquet"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "input.jsonl"
+        records = [{"rfc": "MANO610814JL5"}, {"rfc": "BAD", "nota": "x"}, {"rfc": "BAD", "n": 3}]
+        path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+        validate_file(path, tmp_path / "out.csv", {"rfc": "rfc"}, chunk_size=1)
+        with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["nota"] for r in rows] == ["", "x", ""]
+        assert [r["n"] for r in rows] == ["", "", "3"]
+        validate_file(path, tmp_path / "out.parquet", {"rfc": "rfc"}, chunk_size=1)
+        table = pq.read_table(str(tmp_path / "out.parquet")).to_pydict()
+        assert table["nota"] == [None, "x", None]
+        assert table["n"] == [None, None, "3"]
+        assert table["rfc_valid"] == [True, False, False]
+
+    @pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+    def test_flag_column_collision(self, tmp_path, suffix):
+        """An input column named like a validity flag is not overwritten"""
+        path = tmp_path / "input.csv"
+        path.write_text("rfc,rfc_valid\nMANO610814JL5,manual\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="rfc_valid"):
+            validate_file(path, tmp_path / f"out{suffix}", {"rfc": "rfc"})
+        jsonl = tmp_path / "input.jsonl"
+        jsonl.write_text('{"rfc": "BAD", "rfc_valid": "manual"}\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="rfc_valid"):
+            validate_file(jsonl, tmp_path / f"out{suffix}", {"rfc": "rfc"})
+
+
+class TestValidateFileCLI:
+    """`catalogmx validate-file` command"""
+
+    def setup_method(self):
+        self.runner = CliRunner()
+
+    def test_stdout(self, csv_file):
+        result = self.runner.invoke(main, ["validate-file", str(csv_file), "--rfc", "rfc", "-q"])
+        assert result.exit_code == 0
+        lines = result.output.strip().splitlines()
+        assert lines[0].endswith("rfc_valid")
+        assert lines[2].endswith("false")
+
+    def test_stats_to_stderr(self, csv_file, tmp_path):
+        out = tmp_path / "out.csv"
+        result = self.runner.invoke(
+            main, ["validate-file", str(csv_file), "--rfc", "rfc", "-o", str(out)]
+        )
+        assert result.exit_code == 0
+        assert "rows: 3" in result.stderr
+        assert "rfc: 1 invalid" in result.stderr
+        assert out.exists()
+
+    def test_requires_column(self, csv_file):
+        result = self.runner.invoke(main, ["validate-file", str(csv_file)])
+        assert result.exit_code != 0
+
+    def test_missing_column(self, csv_file):
+        result = self.runner.invoke(main, ["validate-file", str(csv_file), "--rfc", "x", "-q"])
+        assert result.exit_code == 1
+        assert "Columns not found" in result.output
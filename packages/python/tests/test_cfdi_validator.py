@@ -0,0 +1,130 @@
+"""
+Tests for the CFDI 4.0 comprobante validator (CFDIValidator)
+"""
+
+import pytest
+
+from catalogmx.catalogs.sat.cfdi_4 import CFDIValidator
+
+
+def _cfdi(**overrides):
+    cfdi = {
+        "tipo_comprobante": "I",
+        "exportacion": "01",
+        "metodo_pago": "PUE",
+        "forma_pago": "03",
+        "emisor": {"rfc": "EKU9003173C9", "regimen_fiscal": "601"},
+        "receptor": {"rfc": "XAXX010101000", "regimen_fiscal": "616", "uso_cfdi": "S01"},
+        "conceptos": [
+            {"clave_prod_serv": "43211500", "clave_unidad": "H87", "objeto_imp": "02"},
+        ],
+    }
+    cfdi.update(overrides)
+    return cfdi
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return CFDIValidator()
+
+
+class TestCFDIValidator:
+    """Tests for CFDIValidator.validate"""
+
+    def test_valid(self, validator):
+        """A complete comprobante with valid keys passes"""
+        result = validator.validate(_cfdi())
+        assert result == {"valid": True, "errors": [], "warnings": []}
+
+    def test_catalogs_are_frozensets(self, validator):
+        """Catalog keys are pre-resolved into frozensets"""
+        assert isinstance(validator.formas_pago, frozenset)
+        assert isinstance(validator.claves_unidad, frozenset)
+        assert validator.validar_clave_prod_serv
+
+    def test_required_fields(self, validator):
+        """Missing mandatory fields are reported"""
+        result = validator.validate({})
+        assert not result["valid"]
+        assert "TipoDeComprobante es obligatorio" in result["errors"]
+        assert "Exportacion es obligatoria" in result["errors"]
+        assert "Debe incluir al menos un concepto" in result["errors"]
+
+    def test_invalid_codes(self, validator):
+        """Unknown catalog keys are reported"""
+        result = validator.validate(_cfdi(forma_pago="77", metodo_pago="XXX", exportacion="09"))
+        assert "FormaPago 77 no válida" in result["errors"]
+        assert "MetodoPago XXX no válido" in result["errors"]
+        assert "Exportacion 09 no válida" in result["errors"]
+
+    def test_ppd_requires_99(self, validator):
+        """PPD invoices must use FormaPago 99"""
+        assert not validator.validate(_cfdi(metodo_pago="PPD", forma_pago="03"))["valid"]
+        assert validator.validate(_cfdi(metodo_pago="PPD", forma_pago="99"))["valid"]
+
+    def test_pago_without_forma_pago(self, validator):
+        """Tipo P comprobantes must not carry FormaPago or MetodoPago"""
+        result = validator.validate(_cfdi(tipo_comprobante="P"))
+        assert "FormaPago no debe existir en CFDI tipo P" in result["errors"]
+        assert "MetodoPago no debe existir en CFDI tipo P" in result["errors"]
+
+    def test_conceptos(self, validator):
+        """Every concepto is checked"""
+        conceptos = [
+            {"clave_prod_serv": "43211500", "clave_unidad": "H87", "objeto_imp": "02"},
+            {"clave_prod_serv": "99999999", "clave_unidad": "ZZZ", "objeto_imp": "99"},
+        ]
+        errors = validator.validate(_cfdi(conceptos=conceptos))["errors"]
+        assert errors == [
+            "Concepto[1]: ClaveProdServ 99999999 no válida",
+            "Concepto[1]: ClaveUnidad ZZZ no válida",
+            "Concepto[1]: ObjetoImp 99 no válido",
+        ]
+
+    def test_skip_clave_prod_serv(self):
+        """ClaveProdServ can be left out of the checks"""
+        validator = CFDIValidator(validar_clave_prod_serv=False)
+        conceptos = [{"clave_prod_serv": "99999999", "clave_unidad": "H87", "objeto_imp": "02"}]
+        assert validator.validate(_cfdi(conceptos=conceptos))["valid"]
+
+
+class TestUsoRegimen:
+    """Tests for UsoCFDI vs RegimenFiscal compatibility"""
+
+    def test_rfc_generico(self, validator):
+        """The generic RFC requires S01 and regime 616"""
+        receptor = {"rfc": "XAXX010101000", "regimen_fiscal": "601", "uso_cfdi": "G03"}
+        errors = validator.validate(_cfdi(receptor=receptor))["errors"]
+        assert len(errors) == 2
+
+    def test_deducciones_persona_moral(self, validator):
+        """Personal deductions (D01) do not apply to a persona moral regime"""
+        receptor = {"rfc": "EKU9003173C9", "regimen_fiscal": "601", "uso_cfdi": "D01"}
+        errors = validator.validate(_cfdi(receptor=receptor))["errors"]
+        assert errors == ["UsoCFDI D01 no aplica para el RegimenFiscalReceptor 601"]
+
+    def test_deducciones_persona_fisica(self, validator):
+        """D01 is valid for a persona física with a física regime"""
+        receptor = {"rfc": "GODE561231GR8", "regimen_fiscal": "605", "uso_cfdi": "D01"}
+        assert validator.validate(_cfdi(receptor=receptor))["valid"]
+
+    def test_regimen_vs_tipo_persona(self, validator):
+        """A persona moral RFC cannot use a física-only regime"""
+        receptor = {"rfc": "EKU9003173C9", "regimen_fiscal": "605", "uso_cfdi": "G03"}
+        errors = validator.validate(_cfdi(receptor=receptor))["errors"]
+        assert errors == ["RegimenFiscalReceptor 605 no aplica para persona moral"]
+
+
+class TestValidateMany:
+    """Tests for bulk validation"""
+
+    def test_validate_many(self, validator):
+        """Results come back in input order"""
+        cfdis = [_cfdi(), _cfdi(exportacion="09"), _cfdi()]
+        results = validator.validate_many(cfdis)
+        assert [r["valid"] for r in results] == [True, False, True]
+
+    def test_iter_invalid(self, validator):
+        """Only invalid comprobantes are yielded, with their position"""
+        cfdis = (_cfdi(exportacion="09") if i % 3 == 1 else _cfdi() for i in range(7))
+        assert [i for i, _ in validator.iter_invalid(cfdis)] == [1, 4]
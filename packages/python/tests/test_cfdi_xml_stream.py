@@ -0,0 +1,185 @@
+"""
+Tests for streaming CFDI 4.0 XML reading and validation (cfdi_4.xml_stream)
+"""
+
+import zipfile
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from catalogmx.catalogs.sat.cfdi_4 import (
+    iter_cfdi_xml,
+    parse_cfdi_xml,
+    validate_cfdi,
+    validate_cfdi_path,
+)
+
+CFDI = """<?xml version="1.0" encoding="UTF-8"?>
+<cfdi:Comprobante xmlns:cfdi="http://www.sat.gob.mx/cfd/4"
+    Version="4.0" TipoDeComprobante="I" FormaPago="{forma_pago}" MetodoPago="PUE"
+    Exportacion="01" Moneda="MXN" Total="1160.00">
+  <cfdi:Emisor Rfc="EKU9003173C9" Nombre="ESCUELA KEMPER URGATE" RegimenFiscal="601"/>
+  <cfdi:Receptor Rfc="XAXX010101000" Nombre="PUBLICO EN GENERAL"
+      RegimenFiscalReceptor="616" UsoCFDI="S01" DomicilioFiscalReceptor="42501"/>
+  <cfdi:Conceptos>
+    <cfdi:Concepto ClaveProdServ="43211500" ClaveUnidad="H87" ObjetoImp="02"
+        Cantidad="1" Descripcion="Computadora" ValorUnitario="1000.00" Importe="1000.00">
+      <cfdi:Impuestos>
+        <cfdi:Traslados>
+          <cfdi:Traslado Base="1000.00" Impuesto="002" TipoFactor="Tasa"
+              TasaOCuota="0.160000" Importe="160.00"/>
+        </cfdi:Traslados>
+      </cfdi:Impuestos>
+    </cfdi:Concepto>
+    <cfdi:Concepto ClaveProdServ="{clave}" ClaveUnidad="E48" ObjetoImp="01"
+        Cantidad="1" Descripcion="Servicio" ValorUnitario="0" Importe="0"/>
+  </cfdi:Conceptos>
+</cfdi:Comprobante>
+"""
+
+CFDI_CCE = """<?xml version="1.0" encoding="UTF-8"?>
+<cfdi:Comprobante xmlns:cfdi="http://www.sat.gob.mx/cfd/4"
+    xmlns:cce20="http://www.sat.gob.mx/ComercioExterior20"
+    Version="4.0" TipoDeComprobante="I" FormaPago="03" MetodoPago="PUE"
+    Exportacion="02" Moneda="USD" TipoCambio="1" Total="50000">
+  <cfdi:Emisor Rfc="EKU9003173C9" RegimenFiscal="601"/>
+  <cfdi:Receptor Rfc="XEXX010101000" RegimenFiscalReceptor="616" UsoCFDI="S01"
+      NumRegIdTrib="121585958" ResidenciaFiscal="USA"/>
+  <cfdi:Conceptos>
+    <cfdi:Concepto ClaveProdServ="43211500" ClaveUnidad="H87" ObjetoImp="02"/>
+  </cfdi:Conceptos>
+  <cfdi:Complemento>
+    <cce20:ComercioExterior Version="2.0" ClaveDePedimento="A1" CertificadoOrigen="0"
+        Incoterm="{incoterm}" TipoCambioUSD="1" TotalUSD="50000">
+      <cce20:Receptor>
+        <cce20:Domicilio Calle="Main" Estado="TX" Pais="USA" CodigoPostal="78000"/>
+      </cce20:Receptor>
+      <cce20:Mercancias>
+        <cce20:Mercancia FraccionArancelaria="8471300100" CantidadAduana="10"
+            UnidadAduana="06" ValorUnitarioAduana="5000" ValorDolares="50000"
+            PaisOrigen="MEX"/>
+      </cce20:Mercancias>
+    </cce20:ComercioExterior>
+  </cfdi:Complemento>
+</cfdi:Comprobante>
+"""
+
+
+def _write(path, forma_pago="03", clave="80141600"):
+    path.write_text(CFDI.format(forma_pago=forma_pago, clave=clave), encoding="utf-8")
+    return path
+
+
+class TestParseCFDIXml:
+    """Tests for parse_cfdi_xml"""
+
+    def test_fields(self, tmp_path):
+        """Attributes are mapped onto the validator fields"""
+        cfdi = parse_cfdi_xml(_write(tmp_path / "a.xml"))
+        assert cfdi["tipo_comprobante"] == "I"
+        assert cfdi["forma_pago"] == "03"
+        assert cfdi["exportacion"] == "01"
+        assert cfdi["emisor"] == {"rfc": "EKU9003173C9", "regimen_fiscal": "601"}
+        assert cfdi["receptor"]["uso_cfdi"] == "S01"
+        assert cfdi["receptor"]["regimen_fiscal"] == "616"
+        assert cfdi["conceptos"] == [
+            {"clave_prod_serv": "43211500", "clave_unidad": "H87", "objeto_imp": "02"},
+            {"clave_prod_serv": "80141600", "clave_unidad": "E48", "objeto_imp": "01"},
+        ]
+        assert "comercio_exterior" not in cfdi
+
+    def test_comercio_exterior(self, tmp_path):
+        """The Comercio Exterior complement is mapped too"""
+        path = tmp_path / "cce.xml"
+        path.write_text(CFDI_CCE.format(incoterm="FOB"), encoding="utf-8")
+        cce = parse_cfdi_xml(path)["comercio_exterior"]
+        assert cce["incoterm"] == "FOB"
+        assert cce["clave_pedimento"] == "A1"
+        assert cce["moneda"] == "USD"
+        assert cce["total_usd"] == 50000.0
+        assert cce["receptor"]["pais"] == "USA"
+        assert cce["mercancias"][0]["fraccion_arancelaria"] == "8471300100"
+        assert cce["mercancias"][0]["cantidad_aduana"] == 10.0
+
+    def test_malformed(self, tmp_path):
+        """Malformed XML raises ParseError"""
+        path = tmp_path / "bad.xml"
+        path.write_text("<cfdi:Comprobante", encoding="utf-8")
+        with pytest.raises(ParseError):
+            parse_cfdi_xml(path)
+
+
+class TestValidateCFDIPath:
+    """Tests for file, directory and zip validation"""
+
+    def test_validate_cfdi(self, tmp_path):
+        """A parsed CFDI validates against the catalogs"""
+        assert validate_cfdi(parse_cfdi_xml(_write(tmp_path / "a.xml")))["valid"]
+        bad = parse_cfdi_xml(_write(tmp_path / "b.xml", forma_pago="77", clave="00000000"))
+        errors = validate_cfdi(bad)["errors"]
+        assert "FormaPago 77 no válida" in errors
+        assert "Concepto[1]: ClaveProdServ 00000000 no válida" in errors
+
+    def test_comercio_exterior_errors(self, tmp_path):
+        """Comercio Exterior errors are prefixed and make the CFDI invalid"""
+        path = tmp_path / "cce.xml"
+        path.write_text(CFDI_CCE.format(incoterm="ZZZ"), encoding="utf-8")
+        result = validate_cfdi(parse_cfdi_xml(path))
+        assert not result["valid"]
+        assert "ComercioExterior: INCOTERM ZZZ no válido" in result["errors"]
+
+    def test_directory_and_zip(self, tmp_path):
+        """Directories are walked recursively and zip members are read in place"""
+        (tmp_path / "sub").mkdir()
+        _write(tmp_path / "a.xml")
+        _write(tmp_path / "sub" / "b.xml", forma_pago="77")
+        (tmp_path / "notas.txt").write_text("ignored")
+        with zipfile.ZipFile(tmp_path / "lote.zip", "w") as archive:
+            archive.writestr("x.xml", CFDI.format(forma_pago="03", clave="80141600"))
+            archive.writestr("y.xml", "<roto")
+        results = dict(validate_cfdi_path(tmp_path))
+        assert set(results) == {
+            str(tmp_path / "a.xml"),
+            f"{tmp_path / 'lote.zip'}!x.xml",
+            f"{tmp_path / 'lote.zip'}!y.xml",
+            str(tmp_path / "sub" / "b.xml"),
+        }
+        assert results[str(tmp_path / "a.xml")]["valid"]
+        assert not results[str(tmp_path / "sub" / "b.xml")]["valid"]
+        assert results[f"{tmp_path / 'lote.zip'}!x.xml"]["valid"]
+        assert results[f"{tmp_path / 'lote.zip'}!y.xml"]["errors"][0].startswith("XML no legible")
+
+    def test_iter_cfdi_xml(self, tmp_path):
+        """iter_cfdi_xml yields parsed comprobantes in order"""
+        with zipfile.ZipFile(tmp_path / "lote.zip", "w") as archive:
+            for i in range(3):
+                archive.writestr(f"{i}.xml", CFDI.format(forma_pago="03", clave="80141600"))
+        names = [name for name, _ in iter_cfdi_xml(tmp_path / "lote.zip")]
+        assert names == [f"{tmp_path / 'lote.zip'}!{i}.xml" for i in range(3)]
+
+    def test_process_pool(self, tmp_path):
+        """Fan-out across processes gives the same results in the same order"""
+        for i in range(6):
+            _write(tmp_path / f"{i}.xml", forma_pago="77" if i % 2 else "03")
+        serial = list(validate_cfdi_path(tmp_path))
+        parallel = list(validate_cfdi_path(tmp_path, processes=2, chunksize=2))
+        assert parallel == serial
+        assert [r["valid"] for _, r in serial] == [True, False] * 3
+
+    def test_process_pool_is_lazy(self, tmp_path):
+        """A generator of paths is consumed only a few chunks ahead of the results"""
+        paths = [_write(tmp_path / f"{i:02d}.xml") for i in range(20)]
+        consumed = []
+
+        def source():
+            for path in paths:
+                consumed.append(path)
+                yield path
+
+        results = validate_cfdi_path(source(), processes=2, chunksize=1)
+        name, result = next(results)
+        assert name == str(paths[0]) and result["valid"]
+        # processes + 1 tasks in flight, one source each
+        assert len(consumed) == 3
+        assert len(list(results)) == 19
+        assert len(consumed) == 20
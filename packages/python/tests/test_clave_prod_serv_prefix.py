@@ -0,0 +1,96 @@
+"""
+Tests for ClaveProdServ range-based prefix queries, hierarchy tree and in-memory mode
+"""
+
+import pytest
+
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog
+
+
+@pytest.fixture
+def in_memory(monkeypatch):
+    """Load the catalog into memory for one test, then drop it"""
+    monkeypatch.setattr(ClaveProdServCatalog, "_memory_index", None)
+    monkeypatch.setattr(ClaveProdServCatalog, "_memory_rows", None)
+    ClaveProdServCatalog.load_into_memory()
+    return ClaveProdServCatalog
+
+
+def _ids(items):
+    return [item["id"] for item in items]
+
+
+class TestRangePrefix:
+    """Tests for SQLite prefix queries"""
+
+    def test_prefix_upper(self):
+        """The exclusive upper bound increments the last character"""
+        assert ClaveProdServCatalog._prefix_upper("4321") == "4322"
+        assert ClaveProdServCatalog._prefix_upper("49") == "4:"
+
+    def test_get_by_prefix(self):
+        """Every result starts with the prefix, in clave order"""
+        ids = _ids(ClaveProdServCatalog.get_by_prefix("4321", limit=5000))
+        assert ids
+        assert all(clave.startswith("4321") for clave in ids)
+        assert ids == sorted(ids)
+
+    def test_limit(self):
+        """The limit caps the result size"""
+        assert len(ClaveProdServCatalog.get_by_prefix("43", limit=7)) == 7
+
+    def test_count_by_prefix(self):
+        """Counts match the number of prefixed claves"""
+        items = ClaveProdServCatalog.get_by_prefix("432115", limit=10_000)
+        assert ClaveProdServCatalog.count_by_prefix("432115") == len(items)
+        assert ClaveProdServCatalog.count_by_prefix("") == ClaveProdServCatalog.get_total_count()
+
+
+class TestJerarquia:
+    """Tests for the segment → family → class tree"""
+
+    def test_counts_add_up(self):
+        """Segment counts add up to the catalog size, and families to their segment"""
+        arbol = ClaveProdServCatalog.get_jerarquia()
+        assert sum(s["count"] for s in arbol.values()) == ClaveProdServCatalog.get_total_count()
+        segmento = arbol["43"]
+        assert sum(f["count"] for f in segmento["familias"].values()) == segmento["count"]
+        familia = segmento["familias"]["4321"]
+        assert sum(familia["clases"].values()) == familia["count"]
+        assert familia["clases"]["432115"] == ClaveProdServCatalog.count_by_prefix("432115")
+
+    def test_cached(self):
+        """The tree is built once"""
+        assert ClaveProdServCatalog.get_jerarquia() is ClaveProdServCatalog.get_jerarquia()
+
+
+class TestInMemory:
+    """Tests for load_into_memory"""
+
+    def test_same_results_as_sqlite(self, monkeypatch):
+        """Prefix lookups in memory match the SQLite ones"""
+        prefixes = ("01", "4321")
+        expected = {p: _ids(ClaveProdServCatalog.get_by_prefix(p, limit=100)) for p in prefixes}
+        expected_count = ClaveProdServCatalog.count_by_prefix("43")
+        monkeypatch.setattr(ClaveProdServCatalog, "_memory_index", None)
+        monkeypatch.setattr(ClaveProdServCatalog, "_memory_rows", None)
+        ClaveProdServCatalog.load_into_memory()
+        assert ClaveProdServCatalog.is_in_memory()
+        for prefix, ids in expected.items():
+            assert _ids(ClaveProdServCatalog.get_by_prefix(prefix, limit=100)) == ids
+        assert ClaveProdServCatalog.count_by_prefix("43") == expected_count
+
+    def test_no_sqlite(self, in_memory, monkeypatch):
+        """Lookups do not touch SQLite once loaded"""
+
+        def fail():
+            raise AssertionError("SQLite queried")
+
+        monkeypatch.setattr(in_memory, "_get_connection", fail)
+        assert in_memory.get_clave("43211500")["id"] == "43211500"
+        assert in_memory.get_clave("4321") is None
+        assert in_memory.get_clave("99999999") is None
+        assert in_memory.is_valid("01010101")
+        assert _ids(in_memory.get_by_prefix("01010101")) == ["01010101"]
+        assert in_memory.get_by_prefix("abc") == []
+        assert in_memory.count_by_prefix("123456789") == 0
@@ -0,0 +1,90 @@
+"""
+Tests for ClaveProdServ FTS5 search: built index, rowid joins, bm25 ranking and accent folding
+"""
+
+import sqlite3
+
+import pytest
+
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog
+
+
+class TestFTSIndex:
+    """Tests for the shipped FTS5 index"""
+
+    def test_index_built(self):
+        """Every catalog row is indexed"""
+        conn = ClaveProdServCatalog._get_connection()
+        (indexed,) = conn.execute("SELECT COUNT(*) FROM clave_prod_serv_fts_docsize").fetchone()
+        assert indexed == ClaveProdServCatalog.get_total_count()
+
+    def test_tokenizer(self):
+        """The index folds diacritics"""
+        conn = ClaveProdServCatalog._get_connection()
+        (sql,) = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'clave_prod_serv_fts'"
+        ).fetchone()
+        assert "remove_diacritics 2" in sql
+
+
+class TestSearch:
+    """Tests for ClaveProdServCatalog.search"""
+
+    def test_finds_results(self):
+        """Matches come back as full records"""
+        results = ClaveProdServCatalog.search("computadora", limit=10)
+        assert results
+        assert all(set(item) >= {"id", "descripcion"} for item in results)
+
+    def test_accent_insensitive(self):
+        """Queries without accents find accented descriptions"""
+        ids = {item["id"] for item in ClaveProdServCatalog.search("computacion", limit=50)}
+        assert ids == {item["id"] for item in ClaveProdServCatalog.search("computación", limit=50)}
+        assert "43211511" in ids
+
+    def test_ranked(self):
+        """Ranked search returns the same matches ordered by bm25"""
+        plain = ClaveProdServCatalog.search("leche", limit=1000)
+        ranked = ClaveProdServCatalog.search("leche", limit=1000, ranked=True)
+        assert {item["id"] for item in ranked} == {item["id"] for item in plain}
+
+        conn = ClaveProdServCatalog._get_connection()
+        scores = [
+            conn.execute(
+                "SELECT bm25(clave_prod_serv_fts) FROM clave_prod_serv_fts "
+                "WHERE clave_prod_serv_fts MATCH '\"leche\"*' AND clave = ?",
+                (item["id"],),
+            ).fetchone()[0]
+            for item in ranked
+        ]
+        assert scores == sorted(scores)
+
+    @pytest.mark.parametrize("keyword", ["pan-dulce", '"leche', "c++", "AND", "leche OR", "  "])
+    def test_punctuation(self, keyword):
+        """Punctuation and operator words are searched as text, not parsed as FTS5 syntax"""
+        assert isinstance(ClaveProdServCatalog.search(keyword), list)
+
+    def test_prefix(self):
+        """Each word matches as a prefix"""
+        ids = {item["id"] for item in ClaveProdServCatalog.search("computad", limit=50)}
+        assert "43211500" in ids
+
+    def test_raw(self):
+        """Raw queries use the FTS5 syntax"""
+        leche = ClaveProdServCatalog.search("leche", limit=1000)
+        sin_polvo = ClaveProdServCatalog.search("leche NOT polvo", limit=1000, raw=True)
+        assert 0 < len(sin_polvo) < len(leche)
+        with pytest.raises(sqlite3.OperationalError):
+            ClaveProdServCatalog.search("pan-dulce", raw=True)
+
+    def test_bootstrap_schema(self, tmp_path, monkeypatch):
+        """An empty database file is bootstrapped with a searchable index"""
+        db_path = tmp_path / "clave_prod_serv.db"
+        sqlite3.connect(db_path).close()
+        monkeypatch.setattr(ClaveProdServCatalog, "_db_path", db_path)
+        monkeypatch.setattr(ClaveProdServCatalog, "_pool", None)
+        try:
+            results = ClaveProdServCatalog.search("computadora", ranked=True)
+            assert [item["id"] for item in results] == ["43211500"]
+        finally:
+            ClaveProdServCatalog._get_pool().close_all()
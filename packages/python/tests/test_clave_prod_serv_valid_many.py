@@ -0,0 +1,42 @@
+"""
+Tests for ClaveProdServ existence checks backed by the packed clave index
+"""
+
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog
+
+
+class TestIsValid:
+    """Tests for is_valid and is_valid_many"""
+
+    def test_is_valid(self):
+        """Known claves exist; malformed or unknown ones do not"""
+        assert ClaveProdServCatalog.is_valid("43211500")
+        assert ClaveProdServCatalog.is_valid("01010101")
+        assert not ClaveProdServCatalog.is_valid("99999999")
+        assert not ClaveProdServCatalog.is_valid("4321150")
+        assert not ClaveProdServCatalog.is_valid("4321150A")
+        assert not ClaveProdServCatalog.is_valid("")
+
+    def test_is_valid_many(self):
+        """Results come back in input order"""
+        ids = ["43211500", "99999999", "01010101", "abc", None, "432115000"]
+        assert ClaveProdServCatalog.is_valid_many(ids) == [True, False, True, False, False, False]
+
+    def test_matches_catalog(self):
+        """Every catalog clave is valid, and the index is packed"""
+        claves = [item["id"] for item in ClaveProdServCatalog.get_all()]
+        assert all(ClaveProdServCatalog.is_valid_many(claves))
+        index = ClaveProdServCatalog._get_valid_index()
+        assert index.typecode == "I"
+        assert len(index) == len(claves)
+
+    def test_no_sqlite(self, monkeypatch):
+        """Once built, checks do not touch SQLite"""
+        ClaveProdServCatalog._get_valid_index()
+
+        def fail():
+            raise AssertionError("SQLite queried")
+
+        monkeypatch.setattr(ClaveProdServCatalog, "_get_connection", fail)
+        assert ClaveProdServCatalog.is_valid("43211500")
+        assert ClaveProdServCatalog.is_valid_many(iter(["43211500"])) == [True]
@@ -0,0 +1,151 @@
+"""
+Tests for the spatial grid index (catalogmx.utils.geo) and LocalidadesCatalog coordinate queries
+"""
+
+import random
+
+import pytest
+
+from catalogmx.catalogs.inegi import LocalidadesCatalog
+from catalogmx.utils import geo
+from catalogmx.utils.geo import GridIndex, haversine_km
+
+
+def _sample(count=2000, seed=11):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        records.append(
+            {
+                "cvegeo": f"{i:09d}",
+                "nom_localidad": f"Localidad {i}",
+                "latitud": round(rng.uniform(14.5, 32.7), 5),
+                "longitud": round(rng.uniform(-117.1, -86.7), 5),
+            }
+        )
+    records.append(
+        {"cvegeo": "sin_coordenadas", "nom_localidad": "X", "latitud": None, "longitud": None}
+    )
+    return records
+
+
+SAMPLE = _sample()
+QUERIES = [(19.4326, -99.1332), (32.5, -117.0), (14.6, -92.2), (25.0, -105.0), (40.0, -80.0)]
+
+
+def _brute_force(lat, lon, radio_km):
+    resultados = []
+    for loc in SAMPLE:
+        if loc["latitud"] is None:
+            continue
+        distancia = haversine_km(lat, lon, loc["latitud"], loc["longitud"])
+        if distancia <= radio_km:
+            resultados.append(dict(loc, distancia_km=round(distancia, 2)))
+    resultados.sort(key=lambda x: x["distancia_km"])
+    return resultados
+
+
+def _brute_nearest(lat, lon, k):
+    ranked = sorted(
+        (haversine_km(lat, lon, loc["latitud"], loc["longitud"]), doc)
+        for doc, loc in enumerate(SAMPLE)
+        if loc["latitud"] is not None
+    )
+    return [doc for _, doc in ranked[:k]]
+
+
+@pytest.fixture
+def sample_catalog(monkeypatch):
+    monkeypatch.setattr(LocalidadesCatalog, "_data", SAMPLE)
+    monkeypatch.setattr(
+        LocalidadesCatalog,
+        "_geo_index",
+        GridIndex(SAMPLE, lat=lambda loc: loc["latitud"], lon=lambda loc: loc["longitud"]),
+    )
+    return LocalidadesCatalog
+
+
+class TestGridIndex:
+    """Radius and k-nearest queries against a brute-force scan"""
+
+    def test_skips_missing_coordinates(self):
+        index = GridIndex(SAMPLE, lat=lambda r: r["latitud"], lon=lambda r: r["longitud"])
+        assert len(index) == len(SAMPLE) - 1
+
+    @pytest.mark.parametrize("radius", [0, 5, 50, 300])
+    def test_within_matches_scan(self, radius):
+        index = GridIndex(
+            SAMPLE, lat=lambda r: r["latitud"], lon=lambda r: r["longitud"], cell_deg=0.5
+        )
+        for lat, lon in QUERIES:
+            got = [doc for doc, _ in index.within(lat, lon, radius)]
+            assert sorted(got) == sorted(
+                SAMPLE.index(loc)
+                for loc in SAMPLE
+                if loc["latitud"] is not None
+                and haversine_km(lat, lon, loc["latitud"], loc["longitud"]) <= radius
+            )
+
+    @pytest.mark.parametrize("k", [1, 5, 40])
+    def test_nearest_matches_scan(self, k):
+        index = GridIndex(SAMPLE, lat=lambda r: r["latitud"], lon=lambda r: r["longitud"])
+        for lat, lon in QUERIES:
+            assert [doc for doc, _ in index.nearest(lat, lon, k)] == _brute_nearest(lat, lon, k)
+
+    def test_nearest_more_than_available(self):
+        index = GridIndex(SAMPLE[:3], lat=lambda r: r["latitud"], lon=lambda r: r["longitud"])
+        assert len(index.nearest(19.0, -99.0, k=10)) == 3
+
+    def test_empty(self):
+        index = GridIndex([], lat=lambda r: r, lon=lambda r: r)
+        assert index.within(19.0, -99.0, 10) == []
+        assert index.nearest(19.0, -99.0) == []
+        assert index.nearest_many([(19.0, -99.0)]) == [[]]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_nearest_many(self, use_numpy, monkeypatch):
+        if use_numpy:
+            pytest.importorskip("numpy")
+            monkeypatch.setattr(GridIndex, "numpy_min_k", 1)
+        else:
+            monkeypatch.setattr(geo, "optional_numpy", lambda: None)
+        index = GridIndex(SAMPLE, lat=lambda r: r["latitud"], lon=lambda r: r["longitud"])
+        results = index.nearest_many(QUERIES, k=3)
+        assert [[doc for doc, _ in hits] for hits in results] == [
+            _brute_nearest(lat, lon, 3) for lat, lon in QUERIES
+        ]
+        for hits, (lat, lon) in zip(results, QUERIES, strict=True):
+            for doc, distance in hits:
+                expected = haversine_km(lat, lon, SAMPLE[doc]["latitud"], SAMPLE[doc]["longitud"])
+                assert distance == pytest.approx(expected)
+
+
+class TestLocalidadesCoordinates:
+    """LocalidadesCatalog coordinate queries use the grid index"""
+
+    def test_get_by_coordinates_unchanged(self, sample_catalog):
+        for lat, lon in QUERIES:
+            for radio in (10, 120):
+                assert sample_catalog.get_by_coordinates(lat, lon, radio) == _brute_force(
+                    lat, lon, radio
+                )
+
+    def test_results_are_copies(self, sample_catalog):
+        lat, lon = (SAMPLE[0]["latitud"], SAMPLE[0]["longitud"])
+        result = sample_catalog.get_by_coordinates(lat, lon, 1)[0]
+        assert result["cvegeo"] == SAMPLE[0]["cvegeo"]
+        assert result["distancia_km"] == 0
+        assert "distancia_km" not in SAMPLE[0]
+
+    def test_nearest(self, sample_catalog):
+        result = sample_catalog.nearest(19.4326, -99.1332, k=2)
+        assert [r["cvegeo"] for r in result] == [
+            SAMPLE[doc]["cvegeo"] for doc in _brute_nearest(19.4326, -99.1332, 2)
+        ]
+        assert result[0]["distancia_km"] <= result[1]["distancia_km"]
+
+    def test_nearest_many(self, sample_catalog):
+        results = sample_catalog.nearest_many(QUERIES[:2])
+        assert [r[0]["cvegeo"] for r in results] == [
+            sample_catalog.nearest(lat, lon)[0]["cvegeo"] for lat, lon in QUERIES[:2]
+        ]
@@ -0,0 +1,137 @@
+"""
+Import-time benchmark for catalogmx's lazy package exports
+
+Each check runs in a fresh interpreter, since this test process has already
+imported most of the package.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceiling for `import catalogmx` (it measures ~15 ms on CPython 3.11);
+# eager imports of the validators and NumPy took over 200 ms
+IMPORT_BUDGET_US = 100_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _modules_after(statement: str) -> set[str]:
+    """Modules in sys.modules after running ``statement`` in a new interpreter."""
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    return set(json.loads(_run(code).stdout))
+
+
+def _import_time_us(module: str) -> int:
+    """Cumulative microseconds reported by ``-X importtime`` for ``module``."""
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    pattern = rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$"
+    return int(re.search(pattern, stderr, re.MULTILINE).group(1))
+
+
+class TestLazyImports:
+    """Package __init__ files import submodules on first attribute access"""
+
+    def test_import_catalogmx(self):
+        """The top-level package loads no validators, catalogs or NumPy"""
+        loaded = _modules_after("import catalogmx")
+        for module in (
+            "numpy",
+            "unidecode",
+            "catalogmx.helpers",
+            "catalogmx.validators.rfc",
+            "catalogmx.validators.curp",
+            "catalogmx.registry",
+            "catalogmx.catalogs",
+        ):
+            assert module not in loaded
+
+    def test_one_catalog(self):
+        """Importing a catalog loads only its module, not its siblings or other groups"""
+        loaded = _modules_after("from catalogmx.catalogs.sat.cfdi_4 import FormaPagoCatalog")
+        assert "catalogmx.catalogs.sat.cfdi_4.forma_pago" in loaded
+        for module in (
+            "catalogmx.catalogs.sat.cfdi_4.metodo_pago",
+            "catalogmx.catalogs.sat.cfdi_4.xml_stream",
+            "catalogmx.catalogs.sat.nomina",
+            "catalogmx.catalogs.sat.carta_porte",
+            "catalogmx.catalogs.sat.comercio_exterior",
+            "catalogmx.catalogs.banxico",
+            "numpy",
+        ):
+            assert module not in loaded
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "from catalogmx.catalogs.banxico import UDICatalog\n"
+            "UDICatalog.udis_a_pesos_many([1.0, 2.0], ['2024-01-02', '2024-06-03'])",
+            "from catalogmx.catalogs.banxico import InflacionAnualCatalog\n"
+            "InflacionAnualCatalog.get_data()",
+            "from catalogmx.catalogs.inegi import LocalidadesCatalog",
+            "from catalogmx.calculators import ISRCalculator\n"
+            "ISRCalculator.calcular_isr_many([15000.0], 2025)",
+        ],
+    )
+    def test_without_numpy(self, statement):
+        """Catalogs and batch calls on lists do not import NumPy"""
+        assert "numpy" not in _modules_after(statement)
+
+    def test_localidades_without_numpy(self):
+        """LocalidadesCatalog loads and builds its grid index without NumPy"""
+        if not (PACKAGE_ROOT.parent / "shared-data" / "inegi" / "localidades.json").exists():
+            pytest.skip("inegi/localidades.json is not available")
+        loaded = _modules_after(
+            "from catalogmx.catalogs.inegi import LocalidadesCatalog\n"
+            "LocalidadesCatalog.get_by_coordinates(19.43, -99.13, radio_km=5)"
+        )
+        assert "numpy" not in loaded
+
+    def test_cli(self):
+        """The CLI imports validators only inside the commands that use them"""
+        loaded = _modules_after("import catalogmx.cli")
+        assert "catalogmx.validators.rfc" not in loaded
+        assert "numpy" not in loaded
+
+    def test_attribute_access(self):
+        """Lazy names resolve to the same objects as direct imports"""
+        import catalogmx
+        from catalogmx.catalogs import sat
+        from catalogmx.catalogs.sat.cfdi_4.forma_pago import FormaPagoCatalog
+        from catalogmx.validators.rfc import RFCValidator
+
+        assert catalogmx.RFCValidator is RFCValidator
+        assert sat.cfdi_4.FormaPagoCatalog is FormaPagoCatalog
+        assert "validate_rfc" in dir(catalogmx)
+        with pytest.raises(AttributeError):
+            catalogmx.NoExiste  # noqa: B018
+
+    def test_star_import(self):
+        """``from package import *`` still exports everything in __all__"""
+        namespace: dict = {}
+        exec("from catalogmx.catalogs.sat.cfdi_4 import *", namespace)
+        assert "CFDIValidator" in namespace
+        assert "validate_cfdi_path" in namespace
+
+
+class TestImportTime:
+    """Benchmark: -X importtime for `import catalogmx`"""
+
+    def test_budget(self):
+        """`import catalogmx` stays within its budget (best of three runs)"""
+        package = min(_import_time_us("catalogmx") for _ in range(3))
+        assert package < IMPORT_BUDGET_US
@@ -0,0 +1,112 @@
+"""
+Tests for the cumulative inflation index (InflacionAnualCatalog.factor_actualizacion)
+"""
+
+import pytest
+
+from catalogmx.catalogs.banxico import InflacionAnualCatalog
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestIndice:
+    """Tests for the INPC-like index built from annual rates"""
+
+    def test_base_100_on_first_month(self):
+        """The first month of the series is the base of the index"""
+        first = InflacionAnualCatalog._get_series().records[0]["fecha"]
+        assert InflacionAnualCatalog.get_indice(first) == pytest.approx(100.0)
+
+    def test_year_over_year_matches_rate(self):
+        """Index ratio over twelve months reproduces the published annual rate"""
+        for record in InflacionAnualCatalog.get_data()[12:]:
+            fecha = record["fecha"]
+            year, rest = int(fecha[:4]), fecha[4:]
+            factor = InflacionAnualCatalog.factor_actualizacion(f"{year - 1}{rest}", fecha)
+            assert factor == pytest.approx(1 + record["inflacion_anual"] / 100)
+
+    def test_any_day_uses_its_month(self):
+        """Dates inside a month use that month's level"""
+        assert InflacionAnualCatalog.get_indice("2024-06-17") == InflacionAnualCatalog.get_indice(
+            "2024-06-01"
+        )
+
+    def test_before_series(self):
+        """Dates before the series have no index"""
+        assert InflacionAnualCatalog.get_indice("1990-01-01") is None
+        assert InflacionAnualCatalog.factor_actualizacion("1990-01-01", "2024-01-01") is None
+
+
+class TestFactorActualizacion:
+    """Tests for factor_actualizacion and ajustar_por_inflacion"""
+
+    def test_chains(self):
+        """Factors over consecutive periods multiply"""
+        f = InflacionAnualCatalog.factor_actualizacion
+        assert f("2015-03-01", "2024-03-01") == pytest.approx(
+            f("2015-03-01", "2020-08-01") * f("2020-08-01", "2024-03-01")
+        )
+
+    def test_same_date(self):
+        """Updating to the same date is the identity"""
+        assert InflacionAnualCatalog.factor_actualizacion("2020-05-10", "2020-05-20") == 1.0
+
+    def test_ajustar(self):
+        """Adjusted amount is the amount times the factor"""
+        factor = InflacionAnualCatalog.factor_actualizacion("2018-01-01", "2024-01-01")
+        assert factor > 1
+        assert InflacionAnualCatalog.ajustar_por_inflacion(
+            1000, "2018-01-01", "2024-01-01"
+        ) == pytest.approx(1000 * factor)
+
+
+class TestAjustarMany:
+    """Tests for the batch variants"""
+
+    ORIGINALES = ["2018-01-15", "1990-01-01", "2012-07-01", "2018-01-15"]
+    ACTUALES = ["2024-06-30", "2024-06-30", "2023-12-01", "2010-01-01"]
+
+    def test_matches_scalar_list(self):
+        """List input gives the scalar results, None where not covered"""
+        montos = [1000.0, 50.0, 2500.0, 10.0]
+        result = InflacionAnualCatalog.ajustar_por_inflacion_many(
+            montos, self.ORIGINALES, self.ACTUALES
+        )
+        expected = [
+            InflacionAnualCatalog.ajustar_por_inflacion(m, a, b)
+            for m, a, b in zip(montos, self.ORIGINALES, self.ACTUALES, strict=True)
+        ]
+        assert result[1] is None and expected[1] is None
+        assert result[3] is None
+        for got, want in zip(result, expected, strict=True):
+            if want is not None:
+                assert got == pytest.approx(want)
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    def test_numpy(self):
+        """NumPy input gives a float array with NaN where not covered"""
+        montos = np.array([1000.0, 50.0, 2500.0, 10.0])
+        result = InflacionAnualCatalog.ajustar_por_inflacion_many(
+            montos, self.ORIGINALES, self.ACTUALES
+        )
+        assert isinstance(result, np.ndarray)
+        assert np.isnan(result[1]) and np.isnan(result[3])
+        assert result[0] == pytest.approx(
+            InflacionAnualCatalog.ajustar_por_inflacion(1000.0, "2018-01-15", "2024-06-30")
+        )
+
+    def test_factores(self):
+        """factor_actualizacion_many matches factor_actualizacion"""
+        factores = InflacionAnualCatalog.factor_actualizacion_many(self.ORIGINALES, self.ACTUALES)
+        assert factores[0] == pytest.approx(
+            InflacionAnualCatalog.factor_actualizacion("2018-01-15", "2024-06-30")
+        )
+        assert factores[1] is None
+
+    def test_length_mismatch(self):
+        """Columns of different length are rejected"""
+        with pytest.raises(ValueError):
+            InflacionAnualCatalog.ajustar_por_inflacion_many([1.0], [], [])
@@ -0,0 +1,181 @@
+"""
+Tests for the ISR withholding calculator (catalogmx.calculators)
+"""
+
+import pytest
+
+from catalogmx.calculators import PERIODICIDADES, ISRCalculator, calcular_isr_many
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+INGRESOS = [0, 0.01, 500, 746.04, 746.05, 5000, 15000, 50000, 120000, 400000, 1_000_000]
+
+
+def _reference(ingreso, tramos):
+    """Linear-scan ISR, as the tariff is published"""
+    for tramo in tramos:
+        superior = tramo["limite_superior"]
+        if ingreso >= tramo["limite_inferior"] and (superior is None or ingreso <= superior):
+            excedente = ingreso - tramo["limite_inferior"]
+            return tramo["cuota_fija"] + excedente * tramo["tasa_excedente"] / 100
+    return 0.0
+
+
+class TestISRCalculator:
+    """Tests for single-income calculations"""
+
+    def test_anios(self):
+        """Tariffs are available from 2002 on, newest first"""
+        anios = ISRCalculator.get_anios_disponibles()
+        assert anios[0] >= 2025
+        assert 2002 in anios
+        assert anios == sorted(anios, reverse=True)
+
+    @pytest.mark.parametrize("anio", [2010, 2014, 2025])
+    def test_matches_published_tariff(self, anio):
+        """Bisect lookup gives the same ISR as a linear scan of the brackets"""
+        tramos = ISRCalculator.get_tabla(anio)
+        for ingreso in INGRESOS:
+            assert ISRCalculator.calcular_isr(ingreso, anio) == pytest.approx(
+                _reference(ingreso, tramos)
+            )
+
+    def test_calcular_detalle(self):
+        """Detailed result for a monthly salary in the 2025 tariff"""
+        result = ISRCalculator.calcular(15000, 2025)
+        assert result["limite_inferior"] == 12935.83
+        assert result["cuota_fija"] == 1182.88
+        assert result["excedente"] == pytest.approx(2064.17)
+        assert result["isr_a_retener"] == pytest.approx(1182.88 + 2064.17 * 0.1792)
+        assert result["tasa_efectiva"] == pytest.approx(result["isr_a_retener"] / 150)
+
+    def test_subsidio(self):
+        """The employment subsidy lowers withholding, never below zero"""
+        sin = ISRCalculator.calcular(3000, 2025)
+        con = ISRCalculator.calcular(3000, 2025, aplicar_subsidio=True)
+        assert con["subsidio_empleo"] > 0
+        assert con["isr_a_retener"] == max(0.0, sin["isr_causado"] - con["subsidio_empleo"])
+
+    def test_salario_neto(self):
+        """Net salary is gross minus withholding"""
+        neto = ISRCalculator.calcular_salario_neto(20000, 2025, aplicar_subsidio=False)
+        assert neto == pytest.approx(20000 - ISRCalculator.calcular_isr(20000, 2025))
+
+    def test_tasa_marginal(self):
+        """Marginal rate of the top bracket is 35% since 2014"""
+        assert ISRCalculator.calcular_tasa_marginal(1_000_000, 2025) == 35.0
+        assert ISRCalculator.calcular_tasa_marginal(1_000_000, 2013) == 30.0
+
+    def test_default_year(self):
+        """Without a year the latest tariff applies; later years keep using it"""
+        ultimo = ISRCalculator.get_anios_disponibles()[0]
+        assert ISRCalculator.get_anio_vigente() == ultimo
+        assert ISRCalculator.get_anio_vigente(ultimo + 5) == ultimo
+        assert ISRCalculator.calcular_isr(15000) == ISRCalculator.calcular_isr(15000, ultimo)
+        assert ISRCalculator.calcular_isr(15000, ultimo + 1) == ISRCalculator.calcular_isr(
+            15000, ultimo
+        )
+
+    def test_unknown_year_or_period(self):
+        """Unknown years and pay periods raise ValueError"""
+        with pytest.raises(ValueError):
+            ISRCalculator.calcular_isr(1000, 1990)
+        with pytest.raises(ValueError):
+            ISRCalculator.calcular_isr(1000, 2025, "trimestral")
+
+
+# 2025 tariffs as published by SAT (Anexo 8 RMF)
+ANEXO_8_QUINCENAL = [
+    (0.01, 368.10, 0.0, 1.92),
+    (368.11, 3124.35, 7.05, 6.4),
+    (3124.36, 5490.75, 183.45, 10.88),
+    (5490.76, 6382.80, 441.0, 16.0),
+    (6382.81, 7641.90, 583.65, 17.92),
+    (7641.91, 15412.80, 809.25, 21.36),
+    (15412.81, 24292.65, 2469.15, 23.52),
+    (24292.66, 46378.50, 4557.75, 30.0),
+    (46378.51, 61838.10, 11183.40, 32.0),
+    (61838.11, 185514.30, 16130.55, 34.0),
+    (185514.31, None, 58180.35, 35.0),
+]
+ANEXO_8_SEMANAL = [
+    (0.01, 171.78, 0.0, 1.92),
+    (171.79, 1458.03, 3.29, 6.4),
+    (1458.04, 2562.35, 85.61, 10.88),
+    (2562.36, 2978.64, 205.80, 16.0),
+    (2978.65, 3566.22, 272.37, 17.92),
+    (3566.23, 7192.64, 377.65, 21.36),
+    (7192.65, 11336.57, 1152.27, 23.52),
+    (11336.58, 21643.30, 2126.95, 30.0),
+    (21643.31, 28857.78, 5218.92, 32.0),
+    (28857.79, 86573.34, 7527.59, 34.0),
+    (86573.35, None, 27150.83, 35.0),
+]
+
+
+class TestPeriodicidades:
+    """Tests for tariffs scaled to other pay periods"""
+
+    @pytest.mark.parametrize(
+        "periodicidad,oficial",
+        [
+            ("quincenal", ANEXO_8_QUINCENAL),
+            ("semanal", ANEXO_8_SEMANAL),
+        ],
+    )
+    def test_anexo_8(self, periodicidad, oficial):
+        """Derived tariffs equal the ones SAT publishes in Anexo 8 of the RMF"""
+        tabla = ISRCalculator.get_tabla(2025, periodicidad)
+        assert [
+            (t["limite_inferior"], t["limite_superior"], t["cuota_fija"], t["tasa_excedente"])
+            for t in tabla
+        ] == oficial
+
+    def test_no_gaps_or_overlaps(self):
+        """Each lower limit is the previous upper one plus a cent"""
+        for periodicidad in PERIODICIDADES:
+            tabla = ISRCalculator.get_tabla(2025, periodicidad)
+            for prev, t in zip(tabla[:-1], tabla[1:], strict=True):
+                assert t["limite_inferior"] == round(prev["limite_superior"] + 0.01, 2)
+
+    def test_anual(self):
+        """The annual tariff is twelve monthly tariffs, up to the cents of its limits"""
+        assert PERIODICIDADES["anual"] == 12.0
+        assert ISRCalculator.calcular_isr(12 * 15000, 2025, "anual") == pytest.approx(
+            12 * ISRCalculator.calcular_isr(15000, 2025), abs=0.05
+        )
+
+    def test_semanal_above_mensual(self):
+        """The same amount withholds more ISR as a weekly salary than as a monthly one"""
+        assert ISRCalculator.calcular_isr(5000, 2025, "semanal") > ISRCalculator.calcular_isr(
+            5000, 2025
+        )
+
+
+class TestCalcularISRMany:
+    """Tests for batch payroll calculations"""
+
+    @pytest.mark.parametrize("subsidio", [False, True])
+    @pytest.mark.parametrize("periodicidad", ["mensual", "quincenal", "semanal"])
+    def test_matches_scalar(self, periodicidad, subsidio):
+        """Batch results equal the scalar ones"""
+        result = calcular_isr_many(INGRESOS, 2025, periodicidad, subsidio)
+        expected = [ISRCalculator.calcular_isr(x, 2025, periodicidad, subsidio) for x in INGRESOS]
+        assert result == pytest.approx(expected)
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    @pytest.mark.parametrize("subsidio", [False, True])
+    def test_numpy(self, subsidio):
+        """NumPy input gives a float array with the scalar results"""
+        result = ISRCalculator.calcular_isr_many(np.array(INGRESOS), 2025, "mensual", subsidio)
+        assert isinstance(result, np.ndarray)
+        expected = [ISRCalculator.calcular_isr(x, 2025, "mensual", subsidio) for x in INGRESOS]
+        assert result.tolist() == pytest.approx(expected)
+
+    def test_generator_input(self):
+        """Any iterable of incomes is accepted"""
+        result = ISRCalculator.calcular_isr_many((x for x in [1000, 2000]), 2025)
+        assert len(result) == 2
@@ -0,0 +1,124 @@
+"""
+Tests for the vectorized payroll calculator (catalogmx.calculators.NominaCalculator)
+"""
+
+import pytest
+
+from catalogmx.calculators import TOPE_SBC_UMAS, ISRCalculator, NominaCalculator
+from catalogmx.catalogs.mexico import SalariosMinimos, UMACatalog
+from catalogmx.catalogs.sat.nomina import RiesgoPuestoCatalog
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+SALARIOS = [9000.0, 25000.0, 180000.0, 3000.0]
+PERIODICIDADES = ["04", "mensual", "02", "04"]
+FECHAS = ["2025-03-15", "2025-01-15", "2016-06-01", "2025-03-15"]
+FRONTERA = [False, False, False, True]
+RIESGOS = ["1", "2", "5", "1"]
+
+
+@pytest.fixture
+def lote():
+    return NominaCalculator.calcular_lote(
+        SALARIOS, PERIODICIDADES, FECHAS, riesgos=RIESGOS, zona_frontera=FRONTERA
+    )
+
+
+class TestCalcularLote:
+    """Tests for calcular_lote with list columns"""
+
+    def test_dias_y_salario_diario(self, lote):
+        """Days come from c_PeriodicidadPago"""
+        assert lote["dias"] == [15, 30, 7, 15]
+        assert lote["salario_diario"] == pytest.approx([600.0, 25000 / 30, 180000 / 7, 200.0])
+
+    def test_isr_matches_calculator(self, lote):
+        """ISR uses the tariff of the payment year and pay period"""
+        assert lote["isr"] == pytest.approx(
+            [
+                ISRCalculator.calcular_isr(9000, 2025, "quincenal", True),
+                ISRCalculator.calcular_isr(25000, 2025, "mensual", True),
+                ISRCalculator.calcular_isr(180000, 2016, "semanal", True),
+                ISRCalculator.calcular_isr(3000, 2025, "quincenal", True),
+            ]
+        )
+        assert lote["neto"] == pytest.approx(
+            [s - i for s, i in zip(SALARIOS, lote["isr"], strict=True)]
+        )
+
+    def test_salario_minimo(self, lote):
+        """Minimum wage of the year and zone; compliance per employee"""
+        assert lote["salario_minimo"][0] == SalariosMinimos.get_por_zona(2025)
+        assert lote["salario_minimo"][3] == SalariosMinimos.get_por_zona(2025, zona_frontera=True)
+        assert lote["cumple_salario_minimo"] == [True, True, True, False]
+
+    def test_uma_vigencia(self, lote):
+        """UMA changes on February 1st, not January 1st"""
+        assert lote["uma"][0] == UMACatalog.get_valor(2025)
+        assert lote["uma"][1] == UMACatalog.get_valor(2024)
+
+    def test_sbc(self, lote):
+        """SBC is floored at the minimum wage and capped at 25 UMA"""
+        assert lote["sbc"][0] == 600.0
+        assert lote["sbc"][2] == pytest.approx(TOPE_SBC_UMAS * lote["uma"][2])
+        assert lote["sbc"][3] == lote["salario_minimo"][3]
+        assert lote["tope_sbc_aplicado"] == [False, False, True, False]
+
+    def test_cuota_riesgo_trabajo(self, lote):
+        """Work-risk premium is SBC x days x prima media"""
+        prima = RiesgoPuestoCatalog.get_prima_media("2")
+        assert lote["cuota_riesgo_trabajo"][1] == pytest.approx(lote["sbc"][1] * 30 * prima / 100)
+
+    def test_scalar_arguments(self):
+        """Single values are shared by every employee"""
+        lote = NominaCalculator.calcular_lote([9000.0, 12000.0], "quincenal", "2025-03-15")
+        assert lote["dias"] == [15, 15]
+        assert "cuota_riesgo_trabajo" not in lote
+
+    def test_fecha_sin_tarifa_propia(self):
+        """Dates after the latest ISR tariff use the tariff still in force"""
+        ultimo = ISRCalculator.get_anios_disponibles()[0]
+        lote = NominaCalculator.calcular_lote([15000.0], "05", f"{ultimo + 1}-03-15")
+        assert lote["isr"][0] == pytest.approx(ISRCalculator.calcular_isr(15000.0, ultimo))
+
+    def test_factor_integracion(self):
+        """The integration factor raises the SBC"""
+        base = NominaCalculator.calcular_lote([9000.0], "04", "2025-03-15")
+        integrado = NominaCalculator.calcular_lote(
+            [9000.0], "04", "2025-03-15", factor_integracion=1.0493
+        )
+        assert integrado["sbc"][0] == pytest.approx(base["sbc"][0] * 1.0493)
+
+    def test_errors(self):
+        """Unknown periods, risk classes, dates and mismatched columns raise ValueError"""
+        with pytest.raises(ValueError):
+            NominaCalculator.calcular_lote([1000.0], "99", "2025-03-15")
+        with pytest.raises(ValueError):
+            NominaCalculator.calcular_lote([1000.0], "04", "2025-03-15", riesgos="9")
+        with pytest.raises(ValueError):
+            NominaCalculator.calcular_lote([1000.0], "04", "1990-01-01")
+        with pytest.raises(ValueError):
+            NominaCalculator.calcular_lote([1000.0, 2000.0], ["04"], "2025-03-15")
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed")
+class TestCalcularLoteNumpy:
+    """Tests for calcular_lote with NumPy salaries"""
+
+    def test_matches_lists(self, lote):
+        """NumPy columns equal the list results"""
+        result = NominaCalculator.calcular_lote(
+            np.array(SALARIOS), PERIODICIDADES, FECHAS, riesgos=RIESGOS, zona_frontera=FRONTERA
+        )
+        for name, column in lote.items():
+            assert isinstance(result[name], np.ndarray)
+            assert result[name].tolist() == pytest.approx(column)
+
+    def test_datetime64_dates(self):
+        """Payment dates can be a datetime64 column"""
+        fechas = np.array(["2025-03-15", "2024-03-15"], dtype="datetime64[D]")
+        result = NominaCalculator.calcular_lote(np.array([9000.0, 9000.0]), "04", fechas)
+        assert result["uma"].tolist() == [UMACatalog.get_valor(2025), UMACatalog.get_valor(2024)]
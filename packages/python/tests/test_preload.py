@@ -0,0 +1,93 @@
+"""
+Tests for catalog discovery and eager preloading (catalogmx.registry)
+"""
+
+import gc
+
+import pytest
+
+import catalogmx
+from catalogmx.catalogs.banxico import UDICatalog
+from catalogmx.catalogs.sat.cfdi_4 import FormaPagoCatalog
+from catalogmx.registry import discover, get_catalog, preload
+
+
+class _Broken:
+    @classmethod
+    def _load_data(cls) -> None:
+        raise FileNotFoundError("missing.json")
+
+
+class TestDiscover:
+    """Tests for catalog discovery"""
+
+    def test_finds_catalogs(self):
+        """JSON, SQLite and Banxico series catalogs are all discovered"""
+        catalogs = discover()
+        assert catalogs["FormaPagoCatalog"] is FormaPagoCatalog
+        assert catalogs["UDICatalog"] is UDICatalog
+        assert "ClaveProdServCatalog" in catalogs
+        assert "CodigosPostales" in catalogs
+        assert list(catalogs) == sorted(catalogs)
+
+    def test_skips_abstract_bases(self):
+        """Base classes are only loaded through their subclasses"""
+        catalogs = discover()
+        assert "BanxicoSeriesCatalog" not in catalogs
+        assert "BanxicoRateCatalog" not in catalogs
+        assert "TIIE28Catalog" in catalogs
+
+    def test_get_catalog(self):
+        """Unknown names raise KeyError"""
+        assert get_catalog("FormaPagoCatalog") is FormaPagoCatalog
+        with pytest.raises(KeyError):
+            get_catalog("NoExisteCatalog")
+
+
+class TestPreload:
+    """Tests for catalogmx.preload"""
+
+    def test_top_level(self):
+        """preload is exported from the package"""
+        assert catalogmx.preload is preload
+
+    def test_loads_and_reports(self):
+        """Selected catalogs are loaded and reported"""
+        report = preload(["FormaPagoCatalog", UDICatalog], parallel=False)
+        assert set(report) == {"FormaPagoCatalog", "UDICatalog"}
+        assert FormaPagoCatalog._data is not None
+        assert UDICatalog._series is not None
+        udi = report["UDICatalog"]
+        assert udi["error"] is None
+        assert udi["records"] == len(UDICatalog._data)
+        assert udi["memory_bytes"] > 0
+        assert udi["seconds"] >= 0
+
+    def test_errors_are_reported(self):
+        """A catalog that fails to load does not stop the others"""
+        report = preload([_Broken, "FormaPagoCatalog"])
+        assert report["_Broken"]["error"] == "FileNotFoundError: missing.json"
+        assert report["_Broken"]["memory_bytes"] is None
+        assert report["FormaPagoCatalog"]["error"] is None
+
+    def test_class_without_loader(self):
+        """A class with no loader class method is reported, not raised"""
+        report = preload([object], parallel=False)
+        assert report["object"]["error"] == "TypeError: object has no loader class method"
+
+    def test_parallel_matches_sequential(self):
+        """Thread-pool loading reports the same catalogs and sizes"""
+        names = ["FormaPagoCatalog", "MetodoPagoCatalog", "UMACatalog"]
+        parallel = preload(names, parallel=True)
+        sequential = preload(names, parallel=False)
+        assert list(parallel) == names
+        for name in names:
+            assert parallel[name]["memory_bytes"] == sequential[name]["memory_bytes"]
+
+    def test_freeze_gc(self):
+        """freeze_gc moves the loaded objects to the permanent generation"""
+        try:
+            preload(["FormaPagoCatalog"], measure_memory=False, freeze_gc=True)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
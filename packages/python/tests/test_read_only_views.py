@@ -0,0 +1,128 @@
+"""
+Tests for opt-in read-only catalog views (catalogmx.utils.views)
+"""
+
+import threading
+from types import MappingProxyType
+
+import pytest
+
+import catalogmx
+from catalogmx.catalogs.banxico import UDICatalog, UDIRecord
+from catalogmx.catalogs.mexico import HoyNoCirculaCatalog
+from catalogmx.catalogs.sat.cfdi_4 import FormaPagoCatalog
+from catalogmx.utils.views import (
+    copy_dict,
+    copy_dicts,
+    copy_list,
+    is_read_only,
+    read_only,
+    set_read_only,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mode():
+    yield
+    set_read_only(False)
+
+
+class TestDefaultCopies:
+    """Without read-only mode the getters keep returning mutable copies"""
+
+    def test_get_all_is_a_list_copy(self):
+        """Changing the returned list does not change the catalog"""
+        data = FormaPagoCatalog.get_all()
+        assert isinstance(data, list)
+        data.clear()
+        assert FormaPagoCatalog.get_all()
+
+    def test_records_are_copies(self):
+        """Banxico records are copied dicts"""
+        record = UDICatalog.get_actual()
+        assert type(record) is dict
+        record["valor"] = -1
+        assert UDICatalog.get_actual()["valor"] != -1
+
+
+class TestReadOnly:
+    """Tests for catalogmx.read_only()"""
+
+    def test_top_level(self):
+        """read_only and set_read_only are exported from the package"""
+        assert catalogmx.read_only is read_only
+        assert catalogmx.set_read_only is set_read_only
+
+    def test_get_all_view(self):
+        """get_all returns one cached tuple of read-only records"""
+        with read_only():
+            data = FormaPagoCatalog.get_all()
+            assert isinstance(data, tuple)
+            assert data is FormaPagoCatalog.get_all()
+            assert isinstance(data[0], MappingProxyType)
+            with pytest.raises(TypeError):
+                data[0]["descripcion"] = "x"
+        assert list(map(dict, data)) == FormaPagoCatalog.get_all()
+
+    def test_series_views(self):
+        """Banxico getters return the catalog's own immutable records"""
+        with read_only():
+            anio = UDICatalog.get_actual()["año"]
+            records = UDICatalog.get_por_anio(anio)
+            assert isinstance(records, tuple)
+            assert all(isinstance(record, UDIRecord) for record in records)
+            assert isinstance(UDICatalog.get_actual(), UDIRecord)
+        assert [dict(record) for record in records] == UDICatalog.get_por_anio(anio)
+
+    def test_dict_valued_getters(self):
+        """Getters returning a dict return a read-only mapping"""
+        with read_only():
+            data = HoyNoCirculaCatalog.get_data()
+            assert isinstance(data, MappingProxyType)
+
+    def test_context_override(self):
+        """read_only(False) forces copies inside a process-wide read-only mode"""
+        set_read_only(True)
+        assert is_read_only()
+        with read_only(False):
+            assert isinstance(FormaPagoCatalog.get_all(), list)
+        assert isinstance(FormaPagoCatalog.get_all(), tuple)
+
+    def test_process_wide_in_threads(self):
+        """set_read_only applies to threads started afterwards"""
+        set_read_only(True)
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(is_read_only()))
+        thread.start()
+        thread.join()
+        assert seen == [True]
+
+
+class TestHelpers:
+    """Tests for copy_list, copy_dict and copy_dicts"""
+
+    def test_copy_list(self):
+        """Views are cached per list and rebuilt when the list changes"""
+        data = [{"a": 1}, "b"]
+        assert copy_list(data) == data and copy_list(data) is not data
+        with read_only():
+            view = copy_list(data)
+            assert view == (MappingProxyType({"a": 1}), "b")
+            assert copy_list(data) is view
+            data.append("c")
+            assert len(copy_list(data)) == 3
+            assert copy_list([]) == ()
+
+    def test_copy_dict(self):
+        """None passes through in both modes"""
+        assert copy_dict(None) is None
+        with read_only():
+            assert copy_dict(None) is None
+            assert copy_dict({"a": 1})["a"] == 1
+
+    def test_copy_dicts(self):
+        """Accepts generators"""
+        records = [{"a": 1}, {"a": 2}]
+        assert copy_dicts(r for r in records) == records
+        with read_only():
+            assert copy_dicts(r for r in records) == tuple(map(MappingProxyType, records))
@@ -0,0 +1,129 @@
+"""
+Tests for compact catalog records (catalogmx.utils.records)
+"""
+
+import json
+import pickle
+import sys
+
+import pytest
+
+from catalogmx.catalogs.banxico import (
+    TIIE28Catalog,
+    TipoCambioUSDCatalog,
+    UDICatalog,
+    UDIRecord,
+)
+from catalogmx.catalogs.inegi import Localidad, Municipio, MunicipiosCompletoCatalog
+from catalogmx.catalogs.sepomex import CodigoPostal
+from catalogmx.utils.records import Record
+from catalogmx.utils.views import read_only
+
+
+class Punto(Record):
+    __slots__ = ("clave", "estado", "poblacion")
+    _intern = frozenset({"estado", "poblacion"})
+
+
+ROW = {"clave": "01001", "estado": "Aguascalientes", "poblacion": 877190}
+
+
+class TestRecord:
+    """Tests for the Record base class"""
+
+    def test_mapping_access(self):
+        """Records read like the dicts they were built from"""
+        punto = Punto.from_dict(ROW)
+        assert punto["estado"] == "Aguascalientes"
+        assert punto.get("clave") == "01001"
+        assert punto.clave == "01001"
+        assert punto == ROW
+        assert dict(punto) == ROW
+        assert list(punto) == ["clave", "estado", "poblacion"]
+        assert len(punto) == 3
+
+    def test_missing_and_extra_keys(self):
+        """Absent fields are missing keys and unknown keys are kept"""
+        punto = Punto.from_dict({"clave": "02001", "nueva": 1})
+        assert "estado" not in punto
+        assert punto.get("estado") is None
+        with pytest.raises(KeyError):
+            punto["estado"]  # noqa: B018
+        assert punto["nueva"] == 1
+        assert punto.to_dict() == {"clave": "02001", "nueva": 1}
+
+    def test_immutable(self):
+        """Records cannot be modified"""
+        punto = Punto.from_dict(ROW)
+        with pytest.raises(AttributeError):
+            punto.estado = "Sonora"
+        with pytest.raises(AttributeError):
+            del punto.clave
+        with pytest.raises(TypeError):
+            punto["estado"] = "Sonora"
+
+    def test_interning(self):
+        """Repeated values in interned fields share one object"""
+        a = Punto.from_dict(json.loads(json.dumps(ROW)))
+        b = Punto.from_dict(json.loads(json.dumps(ROW)))
+        assert a.estado is b.estado
+        assert a.poblacion is b.poblacion
+        assert a.clave is not b.clave
+
+    def test_to_dict_and_pickle(self):
+        """to_dict gives a mutable dict; records survive pickling"""
+        punto = Punto.from_dict(ROW)
+        data = punto.to_dict()
+        data["estado"] = "Sonora"
+        assert punto["estado"] == "Aguascalientes"
+        assert json.dumps(punto.to_dict())
+        assert pickle.loads(pickle.dumps(punto)) == punto
+
+    def test_smaller_than_dict(self):
+        """A record is smaller than the dict it replaces"""
+        assert sys.getsizeof(Punto.from_dict(ROW)) < sys.getsizeof(dict(ROW))
+
+    @pytest.mark.parametrize("record_type", [Localidad, Municipio, CodigoPostal, UDIRecord])
+    def test_catalog_record_fields(self, record_type):
+        """Catalog record types list their fields from __slots__"""
+        assert record_type._fields == record_type.__slots__
+        assert record_type._intern <= record_type._field_set
+
+
+class TestCatalogRecords:
+    """Catalogs keep their rows as records"""
+
+    def test_banxico_data(self):
+        """Banxico series hold records and return dict copies"""
+        record = UDICatalog.get_actual()
+        assert all(isinstance(row, UDIRecord) for row in UDICatalog._data)
+        assert type(record) is dict
+        assert record == UDICatalog.get_por_fecha(record["fecha"])
+
+    @pytest.mark.parametrize(
+        "getter",
+        [
+            UDICatalog.get_data,
+            TipoCambioUSDCatalog.get_data,
+            TIIE28Catalog.get_data,
+            MunicipiosCompletoCatalog.get_all,
+            lambda: MunicipiosCompletoCatalog.get_by_entidad("14"),
+            lambda: MunicipiosCompletoCatalog.search_by_name("Guadalajara"),
+            lambda: MunicipiosCompletoCatalog.get_by_state_name("Jalisco"),
+            lambda: [MunicipiosCompletoCatalog.get_municipio("14039")],
+        ],
+    )
+    def test_default_getters_return_dicts(self, getter):
+        """Outside read-only mode getters return mutable, JSON-serializable dicts"""
+        records = getter()
+        assert records
+        assert all(type(record) is dict for record in records)
+        assert json.dumps(records[:1])
+        records[0]["valor"] = -1
+        assert getter()[0].get("valor") != -1
+
+    def test_read_only_returns_records(self):
+        """In read-only mode the records are returned without copying"""
+        with read_only():
+            record = UDICatalog.get_actual()
+        assert isinstance(record, UDIRecord)
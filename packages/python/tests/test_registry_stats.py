@@ -0,0 +1,134 @@
+"""
+Tests for catalog registration and load metrics (catalogmx.registry)
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from catalogmx.catalogs.banxico import UDICatalog
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog, FormaPagoCatalog
+from catalogmx.catalogs.sat.cfdi_4.tasa_o_cuota import TasaOCuota
+from catalogmx.cli import main
+from catalogmx.registry import DATA_ROOT, _registry, data_path, discover, register, stats
+from catalogmx.utils.snapshot import is_fresh, snapshot_path
+
+
+def _row(name, **kwargs):
+    return next(row for row in stats(**kwargs) if row["name"] == name)
+
+
+class TestRegister:
+    """Tests for the @register decorator"""
+
+    def test_every_catalog_registers(self):
+        """Discovered catalogs are exactly the registered ones"""
+        assert list(discover()) == sorted(_registry)
+        assert _registry["FormaPagoCatalog"].cls is FormaPagoCatalog
+        assert _registry["ClaveProdServCatalog"].backend == "sqlite"
+
+    def test_sources_resolve(self):
+        """Declared sources are under shared-data"""
+        info = _registry["FormaPagoCatalog"]
+        assert info.path == DATA_ROOT / "sat" / "cfdi_4.0" / "forma_pago.json"
+        assert info.path.exists()
+        assert data_path("sqlite/clave_prod_serv.db") == _registry["ClaveProdServCatalog"].path
+
+    def test_class_data_path(self):
+        """A catalog class resolves to the file it registered, subclasses included"""
+        assert data_path(FormaPagoCatalog) == _registry["FormaPagoCatalog"].path
+        assert data_path(type("Sub", (UDICatalog,), {})) == data_path("banxico/udis.json")
+        with pytest.raises(KeyError):
+            data_path(TestRegister)
+
+    def test_rejects_bad_backend(self):
+        """Unknown backends are rejected"""
+        with pytest.raises(ValueError):
+            register("x.json", backend="csv")
+
+    def test_rejects_duplicate_name(self):
+        """Two catalogs cannot share a class name"""
+
+        class FormaPagoCatalog:
+            @classmethod
+            def _load_data(cls) -> None: ...
+
+        with pytest.raises(ValueError):
+            register("sat/cfdi_4.0/forma_pago.json")(FormaPagoCatalog)
+
+    def test_reload_replaces_entry(self):
+        """Reloading a catalog module re-registers its new class"""
+        import importlib
+
+        from catalogmx.catalogs.sat.cfdi_4 import metodo_pago
+
+        old = metodo_pago.MetodoPagoCatalog
+        importlib.reload(metodo_pago)
+        assert _registry["MetodoPagoCatalog"].cls is metodo_pago.MetodoPagoCatalog
+        assert _registry["MetodoPagoCatalog"].cls is not old
+
+    def test_tasa_o_cuota_path(self):
+        """TasaOCuota reads its file from packages/shared-data"""
+        assert len(TasaOCuota.get_data()) > 0
+
+
+class TestStats:
+    """Tests for registry.stats"""
+
+    def test_records_first_load(self):
+        """The first load is timed and its parsed bytes recorded"""
+        FormaPagoCatalog.get_all()
+        row = _row("FormaPagoCatalog")
+        assert row["loaded"]
+        assert row["backend"] == "json"
+        assert row["records"] == len(FormaPagoCatalog._data)
+        assert row["load_seconds"] >= 0
+        assert row["bytes_parsed"] == data_path("sat/cfdi_4.0/forma_pago.json").stat().st_size
+        assert row["data_bytes"] > 0
+        assert row["index_bytes"] > 0
+
+    def test_snapshot_bytes(self):
+        """Catalogs read from a fresh snapshot report the snapshot's size"""
+        json_path = data_path("banxico/udis.json")
+        if not is_fresh(json_path):
+            pytest.skip("udis.snap is missing or stale")
+        UDICatalog.get_actual()
+        row = _row("UDICatalog", measure_memory=False)
+        assert row["bytes_parsed"] == snapshot_path(json_path).stat().st_size
+        assert row["bytes_parsed"] != json_path.stat().st_size
+
+    def test_sqlite_catalog(self):
+        """SQLite catalogs count rows in the database and parse nothing"""
+        ClaveProdServCatalog.is_valid("01010101")
+        row = _row("ClaveProdServCatalog", measure_memory=False)
+        assert row["loaded"]
+        assert row["records"] == ClaveProdServCatalog.get_total_count()
+        assert row["bytes_parsed"] is None
+        assert row["data_bytes"] is None
+
+    def test_missing_source(self):
+        """Catalogs whose data file is absent report it instead of raising"""
+        for row in stats(measure_memory=False):
+            assert row["exists"] == _registry[row["name"]].path.exists()
+
+
+class TestStatsCommand:
+    """Tests for `catalogmx stats`"""
+
+    def test_table(self):
+        """Prints one line per catalog plus a summary"""
+        FormaPagoCatalog.get_all()
+        result = CliRunner().invoke(main, ["stats", "--no-memory"])
+        assert result.exit_code == 0
+        assert "FormaPagoCatalog" in result.output
+        assert f"/{len(discover())} catalogs loaded" in result.output
+
+    def test_json_loaded_only(self):
+        """--json --loaded-only prints only resident catalogs"""
+        FormaPagoCatalog.get_all()
+        result = CliRunner().invoke(main, ["stats", "--json", "--loaded-only"])
+        assert result.exit_code == 0
+        rows = json.loads(result.output)
+        assert rows and all(row["loaded"] for row in rows)
+        assert "FormaPagoCatalog" in {row["name"] for row in rows}
@@ -0,0 +1,110 @@
+"""Tests for batch RFC validation (validate_rfc_batch / validate_rfc_many)"""
+
+import random
+
+import pytest
+
+from catalogmx import (
+    RFCBatchValidator,
+    RFCValidator,
+    validate_rfc,
+    validate_rfc_batch,
+    validate_rfc_many,
+)
+
+KNOWN = [
+    "MANO610814JL5",
+    "BNM840515VB1",
+    "MME941130K54",
+    "NIR6812205X9",
+    "BACL891217NJ8",
+    "XAXX010101000",
+    "XEXX010101000",
+]
+
+EDGE_CASES = [
+    "",
+    None,
+    123,
+    " mano610814jl5 ",
+    "INVALID",
+    "ABC1234567890",  # 3 letters + trailing character, accepted by general_regex.match
+    "ABC123456XY9!",
+    "MANO611314JL5",  # month 13
+    "MANO610230JL5",  # February 30th
+    "MANO610814OL5",  # 'O' not allowed in homoclave
+    "ÑAN610814JL5",
+    "MANO610814JL5X",
+]
+
+
+def _mutations(count=3000, seed=7):
+    rng = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ&Ñ0123456789 a!"
+    cases = []
+    for _ in range(count):
+        chars = list(rng.choice(KNOWN))
+        for _ in range(rng.randint(0, 2)):
+            chars[rng.randrange(len(chars))] = rng.choice(alphabet)
+        if rng.random() < 0.1:
+            chars.append(rng.choice(alphabet))
+        if rng.random() < 0.1:
+            chars.pop(0)
+        cases.append("".join(chars))
+    return KNOWN + EDGE_CASES + cases
+
+
+CASES = _mutations()
+
+
+class TestValidateRFCBatch:
+    """validate_rfc_batch must agree with validate_rfc"""
+
+    def test_simple(self):
+        assert validate_rfc_batch(["MANO610814JL5", "INVALID"]) == [True, False]
+
+    def test_accepts_generators(self):
+        assert validate_rfc_batch(rfc for rfc in KNOWN) == [validate_rfc(r) for r in KNOWN]
+
+    @pytest.mark.parametrize("check_checksum", [True, False])
+    def test_matches_per_object_path(self, check_checksum, monkeypatch):
+        monkeypatch.setattr(RFCBatchValidator, "numpy_threshold", 10**9)
+        expected = [validate_rfc(rfc, check_checksum) for rfc in CASES]
+        assert validate_rfc_batch(CASES, check_checksum=check_checksum) == expected
+
+    @pytest.mark.parametrize("check_checksum", [True, False])
+    def test_numpy_path_matches(self, check_checksum, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(RFCBatchValidator, "numpy_threshold", 1)
+        expected = [validate_rfc(rfc, check_checksum) for rfc in CASES]
+        assert validate_rfc_batch(CASES, check_checksum=check_checksum) == expected
+
+    def test_empty(self):
+        assert validate_rfc_batch([]) == []
+
+
+class TestValidateRFCMany:
+    """validate_rfc_many must agree with RFCValidator.validators"""
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_matches_validators(self, strict):
+        results = validate_rfc_many(CASES, strict=strict)
+        assert results == [RFCValidator(rfc).validators(strict=strict) for rfc in CASES]
+
+    def test_keys(self):
+        (result,) = validate_rfc_many(["MANO610814JL5"])
+        assert result == {
+            "general_regex": True,
+            "date_format": True,
+            "homoclave": True,
+            "checksum": True,
+        }
+        (result,) = validate_rfc_many(["MANO610814JL5"], strict=False)
+        assert "checksum" not in result
+
+    def test_valid_dates_table(self):
+        valid_dates = RFCBatchValidator._valid_date_set()
+        assert "000229" in valid_dates  # 2000 is a leap year
+        assert "010229" not in valid_dates
+        assert "961231" in valid_dates
+        assert "990631" not in valid_dates
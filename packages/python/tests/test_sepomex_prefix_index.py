@@ -0,0 +1,111 @@
+"""
+Tests for the SEPOMEX CP prefix index and colonia autocomplete
+"""
+
+import json
+
+import pytest
+
+from catalogmx.catalogs.sepomex import CodigosPostales
+
+SAMPLE = [
+    {
+        "cp": "06700",
+        "asentamiento": "Roma Norte",
+        "municipio": "Cuauhtémoc",
+        "estado": "Ciudad de México",
+    },
+    {
+        "cp": "06760",
+        "asentamiento": "Roma Sur",
+        "municipio": "Cuauhtémoc",
+        "estado": "Ciudad de México",
+    },
+    {
+        "cp": "06760",
+        "asentamiento": "Hipódromo",
+        "municipio": "Cuauhtémoc",
+        "estado": "Ciudad de México",
+    },
+    {
+        "cp": "06140",
+        "asentamiento": "Condesa",
+        "municipio": "Cuauhtémoc",
+        "estado": "Ciudad de México",
+    },
+    {
+        "cp": "01000",
+        "asentamiento": "San Ángel",
+        "municipio": "Álvaro Obregón",
+        "estado": "Ciudad de México",
+    },
+    {
+        "cp": "44100",
+        "asentamiento": "Guadalajara Centro",
+        "municipio": "Guadalajara",
+        "estado": "Jalisco",
+    },
+]
+
+
+@pytest.fixture
+def sample_catalog(tmp_path, monkeypatch):
+    path = tmp_path / "codigos_postales_completo.json"
+    path.write_text(json.dumps(SAMPLE), encoding="utf-8")
+    monkeypatch.setattr(CodigosPostales, "_get_data_path", classmethod(lambda cls: path))
+    for attr in (
+        "_data",
+        "_by_cp",
+        "_by_estado",
+        "_by_estado_normalized",
+        "_by_municipio_normalized",
+        "_cp_index",
+        "_asentamientos_normalized",
+        "_asentamientos_sorted",
+        "_asentamientos_sorted_pos",
+    ):
+        monkeypatch.setattr(CodigosPostales, attr, None)
+    return CodigosPostales
+
+
+class TestCPPrefixIndex:
+    """Prefix queries over the sorted CP array"""
+
+    def test_prefix(self, sample_catalog):
+        assert sample_catalog.get_cps_by_prefix("067") == ["06700", "06760"]
+        assert sample_catalog.get_cps_by_prefix("0670") == ["06700"]
+        assert sample_catalog.get_cps_by_prefix("06") == ["06140", "06700", "06760"]
+        assert sample_catalog.get_cps_by_prefix("0") == ["01000", "06140", "06700", "06760"]
+
+    def test_full_cp_and_missing(self, sample_catalog):
+        assert sample_catalog.get_cps_by_prefix("44100") == ["44100"]
+        assert sample_catalog.get_cps_by_prefix("9") == []
+
+    def test_invalid_prefix(self, sample_catalog):
+        assert sample_catalog.get_cps_by_prefix("") == []
+        assert sample_catalog.get_cps_by_prefix("06a") == []
+        assert sample_catalog.get_cps_by_prefix("067000") == []
+
+    def test_limit(self, sample_catalog):
+        assert sample_catalog.get_cps_by_prefix("0", limit=2) == ["01000", "06140"]
+
+    def test_get_by_prefix_returns_settlements(self, sample_catalog):
+        results = sample_catalog.get_by_prefix("0676")
+        assert [r["asentamiento"] for r in results] == ["Roma Sur", "Hipódromo"]
+
+
+class TestColoniaSearch:
+    """Precomputed normalized asentamiento column"""
+
+    def test_search_by_colonia(self, sample_catalog):
+        results = sample_catalog.search_by_colonia("hipodromo")
+        assert [r["cp"] for r in results] == ["06760"]
+
+    def test_autocomplete(self, sample_catalog):
+        results = sample_catalog.autocomplete_colonia("rom")
+        assert [r["asentamiento"] for r in results] == ["Roma Norte", "Roma Sur"]
+
+    def test_autocomplete_accents_and_limit(self, sample_catalog):
+        assert [r["cp"] for r in sample_catalog.autocomplete_colonia("san án")] == ["01000"]
+        assert len(sample_catalog.autocomplete_colonia("roma", limit=1)) == 1
+        assert sample_catalog.autocomplete_colonia("zzz") == []
@@ -0,0 +1,153 @@
+"""
+Tests for binary catalog snapshots (catalogmx.utils.snapshot)
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from catalogmx.utils.records import Record
+from catalogmx.utils.snapshot import (
+    is_fresh,
+    load_records,
+    read_snapshot,
+    snapshot_path,
+    source_read,
+    write_snapshot,
+)
+
+SHARED_DATA = Path(__file__).resolve().parent.parent.parent / "shared-data"
+
+RECORDS = [
+    {
+        "fecha": "2024-01-02",
+        "valor": 7.98,
+        "moneda": "MXN",
+        "año": 2024,
+        "extra": None,
+        "nota": "ñandú",
+    },
+    {
+        "fecha": "2024-01-03",
+        "valor": 7.99,
+        "moneda": "MXN",
+        "año": 2024,
+        "extra": [1, 2],
+        "nota": "ñandú",
+    },
+    {"fecha": "2024-01-04", "valor": 8.0, "moneda": "MXN", "año": 2024, "extra": True, "nota": ""},
+]
+
+
+class Punto(Record):
+    __slots__ = ("fecha", "valor", "moneda", "año")
+    _intern = frozenset({"moneda", "año"})
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "serie.json"
+    path.write_text(json.dumps(RECORDS, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestSnapshotFormat:
+    """Round trip through write_snapshot / read_snapshot"""
+
+    def test_roundtrip(self, tmp_path):
+        path = write_snapshot(RECORDS, tmp_path / "serie.snap")
+        records = read_snapshot(path)
+        assert records == RECORDS
+        assert [list(r) for r in records] == [list(r) for r in RECORDS]
+        assert type(records[2]["valor"]) is float
+        assert records[0]["extra"] is None
+
+    def test_repeated_strings_are_shared(self, tmp_path):
+        records = read_snapshot(write_snapshot(RECORDS, tmp_path / "serie.snap"))
+        assert records[0]["moneda"] is records[2]["moneda"]
+
+    def test_int_widths(self, tmp_path):
+        records = [{"n": value} for value in (0, -(2**40), 2**62, 5)]
+        assert read_snapshot(write_snapshot(records, tmp_path / "ints.snap")) == records
+
+    def test_empty(self, tmp_path):
+        assert read_snapshot(write_snapshot([], tmp_path / "empty.snap")) == []
+
+    def test_heterogeneous_records(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_snapshot([{"a": 1}, {"b": 2}], tmp_path / "bad.snap")
+
+    def test_not_a_snapshot(self, tmp_path):
+        path = tmp_path / "bad.snap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            read_snapshot(path)
+
+
+class TestLoadRecords:
+    """load_records prefers a fresh snapshot and falls back to JSON"""
+
+    def test_without_snapshot(self, source):
+        assert not is_fresh(source)
+        assert load_records(source) == RECORDS
+
+    def test_uses_fresh_snapshot(self, source, monkeypatch):
+        write_snapshot(RECORDS, snapshot_path(source), source=source)
+        assert is_fresh(source)
+        monkeypatch.setattr(json, "load", lambda f: pytest.fail("JSON should not be parsed"))
+        assert load_records(source) == RECORDS
+
+    def test_stale_snapshot_is_ignored(self, source):
+        write_snapshot(RECORDS, snapshot_path(source), source=source)
+        changed = RECORDS[:1]
+        source.write_text(json.dumps(changed), encoding="utf-8")
+        assert not is_fresh(source)
+        assert load_records(source) == changed
+
+    def test_same_size_edit(self, source):
+        """Freshness is checked from metadata; verify=True also compares the contents"""
+        write_snapshot(RECORDS, snapshot_path(source), source=source)
+        text = source.read_text(encoding="utf-8")
+        source.write_text(text.replace("7.98", "7.97"), encoding="utf-8")
+        snap = snapshot_path(source).stat()
+        os.utime(source, ns=(snap.st_atime_ns, snap.st_mtime_ns + 10**9))
+        assert not is_fresh(source)
+        os.utime(source, ns=(snap.st_atime_ns, snap.st_mtime_ns))
+        assert is_fresh(source)
+        assert not is_fresh(source, verify=True)
+
+    def test_corrupt_snapshot_is_ignored(self, source):
+        snapshot_path(source).write_bytes(b"garbage")
+        assert load_records(source) == RECORDS
+        assert source_read(source) == source
+
+    def test_record_type(self, source):
+        """Records built from snapshot columns equal the ones built from the JSON"""
+        expected = Punto.from_dicts(RECORDS)
+        assert load_records(source, Punto) == expected
+        assert source_read(source) == source
+        write_snapshot(RECORDS, snapshot_path(source), source=source)
+        records = load_records(source, Punto)
+        assert source_read(source) == snapshot_path(source)
+        assert records == expected
+        assert [r.to_dict() for r in records] == [r.to_dict() for r in expected]
+        assert records[0].moneda is records[2].moneda
+
+    @pytest.mark.parametrize(
+        "relative",
+        [
+            "banxico/udis.json",
+            "banxico/tipo_cambio_usd.json",
+            "banxico/tiie_28.json",
+            "banxico/cetes_28.json",
+            "inegi/municipios_completo.json",
+        ],
+    )
+    def test_shared_data_snapshots(self, relative):
+        json_path = SHARED_DATA / relative
+        if not is_fresh(json_path):
+            pytest.skip(f"snapshot for {relative} not built (run build_snapshots.py)")
+        with open(json_path, encoding="utf-8") as f:
+            assert read_snapshot(snapshot_path(json_path)) == json.load(f)
@@ -0,0 +1,149 @@
+"""
+Tests for the shared SQLite connection pool (catalogmx.utils.sqlite)
+"""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog
+from catalogmx.utils.sqlite import SQLiteConnectionPool
+
+
+def _make_db(path, rows=(("a",), ("b",))):
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE t (v TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+class TestSQLiteConnectionPool:
+    """Per-thread, read-only connection handling"""
+
+    def test_same_thread_reuses_connection(self, tmp_path):
+        pool = SQLiteConnectionPool(lambda: _make_db(tmp_path / "a.db"))
+        assert pool.get_connection() is pool.get_connection()
+
+    def test_connection_is_read_only(self, tmp_path):
+        db = _make_db(tmp_path / "ro.db")
+        pool = SQLiteConnectionPool(lambda: db)
+        conn = pool.get_connection()
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO t VALUES ('c')")
+
+    def test_pragmas_applied(self, tmp_path):
+        db = _make_db(tmp_path / "p.db")
+        pool = SQLiteConnectionPool(lambda: db, mmap_size=1 << 20, cache_size_kib=2048)
+        conn = pool.get_connection()
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2048
+
+    def test_threads_get_own_connections(self, tmp_path):
+        db = _make_db(tmp_path / "th.db")
+        pool = SQLiteConnectionPool(lambda: db)
+        main_conn = pool.get_connection()
+        results, errors = [], []
+
+        def worker():
+            try:
+                conn = pool.get_connection()
+                results.append(
+                    (conn is not main_conn, conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+                )
+            except Exception as exc:  # pragma: no cover - surfaced by the assert below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert results == [(True, 2)] * 8
+
+    def test_close_all(self, tmp_path):
+        db = _make_db(tmp_path / "c.db")
+        pool = SQLiteConnectionPool(lambda: db)
+        first = pool.get_connection()
+        pool.close_all()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+        assert pool.get_connection() is not first
+
+    def test_missing_file(self, tmp_path):
+        pool = SQLiteConnectionPool(lambda: tmp_path / "missing.db")
+        with pytest.raises(FileNotFoundError):
+            pool.get_connection()
+
+    def test_bootstrap_runs_only_when_needed(self, tmp_path):
+        empty = tmp_path / "empty.db"
+        sqlite3.connect(str(empty)).close()
+        calls = []
+
+        def bootstrap(conn):
+            calls.append(1)
+            conn.execute("CREATE TABLE t (v TEXT)")
+            conn.execute("INSERT INTO t VALUES ('x')")
+
+        def needs(conn):
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 't'").fetchone() is None
+
+        pool = SQLiteConnectionPool(lambda: empty, bootstrap=bootstrap, needs_bootstrap=needs)
+        assert pool.get_connection().execute("SELECT v FROM t").fetchone()[0] == "x"
+        pool.close_all()
+        pool.get_connection()
+        assert calls == [1]
+
+        populated = SQLiteConnectionPool(
+            lambda: _make_db(tmp_path / "full.db"),
+            bootstrap=bootstrap,
+            needs_bootstrap=lambda c: False,
+        )
+        populated.get_connection()
+        assert calls == [1]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_child_process_gets_fresh_connection(self, tmp_path):
+        db = _make_db(tmp_path / "fork.db")
+        pool = SQLiteConnectionPool(lambda: db)
+        parent_conn = pool.get_connection()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            ok = pool.get_connection() is not parent_conn
+            ok = ok and pool.get_connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+            os.write(write_fd, b"1" if ok else b"0")
+            os._exit(0)
+        os.close(write_fd)
+        status = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert status == b"1"
+        assert pool.get_connection() is parent_conn
+
+
+class TestCatalogsUsePool:
+    """SQLite-backed catalogs share the pool across threads"""
+
+    def test_clave_prod_serv_from_threads(self):
+        if not ClaveProdServCatalog._get_db_path().exists():
+            pytest.skip("clave_prod_serv.db not available")
+        errors = []
+
+        def worker():
+            try:
+                assert ClaveProdServCatalog.is_valid("01010101")
+            except Exception as exc:  # pragma: no cover - surfaced by the assert below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
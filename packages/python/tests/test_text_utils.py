@@ -3,7 +3,15 @@ Tests for text normalization utilities.
 
 Tests the catalogmx.utils.text module functions.
 """
-from catalogmx.utils.text import normalize_text, normalize_for_search
+import pytest
+
+from catalogmx.utils.text import (
+    _normalize_uncached,
+    clear_normalize_cache,
+    normalize_cache_info,
+    normalize_for_search,
+    normalize_text,
+)
 
 
 class TestNormalizeText:
@@ -175,3 +183,38 @@ class TestEdgeCases:
         ]
         for with_accent, without_accent in pairs:
             assert normalize_text(with_accent) == normalize_text(without_accent)
+
+
+class TestNormalizeFastPath:
+    """Test the translate-table fast path and the LRU cache."""
+
+    def test_matches_unidecode(self):
+        """Fast path must give exactly unidecode(text).upper()"""
+        unidecode = pytest.importorskip("unidecode").unidecode
+        samples = [chr(code) for code in range(0x2000)]
+        samples += [
+            "Ciudad de México",
+            "Ñuñoa",
+            "Ærø",
+            "straße",
+            "São Paulo",
+            "Me\u0301xico",
+            "北京",
+        ]
+        for sample in samples:
+            text = f"a{sample}z"
+            assert _normalize_uncached(text) == unidecode(text).upper(), repr(sample)
+
+    def test_cache_counters(self):
+        """Repeated names are served from the cache"""
+        clear_normalize_cache()
+        assert normalize_cache_info()["hits"] == 0
+        for _ in range(3):
+            assert normalize_text("Álvaro Obregón") == "ALVARO OBREGON"
+        info = normalize_cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 2
+        assert info["size"] == 1
+        assert info["maxsize"] > 0
+        clear_normalize_cache()
+        assert normalize_cache_info()["size"] == 0
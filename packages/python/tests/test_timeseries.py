@@ -0,0 +1,192 @@
+"""
+Tests for bisect-based time series lookups (catalogmx.utils.timeseries and Banxico catalogs)
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from catalogmx.catalogs.banxico import (
+    CETES28Catalog,
+    InflacionAnualCatalog,
+    TIIE28Catalog,
+    TipoCambioUSDCatalog,
+    UDICatalog,
+)
+from catalogmx.utils.timeseries import TimeSeries, to_ordinal
+
+RECORDS = [
+    {"fecha": "2024-01-08", "valor": 3.0},
+    {"fecha": "2024-01-03", "valor": 1.0},
+    {"fecha": "2024-01-05", "valor": 2.0},
+    {"fecha": "2024-01-05", "valor": 99.0},  # duplicate date: first one wins
+    {"fecha": None, "valor": 5.0},
+    {"fecha": "2024-01-09", "valor": None},
+]
+
+
+@pytest.fixture
+def series():
+    return TimeSeries(RECORDS, value_field="valor")
+
+
+class TestTimeSeries:
+    """Sorted array series with fill policies"""
+
+    def test_sorted_and_deduplicated(self, series):
+        assert len(series) == 3
+        assert list(series.values) == [1.0, 2.0, 3.0]
+        assert series.days[0] == date(2024, 1, 3).toordinal()
+
+    def test_exact(self, series):
+        assert series.value("2024-01-05", fill="exact") == 2.0
+        assert series.value("2024-01-06", fill="exact") is None
+
+    def test_previous(self, series):
+        assert series.value("2024-01-06") == 2.0
+        assert series.value("2024-01-07") == 2.0
+        assert series.value("2024-01-02") is None
+        assert series.value("2030-01-01") == 3.0
+
+    def test_next(self, series):
+        assert series.value("2024-01-06", fill="next") == 3.0
+        assert series.value("2024-01-01", fill="next") == 1.0
+        assert series.value("2024-01-09", fill="next") is None
+
+    def test_nearest(self, series):
+        assert series.value("2024-01-06", fill="nearest") == 2.0
+        assert series.value("2024-01-07", fill="nearest") == 3.0
+        assert series.value("2024-01-04", fill="nearest") == 1.0  # tie: earlier date
+        assert series.value("1999-01-01", fill="nearest") == 1.0
+
+    def test_date_types(self, series):
+        assert series.value(date(2024, 1, 6)) == 2.0
+        assert series.value(datetime(2024, 1, 6, 15, 30)) == 2.0
+        assert to_ordinal("2024-01-06T10:00:00") == date(2024, 1, 6).toordinal()
+
+    def test_previous_date(self, series):
+        assert series.previous_date("2024-01-08") == "2024-01-05"
+        assert series.previous_date("2024-01-06") == "2024-01-05"
+        assert series.previous_date("2024-01-03") is None
+
+    def test_range(self, series):
+        assert list(series.values[series.range("2024-01-04", "2024-01-08")]) == [2.0, 3.0]
+
+    def test_invalid(self, series):
+        with pytest.raises(ValueError):
+            series.value("2024-01-05", fill="closest")
+        with pytest.raises(ValueError):
+            series.value("not a date")
+
+    def test_empty(self):
+        empty = TimeSeries([], value_field="valor")
+        for fill in ("exact", "previous", "next", "nearest"):
+            assert empty.value("2024-01-01", fill=fill) is None
+
+
+class TestBanxicoSeries:
+    """as_of / previous_business_day on the Banxico catalogs"""
+
+    @pytest.mark.parametrize(
+        "catalog, field",
+        [
+            (UDICatalog, "valor"),
+            (TipoCambioUSDCatalog, "tipo_cambio"),
+            (TIIE28Catalog, "tasa"),
+            (CETES28Catalog, "tasa"),
+            (InflacionAnualCatalog, "inflacion_anual"),
+        ],
+    )
+    def test_as_of_matches_published_value(self, catalog, field):
+        record = catalog.get_actual()
+        assert catalog.as_of(record["fecha"], fill="exact") == record[field]
+        assert catalog.get_as_of(record["fecha"])[field] == record[field]
+
+    def test_weekend_uses_previous_fix(self):
+        # 2024-01-06 and 07 are Saturday and Sunday
+        friday = TipoCambioUSDCatalog.get_por_fecha("2024-01-05")
+        assert TipoCambioUSDCatalog.get_por_fecha("2024-01-06") is None
+        assert TipoCambioUSDCatalog.as_of("2024-01-06") == friday["tipo_cambio"]
+        assert TipoCambioUSDCatalog.previous_business_day("2024-01-08") == "2024-01-05"
+
+    def test_get_as_of_returns_copy(self):
+        record = TipoCambioUSDCatalog.get_as_of("2024-01-05")
+        record["tipo_cambio"] = 0
+        assert TipoCambioUSDCatalog.as_of("2024-01-05") != 0
+
+    @pytest.mark.parametrize("catalog, field", [(UDICatalog, "valor"), (TIIE28Catalog, "tasa")])
+    def test_reloaded_data_rebuilds_series(self, catalog, field, monkeypatch):
+        """Replacing or resetting _data is picked up by the cached series"""
+        original = catalog.as_of("2024-01-05")
+        record = dict(catalog.get_as_of("2024-01-05"), **{field: 123.0})
+        monkeypatch.setattr(catalog, "_data", [type(catalog._data[0]).from_dict(record)])
+        assert catalog.as_of("2024-01-05") == 123.0
+        monkeypatch.undo()
+        assert catalog.as_of("2024-01-05") == original
+        monkeypatch.setattr(catalog, "_data", None)
+        assert catalog.as_of("2024-01-05") == original
+
+    def test_udi_nearest_value_for_missing_dates(self):
+        # Before the first published UDI the closest value is the first one
+        first = UDICatalog.get_data()[0]
+        assert UDICatalog.pesos_a_udis(100, "1990-01-01") == pytest.approx(100 / first["valor"])
+
+
+class TestConvertMany:
+    """Batch conversion against the series, no per-row records"""
+
+    FECHAS = ["2024-01-05", "2024-01-06", "2024-01-03", "2024-01-05", "1999-01-01", "2024-01-10"]
+    AMOUNTS = [10.0, 10.0, 5.0, 1.0, 7.0, 2.0]
+
+    def test_lookup_many_matches_index(self, series):
+        days = [to_ordinal(f) for f in self.FECHAS]
+        for fill in ("exact", "previous", "next", "nearest"):
+            expected = [series.index(f, fill) for f in self.FECHAS]
+            assert series.lookup_many(days, fill) == [-1 if i is None else i for i in expected]
+
+    def test_list(self, series):
+        result = series.scale_many(self.AMOUNTS, self.FECHAS)
+        assert result == [20.0, 20.0, 5.0, 2.0, None, 6.0]
+        exact = series.scale_many(self.AMOUNTS, self.FECHAS, fill="exact", divide=True)
+        assert exact == [5.0, None, 5.0, 0.5, None, None]
+
+    def test_array(self, series):
+        from array import array
+
+        result = series.scale_many(array("d", self.AMOUNTS), self.FECHAS)
+        assert isinstance(result, array)
+        assert result[0] == 20.0
+        assert result[4] != result[4]  # NaN
+
+    @pytest.mark.parametrize("fill", ["exact", "previous", "next", "nearest"])
+    def test_numpy(self, series, fill):
+        np = pytest.importorskip("numpy")
+        expected = series.scale_many(self.AMOUNTS, self.FECHAS, fill=fill)
+        for fechas in (self.FECHAS, np.array(self.FECHAS, dtype="datetime64[D]")):
+            result = series.scale_many(np.array(self.AMOUNTS), fechas, fill=fill)
+            assert isinstance(result, np.ndarray)
+            assert [None if v != v else v for v in result.tolist()] == expected
+
+    def test_length_mismatch(self, series):
+        with pytest.raises(ValueError):
+            series.scale_many([1.0], [])
+
+    def test_usd_a_mxn_many_matches_scalar(self):
+        fechas = ["2024-01-05", "2024-01-06", "2023-12-29", "2024-01-05"]
+        amounts = [100.0, 100.0, 1.5, 3.0]
+        assert TipoCambioUSDCatalog.usd_a_mxn_many(amounts, fechas) == [
+            TipoCambioUSDCatalog.usd_a_mxn(a, f) for a, f in zip(amounts, fechas, strict=True)
+        ]
+        assert TipoCambioUSDCatalog.mxn_a_usd_many(amounts, fechas) == [
+            TipoCambioUSDCatalog.mxn_a_usd(a, f) for a, f in zip(amounts, fechas, strict=True)
+        ]
+
+    def test_udis_many_matches_scalar(self):
+        fechas = ["2024-01-05", "1990-01-01", "2100-01-01"]
+        amounts = [1000.0, 1000.0, 1000.0]
+        assert UDICatalog.pesos_a_udis_many(amounts, fechas) == pytest.approx(
+            [UDICatalog.pesos_a_udis(a, f) for a, f in zip(amounts, fechas, strict=True)]
+        )
+        assert UDICatalog.udis_a_pesos_many(amounts, fechas) == pytest.approx(
+            [UDICatalog.udis_a_pesos(a, f) for a, f in zip(amounts, fechas, strict=True)]
+        )
@@ -0,0 +1,116 @@
+"""
+Tests for the inverted token index (catalogmx.utils.search)
+"""
+
+import random
+
+import pytest
+
+from catalogmx.catalogs.banxico import CodigosPlazaCatalog
+from catalogmx.catalogs.inegi import MunicipiosCompletoCatalog
+from catalogmx.catalogs.sat.carta_porte import AeropuertosCatalog
+from catalogmx.catalogs.sat.cfdi_4 import ClaveUnidadCatalog
+from catalogmx.utils.search import TokenIndex
+from catalogmx.utils.text import normalize_text
+
+NAMES = [
+    "San José del Cabo",
+    "San José Iturbide",
+    "Santa María",
+    "Ciudad de México",
+    "Tonalá",
+    "Túxpam",
+    "Mérida",
+    "Ojo",
+    "Yé",
+    "",
+]
+
+
+def naive(items, query):
+    q = normalize_text(query)
+    return [item for item in items if q in normalize_text(item)]
+
+
+class TestTokenIndex:
+    """Substring and word search"""
+
+    def setup_method(self):
+        self.index = TokenIndex(NAMES, key=lambda name: name)
+
+    def test_substring_matches_naive_scan(self):
+        for query in [
+            "san jose",
+            "SAN JOSÉ",
+            "jose del",
+            "é",
+            "mé",
+            "xico",
+            "ojo",
+            "o",
+            "ye",
+            "zzz",
+            "",
+        ]:
+            assert self.index.search(query) == naive(NAMES, query), query
+
+    def test_limit(self):
+        assert self.index.search("san", limit=2) == ["San José del Cabo", "San José Iturbide"]
+
+    def test_tokens_any_order(self):
+        assert self.index.search_tokens("jose san") == ["San José del Cabo", "San José Iturbide"]
+        assert self.index.search_tokens("cabo jose") == ["San José del Cabo"]
+
+    def test_tokens_prefix(self):
+        assert self.index.search_tokens("merid") == ["Mérida"]
+        assert self.index.search_tokens("merid", prefix=False) == []
+        assert self.index.search_tokens("merida", prefix=False) == ["Mérida"]
+        assert self.index.search_tokens("") == []
+        assert self.index.search_tokens("nada") == []
+
+    def test_len(self):
+        assert len(self.index) == len(NAMES)
+
+    def test_invalid_ngram(self):
+        with pytest.raises(ValueError):
+            TokenIndex(NAMES, key=str, ngram=0)
+
+    @pytest.mark.parametrize("ngram", [1, 2, 3, 4])
+    def test_random_queries(self, ngram):
+        rng = random.Random(ngram)
+        index = TokenIndex(NAMES, key=lambda name: name, ngram=ngram)
+        for _ in range(300):
+            source = normalize_text(rng.choice(NAMES[:-1]))
+            start = rng.randrange(len(source))
+            query = source[start : start + rng.randint(1, 6)]
+            assert index.search(query) == naive(NAMES, query), query
+
+
+class TestCatalogsUseTokenIndex:
+    """Catalog search methods keep their substring semantics"""
+
+    def test_codigos_plaza(self):
+        normalize = CodigosPlazaCatalog._normalize
+        expected = [
+            p for p in CodigosPlazaCatalog.get_all() if normalize("Tuxpam") in normalize(p["plaza"])
+        ]
+        assert CodigosPlazaCatalog.search("Tuxpam") == expected
+
+    def test_clave_unidad(self):
+        results = ClaveUnidadCatalog.search_by_name("kilógramo")
+        assert results == ClaveUnidadCatalog.search_by_name("KILOGRAMO")
+        assert all("KILOGRAMO" in normalize_text(u["nombre"]) for u in results)
+
+    def test_municipios_accent_insensitive(self):
+        assert MunicipiosCompletoCatalog.search_by_name("queretaro") == (
+            MunicipiosCompletoCatalog.search_by_name("Querétaro")
+        )
+        assert len(MunicipiosCompletoCatalog.search_by_name("queretaro")) > 0
+
+    def test_aeropuertos(self):
+        expected = [
+            a
+            for a in AeropuertosCatalog.get_all()
+            if normalize_text("internacional") in normalize_text(a["name"])
+        ]
+        assert AeropuertosCatalog.search_by_name("Internacional") == expected
@@ -0,0 +1,225 @@
+"""
+Tests for the unified mexico.sqlite3 backend (catalogmx.backends.sqlite)
+"""
+
+import sqlite3
+
+import pytest
+
+from catalogmx.backends import UnifiedBackend
+from catalogmx.catalogs.sat.cfdi_4 import ClaveProdServCatalog
+
+CODIGOS_POSTALES = [
+    ("06700", "Roma Norte", "Cuauhtémoc", "Ciudad de México"),
+    ("06760", "Roma Sur", "Cuauhtémoc", "Ciudad de México"),
+    ("06760", "Hipódromo", "Cuauhtémoc", "Ciudad de México"),
+    ("44100", "Guadalajara Centro", "Guadalajara", "Jalisco"),
+    ("99999", "Zacatecas", "Zacatecas", "Zacatecas"),
+]
+
+LOCALIDADES = [
+    ("010010001", "01", "001", "Aguascalientes", "U", 21.8853, -102.2916, 863893),
+    ("010010094", "01", "001", "San José de la Ordeña", "R", 21.9100, -102.3300, 1200),
+    ("140390001", "14", "039", "Guadalajara", "U", 20.6597, -103.3496, 1385629),
+]
+
+MUNICIPIOS = [
+    ("01", "Aguascalientes", "001", "Aguascalientes", "01001", 948990),
+    ("01", "Aguascalientes", "002", "Asientos", "01002", 51536),
+    ("14", "Jalisco", "039", "Guadalajara", "14039", 1385629),
+    ("16", "Michoacán de Ocampo", "053", "Morelia", "16053", 849053),
+]
+
+CLAVES = [
+    ("01010101", "No existe en el catálogo", 0, 0, "", "", "", "", ""),
+    ("43211500", "Computadoras", 1, 0, "", "", "", "", "computadora pc"),
+    ("43211511", "Dispositivos de computación de vestir", 1, 0, "", "", "", "", ""),
+]
+
+
+@pytest.fixture
+def backend(tmp_path):
+    """Small database laid out like the build_unified_sqlite.py output"""
+    path = tmp_path / "mexico.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE codigos_postales (cp TEXT, asentamiento TEXT, municipio TEXT, estado TEXT);
+        CREATE INDEX idx_codigos_postales_cp ON codigos_postales (cp);
+        CREATE TABLE localidades (
+            cvegeo TEXT, cve_entidad TEXT, cve_municipio TEXT, nom_localidad TEXT,
+            ambito TEXT, latitud REAL, longitud REAL, poblacion_total INTEGER
+        );
+        CREATE TABLE municipios_completo (
+            cve_entidad TEXT, nom_entidad TEXT, cve_municipio TEXT, nom_municipio TEXT,
+            cve_completa TEXT, poblacion_total INTEGER
+        );
+        CREATE TABLE clave_prod_serv (
+            clave TEXT, descripcion TEXT, incluye_iva INTEGER, incluye_ieps INTEGER,
+            complemento TEXT, fecha_inicio_vigencia TEXT, fecha_fin_vigencia TEXT,
+            estimulo_franja_fronteriza TEXT, palabras_similares TEXT
+        );
+        CREATE VIRTUAL TABLE codigos_postales_fts USING fts5(
+            cp, asentamiento, municipio, estado,
+            content='codigos_postales', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE VIRTUAL TABLE localidades_fts USING fts5(
+            nom_localidad,
+            content='localidades', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE VIRTUAL TABLE municipios_completo_fts USING fts5(
+            nom_municipio,
+            content='municipios_completo', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        CREATE VIRTUAL TABLE clave_prod_serv_fts USING fts5(
+            clave, descripcion, complemento, palabras_similares,
+            content='clave_prod_serv', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        );
+        """)
+    conn.executemany("INSERT INTO codigos_postales VALUES (?, ?, ?, ?)", CODIGOS_POSTALES)
+    conn.executemany("INSERT INTO localidades VALUES (?, ?, ?, ?, ?, ?, ?, ?)", LOCALIDADES)
+    conn.executemany("INSERT INTO municipios_completo VALUES (?, ?, ?, ?, ?, ?)", MUNICIPIOS)
+    conn.executemany("INSERT INTO clave_prod_serv VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", CLAVES)
+    for fts in (
+        "codigos_postales_fts",
+        "localidades_fts",
+        "municipios_completo_fts",
+        "clave_prod_serv_fts",
+    ):
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES('rebuild')")
+    conn.commit()
+    conn.close()
+
+    backend = UnifiedBackend(path)
+    yield backend
+    backend.close()
+
+
+class TestCodigosPostales:
+    """Tests for backend.codigos_postales"""
+
+    def test_get_by_cp(self, backend):
+        """All settlements of a CP, in catalog order"""
+        rows = backend.codigos_postales.get_by_cp("06760")
+        assert [row["asentamiento"] for row in rows] == ["Roma Sur", "Hipódromo"]
+        assert backend.codigos_postales.is_valid("06700")
+        assert not backend.codigos_postales.is_valid("00000")
+        assert backend.codigos_postales.get_municipio("44100") == "Guadalajara"
+        assert backend.codigos_postales.get_estado("00000") is None
+
+    def test_accent_insensitive(self, backend):
+        """State, municipality and settlement lookups ignore accents and case"""
+        assert len(backend.codigos_postales.get_by_estado("ciudad de mexico")) == 3
+        assert len(backend.codigos_postales.get_by_municipio("CUAUHTEMOC")) == 3
+        rows = backend.codigos_postales.search_by_colonia("hipodromo")
+        assert [row["cp"] for row in rows] == ["06760"]
+
+    def test_search_by_colonia(self, backend):
+        """Colonia search matches word prefixes of the settlement only"""
+        rows = backend.codigos_postales.search_by_colonia("rom")
+        assert [row["asentamiento"] for row in rows] == ["Roma Norte", "Roma Sur"]
+        assert backend.codigos_postales.search_by_colonia("cuauhtemoc") == []
+        assert backend.codigos_postales.search_by_colonia("roma-sur")[0]["cp"] == "06760"
+        assert backend.codigos_postales.search_by_colonia("") == []
+
+    def test_prefix(self, backend):
+        """Prefix queries return distinct CPs in order"""
+        assert backend.codigos_postales.get_cps_by_prefix("067") == ["06700", "06760"]
+        assert backend.codigos_postales.get_cps_by_prefix("067", limit=1) == ["06700"]
+        assert backend.codigos_postales.get_cps_by_prefix("9") == ["99999"]
+        assert len(backend.codigos_postales.get_by_prefix("0676")) == 2
+        assert backend.codigos_postales.get_cps_by_prefix("abc") == []
+
+
+class TestLocalidades:
+    """Tests for backend.localidades"""
+
+    def test_lookups(self, backend):
+        """Key, municipality and state lookups"""
+        loc = backend.localidades.get_localidad("140390001")
+        assert loc["nom_localidad"] == "Guadalajara"
+        assert backend.localidades.get_localidad("000000000") is None
+        assert len(backend.localidades.get_by_entidad("1")) == 2
+        assert len(backend.localidades.get_by_municipio("001")) == 2
+        assert len(backend.localidades.get_urbanas()) == 2
+        assert len(backend.localidades.get_rurales()) == 1
+
+    def test_search_by_name(self, backend):
+        """Word prefix search ignores accents and case"""
+        rows = backend.localidades.search_by_name("san jose")
+        assert [row["cvegeo"] for row in rows] == ["010010094"]
+        assert len(backend.localidades.search_by_name("ORDENA")) == 1
+        assert backend.localidades.search_by_name('"AND') == []
+
+    def test_get_by_coordinates(self, backend):
+        """Bounding box plus haversine, closest first"""
+        rows = backend.localidades.get_by_coordinates(21.8853, -102.2916, radio_km=10)
+        assert [row["cvegeo"] for row in rows] == ["010010001", "010010094"]
+        assert rows[0]["distancia_km"] == 0.0
+        nearby = backend.localidades.get_by_coordinates(21.8853, -102.2916, radio_km=1)
+        assert [row["cvegeo"] for row in nearby] == ["010010001"]
+
+    def test_population_range(self, backend):
+        """Population filters with and without an upper bound"""
+        assert len(backend.localidades.get_by_population_range(1_000_000)) == 1
+        assert len(backend.localidades.get_by_population_range(1000, 900_000)) == 2
+
+
+class TestMunicipios:
+    """Tests for backend.municipios"""
+
+    def test_lookups(self, backend):
+        """Code and state lookups"""
+        assert backend.municipios.get_municipio("14039")["nom_municipio"] == "Guadalajara"
+        assert backend.municipios.is_valid("01002")
+        assert not backend.municipios.is_valid("99999")
+        assert backend.municipios.get_count_by_entidad("01") == 2
+        assert len(backend.municipios.get_by_state_name("aguascalientes")) == 2
+        assert backend.municipios.get_total_count() == 4
+
+    def test_accented_state_name(self, backend):
+        """State names match with or without accents"""
+        for name in ("Michoacán de Ocampo", "michoacan de ocampo", "MICHOACÁN DE OCAMPO"):
+            rows = backend.municipios.get_by_state_name(name)
+            assert [row["cve_completa"] for row in rows] == ["16053"]
+
+    def test_search_by_name(self, backend):
+        """Municipality search through the FTS index"""
+        assert [row["cve_completa"] for row in backend.municipios.search_by_name("guadal")] == [
+            "14039"
+        ]
+        assert backend.municipios.search_by_name("jalisco") == []
+
+    def test_estadisticas(self, backend):
+        """Totals are aggregated in SQL"""
+        assert backend.municipios.get_estadisticas() == {
+            "total_municipios": 4,
+            "total_estados": 3,
+            "poblacion_total": 948990 + 51536 + 1385629 + 849053,
+        }
+
+
+class TestClaveProdServ:
+    """Tests for backend.clave_prod_serv"""
+
+    def test_reads_unified_file(self, backend):
+        """The catalog reads the backend's file, not the per-catalog database"""
+        assert issubclass(backend.clave_prod_serv, ClaveProdServCatalog)
+        assert backend.clave_prod_serv.get_total_count() == 3
+        assert backend.clave_prod_serv.is_valid("43211500")
+        assert backend.clave_prod_serv.get_clave("43211500")["descripcion"] == "Computadoras"
+        assert ClaveProdServCatalog.get_total_count() > 3
+
+    def test_search(self, backend):
+        """FTS search with ranking and accent folding"""
+        ids = [row["id"] for row in backend.clave_prod_serv.search("computacion", ranked=True)]
+        assert ids == ["43211511"]
+
+    def test_missing_file(self, tmp_path):
+        """A missing database raises FileNotFoundError on first query"""
+        backend = UnifiedBackend(tmp_path / "missing.sqlite3")
+        with pytest.raises(FileNotFoundError):
+            backend.municipios.get_municipio("14039")
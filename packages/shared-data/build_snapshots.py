@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Generate binary snapshots (.snap) of the large JSON catalogs for fast loading.
+
+Each snapshot is written next to its JSON source and records the size and
+CRC-32 of that source; catalogmx ignores snapshots whose JSON has changed
+since, so rerun this script after updating any of the files below.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+DATA_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(DATA_ROOT.parent / "python"))
+
+from catalogmx.utils.snapshot import is_fresh, snapshot_path, write_snapshot  # noqa: E402
+
+SNAPSHOT_SOURCES = [
+    "banxico/udis.json",
+    "banxico/tipo_cambio_usd.json",
+    "banxico/tiie_28.json",
+    "banxico/cetes_28.json",
+    "inegi/municipios_completo.json",
+]
+
+
+def build(source: Path) -> Path:
+    with open(source, encoding="utf-8") as f:
+        records = json.load(f)
+    return write_snapshot(records, snapshot_path(source), source=source)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report stale or missing snapshots (exit code 1 if any)",
+    )
+    args = parser.parse_args()
+
+    stale = 0
+    for relative in SNAPSHOT_SOURCES:
+        source = DATA_ROOT / relative
+        if args.check:
+            if not is_fresh(source, verify=True):
+                stale += 1
+                print(f"stale: {relative}")
+            continue
+        target = build(source)
+        print(
+            f"{relative}: {source.stat().st_size:,} bytes -> "
+            f"{target.name}: {target.stat().st_size:,} bytes"
+        )
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
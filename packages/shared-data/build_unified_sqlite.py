@@ -21,11 +21,20 @@ INDEX_DEFINITIONS: dict[str, list[Sequence[str]]] = {
         ("idx_codigos_postales_cp", ("cp",)),
         ("idx_codigos_postales_estado", ("estado",)),
         ("idx_codigos_postales_asentamiento", ("asentamiento",)),
+        ("idx_codigos_postales_municipio", ("municipio",)),
     ],
     "localidades": [
         ("idx_localidades_nom_loc", ("nom_loc",)),
         ("idx_localidades_nom_ent", ("nom_ent",)),
         ("idx_localidades_nom_mun", ("nom_mun",)),
+        ("idx_localidades_cvegeo", ("cvegeo",)),
+        ("idx_localidades_cve_entidad", ("cve_entidad",)),
+        ("idx_localidades_cve_municipio", ("cve_municipio",)),
+        ("idx_localidades_lat_lon", ("latitud", "longitud")),
+    ],
+    "municipios_completo": [
+        ("idx_municipios_completo_cve_completa", ("cve_completa",)),
+        ("idx_municipios_completo_cve_entidad", ("cve_entidad",)),
     ],
     "clave_prod_serv": [
         ("idx_clave_prod_serv_clave", ("clave",)),
@@ -38,11 +47,26 @@ FTS_CONFIG = [
         "name": "codigos_postales_fts",
         "content_table": "codigos_postales",
         "columns": ["cp", "asentamiento", "municipio", "estado"],
+        "tokenize": "unicode61 remove_diacritics 2",
+    },
+    {
+        "name": "localidades_fts",
+        "content_table": "localidades",
+        "columns": ["nom_localidad"],
+        "tokenize": "unicode61 remove_diacritics 2",
+    },
+    {
+        "name": "municipios_completo_fts",
+        "content_table": "municipios_completo",
+        "columns": ["nom_municipio"],
+        "tokenize": "unicode61 remove_diacritics 2",
     },
     {
         "name": "clave_prod_serv_fts",
         "content_table": "clave_prod_serv",
-        "columns": ["clave", "descripcion", "palabras_similares"],
+        "columns": ["clave", "descripcion", "complemento", "palabras_similares"],
+        # Accent-insensitive matching ("computacion" finds "computación")
+        "tokenize": "unicode61 remove_diacritics 2",
     },
 ]
 
@@ -52,6 +76,7 @@ JSON_TABLE_OVERRIDES = {
     # Use the full catalog as the canonical table; skip the truncated file elsewhere.
     "sepomex/codigos_postales_completo.json": "codigos_postales",
     "inegi/localidades.json": "localidades",
+    "inegi/municipios_completo.json": "municipios_completo",
     "sat/cfdi_4.0/clave_prod_serv.json": "clave_prod_serv",
 }
 
@@ -389,24 +414,40 @@ def create_fts_indexes(conn: sqlite3.Connection) -> None:
         if not table_exists:
             continue
 
-        conn.execute(f"DROP TABLE IF EXISTS {quote_ident(config['name'])}")
+        fts_table = quote_ident(config["name"])
+        conn.execute(f"DROP TABLE IF EXISTS {fts_table}")
         columns_expr = ",\n        ".join(config["columns"])
+        options = [f"content={quote_ident(base_table)}", "content_rowid='rowid'"]
+        if config.get("tokenize"):
+            options.append(f"tokenize={quote_literal(config['tokenize'])}")
+        options_expr = ",\n        ".join(options)
         conn.execute(
             f"""
-            CREATE VIRTUAL TABLE {quote_ident(config['name'])}
+            CREATE VIRTUAL TABLE {fts_table}
             USING fts5(
                 {columns_expr},
-                content={quote_ident(base_table)}
+                {options_expr}
             );
             """
         )
-        insert_columns = ", ".join(config["columns"])
-        conn.execute(
-            f"""
-            INSERT INTO {quote_ident(config['name'])}(rowid, {insert_columns})
-            SELECT rowid, {insert_columns} FROM {quote_ident(base_table)};
-            """
-        )
+        # 'rebuild' indexes every row of the content table; 'integrity-check'
+        # raises sqlite3.DatabaseError if the index does not match it.
+        conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES('rebuild')")
+        conn.execute(f"INSERT INTO {fts_table}({fts_table}, rank) VALUES('integrity-check', 1)")
+        (indexed,) = conn.execute(f"SELECT COUNT(*) FROM {fts_table}_docsize").fetchone()
+        print(f"[build] Indexed {indexed:,} rows into {config['name']}")
+
+
+def rebuild_sqlite_indexes(path: Path) -> None:
+    """Create the b-tree and FTS indexes of an existing SQLite file in place."""
+    conn = sqlite3.connect(str(path))
+    try:
+        create_indexes(conn)
+        create_fts_indexes(conn)
+        conn.commit()
+        conn.execute("VACUUM;")
+    finally:
+        conn.close()
 
 
 def finalize_database(conn: sqlite3.Connection) -> None:
@@ -471,6 +512,7 @@ def export_individual_sqlite_dbs(conn: sqlite3.Connection) -> None:
                 )
         finally:
             conn.execute(f"DETACH DATABASE {alias}")
+        rebuild_sqlite_indexes(dest_path)
 
 
 def parse_args() -> argparse.Namespace:
@@ -491,11 +533,22 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip copying existing SQLite sources (only import JSON catalogs).",
     )
+    parser.add_argument(
+        "--rebuild-indexes",
+        type=Path,
+        metavar="DB",
+        help="Only rebuild the indexes and FTS tables of an existing SQLite file, then exit.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    if args.rebuild_indexes is not None:
+        print(f"[build] Rebuilding indexes of {args.rebuild_indexes}")
+        rebuild_sqlite_indexes(args.rebuild_indexes)
+        return
+
     output_path: Path = args.output
     if not output_path.is_absolute():
         output_path = output_path.resolve()
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark for catalogmx.utils.text.normalize_text.
+
+Compares the original implementation (unidecode + upper on every call) with
+the translate-table fast path, with and without the LRU cache, on settlement,
+municipality and state names from the SEPOMEX sample data.
+
+Usage:
+    python scripts/bench_normalize_text.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "packages" / "python"))
+
+from catalogmx.utils import text  # noqa: E402
+
+SEPOMEX_FILES = [
+    ROOT / "packages" / "shared-data" / "sepomex" / "codigos_postales_completo.json",
+    ROOT / "packages" / "shared-data" / "sepomex" / "codigos_postales.json",
+]
+
+
+def load_strings() -> list[str]:
+    path = next(p for p in SEPOMEX_FILES if p.exists())
+    with open(path, encoding="utf-8") as f:
+        records = json.load(f)
+    strings = []
+    for record in records:
+        for field in ("asentamiento", "municipio", "estado", "ciudad"):
+            if record.get(field):
+                strings.append(record[field])
+    return strings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the strings")
+    args = parser.parse_args()
+
+    strings = load_strings()
+    unique = len(set(strings))
+
+    def baseline() -> None:
+        for s in strings:
+            str(text.unidecode(s)).upper()
+
+    def fast_path() -> None:
+        for s in strings:
+            text._normalize_uncached(s)
+
+    def cached() -> None:
+        for s in strings:
+            text.normalize_text(s)
+
+    text.clear_normalize_cache()
+    print(f"{len(strings)} strings ({unique} unique), {args.repeat} passes")
+    base = timeit.timeit(baseline, number=args.repeat)
+    for name, func in (("unidecode + upper", baseline), ("translate table", fast_path), ("translate + LRU", cached)):
+        elapsed = base if func is baseline else timeit.timeit(func, number=args.repeat)
+        per_call = elapsed / (len(strings) * args.repeat) * 1e9
+        print(f"  {name:<18} {elapsed:8.4f}s  {per_call:7.1f} ns/call  {base / elapsed:5.1f}x")
+    print(f"  cache: {text.normalize_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()